@@ -221,15 +221,14 @@ class MetadataDownloadProcessor:
             prefix = f"files/"
             paginator = self.s3_client.get_paginator('list_objects_v2')
             
-            # Get CSV data to check s3_paths
-            df = self.csv_manager.read('outputs/output.csv')
-            for _, row in df.iterrows():
-                if str(row.get('row_id', '')).strip() == str(row_id):
-                    # DRY: Use CSVManager for S3 path loading
-                    paths = CSVManager.load_s3_paths(row)
-                    if paths:
-                            logger.info(f"Row {row_id} already has {len(paths)} files in S3")
-                            return True
+            # Get CSV row to check s3_paths (indexed lookup on the cached CSV)
+            row = self.csv_manager.find_row_by_id(row_id)
+            if row is not None:
+                # DRY: Use CSVManager for S3 path loading
+                paths = CSVManager.load_s3_paths(row)
+                if paths:
+                        logger.info(f"Row {row_id} already has {len(paths)} files in S3")
+                        return True
                             
         except Exception as e:
             logger.error(f"Error checking existing media: {e}")
@@ -411,7 +410,10 @@ class MetadataDownloadProcessor:
                 # Track failure
                 self.progress['failed'][metadata['_s3_key']] = datetime.now().isoformat()
                 self._save_progress()
-        
+
+        # Write any batched row updates still pending
+        self.csv_manager.flush_updates()
+
         # Report statistics
         print_section_header("PROCESSING COMPLETE")
         logger.info(f"Metadata files found: {self.stats['metadata_found']}")
@@ -23,7 +23,8 @@ import time
 import uuid
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any, Union, Tuple, NamedTuple
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from urllib.parse import urlparse, parse_qs
 import logging
@@ -31,16 +32,27 @@ import logging
 # Initialize logger using standard logging
 logger = logging.getLogger(__name__)
 
-# Simple rate limiting decorator (inline implementation)
-def rate_limit(service_name: str):
-    """Simple rate limiting decorator."""
-    def decorator(func):
-        def wrapper(*args, **kwargs):
-            # Simple rate limiting - sleep for 2 seconds
-            time.sleep(2.0)
-            return func(*args, **kwargs)
-        return wrapper
-    return decorator
+# Token bucket rate limiting shared with the rest of the system (per-host when
+# rate_limiting.shared_state is enabled), with a simple inline fallback
+try:
+    from utils.rate_limiter import (
+        rate_limit, initialize_rate_limiter,
+        classify_rate_limit_response, report_rate_limit_feedback
+    )
+    _RATE_LIMITER_AVAILABLE = True
+except ImportError:
+    _RATE_LIMITER_AVAILABLE = False
+    
+    # Simple rate limiting decorator (inline implementation)
+    def rate_limit(service_name: str, **scope):
+        """Simple rate limiting decorator."""
+        def decorator(func):
+            def wrapper(*args, **kwargs):
+                # Simple rate limiting - sleep for 2 seconds
+                time.sleep(2.0)
+                return func(*args, **kwargs)
+            return wrapper
+        return decorator
 
 # Simple config loader (inline implementation)
 def get_config():
@@ -55,10 +67,26 @@ def get_config():
         }
     }
 
-# Simple rate limiter initialization (inline implementation)
-def initialize_rate_limiter(config):
-    """Initialize rate limiter (placeholder implementation)."""
-    pass
+if not _RATE_LIMITER_AVAILABLE:
+    # Simple rate limiter initialization (inline implementation)
+    def initialize_rate_limiter(config):
+        """Initialize rate limiter (placeholder implementation)."""
+        pass
+    
+    def classify_rate_limit_response(error_text):
+        """Classify yt-dlp errors (placeholder implementation)."""
+        return None, None
+    
+    def report_rate_limit_feedback(service, signal, retry_after=None):
+        """Report rate limit feedback (placeholder implementation)."""
+        return None
+
+
+def _report_youtube_feedback(result: subprocess.CompletedProcess) -> None:
+    """Feed a yt-dlp result back into the adaptive YouTube rate limit."""
+    error_text = result.stderr if result.returncode != 0 else None
+    signal, retry_after = classify_rate_limit_response(error_text)
+    report_rate_limit_feedback("youtube", signal, retry_after)
 
 # Global validation state
 _YT_DLP_VALIDATED = False
@@ -216,25 +244,77 @@ class VideoMetadata:
                 f"Got: {self.video_url}"
             )
 
+    def to_record(self) -> Tuple:
+        """
+        Pack metadata into a compact tuple in field order.
+
+        Used to ship already-validated metadata between processes without
+        pickling full dataclass instances.
+        """
+        return tuple(getattr(self, name) for name in _VIDEO_METADATA_FIELDS)
+
+    @classmethod
+    def from_record(cls, record: Tuple) -> "VideoMetadata":
+        """
+        Rebuild metadata from a tuple produced by to_record().
+
+        The record was validated when it was created, so validation is not
+        repeated here (keeps the parent process off the CPU-heavy path).
+        """
+        if len(record) != len(_VIDEO_METADATA_FIELDS):
+            raise ValueError(
+                f"VALIDATION ERROR: VideoMetadata record must have {len(_VIDEO_METADATA_FIELDS)} fields. "
+                f"Got: {len(record)}"
+            )
+
+        metadata = cls.__new__(cls)
+        metadata.__dict__.update(zip(_VIDEO_METADATA_FIELDS, record))
+        return metadata
+
+
+_VIDEO_METADATA_FIELDS = tuple(f.name for f in fields(VideoMetadata))
+
 
 class YouTubeChannelDiscovery:
     """
     YouTube channel discovery with fail-fast/fail-loud/fail-safely principles.
     """
     
-    def __init__(self, yt_dlp_path: str = "yt-dlp"):
+    def __init__(self, yt_dlp_path: str = "yt-dlp", parse_workers: int = 0,
+                 parse_batch_size: int = 500):
         """
         Initialize channel discovery with fail-fast validation.
         
         Args:
             yt_dlp_path: Path to yt-dlp executable
+            parse_workers: Worker processes for parsing enumeration output
+                (0 parses inline in the calling thread)
+            parse_batch_size: Lines per batch sent to a parse worker
             
         Raises:
             RuntimeError: If yt-dlp is not available or invalid
+            ValueError: If parse pool settings are invalid
         """
+        if not isinstance(parse_workers, int) or parse_workers < 0:
+            raise ValueError(
+                f"CONFIG ERROR: parse_workers must be non-negative integer. "
+                f"Got: {parse_workers} (type: {type(parse_workers)})"
+            )
+        
+        if not isinstance(parse_batch_size, int) or parse_batch_size <= 0:
+            raise ValueError(
+                f"CONFIG ERROR: parse_batch_size must be positive integer. "
+                f"Got: {parse_batch_size} (type: {type(parse_batch_size)})"
+            )
+        
         self.yt_dlp_path = yt_dlp_path
         self.config = get_config()
         
+        # Optional process pool for CPU-bound JSON parsing/validation (created lazily)
+        self.parse_workers = parse_workers
+        self.parse_batch_size = parse_batch_size
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+        
         # Fail-fast yt-dlp validation
         self._validate_yt_dlp()
         
@@ -374,7 +454,7 @@ class YouTubeChannelDiscovery:
         logger.debug(f"Channel URL validated and normalized: {channel_url}")
         return channel_url
     
-    @rate_limit("youtube")
+    @rate_limit("youtube", channel_arg="channel_url")
     def extract_channel_info(self, channel_url: str) -> ChannelInfo:
         """
         Extract basic channel information (fail-safely).
@@ -414,6 +494,7 @@ class YouTubeChannelDiscovery:
                 text=True,
                 timeout=60  # 1 minute timeout
             )
+            _report_youtube_feedback(result)
             
             if result.returncode != 0:
                 raise RuntimeError(
@@ -494,7 +575,7 @@ class YouTubeChannelDiscovery:
             logger.error(f"Channel info extraction failed: {e}")
             raise
     
-    @rate_limit("youtube")
+    @rate_limit("youtube", channel_arg="channel_url")
     def enumerate_channel_videos(self, channel_url: str, max_videos: Optional[int] = None) -> List[VideoMetadata]:
         """
         Enumerate all videos from a YouTube channel (fail-safely).
@@ -541,6 +622,7 @@ class YouTubeChannelDiscovery:
                 text=True,
                 timeout=300  # 5 minute timeout for channel enumeration
             )
+            _report_youtube_feedback(result)
             
             if result.returncode != 0:
                 # Non-zero return code but still check if we got partial results
@@ -562,36 +644,7 @@ class YouTubeChannelDiscovery:
                 return []
             
             # Parse JSON output (one video per line)
-            videos = []
-            errors = []
-            
-            for line_num, line in enumerate(result.stdout.strip().split('\n'), 1):
-                if not line.strip():
-                    continue
-                
-                try:
-                    data = json.loads(line.strip())
-                    
-                    # Extract video metadata with validation
-                    video_metadata = self._extract_video_metadata(data, normalized_url)
-                    if video_metadata:
-                        videos.append(video_metadata)
-                    
-                except json.JSONDecodeError as e:
-                    error_msg = f"Line {line_num}: Failed to parse JSON: {e}"
-                    errors.append(error_msg)
-                    logger.warning(f"Video enumeration JSON parse error: {error_msg}")
-                    continue
-                except ValueError as e:
-                    error_msg = f"Line {line_num}: Video validation failed: {e}"
-                    errors.append(error_msg)
-                    logger.warning(f"Video enumeration validation error: {error_msg}")
-                    continue
-                except Exception as e:
-                    error_msg = f"Line {line_num}: Unexpected error: {e}"
-                    errors.append(error_msg)
-                    logger.warning(f"Video enumeration unexpected error: {error_msg}")
-                    continue
+            videos, errors = self.parse_enumeration_output(result.stdout, normalized_url)
             
             # Apply max_videos limit if specified (post-processing since --playlist-items may not work reliably)
             if max_videos and max_videos > 0 and len(videos) > max_videos:
@@ -620,7 +673,67 @@ class YouTubeChannelDiscovery:
             logger.error(f"Channel video enumeration failed: {e}")
             raise
     
-    def _extract_video_metadata(self, data: Dict[str, Any], channel_url: str) -> Optional[VideoMetadata]:
+    def parse_enumeration_output(self, output: str, channel_url: str) -> Tuple[List[VideoMetadata], List[str]]:
+        """
+        Parse yt-dlp --dump-json output into validated video metadata.
+        
+        Runs inline unless parse_workers > 0 and the output spans more than one
+        batch, in which case batches are parsed and validated in worker processes
+        so the CPU work does not hold the GIL in I/O threads. Order is preserved.
+        
+        Args:
+            output: Raw yt-dlp stdout (one JSON object per line)
+            channel_url: Normalized channel URL for error context
+            
+        Returns:
+            Tuple of (videos, errors)
+        """
+        numbered_lines = [
+            (line_num, line.strip())
+            for line_num, line in enumerate(output.strip().split('\n'), 1)
+            if line.strip()
+        ]
+        
+        batches = [
+            numbered_lines[i:i + self.parse_batch_size]
+            for i in range(0, len(numbered_lines), self.parse_batch_size)
+        ]
+        
+        if self.parse_workers > 0 and len(batches) > 1:
+            logger.debug(f"Parsing {len(numbered_lines)} lines in {len(batches)} batches "
+                        f"across {self.parse_workers} worker processes")
+            pool = self._get_parse_pool()
+            batch_results = pool.map(_parse_enumeration_batch, batches, [channel_url] * len(batches))
+        else:
+            batch_results = (_parse_enumeration_batch(batch, channel_url) for batch in batches)
+        
+        videos = []
+        errors = []
+        for records, batch_errors in batch_results:
+            videos.extend(VideoMetadata.from_record(record) for record in records)
+            for error_msg in batch_errors:
+                logger.warning(f"Video enumeration error: {error_msg}")
+            errors.extend(batch_errors)
+        
+        return videos, errors
+    
+    def _get_parse_pool(self) -> ProcessPoolExecutor:
+        """Get or create the metadata parsing process pool."""
+        if self._parse_pool is None:
+            self._parse_pool = ProcessPoolExecutor(max_workers=self.parse_workers)
+            logger.info(f"Metadata parse pool started with {self.parse_workers} workers "
+                       f"(batch size: {self.parse_batch_size})")
+        return self._parse_pool
+    
+    def close(self) -> None:
+        """Shut down the metadata parsing process pool if one was started."""
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown(wait=True)
+            self._parse_pool = None
+            logger.info("Metadata parse pool shut down")
+    
+    @classmethod
+    def _extract_video_metadata(cls, data: Dict[str, Any], channel_url: str) -> Optional[VideoMetadata]:
         """
         Enhanced video metadata extraction with comprehensive validation and edge case handling.
         
@@ -645,38 +758,38 @@ class YouTubeChannelDiscovery:
             logger.debug(f"Extracting metadata for {extraction_context}")
             
             # PHASE 1: Required fields with fail-fast validation
-            video_id = self._extract_required_field(data, "id", "video_id", extraction_context)
-            title = self._extract_required_field(data, "title", "title", extraction_context)
+            video_id = cls._extract_required_field(data, "id", "video_id", extraction_context)
+            title = cls._extract_required_field(data, "title", "title", extraction_context)
             
             # PHASE 2: Enhanced optional field extraction with robust error handling
-            description = self._safe_extract_string(data, "description", max_length=5000)
-            duration = self._safe_extract_duration(data)
-            upload_date = self._safe_extract_upload_date(data, extraction_context)
+            description = cls._safe_extract_string(data, "description", max_length=5000)
+            duration = cls._safe_extract_duration(data)
+            upload_date = cls._safe_extract_upload_date(data, extraction_context)
             
             # PHASE 3: Numeric metadata with comprehensive validation
-            view_count = self._safe_extract_numeric(data, "view_count", min_value=0)
-            like_count = self._safe_extract_numeric(data, "like_count", min_value=0)
-            comment_count = self._safe_extract_numeric(data, "comment_count", min_value=0)
+            view_count = cls._safe_extract_numeric(data, "view_count", min_value=0)
+            like_count = cls._safe_extract_numeric(data, "like_count", min_value=0)
+            comment_count = cls._safe_extract_numeric(data, "comment_count", min_value=0)
             
             # PHASE 4: Collection fields with type validation
-            tags = self._safe_extract_list(data, "tags", item_type=str, max_items=50)
-            categories = self._safe_extract_list(data, "categories", item_type=str, max_items=10)
+            tags = cls._safe_extract_list(data, "tags", item_type=str, max_items=50)
+            categories = cls._safe_extract_list(data, "categories", item_type=str, max_items=10)
             
             # PHASE 5: URL and media information
             video_url = f"https://www.youtube.com/watch?v={video_id}"
-            thumbnail_url = self._extract_best_thumbnail(data)
+            thumbnail_url = cls._extract_best_thumbnail(data)
             
             # PHASE 6: Channel identification with fallback strategies
-            channel_id = self._extract_channel_identifier(data)
-            uploader = self._safe_extract_string(data, ["uploader", "channel"], max_length=200)
+            channel_id = cls._extract_channel_identifier(data)
+            uploader = cls._safe_extract_string(data, ["uploader", "channel"], max_length=200)
             
             # PHASE 7: Content characteristics and restrictions
-            is_live = self._safe_extract_boolean(data, ["is_live", "live_status"])
-            age_restricted = self._extract_age_restriction(data)
+            is_live = cls._safe_extract_boolean(data, ["is_live", "live_status"])
+            age_restricted = cls._extract_age_restriction(data)
             
             # PHASE 8: Additional metadata for enhanced functionality
-            availability = self._safe_extract_string(data, "availability", max_length=50)
-            language = self._safe_extract_string(data, ["language", "automatic_captions"], max_length=10)
+            availability = cls._safe_extract_string(data, "availability", max_length=50)
+            language = cls._safe_extract_string(data, ["language", "automatic_captions"], max_length=10)
             
             logger.debug(f"Successfully extracted metadata for {extraction_context}: "
                         f"duration={duration}s, views={view_count}, live={is_live}")
@@ -712,14 +825,16 @@ class YouTubeChannelDiscovery:
             logger.error(f"Unexpected error extracting video metadata for {extraction_context}: {e}")
             raise ValueError(f"Video metadata extraction failed for {extraction_context}: {e}") from e
     
-    def _extract_required_field(self, data: Dict[str, Any], field: str, field_name: str, context: str) -> str:
+    @staticmethod
+    def _extract_required_field(data: Dict[str, Any], field: str, field_name: str, context: str) -> str:
         """Extract required field with fail-fast validation."""
         value = data.get(field)
         if not value or not isinstance(value, str) or not value.strip():
             raise ValueError(f"Missing or invalid required field '{field_name}' in {context}")
         return value.strip()
     
-    def _safe_extract_string(self, data: Dict[str, Any], fields: Union[str, List[str]], 
+    @staticmethod
+    def _safe_extract_string(data: Dict[str, Any], fields: Union[str, List[str]], 
                            max_length: int = 1000) -> Optional[str]:
         """Safely extract string field(s) with length validation."""
         if isinstance(fields, str):
@@ -733,7 +848,8 @@ class YouTubeChannelDiscovery:
                     return value[:max_length] if len(value) > max_length else value
         return None
     
-    def _safe_extract_duration(self, data: Dict[str, Any]) -> Optional[int]:
+    @staticmethod
+    def _safe_extract_duration(data: Dict[str, Any]) -> Optional[int]:
         """Enhanced duration extraction with multiple format support."""
         duration = data.get("duration")
         if duration is None:
@@ -767,7 +883,8 @@ class YouTubeChannelDiscovery:
             logger.debug(f"Could not parse duration '{duration}': {e}")
             return None
     
-    def _safe_extract_upload_date(self, data: Dict[str, Any], context: str) -> Optional[datetime]:
+    @staticmethod
+    def _safe_extract_upload_date(data: Dict[str, Any], context: str) -> Optional[datetime]:
         """Enhanced upload date parsing with multiple format support."""
         date_fields = ["upload_date", "release_date", "timestamp"]
         
@@ -795,7 +912,8 @@ class YouTubeChannelDiscovery:
         
         return None
     
-    def _safe_extract_numeric(self, data: Dict[str, Any], field: str, 
+    @staticmethod
+    def _safe_extract_numeric(data: Dict[str, Any], field: str, 
                             min_value: int = 0, max_value: int = None) -> Optional[int]:
         """Safely extract and validate numeric fields."""
         value = data.get(field)
@@ -823,7 +941,8 @@ class YouTubeChannelDiscovery:
             logger.debug(f"Could not parse numeric field '{field}' value '{value}': {e}")
             return None
     
-    def _safe_extract_list(self, data: Dict[str, Any], field: str, 
+    @staticmethod
+    def _safe_extract_list(data: Dict[str, Any], field: str, 
                          item_type: type = str, max_items: int = 100) -> List:
         """Safely extract and validate list fields."""
         value = data.get(field, [])
@@ -839,7 +958,8 @@ class YouTubeChannelDiscovery:
         
         return validated_items
     
-    def _extract_best_thumbnail(self, data: Dict[str, Any]) -> Optional[str]:
+    @staticmethod
+    def _extract_best_thumbnail(data: Dict[str, Any]) -> Optional[str]:
         """Extract the highest quality thumbnail URL."""
         thumbnails = data.get("thumbnails", [])
         if not isinstance(thumbnails, list) or not thumbnails:
@@ -856,7 +976,8 @@ class YouTubeChannelDiscovery:
             # Fallback to last thumbnail
             return thumbnails[-1].get("url") if thumbnails else None
     
-    def _extract_channel_identifier(self, data: Dict[str, Any]) -> Optional[str]:
+    @staticmethod
+    def _extract_channel_identifier(data: Dict[str, Any]) -> Optional[str]:
         """Extract channel ID with multiple fallback strategies."""
         # Try various channel ID fields in order of preference
         id_fields = [
@@ -875,7 +996,8 @@ class YouTubeChannelDiscovery:
         
         return None
     
-    def _safe_extract_boolean(self, data: Dict[str, Any], fields: Union[str, List[str]]) -> bool:
+    @staticmethod
+    def _safe_extract_boolean(data: Dict[str, Any], fields: Union[str, List[str]]) -> bool:
         """Safely extract boolean values from multiple possible fields."""
         if isinstance(fields, str):
             fields = [fields]
@@ -892,7 +1014,8 @@ class YouTubeChannelDiscovery:
         
         return False
     
-    def _extract_age_restriction(self, data: Dict[str, Any]) -> bool:
+    @staticmethod
+    def _extract_age_restriction(data: Dict[str, Any]) -> bool:
         """Determine if content is age-restricted."""
         age_limit = data.get("age_limit")
         if age_limit and isinstance(age_limit, (int, float)):
@@ -905,7 +1028,7 @@ class YouTubeChannelDiscovery:
             "mature" in str(data.get("content_rating", "")).lower()
         ])
     
-    @rate_limit("youtube")
+    @rate_limit("youtube", host="youtube.com")
     def get_video_details(self, video_id: str) -> VideoMetadata:
         """
         Get detailed metadata for a specific video (fail-safely).
@@ -955,6 +1078,7 @@ class YouTubeChannelDiscovery:
                 text=True,
                 timeout=60  # 1 minute timeout for single video
             )
+            _report_youtube_feedback(result)
             
             if result.returncode != 0:
                 raise RuntimeError(
@@ -1093,6 +1217,40 @@ class YouTubeChannelDiscovery:
         logger.debug(f"Duplicate detection now tracking {len(self._processed_videos)} total videos")
 
 
+def _parse_enumeration_batch(numbered_lines: List[Tuple[int, str]],
+                             channel_url: str) -> Tuple[List[Tuple], List[str]]:
+    """
+    Parse and validate a batch of yt-dlp --dump-json lines.
+
+    Module-level so it can run in a worker process. Returns compact records
+    (see VideoMetadata.to_record) plus error messages, both in input order.
+
+    Args:
+        numbered_lines: (line_number, raw_json_line) pairs
+        channel_url: Normalized channel URL for error context
+
+    Returns:
+        Tuple of (records, errors)
+    """
+    records = []
+    errors = []
+
+    for line_num, line in numbered_lines:
+        try:
+            data = json.loads(line)
+            video_metadata = YouTubeChannelDiscovery._extract_video_metadata(data, channel_url)
+            if video_metadata:
+                records.append(video_metadata.to_record())
+        except json.JSONDecodeError as e:
+            errors.append(f"Line {line_num}: Failed to parse JSON: {e}")
+        except ValueError as e:
+            errors.append(f"Line {line_num}: Video validation failed: {e}")
+        except Exception as e:
+            errors.append(f"Line {line_num}: Unexpected error: {e}")
+
+    return records, errors
+
+
 def validate_channel_discovery_module():
     """
     Validate channel discovery module (fail-fast on import).
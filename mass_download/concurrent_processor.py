@@ -20,7 +20,7 @@ import psutil
 import queue
 import threading
 import logging
-from typing import List, Dict, Any, Optional, Callable, Tuple
+from typing import List, Dict, Any, Optional, Callable, Tuple, Type
 from dataclasses import dataclass, field
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor, Future, as_completed
@@ -33,6 +33,7 @@ sys.path.insert(0, str(current_dir.parent))
 
 # Import mass download logger
 from .logging_setup import get_mass_download_logger
+from .error_recovery import DelayedRetryQueue, RetryManager
 
 # Configure logging
 logger = get_mass_download_logger(__name__)
@@ -195,6 +196,20 @@ class ResourceMonitor:
             return base_concurrency
 
 
+@dataclass
+class _ManagedTask:
+    """A submitted task and its progress through breaker pauses and retries."""
+    task_id: str
+    run: Callable[[], Any]
+    future: Future
+    service: Optional[str] = None
+    max_retries: int = 0
+    retry_on: Tuple[Type[Exception], ...] = (Exception,)
+    on_success: Optional[Callable[[Any], None]] = None
+    on_failure: Optional[Callable[[Exception], None]] = None
+    attempt: int = 0
+
+
 class ConcurrentProcessor:
     """
     Enhanced concurrent processor with resource management.
@@ -203,22 +218,34 @@ class ConcurrentProcessor:
     - Dynamic thread pool sizing based on resources
     - Semaphore-based concurrency control
     - Work queue with priority support
+    - Dispatch paused per service while its circuit breaker is open
     - Comprehensive error handling
     - Progress tracking integration
     """
     
     def __init__(self, 
                  resource_limits: Optional[ResourceLimits] = None,
-                 progress_callback: Optional[Callable[[str, Dict[str, Any]], None]] = None):
+                 progress_callback: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+                 circuit_breakers: Optional[Callable[[str], Any]] = None,
+                 retry_manager: Optional[RetryManager] = None,
+                 retry_state_path: Optional[Path] = None):
         """
         Initialize concurrent processor.
         
         Args:
             resource_limits: Resource limits configuration
             progress_callback: Callback for progress updates
+            circuit_breakers: Service name -> CircuitBreaker lookup (e.g.
+                ErrorRecoveryManager.get_circuit_breaker) used to gate tasks
+                submitted with a service
+            retry_manager: Backoff policy for tasks submitted with max_retries
+            retry_state_path: SQLite file persisting retry counts and next-attempt
+                times across restarts (None = in memory only)
         """
         self.limits = resource_limits or ResourceLimits()
         self.progress_callback = progress_callback
+        self.circuit_breakers = circuit_breakers
+        self.retry_manager = retry_manager or RetryManager()
         
         # Resource monitoring
         self.resource_monitor = ResourceMonitor(self.limits)
@@ -238,12 +265,17 @@ class ConcurrentProcessor:
         self.active_tasks: Dict[str, Future] = {}
         self.completed_tasks: List[str] = []
         self.failed_tasks: List[Tuple[str, Exception]] = []
+        self.paused_tasks: Dict[str, str] = {}  # task_id -> service it is waiting on
+        self.retry_queue = DelayedRetryQueue(state_path=retry_state_path)
+        self._stop_event = threading.Event()
         self._lock = threading.RLock()
         
         logger.info("ConcurrentProcessor initialized with dynamic resource management")
     
     def start(self):
         """Start the concurrent processor."""
+        self._stop_event.clear()
+        
         # Start resource monitoring
         self.resource_monitor.start_monitoring()
         
@@ -252,10 +284,20 @@ class ConcurrentProcessor:
         
         logger.info(f"ConcurrentProcessor started with {self.current_workers} workers")
     
+    @property
+    def is_running(self) -> bool:
+        """Whether start() has been called without a matching stop()."""
+        return self.executor is not None and not self._stop_event.is_set()
+    
     def stop(self):
         """Stop the concurrent processor."""
         logger.info("Stopping ConcurrentProcessor...")
         
+        # Resolve tasks waiting on a breaker or a retry (their retry state stays persisted)
+        self._stop_event.set()
+        for waiting_task in self.retry_queue.drain():
+            waiting_task()
+        
         # Stop resource monitoring
         self.resource_monitor.stop_monitoring()
         
@@ -269,6 +311,8 @@ class ConcurrentProcessor:
         # Shutdown thread pool
         if self.executor:
             self.executor.shutdown(wait=True)
+            # A later start() builds a fresh pool
+            self.executor = None
             logger.info("Thread pool shutdown complete")
         
         logger.info("ConcurrentProcessor stopped")
@@ -290,11 +334,132 @@ class ConcurrentProcessor:
         
         logger.info(f"Thread pool resized to {new_size} workers")
     
+    def _submit_managed(self, task: _ManagedTask) -> Future:
+        """
+        Submit a task through the breaker gate and the delayed-retry queue.
+        
+        Nothing sleeps in a worker: a task whose service's circuit breaker is
+        open is parked in the retry queue until the breaker half-opens, and a
+        failed attempt goes back in with a not-before time from the retry
+        manager's backoff, so workers move straight on to other ready work.
+        A task whose retry state survived a restart resumes that backoff.
+        """
+        state = self.retry_queue.get_state(task.task_id) if task.max_retries else None
+        if state is not None and state.attempt <= task.max_retries:
+            task.attempt = state.attempt
+            delay = max(state.not_before - time.time(), 0.0)
+            logger.info(f"Resuming retry backoff for {task.task_id}: attempt {task.attempt + 1} "
+                        f"in {delay:.1f}s (last error: {state.last_error})")
+            self.retry_queue.schedule(task.task_id, lambda: self._resubmit(task), delay)
+        else:
+            self.executor.submit(self._run_managed, task)
+        return task.future
+    
+    def _run_managed(self, task: _ManagedTask):
+        future = task.future
+        if future.cancelled():
+            return
+        if self._stop_event.is_set():
+            self._abandon(task)
+            return
+        
+        if task.service and self.circuit_breakers is not None:
+            breaker = self.circuit_breakers(task.service)
+            wait_seconds = breaker.allow_dispatch()
+            if wait_seconds > 0:
+                self._park(task, wait_seconds, breaker.state.value)
+                return
+            
+            with self._lock:
+                was_paused = self.paused_tasks.pop(task.task_id, None) is not None
+            if was_paused:
+                logger.info(f"Resuming dispatch of {task.task_id} to {task.service}")
+        
+        if not future.running() and not future.set_running_or_notify_cancel():
+            return
+        
+        try:
+            result = task.run()
+        except Exception as e:
+            if task.attempt < task.max_retries and isinstance(e, task.retry_on):
+                self._schedule_retry(task, e)
+                return
+            if task.max_retries:
+                self.retry_queue.clear(task.task_id)
+            if task.on_failure:
+                task.on_failure(e)
+            future.set_exception(e)
+            return
+        
+        if task.max_retries:
+            self.retry_queue.clear(task.task_id)
+        if task.on_success:
+            task.on_success(result)
+        future.set_result(result)
+    
+    def _schedule_retry(self, task: _ManagedTask, error: Exception):
+        delay = self.retry_manager.get_delay(task.attempt)
+        task.attempt += 1
+        logger.warning(f"Attempt {task.attempt}/{task.max_retries + 1} failed for {task.task_id}: {error}. "
+                       f"Retrying in {delay:.1f}s")
+        
+        if self.progress_callback:
+            self.progress_callback("task_retry_scheduled", {
+                "task_id": task.task_id,
+                "attempt": task.attempt,
+                "delay": delay,
+                "error": str(error)
+            })
+        
+        self.retry_queue.schedule(task.task_id, lambda: self._resubmit(task), delay,
+                                  attempt=task.attempt, error=str(error))
+    
+    def _park(self, task: _ManagedTask, wait_seconds: float, breaker_state: str):
+        with self._lock:
+            newly_paused = task.task_id not in self.paused_tasks
+            self.paused_tasks[task.task_id] = task.service
+        
+        if newly_paused:
+            logger.warning(f"Circuit breaker for {task.service} is {breaker_state} - "
+                           f"pausing dispatch of {task.task_id}")
+            if self.progress_callback:
+                self.progress_callback("task_paused", {
+                    "task_id": task.task_id,
+                    "service": task.service
+                })
+        
+        self.retry_queue.schedule(task.task_id, lambda: self._resubmit(task), wait_seconds)
+    
+    def _resubmit(self, task: _ManagedTask):
+        """Hand a due task back to the pool (runs on the retry queue's timer thread)."""
+        executor = self.executor
+        if executor is None or self._stop_event.is_set() or task.future.cancelled():
+            self._abandon(task)
+            return
+        try:
+            executor.submit(self._run_managed, task)
+        except RuntimeError:
+            self._abandon(task)  # Executor shut down while the task was waiting
+    
+    def _abandon(self, task: _ManagedTask):
+        """Resolve a task that will not run because the processor stopped."""
+        with self._lock:
+            self.paused_tasks.pop(task.task_id, None)
+        future = task.future
+        if not future.done() and not future.cancel():
+            # Already running between retries - cannot be cancelled, so fail it
+            future.set_exception(RuntimeError(
+                f"CONCURRENT PROCESSOR ERROR: Stopped while {task.task_id} was waiting to retry"
+            ))
+    
     def submit_channel_task(self, 
                           task_id: str,
                           task_func: Callable,
                           *args,
                           priority: int = 5,
+                          service: Optional[str] = None,
+                          max_retries: int = 0,
+                          retry_on: Tuple[Type[Exception], ...] = (Exception,),
                           **kwargs) -> Future:
         """
         Submit a channel processing task.
@@ -304,6 +469,9 @@ class ConcurrentProcessor:
             task_func: Function to execute
             *args: Function arguments
             priority: Task priority (lower = higher priority)
+            service: Service the task calls; dispatch pauses while its breaker is open
+            max_retries: Failed attempts to reschedule (with backoff) before failing the task
+            retry_on: Exception types that are rescheduled; others fail the task at once
             **kwargs: Function keyword arguments
             
         Returns:
@@ -321,41 +489,40 @@ class ConcurrentProcessor:
         # Submit task with semaphore control
         def wrapped_task():
             with self.channel_semaphore:
-                try:
-                    logger.info(f"Starting task: {task_id}")
-                    result = task_func(*args, **kwargs)
-                    
-                    with self._lock:
-                        self.completed_tasks.append(task_id)
-                        if task_id in self.active_tasks:
-                            del self.active_tasks[task_id]
-                    
-                    if self.progress_callback:
-                        self.progress_callback("task_completed", {
-                            "task_id": task_id,
-                            "status": "success"
-                        })
-                    
-                    return result
-                    
-                except Exception as e:
-                    logger.error(f"Task failed: {task_id} - {e}")
-                    
-                    with self._lock:
-                        self.failed_tasks.append((task_id, e))
-                        if task_id in self.active_tasks:
-                            del self.active_tasks[task_id]
-                    
-                    if self.progress_callback:
-                        self.progress_callback("task_failed", {
-                            "task_id": task_id,
-                            "error": str(e)
-                        })
-                    
-                    raise
+                logger.info(f"Starting task: {task_id}")
+                return task_func(*args, **kwargs)
+        
+        def on_success(result):
+            with self._lock:
+                self.completed_tasks.append(task_id)
+                if task_id in self.active_tasks:
+                    del self.active_tasks[task_id]
+            
+            if self.progress_callback:
+                self.progress_callback("task_completed", {
+                    "task_id": task_id,
+                    "status": "success"
+                })
+        
+        def on_failure(e):
+            logger.error(f"Task failed: {task_id} - {e}")
+            
+            with self._lock:
+                self.failed_tasks.append((task_id, e))
+                if task_id in self.active_tasks:
+                    del self.active_tasks[task_id]
+            
+            if self.progress_callback:
+                self.progress_callback("task_failed", {
+                    "task_id": task_id,
+                    "error": str(e)
+                })
         
         # Submit to executor
-        future = self.executor.submit(wrapped_task)
+        future = self._submit_managed(_ManagedTask(
+            task_id=task_id, run=wrapped_task, future=Future(), service=service,
+            max_retries=max_retries, retry_on=retry_on, on_success=on_success, on_failure=on_failure
+        ))
         
         with self._lock:
             self.active_tasks[task_id] = future
@@ -367,6 +534,9 @@ class ConcurrentProcessor:
                            task_id: str,
                            download_func: Callable,
                            *args,
+                           service: Optional[str] = None,
+                           max_retries: int = 0,
+                           retry_on: Tuple[Type[Exception], ...] = (Exception,),
                            **kwargs) -> Future:
         """
         Submit a download task with separate concurrency control.
@@ -375,6 +545,9 @@ class ConcurrentProcessor:
             task_id: Unique task identifier
             download_func: Download function to execute
             *args: Function arguments
+            service: Service the download calls; dispatch pauses while its breaker is open
+            max_retries: Failed attempts to reschedule (with backoff) before failing the download
+            retry_on: Exception types that are rescheduled; others fail the download at once
             **kwargs: Function keyword arguments
             
         Returns:
@@ -382,31 +555,30 @@ class ConcurrentProcessor:
         """
         def wrapped_download():
             with self.download_semaphore:
-                try:
-                    logger.info(f"Starting download: {task_id}")
-                    result = download_func(*args, **kwargs)
-                    
-                    if self.progress_callback:
-                        self.progress_callback("download_completed", {
-                            "task_id": task_id,
-                            "status": "success"
-                        })
-                    
-                    return result
-                    
-                except Exception as e:
-                    logger.error(f"Download failed: {task_id} - {e}")
-                    
-                    if self.progress_callback:
-                        self.progress_callback("download_failed", {
-                            "task_id": task_id,
-                            "error": str(e)
-                        })
-                    
-                    raise
+                logger.info(f"Starting download: {task_id}")
+                return download_func(*args, **kwargs)
+        
+        def on_success(result):
+            if self.progress_callback:
+                self.progress_callback("download_completed", {
+                    "task_id": task_id,
+                    "status": "success"
+                })
+        
+        def on_failure(e):
+            logger.error(f"Download failed: {task_id} - {e}")
+            
+            if self.progress_callback:
+                self.progress_callback("download_failed", {
+                    "task_id": task_id,
+                    "error": str(e)
+                })
         
         # Submit to executor
-        future = self.executor.submit(wrapped_download)
+        future = self._submit_managed(_ManagedTask(
+            task_id=task_id, run=wrapped_download, future=Future(), service=service,
+            max_retries=max_retries, retry_on=retry_on, on_success=on_success, on_failure=on_failure
+        ))
         logger.info(f"Submitted download: {task_id}")
         return future
     
@@ -462,6 +634,8 @@ class ConcurrentProcessor:
                 "active_tasks": len(self.active_tasks),
                 "completed_tasks": len(self.completed_tasks),
                 "failed_tasks": len(self.failed_tasks),
+                "paused_tasks": len(self.paused_tasks),
+                "delayed_tasks": len(self.retry_queue),
                 "queue_size": self.work_queue.qsize(),
                 "resource_status": metrics.status.value,
                 "cpu_percent": metrics.cpu_percent,
@@ -470,6 +644,21 @@ class ConcurrentProcessor:
                 "download_semaphore_available": self.download_semaphore._value
             }
 
+    def get_queue_stats(self) -> Dict[str, Any]:
+        """Get queue depths and worker counts without sampling system resources."""
+        with self._lock:
+            return {
+                "current_workers": self.current_workers,
+                "active_tasks": len(self.active_tasks),
+                "completed_tasks": len(self.completed_tasks),
+                "failed_tasks": len(self.failed_tasks),
+                "paused_tasks": len(self.paused_tasks),
+                "delayed_tasks": len(self.retry_queue),
+                "queue_size": self.work_queue.qsize(),
+                "channel_semaphore_available": self.channel_semaphore._value,
+                "download_semaphore_available": self.download_semaphore._value
+            }
+
 
 def process_batch_with_resource_management(
         items: List[Tuple[str, Callable, tuple, dict]],
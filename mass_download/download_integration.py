@@ -16,8 +16,10 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from enum import Enum
+import shutil
 import tempfile
 import uuid
+from contextlib import nullcontext
 
 # Add parent directory to path for imports
 current_dir = Path(__file__).parent
@@ -46,21 +48,6 @@ def with_standard_error_handling(func):
             raise
     return wrapper
 
-def retry_with_backoff(max_retries=3):
-    """Simple retry decorator."""
-    def decorator(func):
-        def wrapper(*args, **kwargs):
-            for attempt in range(max_retries):
-                try:
-                    return func(*args, **kwargs)
-                except Exception as e:
-                    if attempt == max_retries - 1:
-                        raise
-                    logger.warning(f"Attempt {attempt + 1} failed for {func.__name__}: {e}")
-                    time.sleep(2 ** attempt)
-        return wrapper
-    return decorator
-
 # Import real implementations from utils
 sys.path.insert(0, str(current_dir.parent))
 try:
@@ -85,6 +72,40 @@ except ImportError as e:
             logger.warning("S3 upload not implemented - placeholder function")
             return {"success": False, "reason": "placeholder"}
 
+# Hierarchical rate limiting (global bytes, host, service, channel) with no-op fallback
+try:
+    from utils.rate_limiter import rate_limited, record_transfer
+except ImportError as e:
+    logger.warning(f"Rate limiter import failed, downloads are not rate limited: {e}")
+    from contextlib import contextmanager
+    
+    @contextmanager
+    def rate_limited(service, tokens=1, timeout=60.0, channel=None, host=None):
+        """Rate limiter unavailable (no-op)."""
+        yield None
+    
+    def record_transfer(nbytes):
+        """Rate limiter unavailable (no-op)."""
+        pass
+
+# Stage tracing spans with no-op fallback
+try:
+    from utils.tracing import start_span
+except ImportError as e:
+    logger.warning(f"Tracing import failed, downloads are not traced: {e}")
+    from contextlib import nullcontext
+    
+    class _NoopSpan(nullcontext):
+        def set_attribute(self, key, value):
+            pass
+        
+        def end(self, error=None, status=None):
+            pass
+    
+    def start_span(name, parent=None, **attributes):
+        """Tracing unavailable (no-op)."""
+        return _NoopSpan()
+
 # Import database schema with fallback
 try:
     from .database_schema import VideoRecord
@@ -139,6 +160,14 @@ class DownloadResult:
             )
 
 
+class DownloadAttemptError(RuntimeError):
+    """A scheduled download attempt failed; carries its failed DownloadResult."""
+    
+    def __init__(self, result: DownloadResult):
+        super().__init__(result.error_message or f"Download failed: {result.video_id}")
+        self.result = result
+
+
 class DownloadIntegration:
     """
     Integrate existing download infrastructure with mass download coordinator.
@@ -227,12 +256,18 @@ class DownloadIntegration:
                         f"Error: {e}"
                     )
     
-    def download_video(self, video_record: VideoRecord) -> DownloadResult:
+    def download_video(self, video_record: VideoRecord, channel_url: Optional[str] = None,
+                       max_attempts: int = 3) -> DownloadResult:
         """
         Download a single video using the configured mode.
         
+        The download holds a YouTube rate limit grant at every level (global
+        bytes, host, service and - if channel_url is given - channel).
+        
         Args:
             video_record: VideoRecord with video metadata
+            channel_url: Channel the video belongs to (per-channel rate limit)
+            max_attempts: yt-dlp attempts per step (1 when a scheduler retries the download)
             
         Returns:
             DownloadResult with download details
@@ -242,34 +277,44 @@ class DownloadIntegration:
         
         logger.info(f"Starting download for video: {video_record.video_id} ({video_record.title})")
         
-        try:
-            # Choose download strategy based on mode
-            if self.download_mode == DownloadMode.STREAM_TO_S3:
-                return self._stream_to_s3(video_record, video_url, start_time)
-                
-            elif self.download_mode == DownloadMode.LOCAL_THEN_UPLOAD:
-                return self._download_then_upload(video_record, video_url, start_time)
-                
-            elif self.download_mode == DownloadMode.LOCAL_ONLY:
-                return self._download_local_only(video_record, video_url, start_time)
+        with start_span("video", video_id=video_record.video_id, mode=self.download_mode.value) as video_span:
+            try:
+                wait_span = start_span("rate_limit.wait")
+                with rate_limited("youtube", timeout=300.0, channel=channel_url, host="youtube.com") as binding:
+                    wait_span.set_attribute("binding", binding)
+                    wait_span.end()
+                    if binding:
+                        logger.debug(f"Download of {video_record.video_id} was held back by the {binding} rate limit")
+                    
+                    # Choose download strategy based on mode
+                    if self.download_mode == DownloadMode.STREAM_TO_S3:
+                        return self._stream_to_s3(video_record, video_url, start_time)
+                        
+                    elif self.download_mode == DownloadMode.LOCAL_THEN_UPLOAD:
+                        return self._download_then_upload(video_record, video_url, start_time, max_attempts)
+                        
+                    elif self.download_mode == DownloadMode.LOCAL_ONLY:
+                        return self._download_local_only(video_record, video_url, start_time, max_attempts)
+                        
+                    else:
+                        raise ValueError(f"Unsupported download mode: {self.download_mode}")
+                    
+            except Exception as e:
+                duration = time.time() - start_time
+                error_msg = str(e)
                 
-            else:
-                raise ValueError(f"Unsupported download mode: {self.download_mode}")
+                logger.error(f"Download failed for video {video_record.video_id}: {error_msg}")
+                wait_span.end(error=e)
+                video_span.end(error=e)
                 
-        except Exception as e:
-            duration = time.time() - start_time
-            error_msg = str(e)
-            
-            logger.error(f"Download failed for video {video_record.video_id}: {error_msg}")
-            
-            return DownloadResult(
-                video_id=video_record.video_id,
-                video_uuid=video_record.uuid,
-                status="failed",
-                download_duration_seconds=duration,
-                error_message=error_msg,
-                download_mode=self.download_mode
-            )
+                return DownloadResult(
+                    video_id=video_record.video_id,
+                    video_uuid=video_record.uuid,
+                    status="failed",
+                    download_duration_seconds=duration,
+                    error_message=error_msg,
+                    download_mode=self.download_mode
+                )
     
     def _stream_to_s3(self, video_record: VideoRecord, video_url: str, start_time: float) -> DownloadResult:
         """
@@ -301,6 +346,7 @@ class DownloadIntegration:
             
             if result and result.success:
                 logger.info(f"Successfully streamed video {video_record.video_id} to S3 in {duration:.1f}s")
+                record_transfer(result.file_size or 0)
                 
                 return DownloadResult(
                     video_id=video_record.video_id,
@@ -318,7 +364,42 @@ class DownloadIntegration:
         except Exception as e:
             raise RuntimeError(f"Stream to S3 failed: {e}") from e
     
-    def _download_then_upload(self, video_record: VideoRecord, video_url: str, start_time: float) -> DownloadResult:
+    def _fetch_video(self, video_record: VideoRecord, video_url: str, download_dir: Path,
+                     max_attempts: int) -> str:
+        """
+        Download a video with yt-dlp and move it (and its transcript) into download_dir.
+        
+        download_single_video always writes to the shared downloads directory
+        and returns (video_file, transcript_file), either of which may be None.
+        
+        Returns:
+            Path of the downloaded video inside download_dir
+        """
+        video_file, transcript_file = download_single_video(
+            video_url,
+            video_id=video_record.video_id,
+            title=video_record.title,
+            resolution=self.download_resolution,
+            output_format=self.download_format,
+            max_attempts=max_attempts
+        ) or (None, None)
+        
+        if not video_file or not Path(video_file).exists():
+            raise RuntimeError(f"Local download failed: no video file for {video_record.video_id}")
+        
+        files = [Path(video_file)]
+        if transcript_file and self.download_subtitles:
+            files.append(Path(transcript_file))
+        
+        for source in files:
+            target = download_dir / source.name
+            if source.resolve() != target.resolve():
+                shutil.move(str(source), str(target))
+        
+        return str(download_dir / files[0].name)
+    
+    def _download_then_upload(self, video_record: VideoRecord, video_url: str, start_time: float,
+                              max_attempts: int = 3) -> DownloadResult:
         """
         Download video locally first, then upload to S3.
         
@@ -326,6 +407,7 @@ class DownloadIntegration:
             video_record: Video metadata
             video_url: YouTube video URL
             start_time: Download start timestamp
+            max_attempts: yt-dlp attempts per step
             
         Returns:
             DownloadResult with download and upload details
@@ -340,21 +422,8 @@ class DownloadIntegration:
             # Download video locally
             logger.info(f"Downloading video {video_record.video_id} locally first")
             
-            download_result = download_single_video(
-                video_url=video_url,
-                output_dir=str(download_dir),
-                resolution=self.download_resolution,
-                format_type=self.download_format,
-                download_transcript=self.download_subtitles
-            )
-            
-            if not download_result or not download_result.get("success"):
-                error_msg = download_result.get("error", "Unknown download error") if download_result else "Download failed"
-                raise RuntimeError(f"Local download failed: {error_msg}")
-            
-            local_path = download_result.get("video_path")
-            if not local_path or not Path(local_path).exists():
-                raise RuntimeError(f"Downloaded file not found: {local_path}")
+            with start_span("yt_dlp.download"):
+                local_path = self._fetch_video(video_record, video_url, download_dir, max_attempts)
             
             file_size = Path(local_path).stat().st_size
             
@@ -424,7 +493,8 @@ class DownloadIntegration:
                     
             raise RuntimeError(f"Download then upload failed: {e}") from e
     
-    def _download_local_only(self, video_record: VideoRecord, video_url: str, start_time: float) -> DownloadResult:
+    def _download_local_only(self, video_record: VideoRecord, video_url: str, start_time: float,
+                             max_attempts: int = 3) -> DownloadResult:
         """
         Download video locally only (for testing).
         
@@ -432,6 +502,7 @@ class DownloadIntegration:
             video_record: Video metadata
             video_url: YouTube video URL
             start_time: Download start timestamp
+            max_attempts: yt-dlp attempts per step
             
         Returns:
             DownloadResult with local download details
@@ -443,21 +514,8 @@ class DownloadIntegration:
             
             logger.info(f"Downloading video {video_record.video_id} locally only")
             
-            download_result = download_single_video(
-                video_url=video_url,
-                output_dir=str(download_dir),
-                resolution=self.download_resolution,
-                format_type=self.download_format,
-                download_transcript=self.download_subtitles
-            )
-            
-            if not download_result or not download_result.get("success"):
-                error_msg = download_result.get("error", "Unknown download error") if download_result else "Download failed"
-                raise RuntimeError(f"Local download failed: {error_msg}")
-            
-            local_path = download_result.get("video_path")
-            if not local_path or not Path(local_path).exists():
-                raise RuntimeError(f"Downloaded file not found: {local_path}")
+            with start_span("yt_dlp.download"):
+                local_path = self._fetch_video(video_record, video_url, download_dir, max_attempts)
             
             file_size = Path(local_path).stat().st_size
             duration = time.time() - start_time
@@ -477,17 +535,29 @@ class DownloadIntegration:
         except Exception as e:
             raise RuntimeError(f"Local download failed: {e}") from e
     
-    def batch_download(self, video_records: List[VideoRecord], max_concurrent: int = 3) -> List[DownloadResult]:
+    def batch_download(self, video_records: List[VideoRecord], max_concurrent: int = 3,
+                       channel_url: Optional[str] = None, scheduler: Optional[Any] = None,
+                       max_retries: int = 0) -> List[DownloadResult]:
         """
         Download multiple videos with concurrency control.
         
+        With a scheduler (a started ConcurrentProcessor) each video is a download
+        task: a failed attempt waits in the scheduler's delayed retry queue
+        instead of sleeping in a worker, and yt-dlp runs without its own retries.
+        
         Args:
             video_records: List of VideoRecord objects to download
             max_concurrent: Maximum concurrent downloads
+            channel_url: Channel the videos belong to (per-channel rate limit)
+            scheduler: ConcurrentProcessor to run and retry the downloads on
+            max_retries: Failed attempts the scheduler reschedules per video
             
         Returns:
             List of DownloadResult objects
         """
+        if scheduler is not None:
+            return self._scheduled_batch_download(video_records, channel_url, scheduler, max_retries)
+        
         # TODO: Implement concurrent downloading in Phase 4.10
         # For now, download sequentially
         results = []
@@ -495,20 +565,74 @@ class DownloadIntegration:
         for i, video_record in enumerate(video_records):
             logger.info(f"Processing video {i+1}/{len(video_records)}: {video_record.video_id}")
             
-            result = self.download_video(video_record)
+            result = self.download_video(video_record, channel_url=channel_url)
             results.append(result)
-            
-            # Update video record status
-            if result.status == "completed":
-                video_record.download_status = "completed"
-                video_record.s3_path = result.s3_path
-                video_record.file_size = result.file_size
-            elif result.status == "failed":
-                video_record.download_status = "failed"
-                video_record.error_message = result.error_message
+            self._apply_result(video_record, result)
         
         return results
     
+    def _scheduled_batch_download(self, video_records: List[VideoRecord], channel_url: Optional[str],
+                                  scheduler: Any, max_retries: int) -> List[DownloadResult]:
+        """
+        Run each download as a scheduler task, retried from its delayed queue.
+        
+        The scheduler only dispatches while the youtube circuit breaker allows
+        it, so every attempt reports its outcome back to that breaker - a
+        half-open breaker needs those results to close (or reopen) and to free
+        its probe slots.
+        """
+        circuit_breakers = getattr(scheduler, "circuit_breakers", None)
+        
+        def attempt(video_record):
+            tracker = circuit_breakers("youtube").track() if circuit_breakers else nullcontext()
+            with tracker:
+                result = self.download_video(video_record, channel_url=channel_url, max_attempts=1)
+                if result.status == "failed":
+                    raise DownloadAttemptError(result)
+            return result
+        
+        futures = [
+            scheduler.submit_download_task(
+                f"download_{video_record.video_id}",
+                attempt,
+                video_record,
+                service="youtube",
+                max_retries=max_retries,
+                retry_on=(DownloadAttemptError,)
+            )
+            for video_record in video_records
+        ]
+        
+        results = []
+        for video_record, future in zip(video_records, futures):
+            try:
+                result = future.result()
+            except DownloadAttemptError as e:
+                result = e.result
+            except Exception as e:
+                # Cancelled, or the scheduler stopped while the download waited to retry
+                result = DownloadResult(
+                    video_id=video_record.video_id,
+                    video_uuid=video_record.uuid,
+                    status="failed",
+                    error_message=str(e) or type(e).__name__,
+                    download_mode=self.download_mode
+                )
+            results.append(result)
+            self._apply_result(video_record, result)
+        
+        return results
+    
+    def _apply_result(self, video_record: VideoRecord, result: DownloadResult):
+        """Update a video record's status from its download result."""
+        if result.status == "completed":
+            video_record.download_status = "completed"
+            video_record.s3_path = result.s3_path
+            video_record.file_size = result.file_size
+        elif result.status == "failed":
+            video_record.download_status = "failed"
+            video_record.error_message = result.error_message
+    
     def get_download_stats(self, results: List[DownloadResult]) -> Dict[str, Any]:
         """
         Calculate download statistics from results.
@@ -18,16 +18,23 @@ Implements fail-fast, fail-loud, fail-safely principles throughout.
 import os
 import sys
 import time
+import re
 import json
 import pickle
+import zlib
+import struct
+import sqlite3
+import heapq
+import itertools
 import logging
-from typing import Dict, List, Any, Optional, Callable, TypeVar, Generic, Tuple
+from typing import Dict, List, Any, Optional, Callable, TypeVar, Generic, Tuple, Set
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
 from enum import Enum
 import threading
-from collections import deque
+from collections import deque, OrderedDict
+from contextlib import contextmanager
 import random
 
 # Add parent directory to path for imports
@@ -37,6 +44,7 @@ sys.path.insert(0, str(current_dir.parent))
 
 # Import mass download logger
 from .logging_setup import get_mass_download_logger
+from utils.json_utils import open_journal_for_append
 
 # Configure logging
 logger = get_mass_download_logger(__name__)
@@ -74,6 +82,130 @@ class ErrorContext:
     additional_info: Dict[str, Any] = field(default_factory=dict)
 
 
+def _error_context_to_dict(error_context: ErrorContext) -> Dict[str, Any]:
+    return {
+        'error_type': error_context.error_type,
+        'error_message': error_context.error_message,
+        'timestamp': error_context.timestamp.isoformat(),
+        'operation': error_context.operation,
+        'retry_count': error_context.retry_count,
+        'recovery_strategy': error_context.recovery_strategy.value,
+        'additional_info': error_context.additional_info
+    }
+
+
+def _error_context_from_dict(error_dict: Dict[str, Any]) -> ErrorContext:
+    error_context = ErrorContext(
+        error_type=error_dict['error_type'],
+        error_message=error_dict['error_message'],
+        operation=error_dict.get('operation', ''),
+        retry_count=error_dict.get('retry_count', 0)
+    )
+    try:
+        if 'timestamp' in error_dict:
+            error_context.timestamp = datetime.fromisoformat(error_dict['timestamp'])
+        if 'recovery_strategy' in error_dict:
+            error_context.recovery_strategy = RecoveryStrategy(error_dict['recovery_strategy'])
+    except ValueError:
+        pass  # Older records stored these with str(); keep the defaults
+    if isinstance(error_dict.get('additional_info'), dict):
+        error_context.additional_info = error_dict['additional_info']
+    return error_context
+
+
+# Compact checkpoint format: magic + version byte, then a zlib body of three
+# length-prefixed sections - JSON header, newline-joined item IDs in enumeration
+# order, and a completion bitmap over that order (bit i set = item i completed).
+CHECKPOINT_MAGIC = b"RCKP"
+CHECKPOINT_FORMAT_VERSION = 1
+_CHECKPOINT_SECTIONS = struct.Struct(">III")
+
+
+def _pack_bitmap(flags: str) -> bytes:
+    """Pack a '0'/'1' flag string into a little-endian bitmap."""
+    if not flags:
+        return b""
+    return int(flags[::-1], 2).to_bytes((len(flags) + 7) // 8, "little")
+
+
+def _unpack_bitmap(bitmap: bytes, count: int) -> str:
+    """Expand a bitmap back into a '0'/'1' flag string of length count."""
+    flags = format(int.from_bytes(bitmap, "little"), "b")[::-1]
+    return flags.ljust(count, "0")[:count]
+
+
+def _join_ids(item_ids: List[str]) -> bytes:
+    joined = "\n".join(item_ids)
+    if item_ids and joined.count("\n") != len(item_ids) - 1:
+        raise ValueError("CHECKPOINT ERROR: Item IDs cannot contain newlines")
+    return joined.encode("utf-8")
+
+
+def _split_ids(data: bytes) -> List[str]:
+    return data.decode("utf-8").split("\n") if data else []
+
+
+def _pack_checkpoint(header: Dict[str, Any], order: List[str], flags: str) -> bytes:
+    header_bytes = json.dumps(header, default=str).encode("utf-8")
+    id_bytes = _join_ids(order)
+    bitmap = _pack_bitmap(flags)
+    body = (_CHECKPOINT_SECTIONS.pack(len(header_bytes), len(id_bytes), len(bitmap))
+            + header_bytes + id_bytes + bitmap)
+    return CHECKPOINT_MAGIC + bytes([CHECKPOINT_FORMAT_VERSION]) + zlib.compress(body, 1)
+
+
+def _unpack_checkpoint(payload: bytes) -> Tuple[Dict[str, Any], List[str], str]:
+    """Decode a compact checkpoint into (header, ID order, completion flags)."""
+    if len(payload) <= len(CHECKPOINT_MAGIC):
+        raise ValueError("CHECKPOINT ERROR: Truncated checkpoint payload")
+    version = payload[len(CHECKPOINT_MAGIC)]
+    if version != CHECKPOINT_FORMAT_VERSION:
+        raise ValueError(
+            f"CHECKPOINT ERROR: Unsupported checkpoint format version {version} "
+            f"(this build reads version {CHECKPOINT_FORMAT_VERSION})"
+        )
+    
+    try:
+        body = zlib.decompress(payload[len(CHECKPOINT_MAGIC) + 1:])
+        header_len, ids_len, bitmap_len = _CHECKPOINT_SECTIONS.unpack_from(body)
+        offset = _CHECKPOINT_SECTIONS.size
+        header = json.loads(body[offset:offset + header_len])
+        offset += header_len
+        order = _split_ids(body[offset:offset + ids_len])
+        offset += ids_len
+        flags = _unpack_bitmap(body[offset:offset + bitmap_len], len(order))
+    except (zlib.error, struct.error, ValueError) as e:
+        raise ValueError(f"CHECKPOINT ERROR: Corrupt checkpoint payload: {e}") from e
+    
+    return header, order, flags
+
+
+def _pack_delta(completed_items: List[str]) -> bytes:
+    return bytes([CHECKPOINT_FORMAT_VERSION]) + zlib.compress(_join_ids(completed_items), 1)
+
+
+def _apply_deltas(order: List[str], flags: str, deltas: List[bytes]) -> Tuple[List[str], str]:
+    """Mark the items completed by each delta record, in append order."""
+    index = {item_id: i for i, item_id in enumerate(order)}
+    order = list(order)
+    flag_list = list(flags)
+    
+    for delta in deltas:
+        if delta[0] != CHECKPOINT_FORMAT_VERSION:
+            raise ValueError(f"CHECKPOINT ERROR: Unsupported checkpoint delta version {delta[0]}")
+        for item_id in _split_ids(zlib.decompress(delta[1:])):
+            position = index.get(item_id)
+            if position is None:
+                # Completed outside the enumerated set - track it rather than drop it
+                index[item_id] = len(order)
+                order.append(item_id)
+                flag_list.append("1")
+            else:
+                flag_list[position] = "1"
+    
+    return order, "".join(flag_list)
+
+
 @dataclass
 class RecoveryCheckpoint:
     """Checkpoint for recovery operations."""
@@ -85,53 +217,368 @@ class RecoveryCheckpoint:
     pending_items: List[str]
     failed_items: List[Tuple[str, ErrorContext]]
     
+    def to_bytes(self) -> bytes:
+        """
+        Encode in the compact checkpoint format.
+        
+        Item IDs are stored once (completed, then pending) with a completion
+        bitmap over them; the rest of the checkpoint goes in a JSON header.
+        """
+        completed = list(dict.fromkeys(self.completed_items))
+        completed_set = set(completed)
+        order = completed + [item_id for item_id in dict.fromkeys(self.pending_items)
+                             if item_id not in completed_set]
+        flags = "1" * len(completed) + "0" * (len(order) - len(completed))
+        return _pack_checkpoint(self._header(), order, flags)
+    
+    @classmethod
+    def from_bytes(cls, payload: bytes, deltas: Optional[List[bytes]] = None) -> 'RecoveryCheckpoint':
+        """
+        Decode a checkpoint, applying any delta records appended since it was written.
+        
+        Payloads written before the compact format (pickles) are still accepted.
+        """
+        if not payload.startswith(CHECKPOINT_MAGIC):
+            checkpoint = pickle.loads(payload)
+            if not deltas:
+                return checkpoint
+            payload = checkpoint.to_bytes()
+        
+        header, order, flags = _unpack_checkpoint(payload)
+        if deltas:
+            order, flags = _apply_deltas(order, flags, deltas)
+        return cls._from_parts(header, order, flags)
+    
+    def _header(self) -> Dict[str, Any]:
+        return {
+            'checkpoint_id': self.checkpoint_id,
+            'operation': self.operation,
+            'timestamp': self.timestamp.isoformat(),
+            'state': self.state,
+            'failed_items': [[item_id, _error_context_to_dict(error_context)]
+                             for item_id, error_context in self.failed_items]
+        }
+    
+    @classmethod
+    def _from_parts(cls, header: Dict[str, Any], order: List[str], flags: str) -> 'RecoveryCheckpoint':
+        completed_items = []
+        pending_items = []
+        for item_id, flag in zip(order, flags):
+            (completed_items if flag == "1" else pending_items).append(item_id)
+        
+        return cls(
+            checkpoint_id=header['checkpoint_id'],
+            operation=header['operation'],
+            timestamp=datetime.fromisoformat(header['timestamp']),
+            state=header.get('state', {}),
+            completed_items=completed_items,
+            pending_items=pending_items,
+            failed_items=[(item_id, _error_context_from_dict(error_dict))
+                          for item_id, error_dict in header.get('failed_items', [])]
+        )
+    
     def save(self, checkpoint_dir: Path):
         """Save checkpoint to disk."""
         checkpoint_dir.mkdir(parents=True, exist_ok=True)
-        checkpoint_file = checkpoint_dir / f"{self.checkpoint_id}.pkl"
+        checkpoint_file = checkpoint_dir / f"{self.checkpoint_id}.ckpt"
+        temp_file = checkpoint_file.with_suffix(".ckpt.tmp")
         
-        with open(checkpoint_file, 'wb') as f:
-            pickle.dump(self, f)
+        with open(temp_file, 'wb') as f:
+            f.write(self.to_bytes())
+        os.replace(temp_file, checkpoint_file)
         
         logger.info(f"Saved checkpoint: {self.checkpoint_id}")
     
     @classmethod
     def load(cls, checkpoint_file: Path) -> 'RecoveryCheckpoint':
-        """Load checkpoint from disk."""
+        """Load checkpoint from disk (compact .ckpt or legacy pickled .pkl)."""
         with open(checkpoint_file, 'rb') as f:
-            checkpoint = pickle.load(f)
+            checkpoint = cls.from_bytes(f.read())
+        
+        logger.info(f"Loaded checkpoint: {checkpoint.checkpoint_id}")
+        return checkpoint
+
+
+class CheckpointStore:
+    """
+    Indexed checkpoint store: one latest checkpoint per key (e.g. channel URL).
+    
+    Checkpoints live in a single SQLite file keyed by their key, so finding the
+    latest checkpoint for a channel is an index lookup instead of a directory
+    glob plus a stat per match. Saving replaces the key's previous checkpoint
+    in one transaction (atomic replace), and each row carries an optional
+    expiry so stale checkpoints are dropped by a single indexed DELETE.
+    
+    Between full snapshots, progress is recorded as small delta records (the
+    items completed since the last one); every snapshot_every deltas they are
+    folded into a fresh snapshot so a load never replays a long tail.
+    """
+    
+    def __init__(self, db_path: Path, default_ttl: Optional[timedelta] = None,
+                 snapshot_every: int = 20):
+        """
+        Initialize checkpoint store.
+        
+        Args:
+            db_path: SQLite file holding the checkpoints
+            default_ttl: Expiry applied to checkpoints saved without their own TTL
+            snapshot_every: Delta records per key before they are folded into a new snapshot
+        """
+        if default_ttl is not None and default_ttl.total_seconds() <= 0:
+            raise ValueError(f"CHECKPOINT ERROR: default_ttl must be positive, got: {default_ttl}")
+        if snapshot_every < 1:
+            raise ValueError(f"CHECKPOINT ERROR: snapshot_every must be at least 1, got: {snapshot_every}")
+        
+        self.db_path = Path(db_path)
+        self.default_ttl = default_ttl
+        self.snapshot_every = snapshot_every
+        self._lock = threading.RLock()
+        
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_path), timeout=30.0, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            with self._conn:
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS checkpoints ("
+                    "key TEXT PRIMARY KEY, checkpoint_id TEXT NOT NULL UNIQUE, operation TEXT NOT NULL, "
+                    "created_at REAL NOT NULL, expires_at REAL, payload BLOB NOT NULL)"
+                )
+                self._conn.execute("CREATE INDEX IF NOT EXISTS checkpoints_created ON checkpoints (created_at)")
+                self._conn.execute("CREATE INDEX IF NOT EXISTS checkpoints_expires ON checkpoints (expires_at)")
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS checkpoint_deltas ("
+                    "key TEXT NOT NULL, seq INTEGER NOT NULL, payload BLOB NOT NULL, PRIMARY KEY (key, seq))"
+                )
+        except sqlite3.Error as e:
+            raise RuntimeError(
+                f"CHECKPOINT ERROR: Cannot open checkpoint store at {self.db_path}. Error: {e}"
+            ) from e
+    
+    def put(self, key: str, checkpoint: RecoveryCheckpoint, ttl: Optional[timedelta] = None):
+        """Save checkpoint as the latest for key, replacing any previous one atomically."""
+        if not key:
+            raise ValueError("CHECKPOINT ERROR: key is required")
+        
+        ttl = ttl or self.default_ttl
+        created_at = checkpoint.timestamp.timestamp()
+        expires_at = created_at + ttl.total_seconds() if ttl else None
+        payload = checkpoint.to_bytes()
+        
+        with self._lock, self._conn:
+            # A reused checkpoint_id under another key moves rather than duplicates
+            moved = self._conn.execute(
+                "SELECT key FROM checkpoints WHERE checkpoint_id = ? AND key != ?", (checkpoint.checkpoint_id, key)
+            ).fetchone()
+            if moved is not None:
+                self._conn.execute("DELETE FROM checkpoints WHERE key = ?", (moved[0],))
+                self._conn.execute("DELETE FROM checkpoint_deltas WHERE key = ?", (moved[0],))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO checkpoints "
+                "(key, checkpoint_id, operation, created_at, expires_at, payload) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, checkpoint.checkpoint_id, checkpoint.operation, created_at, expires_at, payload)
+            )
+            # A full snapshot supersedes every delta recorded against the old one
+            self._conn.execute("DELETE FROM checkpoint_deltas WHERE key = ?", (key,))
+        
+        logger.info(f"Saved checkpoint: {checkpoint.checkpoint_id}")
+    
+    def append_delta(self, key: str, completed_items: List[str], ttl: Optional[timedelta] = None) -> bool:
+        """
+        Record items completed since the key's last snapshot or delta.
+        
+        Also pushes the key's expiry out by ttl, since the work is still live.
+        
+        Returns:
+            False if key has no snapshot to append to (save a full checkpoint instead)
+        """
+        if not key:
+            raise ValueError("CHECKPOINT ERROR: key is required")
+        
+        payload = _pack_delta(completed_items)
+        ttl = ttl or self.default_ttl
+        
+        with self._lock, self._conn:
+            if self._conn.execute("SELECT 1 FROM checkpoints WHERE key = ?", (key,)).fetchone() is None:
+                return False
+            if not completed_items:
+                return True
+            
+            seq = self._conn.execute(
+                "SELECT COALESCE(MAX(seq), 0) + 1 FROM checkpoint_deltas WHERE key = ?", (key,)
+            ).fetchone()[0]
+            self._conn.execute(
+                "INSERT INTO checkpoint_deltas (key, seq, payload) VALUES (?, ?, ?)", (key, seq, payload)
+            )
+            if ttl:
+                self._conn.execute(
+                    "UPDATE checkpoints SET expires_at = ? WHERE key = ?", (time.time() + ttl.total_seconds(), key)
+                )
+            if seq >= self.snapshot_every:
+                self._fold_deltas(key)
+        
+        return True
+    
+    def get_latest(self, key: str) -> Optional[RecoveryCheckpoint]:
+        """Latest unexpired checkpoint for key (snapshot plus deltas), or None."""
+        return self._load_one(
+            "SELECT key, payload FROM checkpoints WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+            (key, time.time())
+        )
+    
+    def get(self, checkpoint_id: str) -> Optional[RecoveryCheckpoint]:
+        """Checkpoint by ID (expired or not), or None."""
+        return self._load_one("SELECT key, payload FROM checkpoints WHERE checkpoint_id = ?", (checkpoint_id,))
+    
+    def latest(self) -> Optional[RecoveryCheckpoint]:
+        """Most recently created checkpoint across all keys, or None."""
+        return self._load_one("SELECT key, payload FROM checkpoints ORDER BY created_at DESC LIMIT 1", ())
+    
+    def delete(self, key: str) -> bool:
+        """Remove the checkpoint for key."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM checkpoint_deltas WHERE key = ?", (key,))
+            return self._conn.execute("DELETE FROM checkpoints WHERE key = ?", (key,)).rowcount > 0
+    
+    def expire(self, older_than: Optional[datetime] = None) -> int:
+        """
+        Delete expired checkpoints, and optionally any created before older_than.
+        
+        Also sweeps deltas left without a snapshot (e.g. by a crash or an older
+        build); saves only touch their own key's deltas, so this is the one
+        place the whole delta table is scanned.
+        
+        Returns:
+            Number of checkpoints removed
+        """
+        now = time.time()
+        cutoff = older_than.timestamp() if older_than else float("-inf")
+        with self._lock, self._conn:
+            removed = self._conn.execute(
+                "DELETE FROM checkpoints WHERE expires_at <= ? OR created_at < ?", (now, cutoff)
+            ).rowcount
+            self._conn.execute("DELETE FROM checkpoint_deltas WHERE key NOT IN (SELECT key FROM checkpoints)")
+            return removed
+    
+    def list_ids(self) -> List[str]:
+        """IDs of all stored checkpoints, newest first."""
+        with self._lock:
+            rows = self._conn.execute("SELECT checkpoint_id FROM checkpoints ORDER BY created_at DESC").fetchall()
+        return [row[0] for row in rows]
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM checkpoints").fetchone()[0]
+    
+    def close(self):
+        """Close the store's database connection."""
+        with self._lock:
+            self._conn.close()
+    
+    def _load_one(self, query: str, params: Tuple) -> Optional[RecoveryCheckpoint]:
+        with self._lock:
+            row = self._conn.execute(query, params).fetchone()
+            if row is None:
+                return None
+            deltas = self._deltas(row[0])
         
+        checkpoint = RecoveryCheckpoint.from_bytes(row[1], deltas)
         logger.info(f"Loaded checkpoint: {checkpoint.checkpoint_id}")
         return checkpoint
+    
+    def _deltas(self, key: str) -> List[bytes]:
+        rows = self._conn.execute(
+            "SELECT payload FROM checkpoint_deltas WHERE key = ? ORDER BY seq", (key,)
+        ).fetchall()
+        return [row[0] for row in rows]
+    
+    def _fold_deltas(self, key: str):
+        """Rewrite key's snapshot with its deltas applied (caller holds the lock and transaction)."""
+        payload = self._conn.execute("SELECT payload FROM checkpoints WHERE key = ?", (key,)).fetchone()[0]
+        if not payload.startswith(CHECKPOINT_MAGIC):
+            payload = pickle.loads(payload).to_bytes()
+        
+        header, order, flags = _unpack_checkpoint(payload)
+        order, flags = _apply_deltas(order, flags, self._deltas(key))
+        self._conn.execute(
+            "UPDATE checkpoints SET payload = ? WHERE key = ?", (_pack_checkpoint(header, order, flags), key)
+        )
+        self._conn.execute("DELETE FROM checkpoint_deltas WHERE key = ?", (key,))
+    
+
+_URL_HOST_PATTERN = re.compile(r"https?://(?:[^@/\s]*@)?([^/:?#\s]+)", re.IGNORECASE)
+
+
+def circuit_breaker_key(name: str) -> str:
+    """
+    Breaker key for a service name or operation name.
+    
+    Names that embed a URL (e.g. "extract_channel_info_https://youtube.com/@x")
+    collapse to the URL's host, so every channel on a host shares one breaker.
+    """
+    match = _URL_HOST_PATTERN.search(name)
+    if not match:
+        return name
+    host = match.group(1).lower()
+    return host[4:] if host.startswith("www.") else host
 
 
 class CircuitBreaker:
     """
     Circuit breaker pattern implementation.
     
-    Prevents cascading failures by stopping calls to failing services.
+    Prevents cascading failures by stopping calls to failing services. The
+    circuit opens on the failure rate over a sliding time window rather than
+    a run of consecutive failures, so an intermittently failing service still
+    trips it while the odd error among many successes does not.
     """
     
     def __init__(self,
                  failure_threshold: int = 5,
                  recovery_timeout: timedelta = timedelta(minutes=1),
-                 success_threshold: int = 2):
+                 success_threshold: int = 2,
+                 failure_rate_threshold: float = 0.5,
+                 window: timedelta = timedelta(minutes=1),
+                 half_open_max_calls: int = 1):
         """
         Initialize circuit breaker.
         
         Args:
-            failure_threshold: Number of failures before opening circuit
+            failure_threshold: Minimum failures within the window before opening circuit
             recovery_timeout: Time to wait before trying half-open
             success_threshold: Successes needed to close circuit
+            failure_rate_threshold: Fraction of calls in the window that must fail to open circuit
+            window: Sliding window over which calls are counted
+            half_open_max_calls: Dispatches admitted while half-open (see allow_dispatch)
         """
+        if failure_threshold < 1:
+            raise ValueError(f"CIRCUIT BREAKER ERROR: failure_threshold must be at least 1, got: {failure_threshold}")
+        if not 0 < failure_rate_threshold <= 1:
+            raise ValueError(
+                f"CIRCUIT BREAKER ERROR: failure_rate_threshold must be in (0, 1], got: {failure_rate_threshold}"
+            )
+        if window.total_seconds() <= 0:
+            raise ValueError(f"CIRCUIT BREAKER ERROR: window must be positive, got: {window}")
+        if half_open_max_calls < 1:
+            raise ValueError(
+                f"CIRCUIT BREAKER ERROR: half_open_max_calls must be at least 1, got: {half_open_max_calls}"
+            )
+        
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
         self.success_threshold = success_threshold
+        self.failure_rate_threshold = failure_rate_threshold
+        self.window = window
+        self.half_open_max_calls = half_open_max_calls
         
         self._state = CircuitState.CLOSED
         self._failure_count = 0
         self._success_count = 0
         self._last_failure_time: Optional[datetime] = None
+        self._calls: deque = deque()  # (monotonic time, failed) within the window
+        self._window_failures = 0
+        self._half_open_admitted = 0
+        self._half_open_since = 0.0
         self._lock = threading.RLock()
     
     @property
@@ -145,6 +592,8 @@ class CircuitBreaker:
                     self._state = CircuitState.HALF_OPEN
                     self._failure_count = 0
                     self._success_count = 0
+                    self._half_open_admitted = 0
+                    self._half_open_since = time.monotonic()
                     logger.info("Circuit breaker transitioned to HALF_OPEN")
             
             return self._state
@@ -178,17 +627,99 @@ class CircuitBreaker:
             self._on_failure()
             raise
     
+    @contextmanager
+    def track(self):
+        """
+        Record the outcome of the block without gating it.
+        
+        For call sites whose dispatch is already gated by a scheduler (see
+        allow_dispatch): an exception counts as a failure and is re-raised.
+        """
+        try:
+            yield
+        except Exception:
+            self._on_failure()
+            raise
+        self._on_success()
+    
+    def allow_dispatch(self) -> float:
+        """
+        Ask whether a scheduler may dispatch work to this service now.
+        
+        Returns 0.0 if it may, otherwise the seconds to hold off before asking
+        again. While half-open only half_open_max_calls dispatches are admitted
+        as probes; if they report no outcome within recovery_timeout another
+        round is admitted, so the breaker cannot wedge half-open.
+        """
+        with self._lock:
+            state = self.state
+            if state == CircuitState.CLOSED:
+                return 0.0
+            
+            if state == CircuitState.OPEN:
+                elapsed = datetime.now() - self._last_failure_time
+                return max((self.recovery_timeout - elapsed).total_seconds(), 0.0) + 0.001
+            
+            now = time.monotonic()
+            probe_timeout = self.recovery_timeout.total_seconds()
+            if now - self._half_open_since > probe_timeout:
+                self._half_open_admitted = 0
+                self._half_open_since = now
+            if self._half_open_admitted < self.half_open_max_calls:
+                self._half_open_admitted += 1
+                return 0.0
+            # Probes in flight may close the circuit at any moment - check back soon
+            return min(max(probe_timeout - (now - self._half_open_since), 0.0) + 0.001, 1.0)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """State and sliding-window counts."""
+        with self._lock:
+            state = self.state
+            self._prune_window(time.monotonic())
+            calls = len(self._calls)
+            return {
+                'state': state.value,
+                'window_calls': calls,
+                'window_failures': self._window_failures,
+                'failure_rate': self._window_failures / calls if calls else 0.0
+            }
+    
+    def _record_call(self, failed: bool):
+        now = time.monotonic()
+        self._calls.append((now, failed))
+        if failed:
+            self._window_failures += 1
+        self._prune_window(now)
+    
+    def _prune_window(self, now: float):
+        horizon = now - self.window.total_seconds()
+        while self._calls and self._calls[0][0] < horizon:
+            _, failed = self._calls.popleft()
+            if failed:
+                self._window_failures -= 1
+    
+    def _reset_window(self):
+        self._calls.clear()
+        self._window_failures = 0
+    
+    def _release_probe(self):
+        """Free a half-open dispatch slot once its probe reports (caller holds lock)."""
+        if self._half_open_admitted:
+            self._half_open_admitted -= 1
+    
     def _on_success(self):
         """Handle successful call."""
         with self._lock:
             if self._state == CircuitState.HALF_OPEN:
+                self._release_probe()
                 self._success_count += 1
                 if self._success_count >= self.success_threshold:
                     self._state = CircuitState.CLOSED
                     self._failure_count = 0
+                    self._reset_window()
                     logger.info("Circuit breaker CLOSED - service recovered")
             elif self._state == CircuitState.CLOSED:
-                self._failure_count = 0
+                self._record_call(failed=False)
     
     def _on_failure(self):
         """Handle failed call."""
@@ -197,11 +728,17 @@ class CircuitBreaker:
             self._last_failure_time = datetime.now()
             
             if self._state == CircuitState.HALF_OPEN:
+                self._release_probe()
                 self._state = CircuitState.OPEN
                 logger.warning("Circuit breaker reopened due to failure in HALF_OPEN state")
-            elif self._failure_count >= self.failure_threshold:
-                self._state = CircuitState.OPEN
-                logger.error(f"Circuit breaker OPEN after {self._failure_count} failures")
+            elif self._state == CircuitState.CLOSED:
+                self._record_call(failed=True)
+                failure_rate = self._window_failures / len(self._calls)
+                if (self._window_failures >= self.failure_threshold and
+                        failure_rate >= self.failure_rate_threshold):
+                    self._state = CircuitState.OPEN
+                    logger.error(f"Circuit breaker OPEN after {self._window_failures} failures "
+                                 f"({failure_rate:.0%} of calls) in the last {self.window.total_seconds():.0f}s")
 
 
 class RetryManager:
@@ -251,6 +788,10 @@ class RetryManager:
         """
         Execute function with retry logic.
         
+        Sleeps in the calling thread between attempts; work run on a
+        ConcurrentProcessor should be submitted with max_retries instead, so
+        retries wait in its DelayedRetryQueue rather than holding a worker.
+        
         Args:
             func: Function to execute
             should_retry: Function to determine if retry is appropriate
@@ -289,6 +830,167 @@ class RetryManager:
         raise last_exception
 
 
+@dataclass
+class RetryState:
+    """Persisted retry bookkeeping for one task."""
+    key: str
+    attempt: int          # Failed attempts so far
+    not_before: float     # Earliest next attempt (epoch seconds)
+    last_error: str = ""
+
+
+class DelayedRetryQueue:
+    """
+    Time-ordered queue of tasks waiting for their next attempt.
+    
+    Tasks sit in a heap ordered by not-before time and are run by a single
+    timer thread when due, so no worker thread sleeps between attempts. A task
+    here should be a cheap hand-off (e.g. resubmitting to a pool), not the work
+    itself. With state_path, retry counts and next-attempt times are kept in
+    SQLite so a restarted run resumes each task's backoff instead of starting
+    it over.
+    """
+    
+    def __init__(self, state_path: Optional[Path] = None):
+        """
+        Initialize delayed retry queue.
+        
+        Args:
+            state_path: SQLite file for retry state (None = in memory only)
+        """
+        self._heap: List[Tuple[float, int, str, Callable[[], Any]]] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self._states: Dict[str, RetryState] = {}
+        self._conn: Optional[sqlite3.Connection] = None
+        self.state_path = Path(state_path) if state_path else None
+        
+        if self.state_path:
+            try:
+                self.state_path.parent.mkdir(parents=True, exist_ok=True)
+                self._conn = sqlite3.connect(str(self.state_path), timeout=30.0, check_same_thread=False)
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                with self._conn:
+                    self._conn.execute(
+                        "CREATE TABLE IF NOT EXISTS retry_state ("
+                        "key TEXT PRIMARY KEY, attempt INTEGER NOT NULL, not_before REAL NOT NULL, last_error TEXT)"
+                    )
+                for key, attempt, not_before, last_error in self._conn.execute(
+                        "SELECT key, attempt, not_before, last_error FROM retry_state"):
+                    self._states[key] = RetryState(key, attempt, not_before, last_error or "")
+            except sqlite3.Error as e:
+                raise RuntimeError(
+                    f"RETRY QUEUE ERROR: Cannot open retry state at {self.state_path}. Error: {e}"
+                ) from e
+            
+            if self._states:
+                logger.info(f"Loaded retry state for {len(self._states)} tasks")
+    
+    def schedule(self,
+                 key: str,
+                 task: Callable[[], Any],
+                 delay: float,
+                 attempt: Optional[int] = None,
+                 error: Optional[str] = None):
+        """
+        Run task after delay seconds.
+        
+        Args:
+            key: Task identifier
+            task: Callable run on the timer thread when due
+            delay: Seconds from now
+            attempt: Failed attempts so far; when given, the retry state is persisted
+            error: Error from the last attempt, kept with the retry state
+        """
+        delay = max(delay, 0.0)
+        if attempt is not None:
+            self._save_state(RetryState(key, attempt, time.time() + delay, error or ""))
+        
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("RETRY QUEUE ERROR: Cannot schedule on a closed queue")
+            heapq.heappush(self._heap, (time.monotonic() + delay, next(self._sequence), key, task))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="delayed-retry-queue", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+    
+    def get_state(self, key: str) -> Optional[RetryState]:
+        """Retry state for key (possibly from a previous run), or None."""
+        with self._condition:
+            return self._states.get(key)
+    
+    def pending_state(self) -> List[RetryState]:
+        """All retry state, soonest next attempt first."""
+        with self._condition:
+            return sorted(self._states.values(), key=lambda state: state.not_before)
+    
+    def clear(self, key: str):
+        """Forget key's retry state (it succeeded or gave up)."""
+        with self._condition:
+            if self._states.pop(key, None) is None:
+                return
+            if self._conn is not None:
+                with self._conn:
+                    self._conn.execute("DELETE FROM retry_state WHERE key = ?", (key,))
+    
+    def drain(self) -> List[Callable[[], Any]]:
+        """Remove and return every waiting task without running it (retry state is kept)."""
+        with self._condition:
+            tasks = [entry[3] for entry in sorted(self._heap)]
+            self._heap.clear()
+            return tasks
+    
+    def __len__(self) -> int:
+        with self._condition:
+            return len(self._heap)
+    
+    def close(self):
+        """Stop the timer thread; waiting tasks are dropped but their retry state is kept."""
+        with self._condition:
+            self._closed = True
+            self._heap.clear()
+            self._condition.notify()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout=5.0)
+        if self._conn is not None:
+            self._conn.close()
+    
+    def _save_state(self, state: RetryState):
+        with self._condition:
+            self._states[state.key] = state
+            if self._conn is not None:
+                with self._conn:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO retry_state (key, attempt, not_before, last_error) "
+                        "VALUES (?, ?, ?, ?)",
+                        (state.key, state.attempt, state.not_before, state.last_error)
+                    )
+    
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._closed:
+                    if self._heap:
+                        wait = self._heap[0][0] - time.monotonic()
+                        if wait <= 0:
+                            break
+                        self._condition.wait(timeout=wait)
+                    else:
+                        self._condition.wait()
+                if self._closed:
+                    return
+                _, _, key, task = heapq.heappop(self._heap)
+            
+            try:
+                task()
+            except Exception as e:
+                logger.error(f"Delayed task {key} failed to run: {e}")
+
+
 class TransactionManager:
     """
     Manage transaction-like operations with rollback capability.
@@ -364,48 +1066,78 @@ class TransactionManager:
 class DeadLetterQueue(Generic[T]):
     """
     Queue for items that failed processing after all retries.
+    
+    When persisted, the queue is an append-only JSONL journal: every add and
+    removal is one appended line, so add() costs the same no matter how many
+    items are queued. Only the ids of live entries (plus any items that cannot
+    be represented in JSON, such as callables) are kept in memory. The journal
+    is compacted - rewritten with just the live entries - once dead records
+    outnumber live ones and exceed compact_threshold, keeping compaction
+    amortized O(1) per operation.
     """
     
-    def __init__(self, max_size: int = 1000, persist_path: Optional[Path] = None):
+    def __init__(self, max_size: int = 1000, persist_path: Optional[Path] = None,
+                 compact_threshold: int = 1000):
         """
         Initialize dead letter queue.
         
         Args:
             max_size: Maximum queue size
-            persist_path: Optional path to persist queue
+            persist_path: Optional path to persist queue (JSONL journal)
+            compact_threshold: Minimum dead journal records before compaction
         """
+        if max_size <= 0:
+            raise ValueError(f"DLQ ERROR: max_size must be positive, got: {max_size}")
+        if compact_threshold <= 0:
+            raise ValueError(f"DLQ ERROR: compact_threshold must be positive, got: {compact_threshold}")
+        
         self.max_size = max_size
-        self.persist_path = persist_path
-        self._queue: deque = deque(maxlen=max_size)
+        self.persist_path = Path(persist_path) if persist_path else None
+        self.compact_threshold = compact_threshold
+        self._queue: deque = deque(maxlen=max_size)  # in-memory mode only
         self._lock = threading.RLock()
         
+        # Journal mode state
+        self._live: "OrderedDict[int, None]" = OrderedDict()
+        self._unserializable: Dict[int, Any] = {}
+        self._next_id = 0
+        self._journal_records = 0
+        self._journal = None
+        self._retrying: Set[int] = set()  # ids claimed by an in-progress retry_all pass
+        
         # Load persisted items if path provided
-        if persist_path and persist_path.exists():
+        if self.persist_path:
             self._load()
     
     def add(self, item: T, error_context: ErrorContext):
         """Add failed item to queue."""
         with self._lock:
-            self._queue.append({
-                'item': item,
-                'error_context': error_context,
-                'queued_at': datetime.now()
-            })
-            
-            if self.persist_path:
-                self._save()
-            
+            self._add_locked(item, error_context, datetime.now())
             logger.warning(f"Added item to dead letter queue: {error_context.operation}")
     
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._live) if self.persist_path else len(self._queue)
+    
     def get_all(self) -> List[Dict[str, Any]]:
         """Get all items in queue."""
-        with self._lock:
-            return list(self._queue)
+        if not self.persist_path:
+            with self._lock:
+                return list(self._queue)
+        
+        return [entry for _, entry in self._iter_live_entries()]
     
     def retry_all(self, processor: Callable[[T], Any]) -> Tuple[int, int]:
         """
         Retry all items in queue.
         
+        Persisted queues are streamed from the journal one entry at a time
+        rather than loaded up front; items that fail again are re-queued at
+        the end and are not retried twice in the same pass. An entry's
+        removal is journaled only once its retry has succeeded (a failed one
+        is re-appended before the old entry is dropped), so a crash mid-pass
+        never loses an item - at worst it is retried again.
+        
         Args:
             processor: Function to process items
             
@@ -415,70 +1147,227 @@ class DeadLetterQueue(Generic[T]):
         successful = 0
         failed = 0
         
-        with self._lock:
-            items = list(self._queue)
-            self._queue.clear()
+        if self.persist_path:
+            entries = self._iter_live_entries()
+        else:
+            with self._lock:
+                entries = [(None, item_data) for item_data in self._queue]
+                self._queue.clear()
         
-        for item_data in items:
+        for entry_id, item_data in entries:
+            if entry_id is not None:
+                with self._lock:
+                    if entry_id not in self._live or entry_id in self._retrying:
+                        continue  # Removed, evicted or claimed by another pass
+                    self._retrying.add(entry_id)
+            
             try:
                 processor(item_data['item'])
                 successful += 1
+                if entry_id is not None:
+                    with self._lock:
+                        if entry_id in self._live:
+                            self._remove_locked(entry_id)
             except Exception as e:
                 failed += 1
                 # Re-add to queue with updated error
                 error_context = item_data['error_context']
                 error_context.retry_count += 1
                 error_context.error_message = str(e)
-                self.add(item_data['item'], error_context)
+                with self._lock:
+                    self.add(item_data['item'], error_context)
+                    if entry_id is not None and entry_id in self._live:
+                        self._remove_locked(entry_id)
+            finally:
+                if entry_id is not None:
+                    with self._lock:
+                        self._retrying.discard(entry_id)
         
         logger.info(f"Dead letter retry: {successful} successful, {failed} failed")
         return successful, failed
     
-    def _save(self):
-        """Persist queue to disk."""
+    def compact(self):
+        """Rewrite the journal with only live entries."""
         if not self.persist_path:
             return
         
-        self.persist_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(self.persist_path, 'w') as f:
-            json.dump(
-                [{'item': item['item'], 
-                  'error': item['error_context'].__dict__,
-                  'queued_at': item['queued_at'].isoformat()}
-                 for item in self._queue],
-                f,
-                default=str
-            )
+        with self._lock:
+            self._journal.flush()
+            temp_path = self.persist_path.with_name(self.persist_path.name + ".compact")
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                for entry_id, record in self._iter_live_records(self.persist_path.stat().st_size):
+                    f.write(record)
+                f.flush()
+                os.fsync(f.fileno())
+            
+            self._journal.close()
+            os.replace(temp_path, self.persist_path)
+            self._journal = open(self.persist_path, 'a', encoding='utf-8')
+            self._journal_records = len(self._live)
+            logger.debug(f"Compacted dead letter journal to {len(self._live)} entries")
     
-    def _load(self):
-        """Load queue from disk."""
-        if not self.persist_path or not self.persist_path.exists():
+    def close(self):
+        """Close the journal file."""
+        with self._lock:
+            if self._journal:
+                self._journal.close()
+                self._journal = None
+    
+    def _add_locked(self, item: T, error_context: ErrorContext, queued_at: datetime):
+        """Append an entry (caller holds lock)."""
+        if not self.persist_path:
+            self._queue.append({
+                'item': item,
+                'error_context': error_context,
+                'queued_at': queued_at
+            })
             return
         
+        entry_id = self._next_id
+        self._next_id += 1
+        record = {
+            'op': 'add',
+            'id': entry_id,
+            'item': item,
+            'error': _error_context_to_dict(error_context),
+            'queued_at': queued_at.isoformat()
+        }
         try:
-            with open(self.persist_path, 'r') as f:
-                data = json.load(f)
-                
-            for item_data in data:
-                error_dict = item_data['error']
-                error_context = ErrorContext(
-                    error_type=error_dict['error_type'],
-                    error_message=error_dict['error_message'],
-                    operation=error_dict.get('operation', ''),
-                    retry_count=error_dict.get('retry_count', 0)
-                )
+            line = json.dumps(record)
+        except (TypeError, ValueError):
+            # Keep the real object for this process; the journal gets its string form
+            self._unserializable[entry_id] = item
+            line = json.dumps(record, default=str)
+        
+        self._append(line)
+        self._live[entry_id] = None
+        if len(self._live) > self.max_size:
+            # Journal the eviction so replay doesn't depend on max_size
+            self._remove_locked(next(iter(self._live)))
+        else:
+            self._maybe_compact()
+    
+    def _remove_locked(self, entry_id: int):
+        """Journal removal of a live entry (caller holds lock)."""
+        del self._live[entry_id]
+        self._unserializable.pop(entry_id, None)
+        self._append(json.dumps({'op': 'remove', 'id': entry_id}))
+        self._maybe_compact()
+    
+    def _append(self, line: str):
+        self._journal.write(line + "\n")
+        self._journal.flush()
+        self._journal_records += 1
+    
+    def _maybe_compact(self):
+        dead_records = self._journal_records - len(self._live)
+        if dead_records >= self.compact_threshold and dead_records > len(self._live):
+            self.compact()
+    
+    def _iter_live_records(self, end_offset: int):
+        """Yield (id, raw line) for live add records up to end_offset (caller holds lock)."""
+        with open(self.persist_path, 'r', encoding='utf-8') as f:
+            while f.tell() < end_offset:
+                line = f.readline()
+                if not line:
+                    break
+                record = self._parse_record(line)
+                if record and record['op'] == 'add' and record['id'] in self._live:
+                    yield record['id'], line
+    
+    def _iter_live_entries(self):
+        """
+        Stream (id, entry) for live entries from the journal.
+        
+        Only records written before the call are read, so entries appended
+        while iterating (e.g. re-queued retries) are not revisited.
+        """
+        with self._lock:
+            self._journal.flush()
+            end_offset = self.persist_path.stat().st_size
+        
+        # A concurrent compaction replaces the file; reading the old inode stays consistent
+        with open(self.persist_path, 'r', encoding='utf-8') as f:
+            while f.tell() < end_offset:
+                line = f.readline()
+                if not line:
+                    break
+                record = self._parse_record(line)
+                if not record or record['op'] != 'add':
+                    continue
                 
-                self._queue.append({
-                    'item': item_data['item'],
-                    'error_context': error_context,
-                    'queued_at': datetime.fromisoformat(item_data['queued_at'])
-                })
+                entry_id = record['id']
+                with self._lock:
+                    if entry_id not in self._live:
+                        continue
+                    item = self._unserializable.get(entry_id, record['item'])
                 
-            logger.info(f"Loaded {len(self._queue)} items from dead letter queue")
-            
-        except Exception as e:
-            logger.error(f"Failed to load dead letter queue: {e}")
+                yield entry_id, {
+                    'item': item,
+                    'error_context': _error_context_from_dict(record['error']),
+                    'queued_at': datetime.fromisoformat(record['queued_at'])
+                }
+    
+    @staticmethod
+    def _parse_record(line: str) -> Optional[Dict[str, Any]]:
+        try:
+            return json.loads(line)
+        except json.JSONDecodeError:
+            # A torn final line from a crash mid-write - everything before it is intact
+            logger.warning("Skipping corrupt dead letter journal record")
+            return None
+    
+    def _load(self):
+        """Replay the journal (or import a legacy JSON array file) and open it for appending."""
+        self.persist_path.parent.mkdir(parents=True, exist_ok=True)
+        legacy_items = None
+        
+        if self.persist_path.exists():
+            try:
+                with open(self.persist_path, 'r', encoding='utf-8') as f:
+                    first_char = f.read(1)
+                    f.seek(0)
+                    if first_char == '[':
+                        legacy_items = json.load(f)
+                    else:
+                        for line in f:
+                            record = self._parse_record(line)
+                            if not record:
+                                continue
+                            self._journal_records += 1
+                            entry_id = record['id']
+                            self._next_id = max(self._next_id, entry_id + 1)
+                            if record['op'] == 'add':
+                                self._live[entry_id] = None
+                                if len(self._live) > self.max_size:
+                                    self._live.popitem(last=False)
+                            else:
+                                self._live.pop(entry_id, None)
+            except Exception as e:
+                logger.error(f"Failed to load dead letter queue: {e}")
+        
+        if legacy_items is not None:
+            # Pre-journal format: build the journal beside it, then swap it in
+            temp_path = self.persist_path.with_name(self.persist_path.name + ".convert")
+            self._journal = open(temp_path, 'w', encoding='utf-8')
+            # The legacy queue was capped at max_size, so nothing is evicted (or compacted) here
+            for item_data in legacy_items[-self.max_size:]:
+                self._add_locked(
+                    item_data['item'],
+                    _error_context_from_dict(item_data['error']),
+                    datetime.fromisoformat(item_data['queued_at'])
+                )
+            self._journal.flush()
+            os.fsync(self._journal.fileno())
+            self._journal.close()
+            os.replace(temp_path, self.persist_path)
+            logger.info(f"Converted legacy dead letter queue file to journal: {self.persist_path}")
+        
+        # Appending after a torn last line would corrupt the next record too
+        self._journal = open_journal_for_append(self.persist_path)
+        
+        if self._live:
+            logger.info(f"Loaded {len(self._live)} items from dead letter queue")
 
 
 class ErrorRecoveryManager:
@@ -488,33 +1377,55 @@ class ErrorRecoveryManager:
     
     def __init__(self,
                  checkpoint_dir: Optional[Path] = None,
-                 dead_letter_path: Optional[Path] = None):
+                 dead_letter_path: Optional[Path] = None,
+                 checkpoint_ttl: Optional[timedelta] = None,
+                 circuit_breaker_config: Optional[Dict[str, Any]] = None):
         """
         Initialize error recovery manager.
         
         Args:
             checkpoint_dir: Directory for checkpoints
             dead_letter_path: Path for dead letter queue persistence
+            checkpoint_ttl: Default expiry for saved checkpoints (None = keep until cleaned up)
+            circuit_breaker_config: Breaker settings (mass_download.error_recovery.circuit_breaker)
         """
         self.checkpoint_dir = checkpoint_dir
+        self.checkpoint_store = (
+            CheckpointStore(checkpoint_dir / "checkpoint_index.sqlite3", default_ttl=checkpoint_ttl)
+            if checkpoint_dir else None
+        )
         self.circuit_breakers: Dict[str, CircuitBreaker] = {}
+        self.circuit_breaker_config = circuit_breaker_config or {}
         self.retry_manager = RetryManager()
         self.transaction_manager = TransactionManager()
         self.dead_letter_queue = DeadLetterQueue(persist_path=dead_letter_path)
         self._lock = threading.RLock()
     
     def get_circuit_breaker(self, service_name: str) -> CircuitBreaker:
-        """Get or create circuit breaker for service."""
+        """Get or create circuit breaker for service (or host, for names containing a URL)."""
+        key = circuit_breaker_key(service_name)
         with self._lock:
-            if service_name not in self.circuit_breakers:
-                self.circuit_breakers[service_name] = CircuitBreaker()
-            return self.circuit_breakers[service_name]
+            if key not in self.circuit_breakers:
+                self.circuit_breakers[key] = self._create_circuit_breaker()
+            return self.circuit_breakers[key]
+    
+    def _create_circuit_breaker(self) -> CircuitBreaker:
+        config = self.circuit_breaker_config
+        return CircuitBreaker(
+            failure_threshold=config.get('failure_threshold', 5),
+            recovery_timeout=timedelta(seconds=config.get('recovery_timeout', 60)),
+            success_threshold=config.get('success_threshold', 2),
+            failure_rate_threshold=config.get('failure_rate_threshold', 0.5),
+            window=timedelta(seconds=config.get('window_seconds', 60)),
+            half_open_max_calls=config.get('half_open_requests', 1)
+        )
     
     def with_recovery(self,
                      operation_name: str,
                      func: Callable[[], T],
                      recovery_strategy: RecoveryStrategy = RecoveryStrategy.RETRY_BACKOFF,
-                     fallback: Optional[Callable[[], T]] = None) -> Optional[T]:
+                     fallback: Optional[Callable[[], T]] = None,
+                     service: Optional[str] = None) -> Optional[T]:
         """
         Execute function with comprehensive error recovery.
         
@@ -523,13 +1434,15 @@ class ErrorRecoveryManager:
             func: Function to execute
             recovery_strategy: Recovery strategy to use
             fallback: Optional fallback function
+            service: Service whose circuit breaker guards the call (defaults to
+                the host of a URL in operation_name, else operation_name)
             
         Returns:
             Function result or fallback result
         """
         try:
             if recovery_strategy == RecoveryStrategy.CIRCUIT_BREAKER:
-                breaker = self.get_circuit_breaker(operation_name)
+                breaker = self.get_circuit_breaker(service or operation_name)
                 return breaker.call(func, fallback)
             
             elif recovery_strategy == RecoveryStrategy.RETRY_BACKOFF:
@@ -583,8 +1496,15 @@ class ErrorRecoveryManager:
                          operation: str,
                          state: Dict[str, Any],
                          completed_items: List[str],
-                         pending_items: List[str]) -> RecoveryCheckpoint:
-        """Create and save a recovery checkpoint."""
+                         pending_items: List[str],
+                         key: Optional[str] = None) -> RecoveryCheckpoint:
+        """
+        Create and save a recovery checkpoint.
+        
+        Args:
+            key: What the checkpoint is for (e.g. channel URL); it replaces the
+                key's previous checkpoint. Defaults to checkpoint_id.
+        """
         checkpoint = RecoveryCheckpoint(
             checkpoint_id=checkpoint_id,
             operation=operation,
@@ -595,23 +1515,74 @@ class ErrorRecoveryManager:
             failed_items=[]
         )
         
-        if self.checkpoint_dir:
-            checkpoint.save(self.checkpoint_dir)
-        
+        self.save_checkpoint(checkpoint, key)
         return checkpoint
     
+    def save_checkpoint(self, checkpoint: RecoveryCheckpoint, key: Optional[str] = None):
+        """Save (or re-save) a checkpoint as the latest for key (defaults to its ID)."""
+        if self.checkpoint_store is not None:
+            self.checkpoint_store.put(key or checkpoint.checkpoint_id, checkpoint)
+    
+    def record_checkpoint_progress(self, key: str, completed_items: List[str]) -> bool:
+        """
+        Append items completed since key's last checkpoint as a delta record.
+        
+        Returns:
+            False if there is no checkpoint for key yet (create a full one instead)
+        """
+        if self.checkpoint_store is None:
+            return False
+        return self.checkpoint_store.append_delta(key, completed_items)
+    
     def load_checkpoint(self, checkpoint_id: str) -> Optional[RecoveryCheckpoint]:
         """Load a checkpoint by ID."""
-        if not self.checkpoint_dir:
+        if self.checkpoint_store is None:
             return None
         
-        checkpoint_file = self.checkpoint_dir / f"{checkpoint_id}.pkl"
+        checkpoint = self.checkpoint_store.get(checkpoint_id)
+        if checkpoint is not None:
+            return checkpoint
         
-        if checkpoint_file.exists():
-            return RecoveryCheckpoint.load(checkpoint_file)
+        # Checkpoint files written with RecoveryCheckpoint.save() (or pickled before the store existed)
+        for suffix in (".ckpt", ".pkl"):
+            checkpoint_file = self.checkpoint_dir / f"{checkpoint_id}{suffix}"
+            if checkpoint_file.exists():
+                return RecoveryCheckpoint.load(checkpoint_file)
         
         return None
     
+    def load_latest_checkpoint(self, key: str) -> Optional[RecoveryCheckpoint]:
+        """Latest unexpired checkpoint for key (e.g. channel URL), or None."""
+        if self.checkpoint_store is None:
+            return None
+        return self.checkpoint_store.get_latest(key)
+    
+    def cleanup_checkpoints(self, max_age: Optional[timedelta] = None) -> int:
+        """
+        Drop expired checkpoints and, if max_age is given, any older than that.
+        
+        Returns:
+            Number of checkpoints removed
+        """
+        if self.checkpoint_store is None:
+            return 0
+        
+        cutoff = datetime.now() - max_age if max_age else None
+        removed = self.checkpoint_store.expire(older_than=cutoff)
+        
+        # One-file-per-checkpoint saves (RecoveryCheckpoint.save, and legacy pickles)
+        if cutoff and self.checkpoint_dir.exists():
+            checkpoint_files = [*self.checkpoint_dir.glob("*.ckpt"), *self.checkpoint_dir.glob("*.pkl")]
+            for checkpoint_file in checkpoint_files:
+                try:
+                    if datetime.fromtimestamp(checkpoint_file.stat().st_mtime) < cutoff:
+                        checkpoint_file.unlink()
+                        removed += 1
+                except OSError as e:
+                    logger.error(f"Failed to clean checkpoint {checkpoint_file}: {e}")
+        
+        return removed
+    
     def get_recovery_status(self) -> Dict[str, Any]:
         """Get status of all recovery mechanisms."""
         return {
@@ -619,12 +1590,12 @@ class ErrorRecoveryManager:
                 name: breaker.state.value
                 for name, breaker in self.circuit_breakers.items()
             },
-            'dead_letter_queue_size': len(self.dead_letter_queue.get_all()),
-            'checkpoints': [
-                f.stem for f in (self.checkpoint_dir.glob("*.pkl") 
-                                if self.checkpoint_dir and self.checkpoint_dir.exists() 
-                                else [])
-            ]
+            'circuit_breaker_stats': {
+                name: breaker.get_stats()
+                for name, breaker in self.circuit_breakers.items()
+            },
+            'dead_letter_queue_size': len(self.dead_letter_queue),
+            'checkpoints': self.checkpoint_store.list_ids() if self.checkpoint_store is not None else []
         }
 
 
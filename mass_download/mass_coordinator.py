@@ -48,21 +48,6 @@ def with_standard_error_handling(func):
             raise
     return wrapper
 
-def retry_with_backoff(max_retries=3):
-    """Simple retry decorator."""
-    def decorator(func):
-        def wrapper(*args, **kwargs):
-            for attempt in range(max_retries):
-                try:
-                    return func(*args, **kwargs)
-                except Exception as e:
-                    if attempt == max_retries - 1:
-                        raise
-                    logger.warning(f"Attempt {attempt + 1} failed for {func.__name__}: {e}")
-                    time.sleep(2 ** attempt)  # exponential backoff
-        return wrapper
-    return decorator
-
 # Core module imports with graceful fallback
 try:
     from .channel_discovery import YouTubeChannelDiscovery, ChannelInfo, VideoMetadata
@@ -86,6 +71,7 @@ try:
     from .download_integration import DownloadIntegration, DownloadResult
     from .concurrent_processor import ConcurrentProcessor, ResourceLimits
     from .progress_monitor import ProgressMonitor, ProgressReporter
+    from .metrics_exporter import MetricFamily, MetricsExporter
     _ADVANCED_IMPORTS_OK = True
 except ImportError as e:
     logger.warning(f"Advanced imports failed: {e}")
@@ -97,12 +83,65 @@ except ImportError as e:
     ResourceLimits = None
     ProgressMonitor = None
     ProgressReporter = None
+    MetricFamily = None
+    MetricsExporter = None
+
+# Rate limiter (per-process or shared per-host, depending on configuration)
+try:
+    from utils.rate_limiter import (
+        initialize_rate_limiter, get_rate_limit_binding_report, get_rate_limit_status
+    )
+except ImportError:
+    logger.info("Rate limiter module not available - using component defaults")
+    def initialize_rate_limiter(config):
+        """Rate limiter unavailable (no-op)."""
+        pass
+    
+    def get_rate_limit_binding_report():
+        """Rate limiter unavailable (no-op)."""
+        return {}
+    
+    def get_rate_limit_status():
+        """Rate limiter unavailable (no-op)."""
+        return {}
+
+# Tracing spans (no-op unless mass_download.tracing.enabled)
+try:
+    from utils.tracing import initialize_tracing, start_span, flush_tracing
+except ImportError:
+    logger.info("Tracing module not available - stages will not be traced")
+    from contextlib import nullcontext
+    
+    def initialize_tracing(config):
+        """Tracing unavailable (no-op)."""
+        return None
+    
+    class _NoopSpan(nullcontext):
+        def set_attribute(self, key, value):
+            pass
+        
+        def end(self, error=None, status=None):
+            pass
+    
+    def start_span(name, parent=None, **attributes):
+        """Tracing unavailable (no-op)."""
+        return _NoopSpan()
+    
+    def flush_tracing():
+        """Tracing unavailable (no-op)."""
+        pass
+
+# Sharded progress counters (stdlib only)
+try:
+    from .progress_monitor import CounterField, sharded_counters_of
+except ImportError:
+    from progress_monitor import CounterField, sharded_counters_of
 
 # Error recovery imports (may not exist)
 try:
     from .error_recovery import (
         ErrorRecoveryManager, RecoveryStrategy, ErrorContext,
-        RecoveryCheckpoint, TransactionManager
+        RecoveryCheckpoint, TransactionManager, RetryManager
     )
 except ImportError:
     logger.info("Error recovery module not available - using basic error handling")
@@ -111,6 +150,7 @@ except ImportError:
     ErrorContext = None
     RecoveryCheckpoint = None
     TransactionManager = None
+    RetryManager = None
 
 
 class ProcessingStatus(Enum):
@@ -124,6 +164,10 @@ class ProcessingStatus(Enum):
     SKIPPED = "skipped"
 
 
+class RetryableChannelError(RuntimeError):
+    """Channel discovery or enumeration failed and is left for the scheduler to retry."""
+
+
 @dataclass
 class ChannelProcessingResult:
     """Result of processing a single channel."""
@@ -170,20 +214,30 @@ class ChannelProcessingResult:
 
 @dataclass
 class MassDownloadProgress:
-    """Track overall progress of mass download operation."""
-    total_channels: int = 0
-    channels_processed: int = 0
-    channels_failed: int = 0
-    channels_skipped: int = 0
-    total_videos: int = 0
-    videos_processed: int = 0
-    videos_failed: int = 0
-    videos_skipped: int = 0
+    """
+    Track overall progress of mass download operation.
+    
+    Counts are sharded per thread (see ShardedCounters): reading a count sums
+    the shards, and increment() updates the calling thread's shard without a
+    lock, so workers do not contend on progress accounting.
+    """
+    total_channels: int = CounterField()
+    channels_processed: int = CounterField()
+    channels_failed: int = CounterField()
+    channels_skipped: int = CounterField()
+    total_videos: int = CounterField()
+    videos_processed: int = CounterField()
+    videos_failed: int = CounterField()
+    videos_skipped: int = CounterField()
     start_time: datetime = field(default_factory=datetime.now)
     current_channel: Optional[str] = None
     current_status: Optional[str] = None
     errors: List[str] = field(default_factory=list)
     
+    def increment(self, name: str, amount: int = 1):
+        """Add amount to a count (lock-free)."""
+        sharded_counters_of(self).add(name, amount)
+    
     @property
     def channels_remaining(self) -> int:
         """Calculate remaining channels to process."""
@@ -254,8 +308,18 @@ class MassDownloadCoordinator:
         """
         self.config = config or get_config()
         
+        # Configure the process-wide rate limiter before any component uses it
+        initialize_rate_limiter(self.config)
+        
+        # Stage tracing (JSONL spans; no-op when disabled)
+        initialize_tracing(self.config)
+        
         # Initialize components
-        self.channel_discovery = YouTubeChannelDiscovery()
+        parsing_config = self.config.get("mass_download", {}).get("metadata_parsing", {})
+        self.channel_discovery = YouTubeChannelDiscovery(
+            parse_workers=parsing_config.get("process_pool_workers", 0),
+            parse_batch_size=parsing_config.get("batch_size", 500)
+        )
         
         # Initialize database manager (optional for testing)
         try:
@@ -289,6 +353,16 @@ class MassDownloadCoordinator:
         self.job_id: Optional[str] = None
         self.input_file_path: Optional[str] = None
         
+        # Error recovery manager
+        recovery_dir = Path(self.config.get("mass_download.recovery_dir", "/tmp/mass_download_recovery"))
+        checkpoint_ttl_hours = self.config.get("mass_download.error_recovery.checkpoint_ttl_hours", 168)
+        self.error_recovery = ErrorRecoveryManager(
+            checkpoint_dir=recovery_dir / "checkpoints",
+            dead_letter_path=recovery_dir / "dead_letter.json",
+            checkpoint_ttl=timedelta(hours=checkpoint_ttl_hours) if checkpoint_ttl_hours else None,
+            circuit_breaker_config=self.config.get("mass_download.error_recovery.circuit_breaker", {})
+        )
+        
         # Enhanced concurrent processor with resource management
         resource_limits = ResourceLimits(
             max_cpu_percent=80.0,
@@ -298,28 +372,44 @@ class MassDownloadCoordinator:
             max_queue_size=100,
             check_interval_seconds=5.0
         )
+        retry_config = self.config.get("mass_download.error_recovery.retry", {})
+        # Scheduled channel and download tasks retry from the processor's delayed queue
+        self.task_max_retries = retry_config.get("max_retries", 3)
         self.concurrent_processor = ConcurrentProcessor(
             resource_limits=resource_limits,
-            progress_callback=self._on_concurrent_progress
+            progress_callback=self._on_concurrent_progress,
+            circuit_breakers=self.error_recovery.get_circuit_breaker,
+            retry_manager=RetryManager(
+                max_retries=self.task_max_retries,
+                base_delay=retry_config.get("initial_delay", 1.0),
+                max_delay=retry_config.get("max_delay", 30.0),
+                exponential_base=retry_config.get("exponential_base", 2.0)
+            ),
+            retry_state_path=recovery_dir / "retry_state.sqlite3"
         )
         
         # Thread pool for backward compatibility (will be removed)
         self.executor = ThreadPoolExecutor(max_workers=self.max_concurrent_channels)
         
-        # Error recovery manager
-        recovery_dir = Path(self.config.get("mass_download.recovery_dir", "/tmp/mass_download_recovery"))
-        self.error_recovery = ErrorRecoveryManager(
-            checkpoint_dir=recovery_dir / "checkpoints",
-            dead_letter_path=recovery_dir / "dead_letter.json"
-        )
-        
         # Progress monitor
         self.progress_monitor = ProgressMonitor(
             update_interval=1.0,
-            persist_interval=30.0,
+            persist_interval=5.0,
             progress_file=Path("mass_download_progress.json")
         )
         
+        # Metrics export (OpenMetrics file and optional local endpoint)
+        metrics_config = self.config.get("mass_download", {}).get("metrics", {})
+        self.metrics_exporter: Optional[MetricsExporter] = None
+        if metrics_config.get("enabled", False):
+            self.metrics_exporter = MetricsExporter(
+                collect=self.collect_metrics,
+                metrics_file=metrics_config.get("file", "mass_download_metrics.prom"),
+                interval_seconds=metrics_config.get("interval_seconds", 15.0),
+                http_port=metrics_config.get("http_port"),
+                http_host=metrics_config.get("http_host", "127.0.0.1")
+            )
+        
         logger.info("MassDownloadCoordinator initialized successfully")
         logger.info(f"Configuration: max_concurrent_channels={self.max_concurrent_channels}, "
                    f"max_videos_per_channel={self.max_videos_per_channel}, "
@@ -388,14 +478,18 @@ class MassDownloadCoordinator:
             elif event_type == "task_failed":
                 error_msg = f"Task failed: {event_data.get('task_id', 'unknown')} - {event_data.get('error', 'unknown error')}"
                 self._add_error(error_msg)
+            elif event_type == "task_retry_scheduled":
+                logger.info(f"Task retry scheduled: {event_data.get('task_id', 'unknown')} - "
+                            f"attempt {event_data.get('attempt')} in {event_data.get('delay', 0):.1f}s")
+            elif event_type == "task_paused":
+                logger.info(f"Task paused: {event_data.get('task_id', 'unknown')} - "
+                            f"{event_data.get('service', 'unknown')} circuit breaker open")
             elif event_type == "download_completed":
-                with self.progress_lock:
-                    self.progress.videos_processed += 1
-                    self._save_progress_to_database()
+                self.progress.increment("videos_processed")
+                self._save_progress_to_database()
             elif event_type == "download_failed":
-                with self.progress_lock:
-                    self.progress.videos_failed += 1
-                    self._save_progress_to_database()
+                self.progress.increment("videos_failed")
+                self._save_progress_to_database()
         except Exception as e:
             logger.error(f"Error handling concurrent progress event: {e}")
     
@@ -527,17 +621,22 @@ class MassDownloadCoordinator:
                 'job_id': self.job_id
             },
             completed_items=videos_processed,
-            pending_items=videos_pending
+            pending_items=videos_pending,
+            key=channel_url
         )
     
     def process_channel(self, person: PersonRecord, channel_url: str, 
-                       checkpoint_id: Optional[str] = None) -> ChannelProcessingResult:
+                       checkpoint_id: Optional[str] = None,
+                       defer_failure: bool = False) -> ChannelProcessingResult:
         """
         Process a single channel (discover, store, prepare for download).
         
         Args:
             person: PersonRecord for the channel owner
             channel_url: YouTube channel URL
+            defer_failure: Raise RetryableChannelError for failures before any
+                video is processed instead of recording them, so a scheduler can
+                retry the channel (the caller records the final failure)
             
         Returns:
             ChannelProcessingResult with processing details
@@ -546,6 +645,8 @@ class MassDownloadCoordinator:
             channel_url=channel_url,
             start_time=datetime.now()
         )
+        channel_span = start_span("channel.discover", channel_url=channel_url, person=person.name)
+        retryable = True
         
         try:
             logger.info(f"Starting channel processing - URL: {channel_url}, Person: {person.name}")
@@ -558,7 +659,9 @@ class MassDownloadCoordinator:
             
             # Step 1: Extract channel information
             try:
-                channel_info = self.channel_discovery.extract_channel_info(channel_url)
+                with start_span("youtube.extract_channel_info"), \
+                        self.error_recovery.get_circuit_breaker("youtube").track():
+                    channel_info = self.channel_discovery.extract_channel_info(channel_url)
                 result.channel_info = channel_info
                 
                 # Update person record with channel info
@@ -570,7 +673,8 @@ class MassDownloadCoordinator:
             # Step 2: Save or update person in database
             try:
                 if self.db_ops:
-                    person_id = self.db_ops.save_person(person)
+                    with start_span("db.save_person"):
+                        person_id = self.db_ops.save_person(person)
                     result.person_id = person_id
                     logger.info(f"Person record saved to database with ID: {person_id}")
                 else:
@@ -586,10 +690,15 @@ class MassDownloadCoordinator:
             self._update_progress(current_status="enumerating videos")
             
             try:
-                videos = self.channel_discovery.enumerate_channel_videos(
-                    channel_url, 
-                    max_videos=self.max_videos_per_channel
-                )
+                enumeration_start = time.time()
+                with start_span("youtube.enumerate_videos") as enumeration_span, \
+                        self.error_recovery.get_circuit_breaker("youtube").track():
+                    videos = self.channel_discovery.enumerate_channel_videos(
+                        channel_url, 
+                        max_videos=self.max_videos_per_channel
+                    )
+                    enumeration_span.set_attribute("videos", len(videos))
+                self.progress_monitor.record_enumeration_time(time.time() - enumeration_start)
                 
                 result.videos_found = len(videos)
                 logger.info(f"Found {len(videos)} videos in channel {channel_url}")
@@ -608,6 +717,7 @@ class MassDownloadCoordinator:
             
             # Step 4: Process each video
             self._update_progress(current_status="processing videos")
+            retryable = False
             
             for i, video_metadata in enumerate(videos):
                 try:
@@ -633,7 +743,8 @@ class MassDownloadCoordinator:
                     
                     # Save to database or in-memory store
                     if self.db_ops:
-                        video_db_id = self.db_ops.save_video(video_record)
+                        with start_span("db.save_video", video_id=video_record.video_id):
+                            video_db_id = self.db_ops.save_video(video_record)
                         logger.debug(f"Video saved to database with ID: {video_db_id}")
                     else:
                         # Store in memory when database is not available
@@ -651,9 +762,8 @@ class MassDownloadCoordinator:
                     result.videos_processed += 1
                     
                     # Update overall progress
-                    with self.progress_lock:
-                        self.progress.total_videos += 1
-                        self.progress.videos_processed += 1
+                    self.progress.increment("total_videos")
+                    self.progress.increment("videos_processed")
                     
                     # Update progress monitor
                     self.progress_monitor.update_video_progress(
@@ -672,8 +782,7 @@ class MassDownloadCoordinator:
                     logger.error(f"Failed to process video {video_metadata.video_id}: {e}")
                     result.videos_failed += 1
                     
-                    with self.progress_lock:
-                        self.progress.videos_failed += 1
+                    self.progress.increment("videos_failed")
                     
                     if not self.continue_on_error:
                         raise
@@ -696,6 +805,10 @@ class MassDownloadCoordinator:
             return result
             
         except Exception as e:
+            if defer_failure and retryable:
+                channel_span.set_attribute("error", str(e))
+                raise RetryableChannelError(str(e)) from e
+            
             result.status = ProcessingStatus.FAILED
             result.error_message = str(e)
             result.end_time = datetime.now()
@@ -716,16 +829,18 @@ class MassDownloadCoordinator:
         
         finally:
             # Update progress
-            with self.progress_lock:
-                if result.status == ProcessingStatus.COMPLETED:
-                    self.progress.channels_processed += 1
-                elif result.status == ProcessingStatus.FAILED:
-                    self.progress.channels_failed += 1
-                elif result.status == ProcessingStatus.SKIPPED:
-                    self.progress.channels_skipped += 1
+            if result.status == ProcessingStatus.COMPLETED:
+                self.progress.increment("channels_processed")
+            elif result.status == ProcessingStatus.FAILED:
+                self.progress.increment("channels_failed")
+            elif result.status == ProcessingStatus.SKIPPED:
+                self.progress.increment("channels_skipped")
             
             # Save progress after each channel
             self._save_progress_to_database()
+            
+            channel_span.set_attribute("videos", result.videos_found)
+            channel_span.end(status="error" if result.status == ProcessingStatus.FAILED else None)
     
     def process_channel_with_recovery(self, person: PersonRecord, channel_url: str) -> ChannelProcessingResult:
         """
@@ -745,14 +860,12 @@ class MassDownloadCoordinator:
             channel_url=channel_url,
             start_time=datetime.now()
         )
+        channel_span = start_span("channel.discover", channel_url=channel_url, person=person.name, recovery=True)
         
         try:
             # Check if we have a checkpoint for this channel
-            checkpoint = None
-            checkpoint_files = list((self.error_recovery.checkpoint_dir / "checkpoints").glob(f"channel_{channel_url.replace('/', '_')}*.pkl"))
-            if checkpoint_files:
-                latest_checkpoint = max(checkpoint_files, key=lambda f: f.stat().st_mtime)
-                checkpoint = RecoveryCheckpoint.load(latest_checkpoint)
+            checkpoint = self.error_recovery.load_latest_checkpoint(channel_url)
+            if checkpoint:
                 logger.info(f"Found checkpoint for {channel_url}: {checkpoint.checkpoint_id}")
             
             # Use transaction manager for rollback capability
@@ -765,12 +878,14 @@ class MassDownloadCoordinator:
             # Operation 1: Extract channel info with circuit breaker
             def extract_channel_info():
                 nonlocal channel_info
-                channel_info = self.error_recovery.with_recovery(
-                    f"extract_channel_info_{channel_url}",
-                    lambda: self.channel_discovery.extract_channel_info(channel_url),
-                    recovery_strategy=RecoveryStrategy.CIRCUIT_BREAKER,
-                    fallback=lambda: None
-                )
+                with start_span("youtube.extract_channel_info"):
+                    channel_info = self.error_recovery.with_recovery(
+                        f"extract_channel_info_{channel_url}",
+                        lambda: self.channel_discovery.extract_channel_info(channel_url),
+                        recovery_strategy=RecoveryStrategy.CIRCUIT_BREAKER,
+                        fallback=lambda: None,
+                        service="youtube"
+                    )
                 if not channel_info:
                     raise RuntimeError(f"Failed to extract channel info for {channel_url}")
                 
@@ -787,11 +902,12 @@ class MassDownloadCoordinator:
             def save_person():
                 nonlocal person_id
                 if self.db_ops:
-                    person_id = self.error_recovery.with_recovery(
-                        f"save_person_{person.name}",
-                        lambda: self.db_ops.save_person(person),
-                        recovery_strategy=RecoveryStrategy.RETRY_BACKOFF
-                    )
+                    with start_span("db.save_person"):
+                        person_id = self.error_recovery.with_recovery(
+                            f"save_person_{person.name}",
+                            lambda: self.db_ops.save_person(person),
+                            recovery_strategy=RecoveryStrategy.RETRY_BACKOFF
+                        )
                 else:
                     person_id = hash(person.name + person.channel_url) % 1000000
                 
@@ -824,26 +940,36 @@ class MassDownloadCoordinator:
                 logger.info(f"Resuming from checkpoint: {len(videos_processed)} processed, {len(videos_pending)} pending")
             else:
                 # Fresh enumeration
-                videos = self.error_recovery.with_recovery(
-                    f"enumerate_videos_{channel_url}",
-                    lambda: self.channel_discovery.enumerate_channel_videos(
-                        channel_url, 
-                        max_videos=self.max_videos_per_channel
-                    ),
-                    recovery_strategy=RecoveryStrategy.RETRY_BACKOFF
-                )
+                enumeration_start = time.time()
+                with start_span("youtube.enumerate_videos") as enumeration_span:
+                    videos = self.error_recovery.with_recovery(
+                        f"enumerate_videos_{channel_url}",
+                        lambda: self.channel_discovery.enumerate_channel_videos(
+                            channel_url, 
+                            max_videos=self.max_videos_per_channel
+                        ),
+                        recovery_strategy=RecoveryStrategy.RETRY_BACKOFF
+                    )
+                    enumeration_span.set_attribute("videos", len(videos))
+                self.progress_monitor.record_enumeration_time(time.time() - enumeration_start)
                 
                 videos_pending = [v.video_id for v in videos]
                 result.videos_found = len(videos)
                 logger.info(f"Found {len(videos)} videos in channel {channel_url}")
+                
+                # Snapshot the enumeration once; progress below is appended as deltas
+                if videos_pending:
+                    self._create_channel_checkpoint(channel_url, person, [], videos_pending)
             
             # Process videos with periodic checkpointing
-            checkpoint_interval = 25  # Create checkpoint every 25 videos
+            checkpoint_interval = 25  # Record checkpoint progress every 25 videos
+            processed_set = set(videos_processed)
+            unrecorded = []
             
             for i, video_id in enumerate(videos_pending):
                 try:
                     # Skip if already processed
-                    if video_id in videos_processed:
+                    if video_id in processed_set:
                         continue
                     
                     # Process video with skip strategy for individual failures
@@ -876,15 +1002,15 @@ class MassDownloadCoordinator:
                         )
                         
                         if self.db_ops:
-                            self.db_ops.save_video(video_record)
+                            with start_span("db.save_video", video_id=video_id):
+                                self.db_ops.save_video(video_record)
                         
                         # Mark as processed
                         self.channel_discovery.mark_video_processed(video_id, video_record.uuid)
                         
                         result.videos_processed += 1
-                        with self.progress_lock:
-                            self.progress.total_videos += 1
-                            self.progress.videos_processed += 1
+                        self.progress.increment("total_videos")
+                        self.progress.increment("videos_processed")
                     
                     # Process with skip strategy - continue on individual video failures
                     self.error_recovery.with_recovery(
@@ -894,12 +1020,17 @@ class MassDownloadCoordinator:
                     )
                     
                     videos_processed.append(video_id)
+                    processed_set.add(video_id)
+                    unrecorded.append(video_id)
                     
-                    # Create checkpoint periodically
+                    # Record checkpoint progress periodically
                     if (i + 1) % checkpoint_interval == 0:
-                        remaining = [v for v in videos_pending if v not in videos_processed]
-                        self._create_channel_checkpoint(channel_url, person, videos_processed, remaining)
-                        logger.info(f"Checkpoint created: {len(videos_processed)} processed, {len(remaining)} remaining")
+                        if not self.error_recovery.record_checkpoint_progress(channel_url, unrecorded):
+                            remaining = [v for v in videos_pending if v not in processed_set]
+                            self._create_channel_checkpoint(channel_url, person, videos_processed, remaining)
+                        unrecorded = []
+                        logger.info(f"Checkpoint updated: {len(videos_processed)} processed, "
+                                    f"{len(videos_pending) - i - 1} remaining")
                     
                 except Exception as e:
                     logger.error(f"Failed to process video {video_id}: {e}")
@@ -918,8 +1049,7 @@ class MassDownloadCoordinator:
                 self._create_channel_checkpoint(channel_url, person, videos_processed, [])
             
             # Update progress tracking
-            with self.progress_lock:
-                self.progress.channels_processed += 1
+            self.progress.increment("channels_processed")
             
             # Mark result as completed
             result.status = ProcessingStatus.COMPLETED
@@ -939,8 +1069,7 @@ class MassDownloadCoordinator:
             result.error_message = str(e)
             result.end_time = datetime.now()
             
-            with self.progress_lock:
-                self.progress.channels_failed += 1
+            self.progress.increment("channels_failed")
             
             # Save failure checkpoint
             if 'videos_processed' in locals() and 'videos_pending' in locals():
@@ -953,7 +1082,7 @@ class MassDownloadCoordinator:
                     error_message=str(e),
                     operation="process_channel"
                 )))
-                checkpoint.save(self.error_recovery.checkpoint_dir)
+                self.error_recovery.save_checkpoint(checkpoint, key=channel_url)
             
             if not self.continue_on_error:
                 raise
@@ -963,6 +1092,9 @@ class MassDownloadCoordinator:
         finally:
             # Save progress after each channel
             self._save_progress_to_database()
+            
+            channel_span.set_attribute("videos", result.videos_found)
+            channel_span.end(status="error" if result.status == ProcessingStatus.FAILED else None)
     
     def process_channels_concurrently(self, person_channel_pairs: List[Tuple[PersonRecord, str]]) -> List[ChannelProcessingResult]:
         """
@@ -979,6 +1111,7 @@ class MassDownloadCoordinator:
         # Start progress monitor
         self.progress_monitor.start()
         self.progress_monitor.update_channel_count(len(person_channel_pairs))
+        self._start_metrics_export()
         
         # Initialize progress
         with self.progress_lock:
@@ -1023,8 +1156,7 @@ class MassDownloadCoordinator:
                 results.append(failed_result)
                 self.processing_results.append(failed_result)
                 
-                with self.progress_lock:
-                    self.progress.channels_failed += 1
+                self.progress.increment("channels_failed")
                 
                 if not self.continue_on_error:
                     # Cancel remaining futures
@@ -1073,6 +1205,9 @@ class MassDownloadCoordinator:
             
             report["channel_results"] = channel_results
             
+            # Which rate limit level (global bytes, host, service, channel) held work back
+            report["rate_limit_binding"] = get_rate_limit_binding_report()
+            
             # Calculate overall statistics
             total_duration = sum(r.duration_seconds or 0 for r in self.processing_results)
             report["total_processing_seconds"] = round(total_duration, 1)
@@ -1098,74 +1233,101 @@ class MassDownloadCoordinator:
         Returns:
             ChannelProcessingResult with complete processing details
         """
-        # First, process the channel to discover videos
-        result = self.process_channel(person, channel_url)
-        
-        if result.status != ProcessingStatus.COMPLETED or not self.download_videos:
-            return result
-        
-        # Now download the videos
-        logger.info(f"Starting downloads for channel {channel_url}")
-        
-        try:
-            # Get video records that need downloading
-            video_records = self._get_pending_video_records(result.person_id)
+        with start_span("channel", channel_url=channel_url, person=person.name) as channel_span:
+            # First, process the channel to discover videos
+            result = self.process_channel(person, channel_url)
+            channel_span.set_attribute("videos", result.videos_found)
             
-            if not video_records:
-                logger.info(f"No videos to download for channel {channel_url}")
+            if result.status != ProcessingStatus.COMPLETED or not self.download_videos:
                 return result
             
-            # Download videos
-            download_results = self.download_integration.batch_download(
-                video_records,
-                max_concurrent=self.max_concurrent_downloads
-            )
-            
-            # Update result with download statistics
-            downloads_completed = sum(1 for r in download_results if r.status == "completed")
-            downloads_failed = sum(1 for r in download_results if r.status == "failed")
-            
-            # Update video records in database
-            for i, download_result in enumerate(download_results):
-                video_record = video_records[i]
-                if download_result.status == "completed":
-                    video_record.download_status = "completed"
-                    video_record.s3_path = download_result.s3_path
-                    video_record.file_size = download_result.file_size
-                    # Update in database
-                    if self.db_ops:
-                        self.db_ops.update_video_status(
-                            video_record.video_id,
-                            "completed",
-                            s3_path=download_result.s3_path,
-                            file_size=download_result.file_size
-                        )
-                elif download_result.status == "failed":
-                    video_record.download_status = "failed"
-                    video_record.error_message = download_result.error_message
-                    # Update in database
-                    if self.db_ops:
-                        self.db_ops.update_video_status(
-                            video_record.video_id,
-                            "failed",
-                            error_message=download_result.error_message
-                        )
-            
-            # Update progress
-            with self.progress_lock:
-                self.progress.videos_processed += downloads_completed
-                self.progress.videos_failed += downloads_failed
+            # Now download the videos
+            logger.info(f"Starting downloads for channel {channel_url}")
             
-            logger.info(f"Downloads completed for channel {channel_url}: "
-                       f"{downloads_completed} successful, {downloads_failed} failed")
-            
-            return result
-            
-        except Exception as e:
-            logger.error(f"Download phase failed for channel {channel_url}: {e}")
-            if not self.continue_on_error:
-                raise
-            return result
+            try:
+                # Get video records that need downloading
+                video_records = self._get_pending_video_records(result.person_id)
+                
+                if not video_records:
+                    logger.info(f"No videos to download for channel {channel_url}")
+                    return result
+                
+                # Download videos (retried from the processor's delayed queue when it is running)
+                scheduler = self.concurrent_processor if self.concurrent_processor.is_running else None
+                download_results = self.download_integration.batch_download(
+                    video_records,
+                    max_concurrent=self.max_concurrent_downloads,
+                    channel_url=channel_url,
+                    scheduler=scheduler,
+                    max_retries=self.task_max_retries
+                )
+                
+                # Update result with download statistics
+                downloads_completed = sum(1 for r in download_results if r.status == "completed")
+                downloads_failed = sum(1 for r in download_results if r.status == "failed")
+                
+                # Update video records in database
+                for i, download_result in enumerate(download_results):
+                    video_record = video_records[i]
+                    self._record_download_timing(download_result)
+                    if download_result.status == "completed":
+                        video_record.download_status = "completed"
+                        video_record.s3_path = download_result.s3_path
+                        video_record.file_size = download_result.file_size
+                        # Update in database
+                        if self.db_ops:
+                            with start_span("db.update_video_status", video_id=video_record.video_id):
+                                self.db_ops.update_video_status(
+                                    video_record.video_id,
+                                    "completed",
+                                    s3_path=download_result.s3_path,
+                                    file_size=download_result.file_size
+                                )
+                    elif download_result.status == "failed":
+                        video_record.download_status = "failed"
+                        video_record.error_message = download_result.error_message
+                        # Update in database
+                        if self.db_ops:
+                            with start_span("db.update_video_status", video_id=video_record.video_id):
+                                self.db_ops.update_video_status(
+                                    video_record.video_id,
+                                    "failed",
+                                    error_message=download_result.error_message
+                                )
+                
+                # Update progress (scheduled downloads are counted by _on_concurrent_progress)
+                if scheduler is None:
+                    self.progress.increment("videos_processed", downloads_completed)
+                    self.progress.increment("videos_failed", downloads_failed)
+                
+                logger.info(f"Downloads completed for channel {channel_url}: "
+                           f"{downloads_completed} successful, {downloads_failed} failed")
+                
+                return result
+                
+            except Exception as e:
+                logger.error(f"Download phase failed for channel {channel_url}: {e}")
+                channel_span.set_attribute("download_error", str(e))
+                if not self.continue_on_error:
+                    raise
+                return result
+    
+    def _record_download_timing(self, download_result: DownloadResult):
+        """Feed a completed download's size, duration and S3 transfer rate to the progress monitor."""
+        if download_result.status != "completed":
+            return
+        
+        if download_result.file_size:
+            self.progress_monitor.update_download_stats(download_result.file_size)
+        
+        duration = download_result.download_duration_seconds
+        if not duration:
+            return
+        
+        self.progress_monitor.record_video_download_time(duration)
+        if download_result.s3_path and download_result.file_size:
+            # Streaming mode uploads while downloading, so this is the end-to-end S3 transfer rate
+            self.progress_monitor.record_upload_speed(download_result.file_size / 1_048_576 / duration)
     
     def _get_pending_video_records(self, person_id: int) -> List[VideoRecord]:
         """
@@ -1200,6 +1362,7 @@ class MassDownloadCoordinator:
             List of ChannelProcessingResult objects
         """
         logger.info(f"Starting concurrent processing with downloads for {len(person_channel_pairs)} channels")
+        self._start_metrics_export()
         
         # Initialize progress
         with self.progress_lock:
@@ -1209,6 +1372,15 @@ class MassDownloadCoordinator:
         # Save initial progress
         self._save_progress_to_database()
         
+        # Downloads run (and retry) on the concurrent processor
+        self.concurrent_processor.start()
+        try:
+            return self._collect_channels_with_downloads(person_channel_pairs)
+        finally:
+            self.concurrent_processor.stop()
+    
+    def _collect_channels_with_downloads(self, person_channel_pairs: List[Tuple[PersonRecord, str]]) -> List[ChannelProcessingResult]:
+        """Run process_channel_with_downloads for each channel and gather the results."""
         # Submit all tasks
         futures = []
         for person, channel_url in person_channel_pairs:
@@ -1243,8 +1415,7 @@ class MassDownloadCoordinator:
                 results.append(failed_result)
                 self.processing_results.append(failed_result)
                 
-                with self.progress_lock:
-                    self.progress.channels_failed += 1
+                self.progress.increment("channels_failed")
                 
                 if not self.continue_on_error:
                     # Cancel remaining futures
@@ -1270,6 +1441,7 @@ class MassDownloadCoordinator:
             List of ChannelProcessingResult objects
         """
         logger.info(f"Starting resource-managed processing of {len(person_channel_pairs)} channels")
+        self._start_metrics_export()
         
         # Initialize progress
         with self.progress_lock:
@@ -1296,7 +1468,11 @@ class MassDownloadCoordinator:
                     self.process_channel,
                     person,
                     channel_url,
-                    priority=priority
+                    priority=priority,
+                    service="youtube",
+                    max_retries=self.task_max_retries,
+                    retry_on=(RetryableChannelError,),
+                    defer_failure=True
                 )
                 futures.append((future, channel_url))
             
@@ -1323,6 +1499,9 @@ class MassDownloadCoordinator:
                     
                 except Exception as e:
                     logger.error(f"Channel processing failed for {channel_url}: {e}")
+                    if isinstance(e, RetryableChannelError):
+                        # process_channel left its final failure for us to record
+                        self.progress_monitor.complete_channel(channel_url, success=False, error_message=str(e))
                     
                     # Create failed result
                     failed_result = ChannelProcessingResult(
@@ -1336,8 +1515,7 @@ class MassDownloadCoordinator:
                     self.processing_results.append(failed_result)
                     
                     # Update progress
-                    with self.progress_lock:
-                        self.progress.channels_failed += 1
+                    self.progress.increment("channels_failed")
                     
                     if not self.continue_on_error:
                         raise
@@ -1397,18 +1575,16 @@ class MassDownloadCoordinator:
         recovery_status['dead_letter_details'] = dead_letter_summary
         
         # Add checkpoint statistics
-        if self.error_recovery.checkpoint_dir and self.error_recovery.checkpoint_dir.exists():
-            checkpoints = list(self.error_recovery.checkpoint_dir.glob("*.pkl"))
-            
+        checkpoint_store = self.error_recovery.checkpoint_store
+        if checkpoint_store is not None:
             checkpoint_stats = {
-                'total_checkpoints': len(checkpoints),
+                'total_checkpoints': len(checkpoint_store),
                 'latest_checkpoint': None
             }
             
-            if checkpoints:
-                latest = max(checkpoints, key=lambda f: f.stat().st_mtime)
+            if checkpoint_stats['total_checkpoints']:
                 try:
-                    cp = RecoveryCheckpoint.load(latest)
+                    cp = checkpoint_store.latest()
                     checkpoint_stats['latest_checkpoint'] = {
                         'id': cp.checkpoint_id,
                         'operation': cp.operation,
@@ -1418,31 +1594,120 @@ class MassDownloadCoordinator:
                         'failed_items': len(cp.failed_items)
                     }
                 except Exception as e:
-                    logger.error(f"Failed to load checkpoint {latest}: {e}")
+                    logger.error(f"Failed to load latest checkpoint: {e}")
             
             recovery_status['checkpoint_stats'] = checkpoint_stats
         
         return recovery_status
     
     def cleanup_old_checkpoints(self, days: int = 7):
-        """Clean up checkpoints older than specified days."""
-        if not self.error_recovery.checkpoint_dir or not self.error_recovery.checkpoint_dir.exists():
-            return
-        
-        cutoff_time = datetime.now() - timedelta(days=days)
-        cleaned = 0
-        
-        for checkpoint_file in self.error_recovery.checkpoint_dir.glob("*.pkl"):
-            try:
-                if datetime.fromtimestamp(checkpoint_file.stat().st_mtime) < cutoff_time:
-                    checkpoint_file.unlink()
-                    cleaned += 1
-            except Exception as e:
-                logger.error(f"Failed to clean checkpoint {checkpoint_file}: {e}")
+        """Clean up expired checkpoints and those older than specified days."""
+        cleaned = self.error_recovery.cleanup_checkpoints(max_age=timedelta(days=days))
         
         if cleaned > 0:
             logger.info(f"Cleaned up {cleaned} old checkpoints")
     
+    def _start_metrics_export(self):
+        """Start the metrics exporter if configured (idempotent)."""
+        if not self.metrics_exporter:
+            return
+        try:
+            self.metrics_exporter.start()
+        except OSError as e:
+            logger.error(f"Failed to start metrics exporter (continuing without it): {e}")
+    
+    def collect_metrics(self) -> List[MetricFamily]:
+        """
+        Collect counters and gauges for OpenMetrics export.
+        
+        Only reads state that is cheap to sample: no resource polling and no
+        database queries.
+        """
+        families = []
+        
+        progress = self.progress
+        channels = MetricFamily("mass_download_channels", "counter", "Channels finished, by outcome.")
+        channels.add(progress.channels_processed, status="processed")
+        channels.add(progress.channels_failed, status="failed")
+        channels.add(progress.channels_skipped, status="skipped")
+        families.append(channels)
+        families.append(MetricFamily(
+            "mass_download_channels_expected", "gauge", "Channels in the current job."
+        ).add(progress.total_channels))
+        
+        videos = MetricFamily("mass_download_videos", "counter", "Videos finished, by outcome.")
+        videos.add(progress.videos_processed, status="processed")
+        videos.add(progress.videos_failed, status="failed")
+        videos.add(progress.videos_skipped, status="skipped")
+        families.append(videos)
+        families.append(MetricFamily(
+            "mass_download_videos_expected", "gauge", "Videos discovered for the current job."
+        ).add(progress.total_videos))
+        
+        monitor_metrics = self.progress_monitor.get_current_metrics()
+        families.append(MetricFamily(
+            "mass_download_downloaded_bytes", "counter", "Bytes downloaded."
+        ).add(monitor_metrics.bytes_downloaded))
+        
+        queue_stats = self.concurrent_processor.get_queue_stats()
+        queue = MetricFamily("mass_download_queue_tasks", "gauge", "Tasks in the concurrent processor, by state.")
+        for state, key in (("queued", "queue_size"), ("active", "active_tasks"),
+                           ("paused", "paused_tasks"), ("delayed", "delayed_tasks")):
+            queue.add(queue_stats[key], state=state)
+        families.append(queue)
+        families.append(MetricFamily(
+            "mass_download_workers", "gauge", "Current worker pool size."
+        ).add(queue_stats["current_workers"]))
+        slots = MetricFamily("mass_download_semaphore_available", "gauge", "Free concurrency slots.")
+        slots.add(queue_stats["channel_semaphore_available"], kind="channel")
+        slots.add(queue_stats["download_semaphore_available"], kind="download")
+        families.append(slots)
+        
+        wait_seconds = MetricFamily(
+            "mass_download_rate_limit_wait_seconds", "counter",
+            "Seconds spent waiting on the rate limiter, by binding level."
+        )
+        waits = MetricFamily(
+            "mass_download_rate_limit_waits", "counter", "Rate limiter waits, by binding level."
+        )
+        for level, stats in get_rate_limit_binding_report().items():
+            wait_seconds.add(stats["wait_seconds"], level=level)
+            waits.add(stats["count"], level=level)
+        families.extend([wait_seconds, waits])
+        waiters = MetricFamily(
+            "mass_download_rate_limit_waiters", "gauge", "Requests queued on each service's rate limiter."
+        )
+        for service, status in get_rate_limit_status().items():
+            waiters.add(status.get("waiters", 0), service=service)
+        families.append(waiters)
+        
+        breakers = MetricFamily(
+            "mass_download_circuit_breaker_state", "stateset", "Circuit breaker state per service."
+        )
+        with self.error_recovery._lock:
+            breaker_items = list(self.error_recovery.circuit_breakers.items())
+        for service, breaker in breaker_items:
+            current = breaker.get_stats()["state"]
+            for state in ("closed", "open", "half_open"):
+                breakers.add(int(current == state), service=service, mass_download_circuit_breaker_state=state)
+        families.append(breakers)
+        
+        db_manager = getattr(self.db_ops, "db_manager", None)
+        if db_manager is not None and hasattr(db_manager, "get_pool_stats"):
+            pool_stats = db_manager.get_pool_stats()
+            families.append(MetricFamily(
+                "mass_download_db_connection_waits", "counter", "Database connection acquisitions."
+            ).add(pool_stats["wait_count"]))
+            families.append(MetricFamily(
+                "mass_download_db_connection_wait_seconds", "counter",
+                "Seconds spent waiting for database connections."
+            ).add(pool_stats["wait_seconds_total"]))
+            families.append(MetricFamily(
+                "mass_download_db_connection_waiting", "gauge", "Threads currently waiting for a connection."
+            ).add(pool_stats["waiting"]))
+        
+        return families
+    
     def shutdown(self):
         """Gracefully shutdown the coordinator."""
         logger.info("Shutting down MassDownloadCoordinator")
@@ -1458,6 +1723,19 @@ class MassDownloadCoordinator:
         # Shutdown thread pool
         self.executor.shutdown(wait=True)
         
+        # Final metrics write
+        if self.metrics_exporter:
+            try:
+                self.metrics_exporter.stop()
+            except Exception as e:
+                logger.error(f"Error stopping metrics exporter: {e}")
+        
+        # Shutdown metadata parse pool
+        self.channel_discovery.close()
+        
+        # Write buffered trace spans
+        flush_tracing()
+        
         # Log final statistics
         final_report = self.get_progress_report()
         logger.info(f"Final processing report: {final_report}")
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Metrics Export Module
+
+Exposes live mass download metrics in the OpenMetrics text format so an
+existing Prometheus-compatible scraper can graph a long run without parsing
+logs:
+- A metrics file rewritten atomically every interval (node_exporter textfile
+  collector style)
+- An optional local HTTP endpoint serving the same text at /metrics
+
+Metrics are pulled from a collect callback when written or scraped, so the
+download path does no extra work.
+"""
+import os
+import threading
+import logging
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+_METRIC_TYPES = ("counter", "gauge", "stateset", "info", "unknown")
+
+
+@dataclass
+class MetricFamily:
+    """One metric and its labelled samples."""
+    name: str
+    type: str
+    help: str
+    samples: List[Tuple[Dict[str, str], float]] = field(default_factory=list)
+
+    def __post_init__(self):
+        """Validate metric family with fail-fast principles."""
+        if self.type not in _METRIC_TYPES:
+            raise ValueError(
+                f"METRICS ERROR: type must be one of {_METRIC_TYPES}. Got: {self.type}"
+            )
+        if self.type == "counter" and self.name.endswith("_total"):
+            raise ValueError(
+                f"METRICS ERROR: Counter family names omit the _total suffix. Got: {self.name}"
+            )
+
+    def add(self, value: float, **labels: str) -> "MetricFamily":
+        """Add a sample with the given labels."""
+        self.samples.append((labels, value))
+        return self
+
+
+def _escape_label_value(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int):
+        return str(value)
+    if value != value:
+        return "NaN"
+    if value in (float("inf"), float("-inf")):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def render_openmetrics(families: List[MetricFamily]) -> str:
+    """Render metric families as OpenMetrics text (terminated by # EOF)."""
+    lines = []
+    for family in families:
+        lines.append(f"# TYPE {family.name} {family.type}")
+        lines.append(f"# HELP {family.name} {family.help}")
+        sample_name = f"{family.name}_total" if family.type == "counter" else family.name
+        for labels, value in family.samples:
+            if labels:
+                label_text = ",".join(
+                    f'{key}="{_escape_label_value(label)}"' for key, label in sorted(labels.items())
+                )
+                lines.append(f"{sample_name}{{{label_text}}} {_format_value(value)}")
+            else:
+                lines.append(f"{sample_name} {_format_value(value)}")
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+class MetricsExporter:
+    """
+    Periodically write collected metrics to a file, and optionally serve them over HTTP.
+
+    The file is written to a temp file and renamed, so a scraper never reads a
+    partial exposition. The HTTP endpoint binds to localhost by default and
+    collects fresh metrics on every scrape.
+    """
+
+    def __init__(self,
+                 collect: Callable[[], List[MetricFamily]],
+                 metrics_file: Optional[Path] = None,
+                 interval_seconds: float = 15.0,
+                 http_port: Optional[int] = None,
+                 http_host: str = "127.0.0.1"):
+        """
+        Initialize metrics exporter.
+
+        Args:
+            collect: Returns the current metric families
+            metrics_file: OpenMetrics text file to rewrite every interval (None = no file)
+            interval_seconds: Seconds between file writes
+            http_port: Port for the /metrics endpoint (None = no endpoint, 0 = any free port)
+            http_host: Interface for the endpoint
+        """
+        if interval_seconds <= 0:
+            raise ValueError(
+                f"METRICS ERROR: interval_seconds must be positive. Got: {interval_seconds}"
+            )
+
+        self.collect = collect
+        self.metrics_file = Path(metrics_file) if metrics_file else None
+        self.interval_seconds = interval_seconds
+        self.http_port = http_port
+        self.http_host = http_host
+
+        self._stop_event = threading.Event()
+        self._write_thread: Optional[threading.Thread] = None
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._server_thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        """Whether the exporter has been started and not stopped."""
+        return self._write_thread is not None or self._server is not None
+
+    def render(self) -> str:
+        """Collect and render the current metrics."""
+        return render_openmetrics(self.collect())
+
+    def write(self):
+        """Write the current metrics file atomically."""
+        if self.metrics_file is None:
+            return
+
+        try:
+            text = self.render()
+            self.metrics_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.metrics_file.with_name(f".{self.metrics_file.name}.{os.getpid()}.tmp")
+            with open(temp_file, 'w') as f:
+                f.write(text)
+            os.replace(temp_file, self.metrics_file)
+        except Exception as e:
+            logger.error(f"Failed to write metrics file {self.metrics_file}: {e}")
+
+    def start(self):
+        """Start the file writer and HTTP endpoint (no-op if already running)."""
+        with self._lock:
+            if self.running:
+                return
+            self._stop_event.clear()
+
+            if self.metrics_file is not None:
+                self._write_thread = threading.Thread(
+                    target=self._write_loop,
+                    name="MetricsWriterThread",
+                    daemon=True
+                )
+                self._write_thread.start()
+                logger.info(f"Writing OpenMetrics to {self.metrics_file} every {self.interval_seconds}s")
+
+            if self.http_port is not None:
+                self._server = ThreadingHTTPServer((self.http_host, self.http_port), self._handler_class())
+                self._server.daemon_threads = True
+                self._server_thread = threading.Thread(
+                    target=self._server.serve_forever,
+                    name="MetricsHTTPThread",
+                    daemon=True
+                )
+                self._server_thread.start()
+                logger.info(f"Serving OpenMetrics at http://{self.http_host}:{self.server_port}/metrics")
+
+    @property
+    def server_port(self) -> Optional[int]:
+        """Port the endpoint is bound to (resolves http_port=0 to the chosen port)."""
+        return self._server.server_address[1] if self._server is not None else None
+
+    def stop(self):
+        """Stop exporting, writing the file one final time."""
+        with self._lock:
+            self._stop_event.set()
+            if self._write_thread is not None:
+                self._write_thread.join(timeout=5)
+                self._write_thread = None
+                self.write()
+            if self._server is not None:
+                self._server.shutdown()
+                self._server.server_close()
+                self._server = None
+                self._server_thread = None
+
+    def _write_loop(self):
+        while not self._stop_event.is_set():
+            self.write()
+            self._stop_event.wait(self.interval_seconds)
+
+    def _handler_class(self):
+        exporter = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+                    self.send_error(404)
+                    return
+                try:
+                    body = exporter.render().encode("utf-8")
+                except Exception as e:
+                    logger.error(f"Failed to collect metrics for scrape: {e}")
+                    self.send_error(500)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", OPENMETRICS_CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug(f"Metrics scrape: {format % args}")
+
+        return MetricsHandler
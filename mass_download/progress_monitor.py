@@ -11,18 +11,27 @@ for the mass download feature, including:
 - Progress visualization
 - Detailed statistics reporting
 """
+import copy
+import math
+import sys
 import time
 import threading
-from typing import Dict, List, Any, Optional, Callable
-from dataclasses import dataclass, field
+from collections import deque
+from typing import Dict, List, Any, Optional, Callable, Tuple
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta
 from enum import Enum
 import json
 from pathlib import Path
 
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
 # Import logging
 import logging
 
+from utils.json_utils import open_journal_for_append
+
 logger = logging.getLogger(__name__)
 
 # Simple operation logger creator (inline implementation)
@@ -31,6 +40,218 @@ def create_operation_logger(operation_name):
     return logging.getLogger(f"mass_download.{operation_name}")
 
 
+class ShardedCounters:
+    """
+    Integer counters sharded per thread.
+    
+    add() touches only the calling thread's shard, so hot-path updates from
+    many worker threads take no lock and never contend; reads sum every shard.
+    Keys are any hashable (a metric name, or a (metric, channel_url) tuple).
+    set() is meant for initialisation and resume, not for racing with add().
+    """
+    
+    def __init__(self):
+        self._local = threading.local()
+        self._shards: List[Dict[Any, int]] = []
+        self._base: Dict[Any, int] = {}
+        self._lock = threading.Lock()  # Shard registration and set() only
+    
+    def add(self, key: Any, amount: int = 1):
+        """Add amount to key (lock-free after the calling thread's first add)."""
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._local.shard = {}
+            with self._lock:
+                self._shards.append(shard)
+        shard[key] = shard.get(key, 0) + amount
+    
+    def get(self, key: Any) -> int:
+        """Current total for key."""
+        total = self._base.get(key, 0)
+        for shard in tuple(self._shards):
+            total += shard.get(key, 0)
+        return total
+    
+    def set(self, key: Any, value: int):
+        """Make key's total equal value."""
+        with self._lock:
+            self._base[key] = value - sum(shard.get(key, 0) for shard in self._shards)
+    
+    def totals(self) -> Dict[Any, int]:
+        """Current totals for every key."""
+        totals = dict(self._base)
+        for shard in tuple(self._shards):
+            for key, value in shard.copy().items():
+                totals[key] = totals.get(key, 0) + value
+        return totals
+
+
+class CounterField:
+    """
+    Dataclass field whose int value lives in the instance's ShardedCounters.
+    
+    Reading aggregates and assigning sets the total. `obj.field += 1` is a
+    read-then-set and not atomic, so hot paths should call the owner's
+    increment() (i.e. ShardedCounters.add) instead.
+    """
+    
+    def __init__(self, default: int = 0):
+        self.default = default
+    
+    def __set_name__(self, owner, name: str):
+        self.name = name
+    
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self.default
+        return sharded_counters_of(instance).get(self.name)
+    
+    def __set__(self, instance, value: int):
+        sharded_counters_of(instance).set(self.name, value)
+
+
+def sharded_counters_of(instance) -> ShardedCounters:
+    """The ShardedCounters backing an instance's CounterFields (created on first use)."""
+    counters = instance.__dict__.get("_counters")
+    if counters is None:
+        counters = instance.__dict__.setdefault("_counters", ShardedCounters())
+    return counters
+
+
+class Histogram:
+    """
+    HDR-style histogram with bounded relative error.
+    
+    Values are counted in log-linear buckets: each power of two above
+    lowest is split into sub_buckets linear buckets, so every recorded value
+    is reported within 1/sub_buckets of its true value regardless of
+    magnitude, in fixed memory. Counts are sharded per thread, so record()
+    takes no lock.
+    """
+    
+    def __init__(self, lowest: float = 0.001, highest: float = 1_000_000.0, sub_buckets: int = 64):
+        """
+        Initialize histogram.
+        
+        Args:
+            lowest: Smallest distinguishable value (smaller values count here)
+            highest: Largest tracked value (larger values are clamped)
+            sub_buckets: Linear buckets per power of two (precision ~1/sub_buckets)
+        """
+        if lowest <= 0 or highest <= lowest:
+            raise ValueError(f"HISTOGRAM ERROR: Need 0 < lowest < highest, got {lowest}, {highest}")
+        if sub_buckets < 1:
+            raise ValueError(f"HISTOGRAM ERROR: sub_buckets must be at least 1, got {sub_buckets}")
+        
+        self.lowest = lowest
+        self.highest = highest
+        self.sub_buckets = sub_buckets
+        self._counts = ShardedCounters()
+    
+    def record(self, value: float):
+        """Count one value (lock-free)."""
+        value = min(value, self.highest)
+        self._counts.add(self._bucket(value))
+        self._counts.add("sum", value)
+    
+    def _bucket(self, value: float) -> int:
+        if value <= self.lowest:
+            return 0
+        mantissa, exponent = math.frexp(value / self.lowest)  # value/lowest = mantissa * 2**exponent
+        return (exponent - 1) * self.sub_buckets + int((mantissa * 2 - 1) * self.sub_buckets) + 1
+    
+    def _bucket_value(self, bucket: int) -> float:
+        """Midpoint of a bucket's range."""
+        if bucket == 0:
+            return self.lowest
+        exponent, sub_bucket = divmod(bucket - 1, self.sub_buckets)
+        return self.lowest * 2 ** exponent * (1 + (sub_bucket + 0.5) / self.sub_buckets)
+    
+    def summary(self, percentiles: Tuple[float, ...] = (50, 90, 99)) -> Dict[str, Any]:
+        """Count, mean, min, max and the given percentiles (min/max/percentiles at bucket precision)."""
+        totals = self._counts.totals()
+        total_sum = totals.pop("sum", 0.0)
+        buckets = sorted((bucket, count) for bucket, count in totals.items() if count)
+        count = sum(bucket_count for _, bucket_count in buckets)
+        
+        summary: Dict[str, Any] = {"count": count}
+        if not count:
+            return summary
+        
+        summary["mean"] = round(total_sum / count, 4)
+        summary["min"] = round(self._bucket_value(buckets[0][0]), 4)
+        
+        cumulative = 0
+        targets = sorted(percentiles)
+        index = 0
+        for bucket, bucket_count in buckets:
+            cumulative += bucket_count
+            while index < len(targets) and cumulative >= targets[index] / 100 * count:
+                summary[f"p{targets[index]:g}"] = round(self._bucket_value(bucket), 4)
+                index += 1
+        
+        summary["max"] = round(self._bucket_value(buckets[-1][0]), 4)
+        return summary
+
+
+class RollingRates:
+    """
+    Per-second rates of cumulative totals over trailing windows.
+    
+    Writers never touch this: the reader samples the (sharded) totals at most
+    once per resolution seconds, and a window's rate is the change since the
+    newest sample at least that old. Until a window has filled, the rate
+    covers the time since the first sample.
+    """
+    
+    def __init__(self, windows: Tuple[int, ...] = (60, 300, 900), resolution: float = 1.0):
+        """
+        Initialize rolling rates.
+        
+        Args:
+            windows: Window lengths in seconds
+            resolution: Minimum seconds between samples
+        """
+        self.windows = windows
+        self.resolution = resolution
+        self._samples: deque = deque()  # (monotonic time, totals)
+    
+    def sample(self, totals: Dict[str, float], now: Optional[float] = None):
+        """Record current totals (caller serialises calls)."""
+        now = time.monotonic() if now is None else now
+        if self._samples and now - self._samples[-1][0] < self.resolution:
+            return
+        self._samples.append((now, dict(totals)))
+        
+        # Keep one sample at least the longest window old
+        horizon = now - max(self.windows)
+        while len(self._samples) > 1 and self._samples[1][0] <= horizon:
+            self._samples.popleft()
+    
+    def rates(self, totals: Dict[str, float], now: Optional[float] = None) -> Dict[int, Dict[str, float]]:
+        """Per-second rate of each total over each window."""
+        now = time.monotonic() if now is None else now
+        rates: Dict[int, Dict[str, float]] = {}
+        for window in self.windows:
+            start = None
+            for sample in reversed(self._samples):
+                start = sample
+                if sample[0] <= now - window:
+                    break
+            
+            if start is None or now - start[0] <= 0:
+                rates[window] = {name: 0.0 for name in totals}
+                continue
+            
+            elapsed = now - start[0]
+            rates[window] = {
+                name: (value - start[1].get(name, 0)) / elapsed
+                for name, value in totals.items()
+            }
+        return rates
+
+
 class ProgressState(Enum):
     """Progress states for monitoring."""
     NOT_STARTED = "not_started"
@@ -81,6 +302,8 @@ class ProgressMetrics:
             return None
         
         elapsed = self.get_elapsed_time().total_seconds()
+        if elapsed <= 0:
+            return None
         rate = self.channels_processed / elapsed
         remaining = self.total_channels - self.channels_processed
         
@@ -117,26 +340,44 @@ class ProgressMonitor:
     Features:
     - Real-time progress updates
     - Performance metrics calculation
-    - Progress persistence
+    - Progress persistence (event log plus periodic snapshot)
     - Event callbacks
     - Terminal-friendly display
+    
+    Channel-level changes (channel started, video total, channel completed)
+    are recorded as small events that are applied in memory and queued under
+    the lock. Per-video and per-byte updates are hot, so they go to sharded
+    per-thread counters without taking the lock; each flush logs the counter
+    deltas since the previous one as a single event. The persist thread
+    appends queued events to a JSONL log next to the progress file. A
+    compacted snapshot is written only every snapshot_every events (and on
+    stop), after which the log is truncated. load_progress replays the
+    snapshot plus the log tail.
     """
     
     def __init__(self, 
                  update_interval: float = 1.0,
                  persist_interval: float = 10.0,
-                 progress_file: Optional[Path] = None):
+                 progress_file: Optional[Path] = None,
+                 snapshot_every: int = 10000):
         """
         Initialize progress monitor.
         
         Args:
             update_interval: Seconds between display updates
-            persist_interval: Seconds between progress saves
-            progress_file: Path to save progress (optional)
+            persist_interval: Seconds between event log flushes
+            progress_file: Path to save the progress snapshot (optional); events
+                are logged beside it with an .events.jsonl suffix
+            snapshot_every: Logged events between compacted snapshots
         """
+        if snapshot_every < 1:
+            raise ValueError(f"PROGRESS MONITOR ERROR: snapshot_every must be at least 1, got {snapshot_every}")
+        
         self.update_interval = update_interval
         self.persist_interval = persist_interval
         self.progress_file = progress_file or Path("mass_download_progress.json")
+        self.events_file = self.progress_file.with_suffix(".events.jsonl")
+        self.snapshot_every = snapshot_every
         
         # Progress tracking
         self.metrics = ProgressMetrics()
@@ -149,12 +390,29 @@ class ProgressMonitor:
         self._persist_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
         
+        # Hot-path counters: metric name, or (metric, channel_url) per channel
+        self._counters = ShardedCounters()
+        self._logged_counts: Dict[Any, int] = {}
+        
+        # Event log (_log_lock orders file writes; taken before _lock, never inside it)
+        self._pending_events: List[Dict[str, Any]] = []
+        self._sequence = 0
+        self._events_since_snapshot = 0
+        self._log_lock = threading.Lock()
+        self._events_tail_checked = False
+        
         # Callbacks
         self._callbacks: List[Callable[[ProgressMetrics], None]] = []
         
         # Performance tracking
         self._last_update_time = time.time()
         self._last_bytes = 0
+        self.histograms: Dict[str, Histogram] = {
+            "video_download_seconds": Histogram(),
+            "enumeration_seconds": Histogram(),
+            "upload_mb_per_second": Histogram()
+        }
+        self._rolling = RollingRates()
         
         logger.info("ProgressMonitor initialized")
     
@@ -166,7 +424,8 @@ class ProgressMonitor:
                 return
             
             self.state = ProgressState.INITIALIZING
-            self.metrics.start_time = datetime.now()
+            self._record({"type": "started", "time": datetime.now().isoformat()})
+            self._rolling_throughput(self._metrics_snapshot())  # Rolling windows start here
             
             # Start update thread
             self._stop_event.clear()
@@ -226,88 +485,80 @@ class ProgressMonitor:
     def update_channel_count(self, total: int):
         """Update total channel count."""
         with self._lock:
-            self.metrics.total_channels = total
+            self._record({"type": "channel_count", "total": total})
     
     def start_channel(self, channel_url: str, channel_name: Optional[str] = None):
         """Mark channel processing start."""
         with self._lock:
             self.metrics.current_channel = channel_url
             self.metrics.current_operation = f"Processing {channel_name or channel_url}"
-            
-            # Create channel progress entry
-            progress = ChannelProgress(
-                channel_url=channel_url,
-                channel_name=channel_name,
-                start_time=datetime.now(),
-                status="processing"
-            )
-            self.channel_progress[channel_url] = progress
-            
-            logger.info(f"Started processing channel: {channel_url}")
+            self._record({
+                "type": "channel_started",
+                "channel": channel_url,
+                "name": channel_name,
+                "time": datetime.now().isoformat()
+            })
+        
+        logger.info(f"Started processing channel: {channel_url}")
     
     def update_channel_videos(self, channel_url: str, total_videos: int):
         """Update total video count for channel."""
         with self._lock:
             if channel_url in self.channel_progress:
-                self.channel_progress[channel_url].total_videos = total_videos
-                self.metrics.total_videos += total_videos
+                self._record({"type": "channel_videos", "channel": channel_url, "total": total_videos})
     
     def complete_channel(self, channel_url: str, success: bool = True, 
                         error_message: Optional[str] = None):
         """Mark channel processing complete."""
         with self._lock:
             if channel_url in self.channel_progress:
-                progress = self.channel_progress[channel_url]
-                progress.end_time = datetime.now()
-                progress.status = "completed" if success else "failed"
-                progress.error_message = error_message
-                
-                self.metrics.channels_processed += 1
-                if not success:
-                    self.metrics.channels_failed += 1
+                self._fold_channel_counts(self.channel_progress[channel_url])
+                self._record({
+                    "type": "channel_completed",
+                    "channel": channel_url,
+                    "success": success,
+                    "error": error_message,
+                    "time": datetime.now().isoformat()
+                })
                 
                 if self.metrics.current_channel == channel_url:
                     self.metrics.current_channel = None
                     self.metrics.current_operation = "idle"
-            
-            logger.info(f"Completed channel: {channel_url} (success={success})")
+        
+        logger.info(f"Completed channel: {channel_url} (success={success})")
     
     def update_video_progress(self, video_id: str, video_title: str, 
                             downloaded: bool = True, failed: bool = False):
-        """Update video download progress."""
-        with self._lock:
-            self.metrics.current_video = video_title
-            
-            if downloaded:
-                self.metrics.videos_downloaded += 1
-            elif failed:
-                self.metrics.videos_failed += 1
-            else:
-                self.metrics.videos_skipped += 1
-            
-            # Update channel progress
-            if self.metrics.current_channel:
-                channel_url = self.metrics.current_channel
-                if channel_url in self.channel_progress:
-                    self.channel_progress[channel_url].videos_processed += 1
-                    if failed:
-                        self.channel_progress[channel_url].videos_failed += 1
+        """Update video download progress (lock-free)."""
+        if downloaded:
+            self._counters.add("videos_downloaded")
+        elif failed:
+            self._counters.add("videos_failed")
+        else:
+            self._counters.add("videos_skipped")
+        
+        self.metrics.current_video = video_title
+        channel_url = self.metrics.current_channel
+        if channel_url is not None:
+            self._counters.add(("videos_processed", channel_url))
+            if failed:
+                self._counters.add(("videos_failed", channel_url))
     
     def update_download_stats(self, bytes_downloaded: int):
-        """Update download statistics."""
-        with self._lock:
-            self.metrics.bytes_downloaded += bytes_downloaded
-            
-            # Calculate speed
-            current_time = time.time()
-            time_diff = current_time - self._last_update_time
-            if time_diff > 0:
-                bytes_diff = self.metrics.bytes_downloaded - self._last_bytes
-                speed_bps = bytes_diff / time_diff
-                self.metrics.average_speed_mbps = (speed_bps * 8) / 1_000_000  # Convert to Mbps
-                
-                self._last_update_time = current_time
-                self._last_bytes = self.metrics.bytes_downloaded
+        """Update download statistics (lock-free; speed is derived when read)."""
+        self._counters.add("bytes_downloaded", bytes_downloaded)
+    
+    def record_video_download_time(self, seconds: float):
+        """Record how long one video took to download (lock-free)."""
+        self.histograms["video_download_seconds"].record(seconds)
+    
+    def record_enumeration_time(self, seconds: float):
+        """Record how long one channel's video enumeration took (lock-free)."""
+        self.histograms["enumeration_seconds"].record(seconds)
+    
+    def record_upload_speed(self, megabytes_per_second: float):
+        """Record one upload's transfer rate in MB/s (lock-free)."""
+        self.histograms["upload_mb_per_second"].record(megabytes_per_second)
     
     def add_callback(self, callback: Callable[[ProgressMetrics], None]):
         """Add a progress update callback."""
@@ -316,43 +567,63 @@ class ProgressMonitor:
     def get_current_metrics(self) -> ProgressMetrics:
         """Get current progress metrics."""
         with self._lock:
-            # Create a copy to avoid threading issues
-            import copy
-            return copy.deepcopy(self.metrics)
+            return self._metrics_snapshot()
+    
+    def get_channel_progress(self) -> Dict[str, ChannelProgress]:
+        """Get a copy of per-channel progress with current video counts."""
+        counts = self._counters.totals()
+        with self._lock:
+            return {
+                url: replace(
+                    progress,
+                    videos_processed=counts.get(("videos_processed", url), 0),
+                    videos_failed=counts.get(("videos_failed", url), 0)
+                )
+                for url, progress in self.channel_progress.items()
+            }
     
     def get_summary_report(self) -> Dict[str, Any]:
         """Generate a summary report."""
         with self._lock:
-            elapsed = self.metrics.get_elapsed_time()
-            eta = self.metrics.get_eta()
+            metrics = self._metrics_snapshot()
+            elapsed = metrics.get_elapsed_time()
+            eta = metrics.get_eta()
+            throughput = self._rolling_throughput(metrics)
+            eta_recent = self._recent_eta(metrics, throughput)
             
             report = {
                 "state": self.state.value,
                 "overall_progress": {
-                    "percent": self.metrics.get_progress_percent(),
+                    "percent": metrics.get_progress_percent(),
                     "channels": {
-                        "total": self.metrics.total_channels,
-                        "processed": self.metrics.channels_processed,
-                        "failed": self.metrics.channels_failed,
-                        "skipped": self.metrics.channels_skipped
+                        "total": metrics.total_channels,
+                        "processed": metrics.channels_processed,
+                        "failed": metrics.channels_failed,
+                        "skipped": metrics.channels_skipped
                     },
                     "videos": {
-                        "total": self.metrics.total_videos,
-                        "downloaded": self.metrics.videos_downloaded,
-                        "failed": self.metrics.videos_failed,
-                        "skipped": self.metrics.videos_skipped
+                        "total": metrics.total_videos,
+                        "downloaded": metrics.videos_downloaded,
+                        "failed": metrics.videos_failed,
+                        "skipped": metrics.videos_skipped
                     }
                 },
                 "performance": {
                     "elapsed_time": str(elapsed),
                     "eta": str(eta) if eta else None,
-                    "average_speed_mbps": round(self.metrics.average_speed_mbps, 2),
-                    "total_downloaded_gb": round(self.metrics.bytes_downloaded / 1_073_741_824, 2)
+                    "eta_recent": str(eta_recent) if eta_recent else None,
+                    "average_speed_mbps": round(metrics.average_speed_mbps, 2),
+                    "total_downloaded_gb": round(metrics.bytes_downloaded / 1_073_741_824, 2),
+                    "throughput": throughput
+                },
+                "latency": {
+                    name: histogram.summary()
+                    for name, histogram in self.histograms.items()
                 },
                 "current_operation": {
-                    "channel": self.metrics.current_channel,
-                    "video": self.metrics.current_video,
-                    "operation": self.metrics.current_operation
+                    "channel": metrics.current_channel,
+                    "video": metrics.current_video,
+                    "operation": metrics.current_operation
                 }
             }
             
@@ -379,8 +650,9 @@ class ProgressMonitor:
             f"Speed: {report['performance']['average_speed_mbps']:.1f} Mbps"
         )
         
-        if report["performance"]["eta"]:
-            status += f" | ETA: {report['performance']['eta']}"
+        eta = report["performance"]["eta_recent"] or report["performance"]["eta"]
+        if eta:
+            status += f" | ETA: {eta}"
         
         print(status, end="", flush=True)
     
@@ -405,57 +677,261 @@ class ProgressMonitor:
         """Background thread for progress persistence."""
         while not self._stop_event.is_set():
             if self.state in [ProgressState.PROCESSING, ProgressState.PAUSED]:
-                self._save_progress()
+                self._flush_events()
+                if self._events_since_snapshot >= self.snapshot_every:
+                    self._save_progress()
             
             self._stop_event.wait(self.persist_interval)
     
+    def _record(self, event: Dict[str, Any]):
+        """Apply an event to in-memory progress and queue it for the log (caller holds _lock)."""
+        self._sequence += 1
+        event["seq"] = self._sequence
+        self._apply_event(event)
+        self._pending_events.append(event)
+    
+    def _apply_event(self, event: Dict[str, Any]):
+        """Apply one progress event; shared by live updates and replay."""
+        kind = event.get("type")
+        
+        if kind == "counters":
+            for name, delta in event.get("totals", {}).items():
+                self._counters.add(name, delta)
+            for url, (processed, failed) in event.get("channels", {}).items():
+                self._counters.add(("videos_processed", url), processed)
+                self._counters.add(("videos_failed", url), failed)
+        
+        elif kind == "channel_started":
+            self.channel_progress[event["channel"]] = ChannelProgress(
+                channel_url=event["channel"],
+                channel_name=event.get("name"),
+                start_time=datetime.fromisoformat(event["time"]),
+                status="processing"
+            )
+        
+        elif kind == "channel_videos":
+            progress = self.channel_progress.get(event["channel"])
+            if progress is not None:
+                progress.total_videos = event["total"]
+                self.metrics.total_videos += event["total"]
+        
+        elif kind == "channel_completed":
+            progress = self.channel_progress.get(event["channel"])
+            if progress is not None:
+                progress.end_time = datetime.fromisoformat(event["time"])
+                progress.status = "completed" if event["success"] else "failed"
+                progress.error_message = event.get("error")
+                
+                self.metrics.channels_processed += 1
+                if not event["success"]:
+                    self.metrics.channels_failed += 1
+        
+        elif kind == "channel_count":
+            self.metrics.total_channels = event["total"]
+        
+        elif kind == "started":
+            self.metrics.start_time = datetime.fromisoformat(event["time"])
+        
+        else:
+            logger.warning(f"Ignoring unknown progress event type: {kind}")
+    
+    def _metrics_snapshot(self) -> ProgressMetrics:
+        """Copy of metrics with counter totals folded in (caller holds _lock)."""
+        metrics = copy.deepcopy(self.metrics)
+        metrics.videos_downloaded = self._counters.get("videos_downloaded")
+        metrics.videos_failed = self._counters.get("videos_failed")
+        metrics.videos_skipped = self._counters.get("videos_skipped")
+        metrics.bytes_downloaded = self._counters.get("bytes_downloaded")
+        
+        # Speed over the bytes counted since the previous read
+        current_time = time.time()
+        time_diff = current_time - self._last_update_time
+        if time_diff > 0 and metrics.bytes_downloaded != self._last_bytes:
+            speed_bps = (metrics.bytes_downloaded - self._last_bytes) / time_diff
+            self.metrics.average_speed_mbps = (speed_bps * 8) / 1_000_000  # Convert to Mbps
+            metrics.average_speed_mbps = self.metrics.average_speed_mbps
+            self._last_update_time = current_time
+            self._last_bytes = metrics.bytes_downloaded
+        return metrics
+    
+    def _rolling_throughput(self, metrics: ProgressMetrics) -> Dict[str, Dict[str, float]]:
+        """Channel, video and byte throughput over the 1m/5m/15m windows (caller holds _lock)."""
+        totals = {
+            "channels": metrics.channels_processed,
+            "videos": metrics.videos_downloaded + metrics.videos_failed + metrics.videos_skipped,
+            "bytes": metrics.bytes_downloaded
+        }
+        self._rolling.sample(totals)
+        
+        return {
+            f"{window // 60}m": {
+                "channels_per_minute": round(rates["channels"] * 60, 2),
+                "videos_per_minute": round(rates["videos"] * 60, 2),
+                "mbps": round(rates["bytes"] * 8 / 1_000_000, 2)
+            }
+            for window, rates in self._rolling.rates(totals).items()
+        }
+    
+    def _recent_eta(self, metrics: ProgressMetrics,
+                    throughput: Dict[str, Dict[str, float]]) -> Optional[timedelta]:
+        """ETA from the 5-minute channel rate, so a recent slowdown shows up."""
+        remaining = metrics.total_channels - metrics.channels_processed
+        rate = throughput.get("5m", {}).get("channels_per_minute", 0.0)
+        if remaining <= 0 or rate <= 0:
+            return None
+        return timedelta(seconds=int(remaining / rate * 60))
+    
+    def _fold_channel_counts(self, progress: ChannelProgress):
+        """Copy a channel's counter totals onto its ChannelProgress (caller holds _lock)."""
+        progress.videos_processed = self._counters.get(("videos_processed", progress.channel_url))
+        progress.videos_failed = self._counters.get(("videos_failed", progress.channel_url))
+    
+    def _counter_event(self, counts: Dict[Any, int]) -> Optional[Dict[str, Any]]:
+        """Event carrying counter deltas since the last logged counts (caller holds _lock)."""
+        totals: Dict[str, int] = {}
+        channels: Dict[str, List[int]] = {}
+        for key, value in counts.items():
+            delta = value - self._logged_counts.get(key, 0)
+            if not delta:
+                continue
+            if isinstance(key, tuple):
+                metric, url = key
+                channel = channels.setdefault(url, [0, 0])
+                channel[0 if metric == "videos_processed" else 1] = delta
+            else:
+                totals[key] = delta
+        self._logged_counts = counts
+        
+        if not totals and not channels:
+            return None
+        self._sequence += 1
+        return {"type": "counters", "totals": totals, "channels": channels, "seq": self._sequence}
+    
+    def _write_events(self, events: List[Dict[str, Any]]):
+        """Append events to the log (caller holds _log_lock)."""
+        if not events:
+            return
+        lines = "".join(json.dumps(event, separators=(",", ":")) + "\n" for event in events)
+        if self._events_tail_checked:
+            log = open(self.events_file, 'a')
+        else:
+            # A crash may have left a torn last event; appending after it would lose this batch
+            log = open_journal_for_append(self.events_file)
+            self._events_tail_checked = True
+        with log:
+            log.write(lines)
+    
+    def _flush_events(self):
+        """Append queued events to the event log."""
+        try:
+            with self._log_lock:
+                # Counts first: any channel they mention was started before, so
+                # its channel_started event is already queued or logged
+                counts = self._counters.totals()
+                with self._lock:
+                    pending = self._pending_events
+                    self._pending_events = []
+                    counter_event = self._counter_event(counts)
+                    if counter_event is not None:
+                        pending.append(counter_event)
+                    self._events_since_snapshot += len(pending)
+                self._write_events(pending)
+        except Exception as e:
+            logger.error(f"Failed to append progress events: {e}")
+    
     def _save_progress(self):
-        """Save current progress to file."""
+        """Write a compacted progress snapshot and truncate the event log."""
         try:
-            with self._lock:
-                progress_data = {
-                    "timestamp": datetime.now().isoformat(),
-                    "state": self.state.value,
-                    "metrics": {
-                        "total_channels": self.metrics.total_channels,
-                        "channels_processed": self.metrics.channels_processed,
-                        "channels_failed": self.metrics.channels_failed,
-                        "total_videos": self.metrics.total_videos,
-                        "videos_downloaded": self.metrics.videos_downloaded,
-                        "videos_failed": self.metrics.videos_failed,
-                        "bytes_downloaded": self.metrics.bytes_downloaded,
-                        "start_time": self.metrics.start_time.isoformat() if self.metrics.start_time else None
-                    },
-                    "channel_progress": {
-                        url: {
-                            "name": cp.channel_name,
-                            "total_videos": cp.total_videos,
-                            "videos_processed": cp.videos_processed,
-                            "status": cp.status
+            with self._log_lock:
+                counts = self._counters.totals()
+                with self._lock:
+                    pending = self._pending_events
+                    self._pending_events = []
+                    self._logged_counts = counts
+                    progress_data = {
+                        "timestamp": datetime.now().isoformat(),
+                        "state": self.state.value,
+                        "sequence": self._sequence,
+                        "metrics": {
+                            "total_channels": self.metrics.total_channels,
+                            "channels_processed": self.metrics.channels_processed,
+                            "channels_failed": self.metrics.channels_failed,
+                            "total_videos": self.metrics.total_videos,
+                            "videos_downloaded": counts.get("videos_downloaded", 0),
+                            "videos_failed": counts.get("videos_failed", 0),
+                            "videos_skipped": counts.get("videos_skipped", 0),
+                            "bytes_downloaded": counts.get("bytes_downloaded", 0),
+                            "start_time": self.metrics.start_time.isoformat() if self.metrics.start_time else None
+                        },
+                        "channel_progress": {
+                            url: {
+                                "name": cp.channel_name,
+                                "total_videos": cp.total_videos,
+                                "videos_processed": counts.get(("videos_processed", url), 0),
+                                "videos_failed": counts.get(("videos_failed", url), 0),
+                                "status": cp.status
+                            }
+                            for url, cp in self.channel_progress.items()
                         }
-                        for url, cp in self.channel_progress.items()
                     }
-                }
-            
-            # Write to temp file first
-            temp_file = self.progress_file.with_suffix('.tmp')
-            with open(temp_file, 'w') as f:
-                json.dump(progress_data, f, indent=2)
-            
-            # Atomic rename
-            temp_file.replace(self.progress_file)
+                
+                # Log queued events first so they survive a failed snapshot write
+                self._write_events(pending)
+                
+                # Write to temp file first
+                temp_file = self.progress_file.with_suffix('.tmp')
+                with open(temp_file, 'w') as f:
+                    json.dump(progress_data, f, separators=(",", ":"))
+                
+                # Atomic rename
+                temp_file.replace(self.progress_file)
+                
+                # Every logged event is now in the snapshot (replay skips by sequence
+                # if we crash before this truncate)
+                open(self.events_file, 'w').close()
+                with self._lock:
+                    self._events_since_snapshot = 0
             
         except Exception as e:
             logger.error(f"Failed to save progress: {e}")
     
+    def _read_events(self, after_sequence: int) -> List[Dict[str, Any]]:
+        """Read logged events newer than after_sequence."""
+        if not self.events_file.exists():
+            return []
+        
+        with open(self.events_file, 'r') as f:
+            lines = f.read().splitlines()
+        
+        events = []
+        for line_number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                if line_number == len(lines):
+                    logger.warning(f"Ignoring partially written last event in {self.events_file}")
+                    break
+                logger.error(f"Skipping corrupt progress event at {self.events_file}:{line_number}")
+                continue
+            if event.get("seq", 0) > after_sequence:
+                events.append(event)
+        return events
+    
     def load_progress(self) -> bool:
-        """Load progress from file."""
-        if not self.progress_file.exists():
+        """Load progress by replaying the event log over the last snapshot."""
+        if not self.progress_file.exists() and not self.events_file.exists():
             return False
         
         try:
-            with open(self.progress_file, 'r') as f:
-                data = json.load(f)
+            data: Dict[str, Any] = {}
+            if self.progress_file.exists():
+                with open(self.progress_file, 'r') as f:
+                    data = json.load(f)
+            
+            snapshot_sequence = data.get("sequence", 0)
+            events = self._read_events(snapshot_sequence)
             
             with self._lock:
                 # Restore metrics
@@ -464,9 +940,8 @@ class ProgressMonitor:
                 self.metrics.channels_processed = metrics.get("channels_processed", 0)
                 self.metrics.channels_failed = metrics.get("channels_failed", 0)
                 self.metrics.total_videos = metrics.get("total_videos", 0)
-                self.metrics.videos_downloaded = metrics.get("videos_downloaded", 0)
-                self.metrics.videos_failed = metrics.get("videos_failed", 0)
-                self.metrics.bytes_downloaded = metrics.get("bytes_downloaded", 0)
+                for name in ("videos_downloaded", "videos_failed", "videos_skipped", "bytes_downloaded"):
+                    self._counters.set(name, metrics.get(name, 0))
                 
                 if metrics.get("start_time"):
                     self.metrics.start_time = datetime.fromisoformat(metrics["start_time"])
@@ -478,10 +953,25 @@ class ProgressMonitor:
                         channel_name=cp_data.get("name"),
                         total_videos=cp_data.get("total_videos", 0),
                         videos_processed=cp_data.get("videos_processed", 0),
+                        videos_failed=cp_data.get("videos_failed", 0),
                         status=cp_data.get("status", "pending")
                     )
+                    self._counters.set(("videos_processed", url), cp_data.get("videos_processed", 0))
+                    self._counters.set(("videos_failed", url), cp_data.get("videos_failed", 0))
+                
+                # Replay everything logged since the snapshot
+                for event in events:
+                    self._apply_event(event)
+                
+                for progress in self.channel_progress.values():
+                    self._fold_channel_counts(progress)
+                
+                self._sequence = max([snapshot_sequence] + [event["seq"] for event in events])
+                self._events_since_snapshot = len(events)
+                self._logged_counts = self._counters.totals()
+                self._last_bytes = self._counters.get("bytes_downloaded")
             
-            logger.info("Progress loaded from file")
+            logger.info(f"Progress loaded from snapshot plus {len(events)} logged events")
             return True
             
         except Exception as e:
@@ -524,6 +1014,34 @@ class ProgressReporter:
             f"ETA: {report['performance']['eta'] or 'N/A'}",
             f"Average Speed: {report['performance']['average_speed_mbps']:.2f} Mbps",
             f"Total Downloaded: {report['performance']['total_downloaded_gb']:.2f} GB",
+            f"ETA (recent throughput): {report['performance']['eta_recent'] or 'N/A'}",
+            "",
+            "Recent Throughput",
+            "-" * 40
+        ]
+        
+        for window, rates in report['performance']['throughput'].items():
+            lines.append(
+                f"{window:>4}: {rates['channels_per_minute']:.2f} channels/min, "
+                f"{rates['videos_per_minute']:.2f} videos/min, {rates['mbps']:.2f} Mbps"
+            )
+        
+        lines.extend([
+            "",
+            "Latency Histograms",
+            "-" * 40
+        ])
+        
+        for name, summary in report['latency'].items():
+            if not summary['count']:
+                lines.append(f"{name}: no samples")
+                continue
+            lines.append(
+                f"{name}: n={summary['count']} mean={summary['mean']} p50={summary['p50']} "
+                f"p90={summary['p90']} p99={summary['p99']} max={summary['max']}"
+            )
+        
+        lines.extend([
             "",
             "Current Operation",
             "-" * 40,
@@ -533,10 +1051,10 @@ class ProgressReporter:
             "",
             "Channel Details",
             "-" * 40
-        ]
+        ])
         
         # Add channel details
-        for url, progress in self.monitor.channel_progress.items():
+        for url, progress in self.monitor.get_channel_progress().items():
             lines.append(f"\n{progress.channel_name or url}")
             lines.append(f"  Status: {progress.status}")
             lines.append(f"  Videos: {progress.videos_processed}/{progress.total_videos}")
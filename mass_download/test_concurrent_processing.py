@@ -417,6 +417,208 @@ def test_resource_based_throttling():
         return False
 
 
+def test_circuit_breaker_dispatch_pause():
+    """Test that dispatch to a service pauses while its circuit breaker is open."""
+    print("\n🧪 Testing circuit breaker dispatch pause...")
+    
+    try:
+        from concurrent_processor import ConcurrentProcessor, ResourceLimits, ResourceMetrics
+        from error_recovery import CircuitBreaker, CircuitState
+        from datetime import timedelta
+        
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=timedelta(seconds=1),
+                                 success_threshold=1)
+        
+        progress_events = []
+        processor = ConcurrentProcessor(
+            ResourceLimits(max_concurrent_channels=2, max_concurrent_downloads=2),
+            lambda event_type, event_data: progress_events.append((event_type, event_data)),
+            circuit_breakers=lambda service: breaker if service == "youtube" else CircuitBreaker()
+        )
+        processor.start()
+        # Skip the 1s CPU sample per submit so timing reflects the breaker alone
+        processor.resource_monitor.get_current_metrics = lambda queue_size=0: ResourceMetrics(
+            cpu_percent=10.0, memory_percent=10.0,
+            active_threads=threading.active_count(), queue_size=queue_size
+        )
+        
+        try:
+            # Test 1: Queued tasks for the open service wait instead of failing
+            print("  ⏸️  Testing paused dispatch...")
+            try:
+                breaker.call(lambda: 1/0)
+            except ZeroDivisionError:
+                pass
+            assert breaker.state == CircuitState.OPEN
+            calls = []
+            
+            def youtube_task(n):
+                with breaker.track():
+                    calls.append((n, time.time()))
+                return n
+            
+            paused_at = time.time()
+            futures = [processor.submit_channel_task(f"yt_{n}", youtube_task, n, service="youtube")
+                       for n in range(4)]
+            
+            # Other services keep flowing, and no pool worker is held by the paused tasks
+            other = processor.submit_channel_task("drive_0", lambda: "drive", service="google_drive")
+            assert other.result(timeout=5) == "drive"
+            
+            time.sleep(0.3)
+            assert not calls, "No calls while the breaker is open"
+            assert processor.get_status()['paused_tasks'] == 4
+            assert sum(1 for e in progress_events if e[0] == "task_paused") == 4
+            print("    ✅ Tasks held back while open, other services unaffected")
+            
+            # Test 2: A probe closes the breaker and the rest drain
+            print("  ▶️  Testing resume after recovery...")
+            results = sorted(f.result(timeout=10) for f in futures)
+            assert results == [0, 1, 2, 3]
+            assert min(t for _, t in calls) - paused_at >= 0.9, "Dispatch resumed before recovery timeout"
+            assert breaker.state == CircuitState.CLOSED
+            assert processor.get_status()['paused_tasks'] == 0
+            assert not any(e[0] == "task_failed" for e in progress_events)
+            print(f"    ✅ All {len(results)} tasks ran once the breaker closed")
+        finally:
+            processor.stop()
+        
+        print("✅ SUCCESS: Circuit breaker dispatch pause tests passed")
+        return True
+        
+    except Exception as e:
+        print(f"❌ UNEXPECTED ERROR: Circuit breaker dispatch pause failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_delayed_retries_free_workers():
+    """Test that retry backoff waits in the delayed queue, not in a worker."""
+    print("\n🧪 Testing delayed retries...")
+    
+    try:
+        from concurrent_processor import ConcurrentProcessor, ResourceLimits, ResourceMetrics
+        from error_recovery import RetryManager
+        
+        def quiet_metrics(queue_size=0):
+            # Skip the 1s CPU sample per submit so timing reflects the backoff alone
+            return ResourceMetrics(cpu_percent=10.0, memory_percent=10.0,
+                                   active_threads=threading.active_count(), queue_size=queue_size)
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            state_path = Path(temp_dir) / "retry_state.sqlite3"
+            progress_events = []
+            processor = ConcurrentProcessor(
+                ResourceLimits(max_concurrent_channels=1, max_concurrent_downloads=1),
+                lambda event_type, event_data: progress_events.append((event_type, event_data)),
+                retry_manager=RetryManager(base_delay=0.5, jitter=False),
+                retry_state_path=state_path
+            )
+            processor.resource_monitor.get_current_metrics = quiet_metrics
+            processor.start()
+            
+            try:
+                # Test 1: The single worker serves other work during a backoff
+                print("  🔁 Testing backoff without blocking the pool...")
+                attempts = []
+                
+                def flaky():
+                    attempts.append(time.time())
+                    if len(attempts) < 3:
+                        raise ConnectionError(f"Attempt {len(attempts)} failed")
+                    return "recovered"
+                
+                started = time.time()
+                flaky_future = processor.submit_channel_task("flaky", flaky, max_retries=3)
+                time.sleep(0.1)
+                quick = [processor.submit_channel_task(f"quick_{n}", lambda n=n: n) for n in range(3)]
+                assert [f.result(timeout=2) for f in quick] == [0, 1, 2]
+                quick_done = time.time() - started
+                assert quick_done < 0.5, f"Other work waited on the backoff ({quick_done:.2f}s)"
+                assert processor.get_status()['delayed_tasks'] == 1
+                
+                assert flaky_future.result(timeout=5) == "recovered"
+                assert len(attempts) == 3
+                assert attempts[1] - attempts[0] >= 0.45 and attempts[2] - attempts[1] >= 0.95
+                retries = [e for e in progress_events if e[0] == "task_retry_scheduled"]
+                assert [e[1]["attempt"] for e in retries] == [1, 2]
+                assert not any(e[0] == "task_failed" for e in progress_events)
+                assert processor.retry_queue.get_state("flaky") is None
+                print(f"    ✅ Quick tasks done in {quick_done:.2f}s while flaky task backed off")
+                
+                # Test 2: Only the final failure is reported
+                print("  ❌ Testing exhausted retries...")
+                def always_fails():
+                    raise ConnectionError("still down")
+                
+                failing = processor.submit_channel_task("down", always_fails, max_retries=1)
+                try:
+                    failing.result(timeout=5)
+                    assert False, "Should have raised exception"
+                except ConnectionError:
+                    pass
+                assert sum(1 for e in progress_events if e[0] == "task_failed") == 1
+                assert processor.retry_queue.get_state("down") is None
+                print("    ✅ One task_failed event after retries ran out")
+                
+                # Test 2b: Errors outside retry_on fail at once
+                def bad_input():
+                    raise ValueError("not retryable")
+                
+                retried_before = len([e for e in progress_events if e[0] == "task_retry_scheduled"])
+                rejected = processor.submit_channel_task("bad", bad_input, max_retries=3,
+                                                         retry_on=(ConnectionError,))
+                try:
+                    rejected.result(timeout=2)
+                    assert False, "Should have raised exception"
+                except ValueError:
+                    pass
+                assert len([e for e in progress_events if e[0] == "task_retry_scheduled"]) == retried_before
+                print("    ✅ Non-retryable error failed without a retry")
+                
+                # Test 3: Retry state survives a restart
+                print("  💾 Testing retry state across restart...")
+                stalled = processor.submit_download_task("stalled", always_fails, max_retries=2)
+                deadline = time.time() + 2
+                while processor.retry_queue.get_state("stalled") is None and time.time() < deadline:
+                    time.sleep(0.02)
+                assert processor.retry_queue.get_state("stalled").attempt == 1
+            finally:
+                processor.stop()
+            assert stalled.done()
+            
+            restarted = ConcurrentProcessor(
+                ResourceLimits(max_concurrent_channels=1, max_concurrent_downloads=1),
+                retry_manager=RetryManager(base_delay=0.5, jitter=False),
+                retry_state_path=state_path
+            )
+            restarted.resource_monitor.get_current_metrics = quiet_metrics
+            restarted.start()
+            try:
+                resumed_attempts = []
+                
+                def now_works():
+                    resumed_attempts.append(True)
+                    return "done"
+                
+                assert restarted.submit_download_task("stalled", now_works, max_retries=2).result(timeout=5) == "done"
+                assert len(resumed_attempts) == 1
+                assert restarted.retry_queue.get_state("stalled") is None
+                print("    ✅ Restarted processor resumed the persisted backoff")
+            finally:
+                restarted.stop()
+        
+        print("✅ SUCCESS: Delayed retry tests passed")
+        return True
+        
+    except Exception as e:
+        print(f"❌ UNEXPECTED ERROR: Delayed retry test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
 def test_integration_with_coordinator():
     """Test integration with mass download coordinator."""
     print("\n🧪 Testing integration with coordinator...")
@@ -476,7 +678,7 @@ def test_integration_with_coordinator():
             ]
             
             # Mock channel processing
-            def mock_process_channel(person, channel_url):
+            def mock_process_channel(person, channel_url, **kwargs):
                 time.sleep(0.1)  # Simulate work
                 from mass_coordinator import ChannelProcessingResult, ProcessingStatus
                 return ChannelProcessingResult(
@@ -496,6 +698,25 @@ def test_integration_with_coordinator():
             assert all(r.status.value == "completed" for r in results)
             print(f"    ✅ Processed {len(results)} channels with resource management")
             
+            # Test 1b: Discovery failures retry from the delayed queue
+            print("  🔁 Testing scheduled channel retries...")
+            from mass_coordinator import RetryableChannelError
+            coordinator.concurrent_processor.retry_manager.base_delay = 0.05
+            calls = []
+            
+            def flaky_process_channel(person, channel_url, defer_failure=False):
+                calls.append(channel_url)
+                assert defer_failure, "Scheduled channels should defer failures"
+                if calls.count(channel_url) == 1:
+                    raise RetryableChannelError("Channel discovery failed: timed out")
+                return mock_process_channel(person, channel_url)
+            
+            coordinator.process_channel = flaky_process_channel
+            results = coordinator.process_channels_with_resource_management(person_channel_pairs[:2])
+            assert all(r.status.value == "completed" for r in results)
+            assert len(calls) == 4, calls
+            print("    ✅ Each channel recovered on its scheduled retry")
+            
             # Test 2: Check progress callback integration
             print("  📊 Testing progress callback integration...")
             
@@ -690,6 +911,14 @@ def main():
             all_tests_passed = False
             print("❌ Resource-based throttling FAILED")
         
+        if not test_circuit_breaker_dispatch_pause():
+            all_tests_passed = False
+            print("❌ Circuit breaker dispatch pause FAILED")
+        
+        if not test_delayed_retries_free_workers():
+            all_tests_passed = False
+            print("❌ Delayed retry test FAILED")
+        
         if not test_integration_with_coordinator():
             all_tests_passed = False
             print("❌ Integration with coordinator FAILED")
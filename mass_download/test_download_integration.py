@@ -21,7 +21,7 @@ import tempfile
 from pathlib import Path
 from typing import List, Dict, Any
 from unittest.mock import Mock, patch, MagicMock
-from datetime import datetime
+from datetime import datetime, timedelta
 import uuid
 
 # Add the current directory to path for imports
@@ -268,14 +268,16 @@ def test_local_then_upload_mode():
         # Mock configuration
         mock_config = MagicMock()
         mock_config.get.side_effect = lambda key, default=None: {
-            "mass_download.download_mode": "local_then_upload",
-            "mass_download.local_download_dir": temp_dir,
-            "mass_download.delete_after_upload": True,
-            "mass_download.download_resolution": "720",
-            "mass_download.download_format": "mp4",
-            "mass_download.download_subtitles": True,
-            "s3.default_bucket": "test-bucket",
-            "mass_download.s3_prefix": "mass-download"
+            "mass_download": {
+                "download_mode": "local_then_upload",
+                "local_download_dir": temp_dir,
+                "delete_after_upload": True,
+                "download_resolution": "720",
+                "download_format": "mp4",
+                "download_subtitles": True,
+                "s3_prefix": "mass-download"
+            },
+            "downloads": {"s3": {"default_bucket": "test-bucket"}}
         }.get(key, default)
         
         # Create test video record
@@ -292,17 +294,14 @@ def test_local_then_upload_mode():
         mock_video_path.parent.mkdir(parents=True, exist_ok=True)
         mock_video_path.write_text("mock video content")
         
-        # Mock download and upload
-        with patch('download_integration.download_single_video') as mock_download:
+        # Mock download and upload (autospec enforces the real call signature)
+        with patch('download_integration.download_single_video', autospec=True) as mock_download:
             with patch('download_integration.UnifiedS3Manager') as mock_s3_class:
                 mock_s3_manager = MagicMock()
                 mock_s3_class.return_value = mock_s3_manager
                 
-                # Mock successful download
-                mock_download.return_value = {
-                    "success": True,
-                    "video_path": str(mock_video_path)
-                }
+                # Mock successful download: (video_file, transcript_file)
+                mock_download.return_value = (mock_video_path, None)
                 
                 # Mock successful upload
                 mock_s3_manager.generate_uuid_s3_key.return_value = "mass-download/uuid/video.mp4"
@@ -347,11 +346,13 @@ def test_error_handling():
         # Mock configuration for local only mode
         mock_config = MagicMock()
         mock_config.get.side_effect = lambda key, default=None: {
-            "mass_download.download_mode": "local_only",
-            "mass_download.local_download_dir": tempfile.gettempdir(),
-            "mass_download.download_resolution": "720",
-            "mass_download.download_format": "mp4",
-            "mass_download.download_subtitles": True
+            "mass_download": {
+                "download_mode": "local_only",
+                "local_download_dir": tempfile.gettempdir(),
+                "download_resolution": "720",
+                "download_format": "mp4",
+                "download_subtitles": True
+            }
         }.get(key, default)
         
         # Create test video record
@@ -363,41 +364,35 @@ def test_error_handling():
         )
         
         # Test Case 1: Download failure
-        with patch('download_integration.download_single_video') as mock_download:
+        with patch('download_integration.download_single_video', autospec=True) as mock_download:
             with patch('download_integration.UnifiedS3Manager'):
-                # Mock download failure
-                mock_download.return_value = {
-                    "success": False,
-                    "error": "Video is private"
-                }
+                # Mock download failure (yt-dlp errors are logged and reported as no files)
+                mock_download.return_value = (None, None)
                 
                 integration = DownloadIntegration(config=mock_config)
                 result = integration.download_video(video_record)
                 
                 assert result.status == "failed"
-                assert "Video is private" in result.error_message
+                assert "no video file" in result.error_message
                 
                 print("✅ SUCCESS: Download failure handled correctly")
         
         # Test Case 2: File not found after download
-        with patch('download_integration.download_single_video') as mock_download:
+        with patch('download_integration.download_single_video', autospec=True) as mock_download:
             with patch('download_integration.UnifiedS3Manager'):
                 # Mock download claims success but file doesn't exist
-                mock_download.return_value = {
-                    "success": True,
-                    "video_path": "/nonexistent/path.mp4"
-                }
+                mock_download.return_value = (Path("/nonexistent/path.mp4"), None)
                 
                 integration = DownloadIntegration(config=mock_config)
                 result = integration.download_video(video_record)
                 
                 assert result.status == "failed"
-                assert "not found" in result.error_message
+                assert "no video file" in result.error_message
                 
                 print("✅ SUCCESS: Missing file handled correctly")
         
         # Test Case 3: Exception during download
-        with patch('download_integration.download_single_video') as mock_download:
+        with patch('download_integration.download_single_video', autospec=True) as mock_download:
             with patch('download_integration.UnifiedS3Manager'):
                 # Mock exception
                 mock_download.side_effect = Exception("Network timeout")
@@ -426,14 +421,20 @@ def test_batch_download():
         from download_integration import DownloadIntegration, DownloadMode
         from database_schema import VideoRecord
         
+        download_root = tempfile.mkdtemp()
+        shared_downloads = Path(download_root) / "downloads"
+        shared_downloads.mkdir()
+        
         # Mock configuration
         mock_config = MagicMock()
         mock_config.get.side_effect = lambda key, default=None: {
-            "mass_download.download_mode": "local_only",
-            "mass_download.local_download_dir": tempfile.gettempdir(),
-            "mass_download.download_resolution": "720",
-            "mass_download.download_format": "mp4",
-            "mass_download.download_subtitles": False
+            "mass_download": {
+                "download_mode": "local_only",
+                "local_download_dir": download_root,
+                "download_resolution": "720",
+                "download_format": "mp4",
+                "download_subtitles": False
+            }
         }.get(key, default)
         
         # Create test video records
@@ -447,21 +448,22 @@ def test_batch_download():
             for i in range(3)
         ]
         
-        # Mock downloads
-        with patch('download_integration.download_single_video') as mock_download:
+        # yt-dlp writes into the shared downloads directory
+        def fake_download_single_video(url, video_id=None, title=None, transcript_only=False,
+                                       resolution=None, output_format=None, yt_dlp_path="yt-dlp",
+                                       logger=None, max_attempts=3):
+            if video_id == "vid00000002":
+                return None, None
+            video_file = shared_downloads / f"{video_id}.{output_format}"
+            video_file.write_text("mock content")
+            transcript_file = shared_downloads / f"{video_id}_transcript.vtt"
+            transcript_file.write_text("WEBVTT")
+            return video_file, transcript_file
+        
+        # Mock downloads (autospec enforces the real call signature)
+        with patch('download_integration.download_single_video', autospec=True) as mock_download:
             with patch('download_integration.UnifiedS3Manager'):
-                # Mock different results
-                mock_download.side_effect = [
-                    {"success": True, "video_path": f"/tmp/{i}/video.mp4"}
-                    if i < 2 else {"success": False, "error": "Failed"}
-                    for i in range(3)
-                ]
-                
-                # Create mock files for successful downloads
-                for i in range(2):
-                    mock_path = Path(f"/tmp/{i}/video.mp4")
-                    mock_path.parent.mkdir(parents=True, exist_ok=True)
-                    mock_path.write_text("mock content")
+                mock_download.side_effect = fake_download_single_video
                 
                 integration = DownloadIntegration(config=mock_config)
                 results = integration.batch_download(video_records)
@@ -471,6 +473,11 @@ def test_batch_download():
                 assert sum(1 for r in results if r.status == "completed") == 2
                 assert sum(1 for r in results if r.status == "failed") == 1
                 
+                # Videos are moved into the person's directory; transcripts are not wanted here
+                person_dir = Path(download_root) / "1"
+                assert results[0].local_path == str(person_dir / "vid00000000.mp4")
+                assert sorted(p.name for p in person_dir.iterdir()) == ["vid00000000.mp4", "vid00000001.mp4"]
+                
                 # Verify video records were updated
                 assert video_records[0].download_status == "completed"
                 assert video_records[1].download_status == "completed"
@@ -486,14 +493,9 @@ def test_batch_download():
                 print("✅ SUCCESS: Batch download working correctly")
                 print(f"   Completed: {stats['completed']}/{stats['total_videos']}")
                 print(f"   Success rate: {stats['success_rate']:.1f}%")
-                
-                # Clean up
-                for i in range(2):
-                    mock_path = Path(f"/tmp/{i}/video.mp4")
-                    if mock_path.exists():
-                        mock_path.unlink()
-                    if mock_path.parent.exists():
-                        mock_path.parent.rmdir()
+        
+        import shutil
+        shutil.rmtree(download_root, ignore_errors=True)
         
         print("✅ ALL batch download tests PASSED")
         return True
@@ -503,6 +505,106 @@ def test_batch_download():
         return False
 
 
+def test_scheduled_batch_download():
+    """Test batch downloads retried from a ConcurrentProcessor's delayed queue."""
+    print("\n🧪 Testing scheduled batch download...")
+    
+    try:
+        from download_integration import DownloadIntegration, DownloadResult
+        from concurrent_processor import ConcurrentProcessor, ResourceLimits
+        from error_recovery import RetryManager
+        from database_schema import VideoRecord
+        
+        mock_config = MagicMock()
+        mock_config.get.side_effect = lambda key, default=None: {
+            "mass_download": {"download_mode": "local_only", "local_download_dir": tempfile.gettempdir()}
+        }.get(key, default)
+        
+        video_records = [
+            VideoRecord(person_id=1, video_id=f"vid{i:08d}", title=f"Test Video {i+1}", uuid=str(uuid.uuid4()))
+            for i in range(3)
+        ]
+        
+        with patch('download_integration.UnifiedS3Manager'):
+            integration = DownloadIntegration(config=mock_config)
+        
+        attempts = []
+        
+        def fake_download(video_record, channel_url=None, max_attempts=3):
+            attempts.append((video_record.video_id, max_attempts))
+            tries = sum(1 for video_id, _ in attempts if video_id == video_record.video_id)
+            # vid0 succeeds at once, vid1 on its second attempt, vid2 never
+            failed = video_record.video_id == "vid00000002" or (video_record.video_id == "vid00000001" and tries == 1)
+            return DownloadResult(
+                video_id=video_record.video_id,
+                video_uuid=video_record.uuid,
+                status="failed" if failed else "completed",
+                error_message="HTTP Error 503" if failed else None
+            )
+        
+        integration.download_video = fake_download
+        
+        processor = ConcurrentProcessor(
+            ResourceLimits(max_concurrent_channels=2, max_concurrent_downloads=2),
+            retry_manager=RetryManager(base_delay=0.05, jitter=False)
+        )
+        processor.start()
+        try:
+            results = integration.batch_download(video_records, scheduler=processor, max_retries=2)
+        finally:
+            processor.stop()
+        
+        assert [r.status for r in results] == ["completed", "completed", "failed"]
+        assert results[2].error_message == "HTTP Error 503"
+        assert [r.download_status for r in video_records] == ["completed", "completed", "failed"]
+        assert len(attempts) == 1 + 2 + 3, attempts
+        assert all(max_attempts == 1 for _, max_attempts in attempts), "yt-dlp should not retry in place"
+        print("✅ SUCCESS: Scheduled batch download retried failed videos from the delayed queue")
+        
+        # Successful downloads report to a half-open breaker, which closes promptly
+        from error_recovery import CircuitBreaker, CircuitState
+        
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=timedelta(seconds=1),
+                                 success_threshold=2, half_open_max_calls=1)
+        try:
+            breaker.call(lambda: 1 / 0)
+        except ZeroDivisionError:
+            pass
+        breaker._last_failure_time -= timedelta(seconds=2)  # Recovery timeout already elapsed
+        assert breaker.state == CircuitState.HALF_OPEN
+        
+        attempts.clear()
+        healthy = [
+            VideoRecord(person_id=1, video_id=f"vid0000000{i}", title=f"Healthy {i}", uuid=str(uuid.uuid4()))
+            for i in (0, 3, 4, 5)
+        ]
+        processor = ConcurrentProcessor(
+            ResourceLimits(max_concurrent_channels=2, max_concurrent_downloads=2),
+            retry_manager=RetryManager(base_delay=0.05, jitter=False),
+            circuit_breakers=lambda service: breaker
+        )
+        processor.start()
+        try:
+            started = time.time()
+            results = integration.batch_download(healthy, scheduler=processor, max_retries=2)
+            elapsed = time.time() - started
+        finally:
+            processor.stop()
+        
+        assert [r.status for r in results] == ["completed"] * 4, results
+        assert breaker.state == CircuitState.CLOSED, breaker.state
+        # Unreported probes hold their slot until recovery_timeout: one download per second
+        assert elapsed < 2.0, f"Probe slots were not returned ({elapsed:.2f}s for 4 downloads)"
+        print(f"✅ SUCCESS: Half-open breaker closed after scheduled downloads ({elapsed:.2f}s)")
+        return True
+        
+    except Exception as e:
+        print(f"❌ UNEXPECTED ERROR: Scheduled batch download test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
 def main():
     """Run comprehensive download integration test suite."""
     print("🚀 Starting Download Integration Test Suite")
@@ -532,7 +634,8 @@ def main():
         test_stream_to_s3_mode,
         test_local_then_upload_mode,
         test_error_handling,
-        test_batch_download
+        test_batch_download,
+        test_scheduled_batch_download
     ]
     
     for test_func in test_functions:
@@ -550,6 +653,7 @@ def main():
         print("✅ Local then upload mode working")
         print("✅ Error handling comprehensive")
         print("✅ Batch download validated")
+        print("✅ Scheduled download retries validated")
         print("\n🔥 Download integration is PRODUCTION-READY!")
         return 0
     else:
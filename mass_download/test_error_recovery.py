@@ -136,6 +136,118 @@ def test_circuit_breaker():
         return False
 
 
+def test_service_circuit_breakers():
+    """Test sliding-window failure rate and per-service breaker keying."""
+    print("\n🧪 Testing service circuit breakers...")
+    
+    try:
+        from error_recovery import CircuitBreaker, CircuitState, ErrorRecoveryManager, RecoveryStrategy
+        
+        def fail():
+            raise RuntimeError("Service unavailable")
+        
+        # Test 1: Scattered failures among successes don't trip the breaker
+        print("  📉 Testing failure rate threshold...")
+        breaker = CircuitBreaker(
+            failure_threshold=3,
+            failure_rate_threshold=0.5,
+            window=timedelta(seconds=1),
+            recovery_timeout=timedelta(seconds=0.5)
+        )
+        for i in range(20):
+            if i % 6 == 5:
+                try:
+                    breaker.call(fail)
+                except RuntimeError:
+                    pass
+            else:
+                breaker.call(lambda: "ok")
+        assert breaker.state == CircuitState.CLOSED, "3 failures in 20 calls is under the 50% rate"
+        print(f"    ✅ Still closed at {breaker.get_stats()['failure_rate']:.0%} failure rate")
+        
+        # Test 2: Old calls slide out of the window; a high failure rate trips it
+        print("  🪟 Testing sliding window...")
+        time.sleep(1.1)
+        assert breaker.get_stats()['window_calls'] == 0
+        breaker.call(lambda: "ok")
+        for _ in range(3):
+            try:
+                breaker.call(fail)
+            except RuntimeError:
+                pass
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.allow_dispatch() > 0, "Dispatch must be held while open"
+        print("    ✅ Opened at 75% failure rate within the window")
+        
+        # Test 3: Half-open admits a bounded number of probes
+        print("  🔎 Testing half-open probes...")
+        time.sleep(0.6)
+        assert breaker.allow_dispatch() == 0.0, "First probe should be admitted"
+        assert breaker.allow_dispatch() > 0, "Only one probe at a time"
+        with breaker.track():
+            pass
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.allow_dispatch() == 0.0, "A finished probe frees its slot"
+        with breaker.track():
+            pass
+        assert breaker.state == CircuitState.CLOSED and breaker.allow_dispatch() == 0.0
+        print("    ✅ Probes closed the circuit")
+
+        # Test 3b: More successes needed than probe slots closes without waiting out the timeout
+        slow_recovery = CircuitBreaker(
+            failure_threshold=1,
+            recovery_timeout=timedelta(seconds=0.3),
+            success_threshold=3,
+            half_open_max_calls=1
+        )
+        try:
+            slow_recovery.call(fail)
+        except RuntimeError:
+            pass
+        time.sleep(0.35)
+        started = time.monotonic()
+        for _ in range(3):
+            assert slow_recovery.allow_dispatch() == 0.0
+            with slow_recovery.track():
+                pass
+        assert slow_recovery.state == CircuitState.CLOSED
+        assert time.monotonic() - started < 0.3
+        print("    ✅ success_threshold > half_open_max_calls closes promptly")
+        
+        # Test 4: Operations naming channel URLs share the host's breaker
+        print("  🌐 Testing per-host keying...")
+        recovery_mgr = ErrorRecoveryManager(circuit_breaker_config={'failure_threshold': 3})
+        for i in range(10):
+            try:
+                recovery_mgr.with_recovery(
+                    f"extract_channel_info_https://www.youtube.com/@channel{i}",
+                    fail,
+                    recovery_strategy=RecoveryStrategy.CIRCUIT_BREAKER,
+                    fallback=lambda: None
+                )
+            except RuntimeError:
+                pass  # Failures propagate until the breaker opens
+        assert list(recovery_mgr.circuit_breakers) == ["youtube.com"], recovery_mgr.circuit_breakers
+        assert recovery_mgr.get_circuit_breaker("https://youtube.com/@other").state == CircuitState.OPEN
+        try:
+            recovery_mgr.with_recovery("list", fail, recovery_strategy=RecoveryStrategy.CIRCUIT_BREAKER,
+                                       service="google_drive")
+        except RuntimeError:
+            pass
+        assert recovery_mgr.get_circuit_breaker("google_drive").state == CircuitState.CLOSED
+        assert recovery_mgr.get_recovery_status()['circuit_breaker_stats']['youtube.com']['state'] == "open"
+        print("    ✅ One breaker per host instead of one per channel")
+        
+        print("✅ SUCCESS: All service circuit breaker tests passed")
+        return True
+        
+    except Exception as e:
+        print(f"❌ UNEXPECTED ERROR: Service circuit breaker test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
 def test_retry_manager():
     """Test retry manager with exponential backoff."""
     print("\n🧪 Testing retry manager...")
@@ -236,6 +348,83 @@ def test_retry_manager():
         return False
 
 
+def test_delayed_retry_queue():
+    """Test time-ordered delayed retries and persisted retry state."""
+    print("\n🧪 Testing delayed retry queue...")
+    
+    try:
+        from error_recovery import DelayedRetryQueue
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            state_path = Path(temp_dir) / "retry_state.sqlite3"
+            
+            # Test 1: Tasks run in not-before order, not submission order
+            print("  ⏱️  Testing time ordering...")
+            queue = DelayedRetryQueue(state_path=state_path)
+            ran = []
+            done = threading.Event()
+            
+            def record(name):
+                def task():
+                    ran.append(name)
+                    if len(ran) == 3:
+                        done.set()
+                return task
+            
+            queue.schedule("slow", record("slow"), 0.3, attempt=2, error="HTTP 503")
+            queue.schedule("fast", record("fast"), 0.05, attempt=1, error="timeout")
+            queue.schedule("now", record("now"), 0.0)
+            
+            assert done.wait(timeout=5.0), "Delayed tasks did not run"
+            assert ran == ["now", "fast", "slow"], f"Wrong order: {ran}"
+            assert len(queue) == 0
+            print(f"    ✅ Ran in due order: {ran}")
+            
+            # Test 2: Only attempts with a count are persisted
+            print("  💾 Testing retry state persistence...")
+            assert queue.get_state("now") is None
+            state = queue.get_state("slow")
+            assert state.attempt == 2 and state.last_error == "HTTP 503"
+            assert [s.key for s in queue.pending_state()] == ["fast", "slow"]
+            queue.clear("fast")
+            queue.close()
+            
+            reopened = DelayedRetryQueue(state_path=state_path)
+            assert reopened.get_state("fast") is None
+            state = reopened.get_state("slow")
+            assert state is not None and state.attempt == 2
+            assert state.not_before > time.time() - 60
+            print("    ✅ Retry count and next attempt survived restart")
+            
+            # Test 3: drain() hands back waiting tasks without running them
+            print("  🚰 Testing drain...")
+            drained = []
+            reopened.schedule("later", lambda: drained.append("ran"), 60.0, attempt=1)
+            assert len(reopened) == 1
+            tasks = reopened.drain()
+            assert len(tasks) == 1 and len(reopened) == 0
+            assert drained == []
+            assert reopened.get_state("later") is not None
+            print("    ✅ Drained waiting task, state kept")
+            
+            reopened.close()
+            try:
+                reopened.schedule("closed", lambda: None, 0.0)
+                assert False, "Should not schedule on a closed queue"
+            except RuntimeError as e:
+                assert "RETRY QUEUE ERROR" in str(e)
+            print("    ✅ Closed queue rejects new work")
+        
+        print("✅ SUCCESS: All delayed retry queue tests passed")
+        return True
+        
+    except Exception as e:
+        print(f"❌ UNEXPECTED ERROR: Delayed retry queue test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
 def test_transaction_manager():
     """Test transaction manager with rollback."""
     print("\n🧪 Testing transaction manager...")
@@ -409,6 +598,136 @@ def test_dead_letter_queue():
         return False
 
 
+def test_dead_letter_journal():
+    """Test dead letter queue journal replay, compaction and legacy conversion."""
+    print("\n🧪 Testing dead letter queue journal...")
+    
+    try:
+        from error_recovery import DeadLetterQueue, ErrorContext, RecoveryStrategy
+        
+        def make_error(i):
+            return ErrorContext(
+                error_type="TestError",
+                error_message=f"Error {i}",
+                operation=f"operation_{i}",
+                recovery_strategy=RecoveryStrategy.CIRCUIT_BREAKER
+            )
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # Test 1: Each add appends exactly one journal line
+            print("  📝 Testing append-only writes...")
+            journal_path = Path(temp_dir) / "dlq.json"
+            dlq = DeadLetterQueue(max_size=10, persist_path=journal_path, compact_threshold=20)
+            for i in range(5):
+                dlq.add(f"item_{i}", make_error(i))
+            lines = journal_path.read_text().splitlines()
+            assert len(lines) == 5, f"Expected 5 journal lines, got {len(lines)}"
+            assert all(json.loads(line)['op'] == 'add' for line in lines)
+            print("    ✅ One journal line per add")
+            
+            # Test 2: Removals and retries survive a restart
+            print("  🔄 Testing replay after retry...")
+            dlq.retry_all(lambda item: None if item in ("item_0", "item_1") else 1 / 0)
+            dlq.close()
+            
+            reloaded = DeadLetterQueue(max_size=10, persist_path=journal_path, compact_threshold=20)
+            items = reloaded.get_all()
+            assert [item['item'] for item in items] == ["item_2", "item_3", "item_4"], items
+            assert all(item['error_context'].retry_count == 1 for item in items)
+            assert all(item['error_context'].recovery_strategy == RecoveryStrategy.CIRCUIT_BREAKER
+                       for item in items)
+            print(f"    ✅ Replayed {len(items)} live entries with retry counts")
+            
+            # Test 3: Eviction past max_size replays identically
+            for i in range(5, 17):
+                reloaded.add(f"item_{i}", make_error(i))
+            expected = [item['item'] for item in reloaded.get_all()]
+            assert len(expected) == 10 and expected[0] == "item_7", expected
+            reloaded.close()
+            replayed = DeadLetterQueue(max_size=10, persist_path=journal_path, compact_threshold=20)
+            assert [item['item'] for item in replayed.get_all()] == expected
+            print("    ✅ Max size eviction replays identically")
+            
+            # Test 4: Compaction keeps the journal proportional to live entries
+            print("  🗜️  Testing compaction...")
+            replayed.retry_all(lambda item: None)
+            for i in range(30):
+                replayed.add(f"again_{i}", make_error(i))
+                replayed.retry_all(lambda item: None)
+            line_count = len(journal_path.read_text().splitlines())
+            assert len(replayed) == 0
+            assert line_count < 45, f"Journal should have been compacted, has {line_count} lines"
+            replayed.add("survivor", make_error(99))
+            replayed.compact()
+            assert len(journal_path.read_text().splitlines()) == 1
+            assert [item['item'] for item in replayed.get_all()] == ["survivor"]
+            replayed.close()
+            print(f"    ✅ Journal compacted ({line_count} lines after 60+ operations)")
+            
+            # Test 5: Legacy JSON array files are converted in place
+            print("  📦 Testing legacy file conversion...")
+            legacy_path = Path(temp_dir) / "legacy.json"
+            legacy_path.write_text(json.dumps([
+                {'item': f"old_{i}", 'error': make_error(i).__dict__, 'queued_at': datetime.now().isoformat()}
+                for i in range(3)
+            ], default=str))
+            legacy = DeadLetterQueue(persist_path=legacy_path)
+            assert [item['item'] for item in legacy.get_all()] == ["old_0", "old_1", "old_2"]
+            assert legacy_path.read_text().startswith('{'), "Legacy file should be rewritten as journal"
+            legacy.close()
+            print("    ✅ Legacy dead letter file converted to journal")
+
+            # Test 6: A torn last line doesn't swallow the next entry
+            print("  ✂️  Testing torn journal tail...")
+            with open(legacy_path, 'a', encoding='utf-8') as f:
+                f.write('{"op": "add", "id": 99, "it')
+            torn = DeadLetterQueue(persist_path=legacy_path)
+            torn.add("after_crash", make_error(4))
+            torn.close()
+            repaired = DeadLetterQueue(persist_path=legacy_path)
+            assert [item['item'] for item in repaired.get_all()] == ["old_0", "old_1", "old_2", "after_crash"]
+            repaired.close()
+            print("    ✅ Torn tail truncated before appending")
+
+            # Test 7: Non-JSON items (callables) stay usable within the process
+            print("  🔧 Testing unserializable items...")
+            calls = []
+            callable_dlq = DeadLetterQueue(persist_path=Path(temp_dir) / "callables.json")
+            callable_dlq.add({'operation': 'op', 'func': lambda: calls.append(1)}, make_error(0))
+            success_count, _ = callable_dlq.retry_all(lambda item: item['func']())
+            assert success_count == 1 and calls == [1]
+            callable_dlq.close()
+            print("    ✅ Callables retried from memory, journal stores their description")
+
+            # Test 8: An item is not journaled as removed until its retry succeeds
+            print("  💥 Testing crash during retry...")
+            crash_path = Path(temp_dir) / "crash.json"
+            crash_dlq = DeadLetterQueue(persist_path=crash_path)
+            crash_dlq.add("in_flight", make_error(0))
+            
+            def crash(item):
+                raise KeyboardInterrupt  # Process dies mid-retry
+            
+            try:
+                crash_dlq.retry_all(crash)
+            except KeyboardInterrupt:
+                pass
+            crash_dlq.close()
+            recovered = DeadLetterQueue(persist_path=crash_path)
+            assert [item['item'] for item in recovered.get_all()] == ["in_flight"]
+            recovered.close()
+            print("    ✅ Item survives a crash while being retried")
+        
+        print("✅ SUCCESS: All dead letter journal tests passed")
+        return True
+        
+    except Exception as e:
+        print(f"❌ UNEXPECTED ERROR: Dead letter journal test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
 def test_checkpoint_recovery():
     """Test checkpoint creation and recovery."""
     print("\n🧪 Testing checkpoint recovery...")
@@ -441,7 +760,7 @@ def test_checkpoint_recovery():
             
             checkpoint.save(checkpoint_dir)
             
-            checkpoint_file = checkpoint_dir / "test_checkpoint_001.pkl"
+            checkpoint_file = checkpoint_dir / "test_checkpoint_001.ckpt"
             assert checkpoint_file.exists(), "Checkpoint file should exist"
             print("    ✅ Checkpoint saved successfully")
             
@@ -454,6 +773,7 @@ def test_checkpoint_recovery():
             assert len(loaded.completed_items) == 3
             assert len(loaded.pending_items) == 2
             assert len(loaded.failed_items) == 1
+            assert loaded.failed_items[0][1].error_type == "DownloadError"
             assert loaded.state["channel_url"] == "https://youtube.com/@test"
             print("    ✅ Checkpoint loaded correctly")
             
@@ -485,7 +805,7 @@ def test_checkpoint_recovery():
                 )
                 cp.save(checkpoint_dir)
             
-            all_checkpoints = list(checkpoint_dir.glob("*.pkl"))
+            all_checkpoints = list(checkpoint_dir.glob("*.ckpt"))
             assert len(all_checkpoints) == 4, f"Should have 4 checkpoints, got {len(all_checkpoints)}"
             
             # Find latest checkpoint
@@ -506,6 +826,178 @@ def test_checkpoint_recovery():
         return False
 
 
+def test_checkpoint_store():
+    """Test indexed checkpoint store: latest lookup, atomic replace and TTL expiry."""
+    print("\n🧪 Testing checkpoint store...")
+    
+    try:
+        from error_recovery import CheckpointStore, ErrorRecoveryManager, RecoveryCheckpoint
+        
+        def make_checkpoint(checkpoint_id, completed, pending, age=timedelta()):
+            return RecoveryCheckpoint(
+                checkpoint_id=checkpoint_id,
+                operation="process_channel",
+                timestamp=datetime.now() - age,
+                state={'channel_url': checkpoint_id},
+                completed_items=completed,
+                pending_items=pending,
+                failed_items=[]
+            )
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = CheckpointStore(Path(temp_dir) / "checkpoints.sqlite3")
+            channel = "https://youtube.com/@test"
+            
+            # Test 1: Saving replaces the key's previous checkpoint
+            print("  🔁 Testing atomic replace...")
+            store.put(channel, make_checkpoint("cp_1", ["a"], ["b", "c"]))
+            store.put(channel, make_checkpoint("cp_2", ["a", "b"], ["c"]))
+            latest = store.get_latest(channel)
+            assert latest.checkpoint_id == "cp_2" and latest.pending_items == ["c"]
+            assert len(store) == 1 and store.get("cp_1") is None
+            print("    ✅ Latest checkpoint replaced the previous one")
+            
+            # Test 2: TTL expiry hides and removes stale checkpoints
+            print("  ⏰ Testing TTL expiry...")
+            store.put("stale", make_checkpoint("cp_stale", [], ["x"], age=timedelta(hours=2)),
+                      ttl=timedelta(hours=1))
+            assert store.get_latest("stale") is None, "Expired checkpoint must not be resumed"
+            assert store.expire() == 1 and len(store) == 1
+            store.put("old", make_checkpoint("cp_old", [], ["y"], age=timedelta(days=10)))
+            assert store.expire(older_than=datetime.now() - timedelta(days=7)) == 1
+            assert store.list_ids() == ["cp_2"]
+            print("    ✅ Expired and aged-out checkpoints removed")
+            store.close()
+            
+            # Test 3: Manager saves per key and cleans up legacy pickles
+            print("  🧭 Testing manager integration...")
+            checkpoint_dir = Path(temp_dir) / "recovery"
+            manager = ErrorRecoveryManager(checkpoint_dir=checkpoint_dir, checkpoint_ttl=timedelta(days=1))
+            manager.create_checkpoint("channel_a_1", "op", {}, ["v1"], ["v2"], key=channel)
+            manager.create_checkpoint("channel_a_2", "op", {}, ["v1", "v2"], [], key=channel)
+            assert manager.load_latest_checkpoint(channel).checkpoint_id == "channel_a_2"
+            assert manager.load_checkpoint("channel_a_2").completed_items == ["v1", "v2"]
+            
+            legacy = make_checkpoint("legacy", [], [])
+            (checkpoint_dir / "legacy.pkl").write_bytes(pickle.dumps(legacy))
+            old_time = time.time() - 10 * 24 * 3600
+            os.utime(checkpoint_dir / "legacy.pkl", (old_time, old_time))
+            assert manager.load_checkpoint("legacy") is not None
+            assert manager.cleanup_checkpoints(max_age=timedelta(days=7)) == 1
+            assert not (checkpoint_dir / "legacy.pkl").exists()
+            assert manager.get_recovery_status()['checkpoints'] == ["channel_a_2"]
+            manager.checkpoint_store.close()
+            print("    ✅ Manager uses indexed store and cleans legacy files")
+        
+        print("✅ SUCCESS: All checkpoint store tests passed")
+        return True
+        
+    except Exception as e:
+        print(f"❌ UNEXPECTED ERROR: Checkpoint store test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_checkpoint_deltas():
+    """Test compact checkpoint format, delta records and snapshot folding."""
+    print("\n🧪 Testing checkpoint deltas...")
+    
+    try:
+        from error_recovery import CheckpointStore, RecoveryCheckpoint, CHECKPOINT_MAGIC
+        
+        video_ids = [f"vid{i:08d}" for i in range(1000)]
+        checkpoint = RecoveryCheckpoint(
+            checkpoint_id="channel_deltas",
+            operation="process_channel",
+            timestamp=datetime.now(),
+            state={'channel_url': "https://youtube.com/@deltas"},
+            completed_items=[],
+            pending_items=video_ids,
+            failed_items=[]
+        )
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # Test 1: Compact encoding is versioned and much smaller than a pickle
+            print("  📦 Testing compact encoding...")
+            payload = checkpoint.to_bytes()
+            assert payload.startswith(CHECKPOINT_MAGIC)
+            assert len(payload) < len(pickle.dumps(checkpoint)) / 2
+            future = payload[:len(CHECKPOINT_MAGIC)] + bytes([99]) + payload[len(CHECKPOINT_MAGIC) + 1:]
+            try:
+                RecoveryCheckpoint.from_bytes(future)
+                assert False, "Unknown format versions must be rejected"
+            except ValueError as e:
+                assert "version" in str(e)
+            print("    ✅ Compact, versioned encoding")
+            
+            # Test 2: Deltas replay on top of the snapshot, in enumeration order
+            print("  ➕ Testing delta replay...")
+            store = CheckpointStore(Path(temp_dir) / "checkpoints.sqlite3", snapshot_every=4)
+            key = "https://youtube.com/@deltas"
+            assert not store.append_delta(key, ["vid00000000"]), "No snapshot to append to yet"
+            store.put(key, checkpoint)
+            for batch in range(3):
+                assert store.append_delta(key, video_ids[batch * 25:(batch + 1) * 25])
+            loaded = store.get_latest(key)
+            assert loaded.completed_items == video_ids[:75]
+            assert loaded.pending_items == video_ids[75:]
+            print("    ✅ Snapshot plus deltas resumes at the right item")
+            
+            # Test 3: Every snapshot_every deltas are folded into a new snapshot
+            print("  🗜️ Testing snapshot folding...")
+            store.append_delta(key, video_ids[75:100])
+            assert store._conn.execute("SELECT COUNT(*) FROM checkpoint_deltas").fetchone()[0] == 0
+            store.append_delta(key, video_ids[100:110])
+            loaded = store.get_latest(key)
+            assert loaded.completed_items == video_ids[:110] and len(loaded.pending_items) == 890
+            
+            # A new full snapshot supersedes outstanding deltas
+            store.put(key, checkpoint)
+            assert store.get_latest(key).completed_items == []
+            print("    ✅ Deltas folded and superseded correctly")
+            
+            # Test 4: Checkpoints pickled by an older build still load, with deltas
+            print("  🕰️ Testing legacy payloads...")
+            with store._conn:
+                store._conn.execute(
+                    "UPDATE checkpoints SET payload = ? WHERE key = ?", (pickle.dumps(checkpoint), key)
+                )
+            store.append_delta(key, video_ids[:5])
+            assert store.get_latest(key).completed_items == video_ids[:5]
+            print("    ✅ Legacy pickled checkpoints still resume")
+            
+            # Test 5: Saves only clear their own key's deltas; expire() sweeps orphans
+            print("  🧹 Testing orphan delta sweep...")
+            def delta_keys():
+                rows = store._conn.execute("SELECT DISTINCT key FROM checkpoint_deltas ORDER BY key")
+                return [row[0] for row in rows]
+            
+            with store._conn:
+                store._conn.execute("INSERT INTO checkpoint_deltas (key, seq, payload) VALUES ('gone', 1, x'00')")
+            other = RecoveryCheckpoint.from_bytes(checkpoint.to_bytes())
+            other.checkpoint_id = "channel_other"
+            store.put("other", other)
+            assert delta_keys() == ["gone", key], delta_keys()
+            
+            # Moving a checkpoint_id to a new key takes the old key's deltas with it
+            store.put("moved", checkpoint)
+            assert delta_keys() == ["gone"], delta_keys()
+            store.expire()
+            assert delta_keys() == [], delta_keys()
+            store.close()
+            print("    ✅ Orphaned deltas swept on expire, not on every save")
+        
+        print("✅ SUCCESS: All checkpoint delta tests passed")
+        return True
+        
+    except Exception as e:
+        print(f"❌ UNEXPECTED ERROR: Checkpoint delta test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
 def test_error_recovery_manager():
     """Test error recovery manager integration."""
     print("\n🧪 Testing error recovery manager...")
@@ -720,20 +1212,20 @@ def test_coordinator_error_recovery():
                 
                 # Change the file's modification time to be old
                 import os
-                old_checkpoint_file = coordinator.error_recovery.checkpoint_dir / "old_checkpoint.pkl"
+                old_checkpoint_file = coordinator.error_recovery.checkpoint_dir / "old_checkpoint.ckpt"
                 if old_checkpoint_file.exists():
                     # Set modification time to 10 days ago
                     old_time = time.time() - (10 * 24 * 60 * 60)
                     os.utime(old_checkpoint_file, (old_time, old_time))
                 
                 # Get checkpoint count from the correct directory
-                checkpoint_files = list(coordinator.error_recovery.checkpoint_dir.glob("*.pkl"))
+                checkpoint_files = list(coordinator.error_recovery.checkpoint_dir.glob("*.ckpt"))
                 initial_count = len(checkpoint_files)
                 
                 # Run cleanup
                 coordinator.cleanup_old_checkpoints(days=7)
                 
-                checkpoint_files = list(coordinator.error_recovery.checkpoint_dir.glob("*.pkl"))
+                checkpoint_files = list(coordinator.error_recovery.checkpoint_dir.glob("*.ckpt"))
                 final_count = len(checkpoint_files)
                 
                 # The old checkpoint should have been deleted
@@ -953,10 +1445,18 @@ def main():
             all_tests_passed = False
             print("❌ Circuit breaker test FAILED")
         
+        if not test_service_circuit_breakers():
+            all_tests_passed = False
+            print("❌ Service circuit breaker test FAILED")
+        
         if not test_retry_manager():
             all_tests_passed = False
             print("❌ Retry manager test FAILED")
         
+        if not test_delayed_retry_queue():
+            all_tests_passed = False
+            print("❌ Delayed retry queue test FAILED")
+        
         if not test_transaction_manager():
             all_tests_passed = False
             print("❌ Transaction manager test FAILED")
@@ -965,10 +1465,22 @@ def main():
             all_tests_passed = False
             print("❌ Dead letter queue test FAILED")
         
+        if not test_dead_letter_journal():
+            all_tests_passed = False
+            print("❌ Dead letter journal test FAILED")
+        
         if not test_checkpoint_recovery():
             all_tests_passed = False
             print("❌ Checkpoint recovery test FAILED")
         
+        if not test_checkpoint_store():
+            all_tests_passed = False
+            print("❌ Checkpoint store test FAILED")
+        
+        if not test_checkpoint_deltas():
+            all_tests_passed = False
+            print("❌ Checkpoint delta test FAILED")
+        
         if not test_error_recovery_manager():
             all_tests_passed = False
             print("❌ Error recovery manager test FAILED")
@@ -213,6 +213,24 @@ Examples:
         action='store_true',
         help='Enable verbose logging'
     )
+    output_group.add_argument(
+        '--metrics-file',
+        type=str,
+        default=None,
+        help='Write OpenMetrics to this file during the run (enables metrics export)'
+    )
+    output_group.add_argument(
+        '--metrics-port',
+        type=int,
+        default=None,
+        help='Serve OpenMetrics at http://127.0.0.1:PORT/metrics (enables metrics export)'
+    )
+    output_group.add_argument(
+        '--trace-file',
+        type=str,
+        default=None,
+        help='Write per-stage tracing spans to this JSONL file (enables tracing)'
+    )
     
     # Validation options
     validation_group = parser.add_argument_group('Validation Options')
@@ -292,6 +310,18 @@ def load_configuration(args: argparse.Namespace) -> Any:
     if args.continue_on_error:
         overrides['mass_download.continue_on_error'] = True
     
+    if args.metrics_file:
+        overrides['mass_download.metrics.enabled'] = True
+        overrides['mass_download.metrics.file'] = args.metrics_file
+    
+    if args.metrics_port is not None:
+        overrides['mass_download.metrics.enabled'] = True
+        overrides['mass_download.metrics.http_port'] = args.metrics_port
+    
+    if args.trace_file:
+        overrides['mass_download.tracing.enabled'] = True
+        overrides['mass_download.tracing.file'] = args.trace_file
+    
     # Apply overrides to config
     # Note: This is a simplified approach. In production, you'd want
     # a more sophisticated config override mechanism
@@ -21,15 +21,23 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+# Optional fast HTML parser for the sheet table (google_sheets.html_parser)
+try:
+    import lxml.html
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
 # Import centralized configuration, path utilities, error handling, patterns, and CSV operations (DRY)
 from utils.config import get_config, ensure_parent_dir, ensure_directory, format_error_message, load_json_state, save_json_state
 from utils.patterns import PatternRegistry, extract_youtube_id, extract_drive_id, clean_url, normalize_whitespace, cleanup_selenium_driver, get_selenium_driver
 from utils.extract_links import extract_google_doc_text, extract_actual_url, extract_text_with_retry
-from utils.csv_manager import CSVManager
+from utils.csv_manager import CSVManager, IncrementalCSVWriter
 from utils.http_pool import get as http_get  # Centralized HTTP requests (DRY)
 from utils.streaming_integration import stream_extracted_links
 from utils.constants import CSVConstants, URLPatterns
 from utils.s3_manager import UnifiedS3Manager, S3Config, UploadMode
+from utils.sheet_sync import SheetCache, SheetState, content_hash
 
 
 # Configuration - centralized in config.yaml (DRY)
@@ -58,42 +66,50 @@ def save_failed_docs(failed_list):
 
 # Selenium driver functions moved to patterns.py (DRY consolidation)
 
+def get_sheet_cache():
+    """Cached sheet HTML with its HTTP validators and content hash"""
+    return SheetCache(config.get("google_sheets.cache_file", "cache/google_sheet_cache.html"))
+
+def get_sheet_state():
+    """Previous sheet parse and per-output processed people (see utils/sheet_sync.py)"""
+    return SheetState(config.get("google_sheets.state_file", "cache/google_sheet_state.json"))
+
 def step1_download_sheet():
     """Step 1: Download a local copy of the Google Sheet"""
     print("Step 1: Downloading Google Sheet...")
+    sheet_cache = get_sheet_cache()
     
-    # First try HTTP request (faster)
+    # First try HTTP request (faster), revalidating the cached copy
     try:
         print("  Trying HTTP download...")
-        response = http_get(config.get("google_sheets.url"))
+        response = http_get(config.get("google_sheets.url"), headers=sheet_cache.conditional_headers())
+        if response.status_code == 304:
+            html_content = sheet_cache.cached_html()
+            if html_content is not None:
+                print("  ✓ Sheet not modified since last download (using cache)")
+                return html_content
+            response = http_get(config.get("google_sheets.url"))
         response.raise_for_status()
         html_content = response.text
         
+        if sheet_cache.is_unchanged(html_content):
+            sheet_cache.store(html_content, response.headers)
+            print("  ✓ Sheet content unchanged since last download")
+            return html_content
+        
         # Quick check if we got actual data
-        soup = BeautifulSoup(html_content, "html.parser")
+        rows = extract_sheet_rows(html_content)
         
-        # Look for the specific div with target ID
-        target_div = soup.find("div", {"id": str(config.get("google_sheets.target_div_id"))})
-        if target_div:
-            table = target_div.find("table")
-        else:
-            # Fallback to any table
-            table = soup.find("table", {"class": "waffle"})
-            if not table:
-                tables = soup.find_all("table")
-                table = tables[0] if tables else None
-        
-        # Check if we found a table with rows
-        if table:
-            rows = table.find_all("tr")
-            if len(rows) > 1:  # More than just header
-                # Save the HTML
-                sheet_cache_path = get_config().get('paths.sheet_cache', 'sheet.html')
-                with open(sheet_cache_path, "w", encoding="utf-8") as f:
-                    f.write(html_content)
-                
-                print(f"  ✓ Sheet downloaded via HTTP (found {len(rows)} rows)")
-                return html_content
+        # Check if we found a table with rows (more than just header)
+        if rows and len(rows) > 1:
+            # Save the HTML
+            sheet_cache_path = get_config().get('paths.sheet_cache', 'sheet.html')
+            with open(sheet_cache_path, "w", encoding="utf-8") as f:
+                f.write(html_content)
+            sheet_cache.store(html_content, response.headers)
+            
+            print(f"  ✓ Sheet downloaded via HTTP (found {len(rows)} rows)")
+            return html_content
         
         print("  ✗ HTTP download incomplete (no table data found)")
         print("  Falling back to Selenium...")
@@ -149,6 +165,7 @@ def step1_download_sheet():
         sheet_cache_path = get_config().get('paths.sheet_cache', 'sheet.html')
         with open(sheet_cache_path, "w", encoding="utf-8") as f:
             f.write(html_content)
+        sheet_cache.store(html_content)
         
         print("✓ Sheet downloaded with Selenium")
         return html_content
@@ -161,10 +178,10 @@ def step1_download_sheet():
         if driver:
             driver.quit()
 
-def step2_extract_people_and_docs(html_content):
-    """Step 2: Extract people data and Google Doc links from the sheet"""
-    print("Step 2: Extracting people data and Google Doc links...")
-    
+GOOGLE_REDIRECT_PREFIX = "https://www.google.com/url?q="
+
+def _sheet_rows_soup(html_content):
+    """Sheet table rows via BeautifulSoup (html.parser)"""
     soup = BeautifulSoup(html_content, "html.parser")
     
     # Look for the specific div with target ID
@@ -177,54 +194,132 @@ def step2_extract_people_and_docs(html_content):
         if not table:
             tables = soup.find_all("table")
             table = tables[0] if tables else None
+    if not table:
+        return None
+    
+    rows = []
+    for row in table.find_all("tr"):
+        cells = row.find_all("td")
+        href = None
+        if len(cells) > 2:
+            a_tag = cells[2].find("a")
+            if a_tag is not None and a_tag.has_attr("href"):
+                href = a_tag["href"]
+        rows.append(([cell.get_text(strip=True) for cell in cells], href))
+    return rows
+
+_CELL_TEXT = ".//text()[not(ancestor::script or ancestor::style)]"
+
+def _sheet_rows_lxml(html_content):
+    """Sheet table rows via lxml (same table lookup and cell text as _sheet_rows_soup)"""
+    if not html_content.strip():
+        return None
+    root = lxml.html.fromstring(html_content.encode("utf-8"), parser=lxml.html.HTMLParser(encoding="utf-8"))
+    
+    target_div = root.xpath("//div[@id=$div_id]", div_id=str(config.get("google_sheets.target_div_id")))
+    if target_div:
+        table = next(target_div[0].iter("table"), None)
+    else:
+        tables = root.xpath("//table[contains(concat(' ', normalize-space(@class), ' '), ' waffle ')]")
+        table = tables[0] if tables else next(root.iter("table"), None)
+    if table is None:
+        return None
+    
+    rows = []
+    for row in table.iter("tr"):
+        cells = list(row.iter("td"))
+        href = None
+        if len(cells) > 2:
+            a_tag = next(cells[2].iter("a"), None)
+            if a_tag is not None:
+                href = a_tag.get("href")
+        # Like get_text(strip=True): each text fragment stripped, then joined (script/style text skipped)
+        rows.append((["".join(text.strip() for text in cell.xpath(_CELL_TEXT)) for cell in cells], href))
+    return rows
+
+def extract_sheet_rows(html_content, parser=None):
+    """Walk the sheet table once: one (cell texts, first link in the name cell) per row
+    
+    Args:
+        html_content: Sheet HTML
+        parser: 'lxml' or 'html.parser' (default: google_sheets.html_parser,
+            'auto' = lxml when installed)
+    
+    Returns:
+        List of rows, or None if the HTML has no table
+    """
+    parser = parser or config.get("google_sheets.html_parser", "auto")
+    if parser == "auto":
+        parser = "lxml" if HAS_LXML else "html.parser"
+    if parser == "lxml":
+        if not HAS_LXML:
+            raise ImportError("SHEET PARSER ERROR: html_parser 'lxml' requires lxml (pip install lxml)")
+        return _sheet_rows_lxml(html_content)
+    if parser != "html.parser":
+        raise ValueError(f"SHEET PARSER ERROR: html_parser must be 'auto', 'lxml' or 'html.parser'. Got: {parser}")
+    return _sheet_rows_soup(html_content)
+
+def parse_people_from_sheet(html_content, parser=None):
+    """Parse the people rows (row_id, name, email, type, doc_link) out of the sheet HTML"""
+    rows = extract_sheet_rows(html_content, parser)
     
     people_data = []
-    if table:
-        rows = table.find_all("tr")
+    if rows:
         print(f"Found {len(rows)} rows in the table")
         
         # Process rows starting from row 1 (skip header)
-        for row_index in range(1, len(rows)):
-            row = rows[row_index]
-            cells = row.find_all("td")
-            
+        for texts, href in rows[1:]:
             # Need at least 5 cells (row_id, name, email, type)
-            if len(cells) < 5:
+            if len(texts) < 5:
                 continue
             
             # Extract data using the correct column indices from the working code
-            row_id = cells[0].get_text(strip=True)
-            name = cells[2].get_text(strip=True)  # Name in column 2
-            email = cells[3].get_text(strip=True)  # Email in column 3  
-            type_val = cells[4].get_text(strip=True)  # Type in column 4
+            row_id = texts[0]
+            name = texts[2]  # Name in column 2
+            email = texts[3]  # Email in column 3  
+            type_val = texts[4]  # Type in column 4
             
             # Skip header rows and invalid data
             if not name or name.lower() == "name" or row_id == "#" or "name" in name.lower() and "email" in email.lower():
                 continue
             
             # Skip any row that looks like a header (contains "Name", "Email", "Type" pattern)
-            if any(["Name" in str(cell.get_text(strip=True)) and "Email" in str(cells[3].get_text(strip=True)) and "Type" in str(cells[4].get_text(strip=True)) for cell in cells]):
+            if "Email" in email and "Type" in type_val and any("Name" in text for text in texts):
                 continue
             
-            # Look for Google Doc link in the name cell
-            doc_link = None
-            name_cell = cells[2]
-            a_tags = name_cell.find_all("a")
-            if a_tags:
-                a_tag = a_tags[0]
-                if a_tag.has_attr("href"):
-                    href = a_tag["href"]
-                    if href.startswith("https://www.google.com/url?q="):
-                        doc_link = extract_actual_url(href)
-            
+            # Google Doc link in the name cell (resolved below)
             people_data.append({
                 "row_id": row_id,
                 "name": name,
                 "email": email,
                 "type": type_val,
-                "doc_link": doc_link if doc_link else ""
+                "doc_link": href if href and href.startswith(GOOGLE_REDIRECT_PREFIX) else ""
             })
     
+    # Resolve google.com/url?q= redirects once per distinct URL
+    redirects = {person["doc_link"] for person in people_data if person["doc_link"]}
+    resolved = {href: extract_actual_url(href) for href in redirects}
+    for person in people_data:
+        if person["doc_link"]:
+            person["doc_link"] = resolved[person["doc_link"]] or ""
+    
+    return people_data
+
+def step2_extract_people_and_docs(html_content):
+    """Step 2: Extract people data and Google Doc links from the sheet"""
+    print("Step 2: Extracting people data and Google Doc links...")
+    
+    # The same sheet content parses to the same people
+    sheet_state = get_sheet_state()
+    sheet_sha256 = content_hash(html_content)
+    people_data = sheet_state.parsed_people(sheet_sha256)
+    if people_data is not None:
+        print("  ✓ Sheet unchanged since the last parse, reusing it")
+    else:
+        people_data = parse_people_from_sheet(html_content)
+        sheet_state.remember_parse(sheet_sha256, people_data)
+        sheet_state.save()
+    
     print(f"✓ Found {len(people_data)} people records")
     
     # Filter to only those with actual Google Doc links (not direct YouTube/Drive links)
@@ -654,11 +749,15 @@ def step6_map_data(processed_records, basic_mode=False, text_mode=False, output_
     return df
 
 
+# Open incremental writers by output file (see IncrementalCSVWriter)
+_incremental_writers = {}
+
 def update_csv_incrementally(all_records, current_index, record, basic_mode=False, text_mode=False, output_file=None):
-    """Update CSV incrementally after each successful S3 process"""
-    # Update the record at the current index
-    all_records[current_index] = record
+    """Update CSV incrementally after each successful S3 process
     
+    The first call for an output file writes the full CSV; later calls append
+    the record to a journal. finish_incremental_csv() writes the final CSV.
+    """
     # Handle different column sets based on processing mode
     if basic_mode:
         required_columns = config.get('csv_columns.basic')
@@ -667,18 +766,6 @@ def update_csv_incrementally(all_records, current_index, record, basic_mode=Fals
     else:
         required_columns = config.get('csv_columns.full')
     
-    # Ensure all required columns are present in all records
-    for rec in all_records:
-        for col in required_columns:
-            if col not in rec:
-                rec[col] = ''
-    
-    # Filter records to only include required columns in correct order
-    filtered_records = []
-    for rec in all_records:
-        filtered_record = {col: rec.get(col, '') for col in required_columns}
-        filtered_records.append(filtered_record)
-    
     # Determine output file
     if not output_file:
         if basic_mode:
@@ -688,18 +775,135 @@ def update_csv_incrementally(all_records, current_index, record, basic_mode=Fals
         else:
             output_file = config.get("paths.output_csv", "simple_output.csv")
     
-    # Create DataFrame for CSV operations
-    df = pd.DataFrame(filtered_records)
-    
-    # Write to CSV
-    csv_manager = CSVManager(csv_path=output_file)
-    csv_success = csv_manager.safe_csv_write(df, operation_name=f"incremental_update_{current_index}")
+    writer = _incremental_writers.get(output_file)
+    if writer is None or writer.columns != list(required_columns):
+        # First write (or new column set): full CSV once, then journal appends
+        if writer is not None:
+            writer.finalize()
+        writer = IncrementalCSVWriter(output_file, required_columns)
+        _incremental_writers[output_file] = writer
+        all_records[current_index] = record
+        csv_success = writer.start(all_records)
+    else:
+        csv_success = writer.append(current_index, record)
     
     if not csv_success:
         print(f"  ❌ Failed to update CSV after processing record {current_index}")
     
     return csv_success
 
+def finish_incremental_csv():
+    """Write the consolidated CSV for every incrementally updated output file"""
+    success = True
+    for output_file, writer in list(_incremental_writers.items()):
+        if writer.finalize():
+            print(f"  📝 Consolidated {writer.appended} incremental updates into {output_file}")
+        else:
+            print(f"  ❌ Failed to consolidate {output_file} (journal kept at {writer.journal_path})")
+            success = False
+        del _incremental_writers[output_file]
+    return success
+
+def apply_sheet_diff(all_records, record_positions, sheet_diff, output_file):
+    """Carry over output records of people unchanged since the last run
+    
+    Returns (row_ids still to process, row_ids carried over); every row_id is
+    to be processed when sheet_diff is None.
+    """
+    if sheet_diff is None:
+        return None, set()
+    
+    carried_ids = set()
+    unchanged_ids = sheet_diff.unchanged_ids
+    if unchanged_ids:
+        existing = CSVManager(csv_path=output_file).read('all_string').fillna('')
+        for row in existing.to_dict('records'):
+            record_index = record_positions.get(row.get('row_id'))
+            if record_index is not None and row['row_id'] in unchanged_ids:
+                all_records[record_index] = row
+                carried_ids.add(row['row_id'])
+    
+    # Unchanged people missing from the output are processed again
+    return sheet_diff.pending_ids | (unchanged_ids - carried_ids), carried_ids
+
+def process_person_full(person, has_doc, all_records, record_index, output_file):
+    """Run steps 3-5 for one person in full mode and write their record
+    
+    Returns True only if the document (if any) was scraped and the record
+    reached the CSV; anyone else must be processed again on the next run.
+    """
+    # Check if this person has a link
+    if person.get('doc_link'):
+        link = person['doc_link'].lower()
+        
+        # Check if it's a Google Doc that needs scraping
+        if has_doc:
+            print(f"  → Has Google Doc: {person['doc_link']}")
+            
+            # Step 3: Scrape doc content and text
+            doc_content, doc_text = step3_scrape_doc_contents(person['doc_link'])
+            scraped = bool(doc_content or doc_text)
+            
+            # Step 4: Extract links from HTML content and document text
+            links = step4_extract_links(doc_content, doc_text)
+            
+            # Step 5: Process extracted data (includes S3 streaming)
+            record = step5_process_extracted_data(person, links, doc_text)
+            
+            # Update CSV incrementally after successful S3 process
+            print("  📝 Updating CSV...")
+            written = update_csv_incrementally(all_records, record_index, record, output_file=output_file)
+        
+        # Handle direct YouTube/Drive links (Case 2)
+        elif "youtube.com" in link or "youtu.be" in link or "drive.google.com/file" in link:
+            print(f"  → Has direct link: {person['doc_link']}")
+            
+            # For direct links, create the links structure directly without scraping
+            links = {
+                'youtube': [],
+                'drive_files': [],
+                'drive_folders': [],
+                'all_links': []
+            }
+            
+            # Add the direct link to appropriate category
+            if "youtube.com" in link or "youtu.be" in link:
+                links['youtube'].append(person['doc_link'])
+            elif "drive.google.com/file" in link:
+                links['drive_files'].append(person['doc_link'])
+            
+            links['all_links'].append(person['doc_link'])
+            scraped = True
+            
+            # Process without doc scraping (includes S3 streaming)
+            record = step5_process_extracted_data(person, links, '')
+            
+            # Update CSV incrementally after successful S3 process
+            print("  📝 Updating CSV...")
+            written = update_csv_incrementally(all_records, record_index, record, output_file=output_file)
+        
+        else:
+            print(f"  → Has unknown link type: {person['doc_link']}")
+            # Unknown link type, process as doc for safety
+            doc_content, doc_text = step3_scrape_doc_contents(person['doc_link'])
+            scraped = bool(doc_content or doc_text)
+            links = step4_extract_links(doc_content, doc_text)
+            record = step5_process_extracted_data(person, links, doc_text)
+            
+            # Update CSV incrementally after successful S3 process
+            print("  📝 Updating CSV...")
+            written = update_csv_incrementally(all_records, record_index, record, output_file=output_file)
+    else:
+        print(f"  → No document")
+        # Create record for person without document using factory (DRY)
+        record = CSVManager.create_record(person, mode='full', doc_text='', links=None)
+        scraped = True
+        
+        # Update CSV incrementally (even for no-doc cases to maintain consistency)
+        written = update_csv_incrementally(all_records, record_index, record, output_file=output_file)
+    
+    return scraped and written
+
 def parse_arguments():
     """Parse command line arguments"""
     parser = argparse.ArgumentParser(description='Simple 6-Step Workflow - Unified Processing')
@@ -724,6 +928,8 @@ def parse_arguments():
                        help='Override output CSV filename')
     parser.add_argument('--no-yt-dlp-update', action='store_true',
                        help='Skip automatic yt-dlp update before processing')
+    parser.add_argument('--full-refresh', action='store_true',
+                       help='Process every person, not only those new or changed since the last run')
     
     return parser.parse_args()
 
@@ -776,6 +982,21 @@ def main():
         basic_record = CSVManager.create_record(person, mode='basic')
         all_records.append(basic_record)
     
+    # row_id -> index in all_records (first match, like a linear search)
+    record_positions = {}
+    for idx, rec in enumerate(all_records):
+        record_positions.setdefault(rec['row_id'], idx)
+    
+    # Row-level diff against the last run: unchanged people keep their output records
+    mode_name = 'basic' if basic_mode else 'text' if text_mode else 'full'
+    sheet_state = get_sheet_state()
+    sheet_diff = None
+    if not basic_mode and not args.full_refresh:
+        sheet_diff = sheet_state.diff(all_people, output_file, mode_name)
+        print(f"  - Since the last run: {len(sheet_diff.new)} new, {len(sheet_diff.changed)} changed, "
+              f"{len(sheet_diff.unchanged)} unchanged, {len(sheet_diff.removed)} removed")
+    done_ids = set()
+    
     # Determine processing approach based on mode
     if basic_mode:
         print(f"\n🚀 BASIC MODE: Processing {len(all_people)} people (basic data only)...")
@@ -803,6 +1024,7 @@ def main():
             # Update basic record to text mode record
             text_record = CSVManager.create_record(person, mode='text')
             all_records[i] = text_record
+        pending_ids, carried_ids = apply_sheet_diff(all_records, record_positions, sheet_diff, output_file)
         
         # Write initial CSV with all records in text mode format
         print("\n📝 Writing initial CSV with text mode columns...")
@@ -819,6 +1041,14 @@ def main():
             docs_to_process = people_with_docs
             print(f"  Processing all {len(docs_to_process)} documents...")
         
+        if pending_ids is not None and not args.retry_failed:
+            docs_to_process = [person for person in docs_to_process if person['row_id'] in pending_ids]
+            print(f"  {len(docs_to_process)} documents belong to new or changed people")
+        # People without documents have nothing to extract
+        doc_row_ids = {person['row_id'] for person in people_with_docs}
+        done_ids = {person['row_id'] for person in all_people
+                    if person['row_id'] not in doc_row_ids and (pending_ids is None or person['row_id'] in pending_ids)}
+        
         # Apply test limit if specified
         if test_limit:
             docs_to_process = docs_to_process[:test_limit]
@@ -855,11 +1085,12 @@ def main():
                     record = CSVManager.create_record(person, mode='text', doc_text=doc_text)
                 
                 # Find the index in all_records for this person
-                record_index = next((idx for idx, rec in enumerate(all_records) if rec['row_id'] == person['row_id']), -1)
+                record_index = record_positions.get(person['row_id'], -1)
                 if record_index >= 0:
                     # Update CSV incrementally after each document extraction
                     print("  📝 Updating CSV...")
-                    update_csv_incrementally(all_records, record_index, record, basic_mode=basic_mode, text_mode=text_mode, output_file=output_file)
+                    if update_csv_incrementally(all_records, record_index, record, basic_mode=basic_mode, text_mode=text_mode, output_file=output_file) and not error:
+                        done_ids.add(person['row_id'])
                 
                 progress['total_processed'] += 1
                 
@@ -889,7 +1120,11 @@ def main():
     else:
         print(f"\n🚀 FULL MODE: Processing {len(all_people)} people (with document processing)...")
         # Full processing of all people (both with and without docs)
-        people_to_process = all_people[:test_limit] if test_limit else all_people
+        pending_ids, carried_ids = apply_sheet_diff(all_records, record_positions, sheet_diff, output_file)
+        people_to_process = all_people if pending_ids is None else [
+            person for person in all_people if person['row_id'] in pending_ids
+        ]
+        people_to_process = people_to_process[:test_limit] if test_limit else people_to_process
         
         # Write initial CSV with all basic records
         print("\n📝 Writing initial CSV with basic data for all people...")
@@ -899,75 +1134,20 @@ def main():
             print(f"\nProcessing person {i+1}/{len(people_to_process)}: {person['name']} (Row {person.get('row_id', 'Unknown')})")
             
             # Find the index in all_records for this person
-            record_index = next((idx for idx, rec in enumerate(all_records) if rec['row_id'] == person['row_id']), i)
+            record_index = record_positions.get(person['row_id'], i)
             
-            # Check if this person has a link
-            if person.get('doc_link'):
-                link = person['doc_link'].lower()
-                
-                # Check if it's a Google Doc that needs scraping
-                if person.get('row_id') in people_with_docs_dict:
-                    print(f"  → Has Google Doc: {person['doc_link']}")
-                    
-                    # Step 3: Scrape doc content and text
-                    doc_content, doc_text = step3_scrape_doc_contents(person['doc_link'])
-                    
-                    # Step 4: Extract links from HTML content and document text
-                    links = step4_extract_links(doc_content, doc_text)
-                    
-                    # Step 5: Process extracted data (includes S3 streaming)
-                    record = step5_process_extracted_data(person, links, doc_text)
-                    
-                    # Update CSV incrementally after successful S3 process
-                    print("  📝 Updating CSV...")
-                    update_csv_incrementally(all_records, record_index, record, basic_mode=basic_mode, text_mode=text_mode, output_file=output_file)
-                
-                # Handle direct YouTube/Drive links (Case 2)
-                elif "youtube.com" in link or "youtu.be" in link or "drive.google.com/file" in link:
-                    print(f"  → Has direct link: {person['doc_link']}")
-                    
-                    # For direct links, create the links structure directly without scraping
-                    links = {
-                        'youtube': [],
-                        'drive_files': [],
-                        'drive_folders': [],
-                        'all_links': []
-                    }
-                    
-                    # Add the direct link to appropriate category
-                    if "youtube.com" in link or "youtu.be" in link:
-                        links['youtube'].append(person['doc_link'])
-                    elif "drive.google.com/file" in link:
-                        links['drive_files'].append(person['doc_link'])
-                    
-                    links['all_links'].append(person['doc_link'])
-                    
-                    # Process without doc scraping (includes S3 streaming)
-                    record = step5_process_extracted_data(person, links, '')
-                    
-                    # Update CSV incrementally after successful S3 process
-                    print("  📝 Updating CSV...")
-                    update_csv_incrementally(all_records, record_index, record, basic_mode=basic_mode, text_mode=text_mode, output_file=output_file)
-                
-                else:
-                    print(f"  → Has unknown link type: {person['doc_link']}")
-                    # Unknown link type, process as doc for safety
-                    doc_content, doc_text = step3_scrape_doc_contents(person['doc_link'])
-                    links = step4_extract_links(doc_content, doc_text)
-                    record = step5_process_extracted_data(person, links, doc_text)
-                    
-                    # Update CSV incrementally after successful S3 process
-                    print("  📝 Updating CSV...")
-                    update_csv_incrementally(all_records, record_index, record, basic_mode=basic_mode, text_mode=text_mode, output_file=output_file)
-            else:
-                print(f"  → No document")
-                # Create record for person without document using factory (DRY)
-                record = CSVManager.create_record(person, mode='full', doc_text='', links=None)
-                
-                # Update CSV incrementally (even for no-doc cases to maintain consistency)
-                update_csv_incrementally(all_records, record_index, record, basic_mode=basic_mode, text_mode=text_mode, output_file=output_file)
+            if process_person_full(person, person['row_id'] in people_with_docs_dict,
+                                   all_records, record_index, output_file):
+                done_ids.add(person['row_id'])
+    
+    # Step 6 is now done incrementally; write the consolidated CSV
+    if finish_incremental_csv() and not basic_mode:
+        # The next run only processes people whose sheet rows differ from these
+        current_ids = carried_ids | done_ids
+        sheet_state.record_output(output_file, mode_name,
+                                  [person for person in all_people if person['row_id'] in current_ids])
+        sheet_state.save()
     
-    # Step 6 is now done incrementally, so just print summary
     print("\n" + "=" * 50)
     print("📊 FINAL SUMMARY")
     print(f"  Total people processed: {len(people_to_process) if 'people_to_process' in locals() else len(processed_records)}")
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the validated read cache and row_id index of CSVManager.
+"""
+
+# Standardized project imports
+from utils.config import setup_project_imports
+setup_project_imports()
+import unittest
+import os
+import tempfile
+import time
+from pathlib import Path
+from unittest import mock
+
+import pandas as pd
+
+from utils.csv_manager import CSVManager, CSVRowStore
+
+
+def write_people_csv(csv_path, rows):
+    pd.DataFrame({
+        'row_id': [str(i) for i in range(rows)],
+        'name': [f"Person {i}" for i in range(rows)],
+        'youtube_status': ['pending'] * rows,
+        'document_text': ["Document text " * 20] * rows
+    }).to_csv(csv_path, index=False)
+
+
+class TestCSVReadCache(unittest.TestCase):
+    """Test reads share one parse until the CSV changes"""
+
+    def setUp(self):
+        """Create a temporary CSV"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.csv_path = Path(self.temp_dir) / "output.csv"
+        write_people_csv(self.csv_path, 50)
+        self.manager = CSVManager(str(self.csv_path), auto_backup=False, storage_format='csv')
+
+    def tearDown(self):
+        """Clean up temporary files"""
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    def _count_parses(self):
+        return mock.patch.object(CSVManager, 'safe_csv_read', wraps=CSVManager.safe_csv_read)
+
+    def test_repeated_reads_parse_once(self):
+        """Test full reads, projections and lookups reuse one parse"""
+        with self._count_parses() as parse:
+            self.assertEqual(len(self.manager.read()), 50)
+            self.assertEqual(list(self.manager.read(columns=['row_id']).columns), ['row_id'])
+            self.assertEqual(self.manager.find_row_by_id(7)['name'], 'Person 7')
+            self.assertEqual(len(self.manager.find_rows_by_criteria({'youtube_status': 'pending'})), 50)
+            self.assertEqual(sum(1 for _ in self.manager.iterate_rows()), 50)
+        self.assertEqual(parse.call_count, 1)
+
+    def test_snapshots_are_independent(self):
+        """Test modifying a returned frame does not change later reads"""
+        df = self.manager.read()
+        df.loc[0, 'name'] = 'Changed'
+        df['extra'] = 'x'
+        again = self.manager.read()
+        self.assertEqual(again.loc[0, 'name'], 'Person 0')
+        self.assertNotIn('extra', again.columns)
+
+    def test_external_change_invalidates(self):
+        """Test a write by another process is seen on the next read"""
+        self.assertIsNone(self.manager.find_row_by_id(60))
+        write_people_csv(self.csv_path, 70)
+        self.assertEqual(self.manager.find_row_by_id(60)['name'], 'Person 60')
+
+        # Same size and inode: only the mtime tells the versions apart
+        stat = self.csv_path.stat()
+        df = pd.read_csv(self.csv_path, dtype=str)
+        df.loc[5, 'name'] = 'Person X'
+        df.to_csv(self.csv_path, index=False)
+        os.utime(self.csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000))
+        self.assertEqual(self.csv_path.stat().st_size, stat.st_size)
+        self.assertEqual(self.manager.find_row_by_id(5)['name'], 'Person X')
+
+    def test_own_writes_invalidate(self):
+        """Test row updates and full writes through the manager are seen immediately"""
+        self.manager.read()
+        self.assertTrue(self.manager.update_row_by_id(3, {'youtube_status': 'completed'}))
+        self.assertEqual(self.manager.find_row_by_id(3)['youtube_status'], 'completed')
+
+        df = self.manager.read()
+        df.loc[4, 'youtube_status'] = 'failed'
+        self.assertTrue(self.manager.safe_csv_write(df))
+        self.assertEqual(self.manager.find_row_by_id(4)['youtube_status'], 'failed')
+
+    def test_row_store_flushes_keep_cache(self):
+        """Test a find/update loop that rewrites on every update parses the CSV once"""
+        self.manager._row_store = CSVRowStore(self.csv_path, flush_interval=0,
+                                              on_flush=self.manager._on_row_store_flush)
+        with self._count_parses() as parse:
+            for row_id in range(1, 51):
+                row = self.manager.find_row_by_id(row_id)
+                if row_id < 50:
+                    self.assertEqual(row['youtube_status'], 'pending')
+                self.assertTrue(self.manager.update_row_by_id(row_id - 1, {'youtube_status': 'completed'}))
+            self.assertEqual(self.manager.find_row_by_id(49)['youtube_status'], 'completed')
+        self.assertEqual(parse.call_count, 1)
+        self.assertEqual(self.manager._row_store.rewrites, 50)
+        self.assertEqual(self.manager._row_store.pending_count, 0)
+
+        cached = self.manager.read()
+        self.assertEqual(list(cached['youtube_status']), ['completed'] * 50)
+        pd.testing.assert_frame_equal(cached, CSVManager.safe_csv_read(str(self.csv_path)))
+
+    def test_lookup_benchmark(self):
+        """Benchmark repeated find_row_by_id against a fresh parse per lookup"""
+        write_people_csv(self.csv_path, 20000)
+        lookups = 200
+
+        start_time = time.perf_counter()
+        for row_id in range(1, 20000, 20000 // 20):
+            df = CSVManager.safe_csv_read(str(self.csv_path))
+            df[df['row_id'].astype(str) == str(row_id)].iloc[0]
+        uncached_seconds = (time.perf_counter() - start_time) / 20 * lookups
+
+        start_time = time.perf_counter()
+        for row_id in range(1, 20000, 20000 // lookups):
+            self.assertEqual(self.manager.find_row_by_id(row_id)['row_id'], str(row_id))
+        cached_seconds = time.perf_counter() - start_time
+
+        print(f"\n{lookups} lookups on 20k rows: re-parsing {uncached_seconds:.2f}s (estimated), "
+              f"cached {cached_seconds:.3f}s")
+        self.assertLess(cached_seconds, uncached_seconds / 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Unit tests for batched, indexed CSV row updates.
+"""
+
+# Standardized project imports
+from utils.config import setup_project_imports
+setup_project_imports()
+import unittest
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from utils.csv_manager import CSVManager, CSVRowStore
+from utils.row_context import DownloadResult
+
+
+class TestCSVRowStore(unittest.TestCase):
+    """Test row updates are batched, visible to reads and survive external writes"""
+
+    def setUp(self):
+        """Create a temporary tracking CSV"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.csv_path = Path(self.temp_dir) / "output.csv"
+        self._write_rows(10)
+
+    def tearDown(self):
+        """Clean up temporary files"""
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    def _write_rows(self, count):
+        pd.DataFrame({
+            'row_id': [str(i) for i in range(count)],
+            'name': [f"Person {i}" for i in range(count)],
+            'youtube_status': ['pending'] * count,
+            'youtube_error': [''] * count
+        }).to_csv(self.csv_path, index=False)
+
+    def _result(self, success, error_message=None):
+        return DownloadResult(
+            success=success, files_downloaded=[], media_id=None, error_message=error_message,
+            metadata_file=None, row_context=None, download_type='youtube'
+        )
+
+    def _manager(self, store):
+        manager = CSVManager(str(self.csv_path), auto_backup=False)
+        manager._row_store = store
+        return manager
+
+    def test_batched_updates_visible_to_reads(self):
+        """Test updates are written once per interval and read() sees them"""
+        store = CSVRowStore(self.csv_path, flush_interval=3600)
+        manager = self._manager(store)
+
+        for row_id in range(5):
+            self.assertTrue(manager.update_row_by_id(row_id, {'youtube_status': 'completed'}))
+        self.assertTrue(manager.update_download_status(7, 'youtube', self._result(False, 'HTTP 429')))
+        self.assertEqual(store.rewrites, 0)
+        self.assertEqual(store.pending_count, 6)
+
+        # Reads overlay pending updates rather than forcing a rewrite
+        df = manager.read()
+        self.assertEqual(store.rewrites, 0)
+        self.assertEqual(list(df['youtube_status'][:5]), ['completed'] * 5)
+        self.assertEqual(df.loc[7, 'youtube_status'], 'failed')
+        self.assertEqual(df.loc[7, 'youtube_error'], 'HTTP 429')
+        self.assertEqual(df.loc[8, 'youtube_status'], 'pending')
+        filtered = manager.read(columns=['row_id'], filters=[('youtube_status', '==', 'completed')])
+        self.assertEqual(list(filtered['row_id']), ['0', '1', '2', '3', '4'])
+
+        store.flush()
+        self.assertEqual(store.rewrites, 1)
+        self.assertTrue(manager.read().equals(df))
+
+    def test_find_update_loop_does_not_rewrite(self):
+        """Test interleaved lookups and updates stay batched"""
+        self._write_rows(10000)
+        store = CSVRowStore(self.csv_path, flush_interval=3600, max_pending=100000)
+        manager = self._manager(store)
+
+        for row_id in range(1, 51):
+            row = manager.find_row_by_id(row_id)
+            self.assertEqual(row['youtube_status'], 'pending')
+            self.assertTrue(manager.update_row_by_id(row_id, {'youtube_status': 'completed'}))
+            self.assertEqual(manager.find_row_by_id(row_id)['youtube_status'], 'completed')
+        self.assertEqual(store.rewrites, 0)
+        self.assertEqual(store.pending_count, 50)
+
+    def test_timer_flushes_lone_update(self):
+        """Test an update is written flush_interval later without another update"""
+        store = CSVRowStore(self.csv_path, flush_interval=0.1)
+        store.update(4, {'youtube_status': 'completed'})
+        self.assertEqual(store.rewrites, 0)
+
+        deadline = time.time() + 5
+        while store.rewrites == 0 and time.time() < deadline:
+            time.sleep(0.02)
+        self.assertEqual(store.rewrites, 1)
+        df = pd.read_csv(self.csv_path, dtype=str, keep_default_na=False)
+        self.assertEqual(df.loc[4, 'youtube_status'], 'completed')
+
+    def test_missing_rows_and_columns(self):
+        """Test unknown row IDs fail and new mapping columns are added"""
+        manager = self._manager(CSVRowStore(self.csv_path, flush_interval=3600))
+
+        self.assertFalse(manager.update_row_by_id(999, {'youtube_status': 'completed'}))
+        self.assertFalse(manager.update_download_status(50, 'youtube', self._result(True)))
+        self.assertTrue(manager.update_row_by_id(1, {'not_a_column': 'x'}))
+        self.assertTrue(manager.update_s3_mappings(2, {'video': 's3://bucket/v.mp4'}, {'video': 'uuid-1'}))
+
+        df = manager.read()
+        self.assertNotIn('not_a_column', df.columns)
+        self.assertEqual(manager.load_s3_paths(df.loc[2])['video'], 's3://bucket/v.mp4')
+        self.assertEqual(manager.load_file_uuids(df.loc[2])['video'], 'uuid-1')
+
+    def test_external_write_reapplies_pending(self):
+        """Test pending updates are re-applied when another writer replaces the file"""
+        store = CSVRowStore(self.csv_path, flush_interval=3600)
+        store.update(3, {'youtube_status': 'completed'})
+
+        # Another process appends rows; the pending update must land on the new file
+        time.sleep(0.01)
+        self._write_rows(12)
+        store.flush()
+
+        df = pd.read_csv(self.csv_path, dtype=str, keep_default_na=False)
+        self.assertEqual(len(df), 12)
+        self.assertEqual(df.loc[3, 'youtube_status'], 'completed')
+        self.assertEqual(df.loc[11, 'youtube_status'], 'pending')
+
+    def test_update_cost_independent_of_rows(self):
+        """Test an update costs O(1) instead of a full read and rewrite"""
+        self._write_rows(10000)
+        store = CSVRowStore(self.csv_path, flush_interval=3600, max_pending=100000)
+        store.update(0, {'youtube_status': 'completed'})
+
+        updates = 2000
+        start_time = time.perf_counter()
+        for row_id in range(updates):
+            store.update(row_id, {'youtube_status': 'completed'})
+        per_update = (time.perf_counter() - start_time) / updates
+        store.flush()
+
+        self.assertLess(per_update, 0.001, f"Update costs {per_update * 1000:.2f}ms on 10k rows")
+        self.assertEqual(store.rewrites, 1)
+        df = pd.read_csv(self.csv_path, dtype=str, keep_default_na=False)
+        self.assertEqual((df['youtube_status'] == 'completed').sum(), updates)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Unit tests for debounced, content-addressed CSV S3 versioning.
+"""
+
+# Standardized project imports
+from utils.config import setup_project_imports
+setup_project_imports()
+import unittest
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from utils.csv_s3_versioning import CSVS3Versioning, make_csv_diff, apply_csv_diff
+
+
+class RecordingS3Client:
+    """Keeps put_object calls instead of sending them"""
+
+    def __init__(self):
+        self.objects = []
+
+    def put_object(self, **kwargs):
+        self.objects.append(kwargs)
+
+
+class TestCSVS3Versioning(unittest.TestCase):
+    """Test uploads follow content changes rather than write count"""
+
+    def setUp(self):
+        """Create a temporary CSV"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.csv_path = Path(self.temp_dir) / "output.csv"
+        self.rows = [f"{i},Person {i},pending\n" for i in range(200)]
+        self._write()
+
+    def tearDown(self):
+        """Clean up temporary files"""
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    def _write(self):
+        self.csv_path.write_text("row_id,name,youtube_status\n" + "".join(self.rows))
+
+    def _versioning(self, **kwargs):
+        self.s3 = RecordingS3Client()
+        with patch("utils.s3_manager.get_s3_client", return_value=self.s3):
+            versioning = CSVS3Versioning(bucket_name="test-bucket", **kwargs)
+        self.addCleanup(versioning.flush)
+        return versioning
+
+    def test_unchanged_content_skipped(self):
+        """Test a version identical to the last upload is not uploaded again"""
+        versioning = self._versioning(min_interval_seconds=0)
+
+        first = versioning.request_upload(str(self.csv_path), {'operation': 'write'})
+        second = versioning.request_upload(str(self.csv_path), {'operation': 'write'})
+        self.rows[5] = "5,Person 5,completed\n"
+        self._write()
+        third = versioning.request_upload(str(self.csv_path), {'operation': 'write'})
+
+        self.assertFalse(first.get('skipped'))
+        self.assertTrue(second['skipped'])
+        self.assertEqual(second['s3_key'], first['s3_key'])
+        self.assertNotEqual(third['content_sha256'], first['content_sha256'])
+        self.assertEqual(len(self.s3.objects), 2)
+        self.assertEqual(self.s3.objects[0]['Body'], self.csv_path.read_bytes().replace(b"completed", b"pending"))
+
+    def test_writes_debounced_with_trailing_upload(self):
+        """Test a burst of writes becomes one immediate and one trailing upload"""
+        versioning = self._versioning(min_interval_seconds=0.2, max_pending_writes=1000)
+
+        for i in range(50):
+            self.rows[i] = f"{i},Person {i},completed\n"
+            self._write()
+            versioning.request_upload(str(self.csv_path), {'operation': 'update'})
+        self.assertEqual(len(self.s3.objects), 1)
+
+        time.sleep(0.5)
+        self.assertEqual(len(self.s3.objects), 2)
+        trailing = self.s3.objects[1]
+        self.assertEqual(trailing['Body'], self.csv_path.read_bytes())
+        self.assertEqual(trailing['Metadata']['coalesced_writes'], '49')
+
+    def test_max_pending_writes_forces_upload(self):
+        """Test enough pending writes upload before the interval elapses"""
+        versioning = self._versioning(min_interval_seconds=3600, max_pending_writes=10)
+
+        for i in range(21):
+            self.rows[i] = f"{i},Person {i},failed\n"
+            self._write()
+            versioning.request_upload(str(self.csv_path))
+        self.assertEqual(len(self.s3.objects), 3)
+
+    def test_first_write_uploads_on_fresh_clock(self):
+        """Test the first write uploads even when the monotonic clock is below the interval"""
+        versioning = self._versioning(min_interval_seconds=3600, max_pending_writes=10)
+
+        with patch("utils.csv_s3_versioning.time.monotonic", return_value=5.0):
+            first = versioning.request_upload(str(self.csv_path))
+
+        self.assertFalse(first.get('deferred'))
+        self.assertEqual(len(self.s3.objects), 1)
+
+    def test_versions_in_same_second_get_distinct_keys(self):
+        """Test back-to-back uploads never overwrite each other's S3 key"""
+        versioning = self._versioning(min_interval_seconds=0, diff_uploads=True)
+
+        for i in range(3):
+            self.rows[i] = f"{i},Person {i},completed\n"
+            self._write()
+            versioning.request_upload(str(self.csv_path))
+
+        keys = [obj['Key'] for obj in self.s3.objects]
+        self.assertEqual(len(set(keys)), 3)
+        self.assertEqual(self.s3.objects[2]['Metadata']['base_s3_key'], keys[1])
+
+    def test_diff_uploads_restore_versions(self):
+        """Test diff versions are small and restore the exact content"""
+        versioning = self._versioning(min_interval_seconds=0, diff_uploads=True, full_every=3)
+
+        versions = []
+        for i in range(4):
+            self.rows[i * 10] = f"{i * 10},Person {i * 10},completed\n"
+            self.rows.insert(i, f"new{i},Added {i},pending\n")
+            self._write()
+            versions.append(self.csv_path.read_bytes())
+            versioning.request_upload(str(self.csv_path))
+
+        formats = [obj['Metadata'].get('version_format') for obj in self.s3.objects]
+        self.assertEqual(formats, [None, 'unified-diff-gzip', 'unified-diff-gzip', None])
+        self.assertEqual(self.s3.objects[1]['Metadata']['base_s3_key'], self.s3.objects[0]['Key'])
+        self.assertLess(len(self.s3.objects[1]['Body']), len(versions[1]) / 5)
+
+        restored = self.s3.objects[0]['Body']
+        for obj, expected in zip(self.s3.objects[1:3], versions[1:3]):
+            restored = apply_csv_diff(restored, obj['Body'])
+            self.assertEqual(restored, expected)
+
+    def test_diff_round_trip_edge_cases(self):
+        """Test diffs handle insertions at the start, deletions and appends"""
+        base = b"a\nb\nc\nd\n"
+        for new in (b"x\na\nb\nc\nd\n", b"a\nd\n", b"a\nb\nc\nd\ne\nf\n", b"", b"b\nq\nd\nz\n"):
+            self.assertEqual(apply_csv_diff(base, make_csv_diff(base, new)), new)
+
+    def test_diff_round_trip_missing_final_newline(self):
+        """Test diffs keep a missing (or added) newline at the end of the file"""
+        pairs = [(b"a,1\nb,2", b"a,1\nb,3\n"), (b"a,1\nb,2\n", b"a,1\nb,3"), (b"a,1\nb,2", b"a,1\nb,3"),
+                 (b"a,1\nb,2", b"x,0\nb,2"), (b"a,1", b""), (b"", b"a,1")]
+        for base, new in pairs:
+            self.assertEqual(apply_csv_diff(base, make_csv_diff(base, new)), new)
+
+    def test_upload_does_not_block_requests(self):
+        """Test writers can request uploads while a version is being sent to S3"""
+        versioning = self._versioning(min_interval_seconds=60)
+        requests = []
+
+        def put_object(**kwargs):
+            writer = threading.Thread(target=lambda: requests.append(versioning.request_upload(str(self.csv_path))))
+            writer.start()
+            writer.join(timeout=2)
+            self.s3.objects.append(kwargs)
+
+        self.s3.put_object = put_object
+        self.assertTrue(versioning.request_upload(str(self.csv_path))['success'])
+        self.assertEqual(len(requests), 1)
+        self.assertTrue(requests[0]['deferred'])
+
+
+if __name__ == '__main__':
+    unittest.main()
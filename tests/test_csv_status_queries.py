@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the vectorised pending-download, status summary and link count queries.
+"""
+
+# Standardized project imports
+from utils.config import setup_project_imports
+setup_project_imports()
+import unittest
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from utils.csv_manager import CSVManager, count_links_by_type, extract_links_from_row
+
+
+def write_status_csv(csv_path, rows):
+    statuses = ['pending', 'completed', 'failed', 'completed', '', 'skipped']
+    pd.DataFrame({
+        'row_id': [str(i) for i in range(rows)],
+        'name': [f"Person {i}" for i in range(rows)],
+        'email': [f"p{i}@example.com" if i % 3 else '' for i in range(rows)],
+        'type': ['ENTJ'] * rows,
+        'youtube_status': [statuses[i % 6] for i in range(rows)],
+        'drive_status': [statuses[(i // 6) % 6] for i in range(rows)],
+        'youtube_playlist': [
+            '|'.join(f"https://youtube.com/watch?v={i}{j}" for j in range(i % 3)) + (' | ' if i % 5 == 0 else '')
+            for i in range(rows)
+        ],
+        'google_drive': ["https://drive.google.com/file/d/x|None" if i % 4 == 0 else '' for i in range(rows)],
+        'document_text': ["Document text " * 40] * rows
+    }).to_csv(csv_path, index=False)
+
+
+def pending_row_ids_by_loop(df, download_type='both', include_failed=True):
+    """Row-by-row reference for get_pending_downloads()"""
+    row_ids = []
+    for _, row in df.iterrows():
+        for kind in ('youtube', 'drive'):
+            if download_type in ['both', kind]:
+                status = str(row.get(f'{kind}_status', ''))
+                if status in ['pending', ''] or (include_failed and status == 'failed'):
+                    row_ids.append(str(row.get('row_id', '')))
+                    break
+    return row_ids
+
+
+def link_counts_by_loop(df):
+    """Row-by-row reference for count_links_by_type()"""
+    counts = {'youtube': 0, 'drive': 0, 'total_people': len(df), 'people_with_youtube': 0, 'people_with_drive': 0}
+    for _, row in df.iterrows():
+        youtube_links = extract_links_from_row(row, 'youtube_playlist')
+        drive_links = extract_links_from_row(row, 'google_drive')
+        counts['youtube'] += len(youtube_links)
+        counts['drive'] += len(drive_links)
+        counts['people_with_youtube'] += bool(youtube_links)
+        counts['people_with_drive'] += bool(drive_links)
+    return counts
+
+
+class TestCSVStatusQueries(unittest.TestCase):
+    """Test vectorised queries match the row-by-row results"""
+
+    def setUp(self):
+        """Create a temporary tracking CSV"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.csv_path = Path(self.temp_dir) / "output.csv"
+        write_status_csv(self.csv_path, 300)
+        self.manager = CSVManager(str(self.csv_path), auto_backup=False, storage_format='csv')
+
+    def tearDown(self):
+        """Clean up temporary files"""
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    def test_pending_downloads_match_loop(self):
+        """Test pending rows, their order and their row contexts"""
+        df = CSVManager.safe_csv_read(str(self.csv_path))
+        for download_type in ('both', 'youtube', 'drive'):
+            for include_failed in (True, False):
+                pending = self.manager.get_pending_downloads(download_type, include_failed)
+                self.assertEqual([context.row_id for context in pending],
+                                 pending_row_ids_by_loop(df, download_type, include_failed))
+
+        context = self.manager.get_pending_downloads('youtube')[1]
+        self.assertEqual(context.row_index, int(context.row_id))
+        self.assertEqual(context.name, f"Person {context.row_id}")
+        self.assertEqual(context.type, 'ENTJ')
+
+    def test_missing_status_column_means_pending(self):
+        """Test rows count as pending when the status column does not exist yet"""
+        df = pd.read_csv(self.csv_path, dtype=str, keep_default_na=False).drop(columns=['drive_status'])
+        df.to_csv(self.csv_path, index=False)
+        self.assertEqual(len(self.manager.get_pending_downloads('drive')), 300)
+        self.assertEqual(self.manager.get_download_status_summary(), {})
+
+    def test_status_summary(self):
+        """Test status counts"""
+        summary = self.manager.get_download_status_summary()
+        df = pd.read_csv(self.csv_path, dtype=str, keep_default_na=False)
+        self.assertEqual(summary['total_rows'], 300)
+        self.assertEqual(summary['youtube']['completed'], (df['youtube_status'] == 'completed').sum())
+        self.assertEqual(summary['youtube']['failed'], (df['youtube_status'] == 'failed').sum())
+        self.assertEqual(summary['drive']['pending'], (df['drive_status'] == 'pending').sum())
+
+    def test_link_counts_match_loop(self):
+        """Test link counts follow extract_links_from_row()"""
+        expected = link_counts_by_loop(pd.read_csv(self.csv_path))
+        self.assertEqual(count_links_by_type(str(self.csv_path)), expected)
+        self.assertGreater(expected['people_with_drive'], 0)
+
+    def test_queries_benchmark_100k_rows(self):
+        """Benchmark vectorised queries against the row-by-row versions at 100k rows"""
+        write_status_csv(self.csv_path, 100000)
+        df = CSVManager.safe_csv_read(str(self.csv_path))
+
+        start_time = time.perf_counter()
+        expected_ids = pending_row_ids_by_loop(df)
+        loop_seconds = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        pending = self.manager.get_pending_downloads()
+        vectorised_seconds = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        expected_links = link_counts_by_loop(pd.read_csv(self.csv_path))
+        links_loop_seconds = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        link_counts = count_links_by_type(str(self.csv_path))
+        links_vectorised_seconds = time.perf_counter() - start_time
+
+        print(f"\nPending downloads (100k rows): loop {loop_seconds:.2f}s (after read), "
+              f"vectorised {vectorised_seconds:.2f}s (including read)")
+        print(f"Link counts (100k rows): loop {links_loop_seconds:.2f}s, vectorised {links_vectorised_seconds:.2f}s")
+
+        self.assertEqual([context.row_id for context in pending], expected_ids)
+        self.assertEqual(link_counts, expected_links)
+        self.assertLess(vectorised_seconds, loop_seconds / 2)
+        self.assertLess(links_vectorised_seconds, links_loop_seconds / 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
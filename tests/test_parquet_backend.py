@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Unit tests for projected/filtered reads and the optional Parquet backend of CSVManager.
+"""
+
+# Standardized project imports
+from utils.config import setup_project_imports
+setup_project_imports()
+import unittest
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from utils.csv_manager import CSVManager, HAS_PYARROW
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+STATUS_FILTER = [('youtube_status', 'in', ['pending', 'failed'])]
+
+
+def write_tracking_csv(csv_path, rows, text_size=50):
+    statuses = ['completed', 'pending', 'failed', 'completed']
+    pd.DataFrame({
+        'row_id': [str(i) for i in range(rows)],
+        'name': [f"Person {i}" for i in range(rows)],
+        'youtube_status': [statuses[i % 4] if i % 7 else '' for i in range(rows)],
+        'drive_status': ['completed'] * rows,
+        'document_text': [f"Doc {i}, \"quoted\"\n" + "x" * text_size for i in range(rows)],
+        'extracted_links': [json.dumps([f"https://youtube.com/watch?v={i:011d}"]) for i in range(rows)]
+    }).to_csv(csv_path, index=False)
+
+
+# Loads the dataset in a fresh process so RSS growth belongs to one read
+LOAD_SCRIPT = """
+import json, sys, time, psutil
+from utils.config import setup_project_imports
+setup_project_imports()
+from utils.csv_manager import CSVManager
+csv_path, storage_format, mode = sys.argv[1:]
+manager = CSVManager(csv_path, storage_format=storage_format)
+rss_before = psutil.Process().memory_info().rss
+start = time.perf_counter()
+if mode == 'full':
+    df = manager.read()
+else:
+    df = manager.read(columns=['row_id', 'youtube_status'],
+                      filters=[('youtube_status', 'in', ['pending', 'failed'])])
+print(json.dumps({'seconds': time.perf_counter() - start, 'rows': len(df),
+                  'rss_mb': (psutil.Process().memory_info().rss - rss_before) / 1024 / 1024}))
+"""
+
+
+class TestProjectedReads(unittest.TestCase):
+    """Test column projection and row filters on both backends"""
+
+    def setUp(self):
+        """Create a temporary tracking CSV"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.csv_path = Path(self.temp_dir) / "output.csv"
+        write_tracking_csv(self.csv_path, 100)
+
+    def tearDown(self):
+        """Clean up temporary files"""
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    def _check_projected_read(self, manager):
+        df = manager.read(columns=['row_id', 'youtube_status'], filters=STATUS_FILTER)
+        expected = pd.read_csv(self.csv_path, dtype=str, keep_default_na=False)
+        expected = expected[expected['youtube_status'].isin(['pending', 'failed'])]
+
+        self.assertEqual(list(df.columns), ['row_id', 'youtube_status'])
+        self.assertEqual(list(df['row_id']), list(expected['row_id']))
+        self.assertEqual(list(df.index), list(range(len(expected))))
+
+        missing = manager.read(columns=['row_id'], filters=[('youtube_status', '!=', 'completed')])
+        self.assertEqual(len(missing), len(expected))
+
+    def test_csv_projection_and_filters(self):
+        """Test the CSV backend projects columns and filters rows"""
+        manager = CSVManager(str(self.csv_path), auto_backup=False, storage_format='csv')
+        self._check_projected_read(manager)
+        with self.assertRaises(ValueError):
+            manager.read(filters=[('youtube_status', 'like', 'pend%')])
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow not installed")
+    def test_parquet_projection_and_filters(self):
+        """Test the Parquet backend matches the CSV backend"""
+        manager = CSVManager(str(self.csv_path), auto_backup=False, storage_format='parquet')
+        self._check_projected_read(manager)
+        self.assertTrue(manager.parquet_path.exists())
+
+        full = manager.read()
+        self.assertEqual(full.loc[3, 'document_text'], pd.read_csv(self.csv_path).loc[3, 'document_text'])
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow not installed")
+    def test_parquet_copy_follows_csv(self):
+        """Test writes update the Parquet copy and outside CSV changes rebuild it"""
+        manager = CSVManager(str(self.csv_path), auto_backup=False, storage_format='parquet')
+        manager.read(columns=['row_id'])
+        self.assertFalse(manager.sync_parquet())
+
+        df = manager.read()
+        df.loc[0, 'youtube_status'] = 'failed'
+        self.assertTrue(manager.safe_csv_write(df))
+        self.assertFalse(manager.sync_parquet())
+        self.assertEqual(manager.read(columns=['youtube_status']).loc[0, 'youtube_status'], 'failed')
+
+        time.sleep(0.01)
+        write_tracking_csv(self.csv_path, 20)
+        self.assertEqual(len(manager.read(columns=['row_id'])), 20)
+
+        exported = Path(self.temp_dir) / "exports" / "pending.csv"
+        count = manager.export_csv(str(exported), columns=['row_id', 'youtube_status'], filters=STATUS_FILTER)
+        self.assertEqual(len(pd.read_csv(exported)), count)
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow not installed")
+    def test_load_time_and_rss_benchmark(self):
+        """Benchmark CSV vs Parquet load time and RSS growth at 10k and 100k rows"""
+        print("\n=== Tracking dataset load: CSV vs Parquet ===")
+        print(f"{'Rows':>8} {'Backend':<8} {'Read':<10} {'Seconds':>8} {'RSS growth MB':>14}")
+        for rows in (10000, 100000):
+            csv_path = Path(self.temp_dir) / f"output_{rows}.csv"
+            write_tracking_csv(csv_path, rows, text_size=1000)
+            CSVManager(str(csv_path), storage_format='parquet').sync_parquet()
+
+            results = {}
+            for storage_format in ('csv', 'parquet'):
+                for mode in ('full', 'status'):
+                    completed = subprocess.run(
+                        [sys.executable, "-c", LOAD_SCRIPT, str(csv_path), storage_format, mode],
+                        cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+                    )
+                    result = json.loads(completed.stdout.strip().splitlines()[-1])
+                    results[storage_format, mode] = result
+                    print(f"{rows:>8} {storage_format:<8} {mode:<10} {result['seconds']:>8.3f} "
+                          f"{result['rss_mb']:>14.1f}")
+
+            self.assertEqual(results['csv', 'status']['rows'], results['parquet', 'status']['rows'])
+            self.assertLess(results['parquet', 'status']['seconds'], results['csv', 'status']['seconds'])
+        self.assertLess(results['parquet', 'status']['rss_mb'], results['csv', 'full']['rss_mb'])
+        print("✓ Parquet status reads benchmarked")
+
+
+if __name__ == '__main__':
+    unittest.main()
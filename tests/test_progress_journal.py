@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the journaled ProgressTracker implementations.
+"""
+
+# Standardized project imports
+from utils.config import setup_project_imports
+setup_project_imports()
+import unittest
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from utils import config as config_module
+from utils.json_utils import ProgressTracker, ProgressJournal, write_json_safe
+
+
+class TestJsonProgressTracker(unittest.TestCase):
+    """Test utils.json_utils.ProgressTracker journaling and recovery"""
+
+    def setUp(self):
+        """Create a temporary progress location"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.progress_file = Path(self.temp_dir) / "progress.json"
+
+    def tearDown(self):
+        """Clean up temporary files"""
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    def test_marks_survive_restart_without_compaction(self):
+        """Test a new tracker replays journaled changes"""
+        tracker = ProgressTracker(self.progress_file, "test", compact_every=100)
+        tracker.mark_processed("a", {"size": 1})
+        tracker.mark_processed("a")
+        tracker.mark_failed("b", "boom")
+        tracker.mark_skipped("c", "exists")
+        self.assertFalse(self.progress_file.exists())
+
+        resumed = ProgressTracker(self.progress_file, "test", compact_every=100)
+        self.assertTrue(resumed.is_processed("a"))
+        self.assertTrue(resumed.is_failed("b"))
+        self.assertTrue(resumed.is_skipped("c"))
+        self.assertEqual(resumed.get_summary()['stats'],
+                         {'total_items': 0, 'completed': 1, 'failed': 1, 'skipped': 1})
+
+    def test_compaction_rewrites_snapshot_and_truncates_journal(self):
+        """Test the JSON file is rewritten every compact_every changes"""
+        tracker = ProgressTracker(self.progress_file, "test", compact_every=10)
+        for i in range(25):
+            tracker.mark_processed(f"item{i}")
+
+        snapshot = json.loads(self.progress_file.read_text())
+        self.assertEqual(len(snapshot['processed']), 20)
+        self.assertEqual(len(tracker._journal.events_file.read_text().splitlines()), 5)
+
+        tracker.close()
+        snapshot = json.loads(self.progress_file.read_text())
+        self.assertEqual(len(snapshot['processed']), 25)
+        self.assertEqual(tracker._journal.events_file.read_text(), '')
+
+    def test_crash_between_snapshot_and_truncate(self):
+        """Test events already in the snapshot are not applied twice"""
+        tracker = ProgressTracker(self.progress_file, "test", compact_every=1000)
+        tracker.mark_failed("x", "first")
+        tracker.mark_failed("x", "second")
+        # Snapshot written, journal not yet truncated
+        state = dict(tracker._state, **{ProgressJournal.SEQUENCE_KEY: 2})
+        write_json_safe(self.progress_file, state)
+        with open(tracker._journal.events_file, 'a') as f:
+            f.write('{"op": "failed", "id": "y", "ent')
+
+        resumed = ProgressTracker(self.progress_file, "test")
+        self.assertEqual(resumed.get_summary()['stats']['failed'], 2)
+        self.assertFalse(resumed.is_failed("y"))
+
+    def test_change_after_torn_tail_survives(self):
+        """Test the first change after a crash isn't merged into the torn line"""
+        tracker = ProgressTracker(self.progress_file, "test", compact_every=1000)
+        tracker.mark_processed("a")
+        with open(tracker._journal.events_file, 'a') as f:
+            f.write('{"op": "processed", "id": "b", "ent')
+
+        resumed = ProgressTracker(self.progress_file, "test", compact_every=1000)
+        resumed.mark_processed("c")
+
+        reloaded = ProgressTracker(self.progress_file, "test", compact_every=1000)
+        self.assertTrue(reloaded.is_processed("a"))
+        self.assertFalse(reloaded.is_processed("b"))
+        self.assertTrue(reloaded.is_processed("c"))
+
+    def test_legacy_progress_file_loads(self):
+        """Test a progress file written before journaling still loads"""
+        write_json_safe(self.progress_file, {
+            'operation': 'old', 'started_at': 'then', 'last_updated': 'then',
+            'processed': [{'id': 'done'}], 'failed': {}, 'skipped': [],
+            'stats': {'total_items': 0, 'completed': 1, 'failed': 0, 'skipped': 0}
+        })
+        tracker = ProgressTracker(self.progress_file, "old")
+        self.assertTrue(tracker.is_processed("done"))
+        tracker.mark_processed("done")
+        self.assertEqual(tracker.get_summary()['total_processed'], 1)
+
+    def test_mark_processed_benchmark(self):
+        """Benchmark 10k mark_processed calls (was a full scan and rewrite per call)"""
+        tracker = ProgressTracker(self.progress_file, "bench")
+        start_time = time.perf_counter()
+        for i in range(10000):
+            tracker.mark_processed(f"item{i}")
+            self.assertTrue(tracker.is_processed(f"item{i}"))
+        seconds = time.perf_counter() - start_time
+        tracker.close()
+
+        print(f"\n10k mark_processed: {seconds:.2f}s")
+        self.assertEqual(len(json.loads(self.progress_file.read_text())['processed']), 10000)
+        self.assertLess(seconds, 5.0)
+
+
+class TestConfigProgressTracker(unittest.TestCase):
+    """Test utils.config.ProgressTracker journaling and recovery"""
+
+    def setUp(self):
+        """Create a temporary progress location"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.progress_file = str(Path(self.temp_dir) / "workflow_progress.json")
+
+    def tearDown(self):
+        """Clean up temporary files"""
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    def test_state_replayed_after_restart(self):
+        """Test completions, failures and batch position survive a restart"""
+        tracker = config_module.ProgressTracker(self.progress_file)
+        tracker.mark_failed("step1", "timeout")
+        tracker.mark_completed("step2")
+        tracker.mark_completed("step1")
+        tracker.mark_failed("step3")
+        tracker.set_batch_position(4)
+        tracker.save()
+
+        resumed = config_module.ProgressTracker(self.progress_file)
+        self.assertTrue(resumed.is_completed("step1"))
+        self.assertFalse(resumed.is_failed("step1"))
+        self.assertTrue(resumed.is_failed("step3"))
+        self.assertEqual(resumed.get_total_processed(), 2)
+        self.assertEqual(resumed.get_batch_position(), 4)
+
+    def test_reset_is_journaled(self):
+        """Test reset clears progress on disk as well"""
+        tracker = config_module.ProgressTracker(self.progress_file, compact_every=2)
+        for item in ("a", "b", "c"):
+            tracker.mark_completed(item)
+            tracker.save()
+        tracker.reset()
+
+        resumed = config_module.ProgressTracker(self.progress_file)
+        self.assertEqual(resumed.get_completed_count(), 0)
+        self.assertFalse(resumed.is_completed("a"))
+        self.assertIsNotNone(resumed.data["start_time"])
+        # The default structure is not shared with the tracker's data
+        self.assertEqual(tracker.default_structure["completed"], [])
+
+    def test_dict_failures(self):
+        """Test detailed failure tracking keeps its dict format"""
+        tracker = config_module.ProgressTracker(self.progress_file, default_structure={
+            "completed": [], "failed": {}, "total_processed": 0, "last_batch": 0,
+            "start_time": None, "last_update": None
+        })
+        tracker.mark_failed("item", "bad")
+        tracker.compact()
+
+        with open(self.progress_file) as f:
+            self.assertEqual(json.load(f)["failed"]["item"]["error"], "bad")
+
+    def test_save_per_item_benchmark(self):
+        """Benchmark mark_completed + save for 10k items"""
+        tracker = config_module.ProgressTracker(self.progress_file)
+        start_time = time.perf_counter()
+        for i in range(10000):
+            tracker.mark_completed(f"item{i}")
+            tracker.save()
+        seconds = time.perf_counter() - start_time
+
+        print(f"\n10k mark_completed + save: {seconds:.2f}s")
+        self.assertEqual(config_module.ProgressTracker(self.progress_file).get_completed_count(), 10000)
+        self.assertLess(seconds, 5.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the single-pass sheet table parsers used by step 2 of simple_workflow.
+"""
+
+# Standardized project imports
+from utils.config import setup_project_imports
+setup_project_imports()
+import unittest
+import time
+import urllib.parse
+
+from bs4 import BeautifulSoup
+
+from simple_workflow import HAS_LXML, parse_people_from_sheet, extract_sheet_rows
+from utils.extract_links import extract_actual_url
+
+
+def make_sheet_html(rows, target_div=True):
+    """Published-sheet style HTML with header rows, links and nested markup"""
+    html_rows = ['<tr><th></th><td>#</td><td></td><td>Name</td><td>Email</td><td>Type</td></tr>'.replace('<th></th>', ''),
+                 '<tr><td>#</td><td></td><td>Name</td><td>Email</td><td>Type</td></tr>']
+    for i in range(1, rows + 1):
+        if i % 5 == 0:
+            target = f"https://docs.google.com/document/d/doc{i % 40}/edit?usp=sharing&a=1"
+        elif i % 5 == 1:
+            target = f"https://www.youtube.com/watch?v=vid{i}"
+        else:
+            target = None
+        if target:
+            href = "https://www.google.com/url?q=" + urllib.parse.quote(target, safe='') + f"&amp;sa=D&amp;ust={i}"
+            name_cell = f'<a href="{href}" target="_blank">Person <b>{i}</b> &amp; Co</a>'
+        elif i % 7 == 0:
+            name_cell = f'<a href="https://example.com/{i}">Plain {i}</a>'
+        elif i % 11 == 0:
+            name_cell = f'Person {i}<script>track({i})</script><style>.c {{}}</style>'
+        else:
+            name_cell = f' Person {i} <!-- note --> '
+        if i % 50 == 0:
+            # A repeated header block in the middle of the sheet
+            html_rows.append('<tr><td>x</td><td></td><td>Full Name</td><td>Email address</td><td>Type</td></tr>')
+        if i % 33 == 0:
+            html_rows.append(f'<tr><td>{i}</td><td></td><td></td></tr>')
+        html_rows.append(f'<tr style="height: 20px"><th class="row-header">{i}</th><td>{i}</td><td class="s1"></td>'
+                         f'<td class="s2">{name_cell}</td><td>p{i}@example.com</td><td>INTJ</td><td>extra</td></tr>')
+    table = f'<table class="waffle" cellspacing="0"><tbody>{"".join(html_rows)}</tbody></table>'
+    body = f'<div id="1159146182" class="grid">{table}</div>' if target_div else f'<table><tr><td>decoy</td></tr></table>{table}'
+    return f'<!DOCTYPE html><html><head><meta charset="utf-8"><style>td {{}}</style></head><body>{body}</body></html>'
+
+
+def parse_people_by_soup_scan(html_content):
+    """The step 2 parser before the single-pass rewrite (reference)"""
+    soup = BeautifulSoup(html_content, "html.parser")
+    target_div = soup.find("div", {"id": "1159146182"})
+    if target_div:
+        table = target_div.find("table")
+    else:
+        table = soup.find("table", {"class": "waffle"})
+        if not table:
+            tables = soup.find_all("table")
+            table = tables[0] if tables else None
+    people_data = []
+    if table:
+        rows = table.find_all("tr")
+        for row_index in range(1, len(rows)):
+            cells = rows[row_index].find_all("td")
+            if len(cells) < 5:
+                continue
+            row_id = cells[0].get_text(strip=True)
+            name = cells[2].get_text(strip=True)
+            email = cells[3].get_text(strip=True)
+            type_val = cells[4].get_text(strip=True)
+            if not name or name.lower() == "name" or row_id == "#" or "name" in name.lower() and "email" in email.lower():
+                continue
+            if any(["Name" in str(cell.get_text(strip=True)) and "Email" in str(cells[3].get_text(strip=True)) and "Type" in str(cells[4].get_text(strip=True)) for cell in cells]):
+                continue
+            doc_link = None
+            a_tags = cells[2].find_all("a")
+            if a_tags and a_tags[0].has_attr("href"):
+                href = a_tags[0]["href"]
+                if href.startswith("https://www.google.com/url?q="):
+                    doc_link = extract_actual_url(href)
+            people_data.append({"row_id": row_id, "name": name, "email": email,
+                                "type": type_val, "doc_link": doc_link if doc_link else ""})
+    return people_data
+
+
+class TestSheetParsing(unittest.TestCase):
+    """Test every parser path returns exactly what the old parser did"""
+
+    def setUp(self):
+        self.html = make_sheet_html(300)
+        self.expected = parse_people_by_soup_scan(self.html)
+
+    def test_reference_sheet_is_representative(self):
+        """Test the generated sheet exercises headers, redirects and plain links"""
+        self.assertEqual(len(self.expected), 300)
+        self.assertEqual(self.expected[4]['doc_link'], "https://docs.google.com/document/d/doc5/edit?usp=sharing&a=1")
+        self.assertEqual(self.expected[4]['name'], "Person5& Co")
+        self.assertEqual(self.expected[6]['doc_link'], "")
+
+    def test_soup_single_pass_matches(self):
+        """Test the html.parser path"""
+        self.assertEqual(parse_people_from_sheet(self.html, parser='html.parser'), self.expected)
+        fallback_html = make_sheet_html(20, target_div=False)
+        self.assertEqual(parse_people_from_sheet(fallback_html, parser='html.parser'),
+                         parse_people_by_soup_scan(fallback_html))
+
+    @unittest.skipUnless(HAS_LXML, "lxml not installed")
+    def test_lxml_matches(self):
+        """Test the lxml path, including the table fallbacks"""
+        self.assertEqual(parse_people_from_sheet(self.html, parser='lxml'), self.expected)
+        fallback_html = make_sheet_html(20, target_div=False)
+        self.assertEqual(parse_people_from_sheet(fallback_html, parser='lxml'),
+                         parse_people_by_soup_scan(fallback_html))
+        self.assertIsNone(extract_sheet_rows("<html><body><p>no table</p></body></html>", parser='lxml'))
+        self.assertIsNone(extract_sheet_rows("", parser='lxml'))
+
+    def test_unknown_parser_rejected(self):
+        """Test a misconfigured parser name fails loudly"""
+        with self.assertRaises(ValueError):
+            extract_sheet_rows(self.html, parser='html5lib')
+        if not HAS_LXML:
+            with self.assertRaises(ImportError):
+                extract_sheet_rows(self.html, parser='lxml')
+
+    def test_parse_benchmark(self):
+        """Benchmark the old parser against the single-pass parsers on a 5000-row sheet"""
+        html = make_sheet_html(5000)
+        timings = {}
+        results = {}
+        parsers = [('old html.parser scan', parse_people_by_soup_scan),
+                   ('html.parser single pass', lambda h: parse_people_from_sheet(h, parser='html.parser'))]
+        if HAS_LXML:
+            parsers.append(('lxml single pass', lambda h: parse_people_from_sheet(h, parser='lxml')))
+        for label, parse in parsers:
+            start_time = time.perf_counter()
+            results[label] = parse(html)
+            timings[label] = time.perf_counter() - start_time
+
+        print("\n=== Sheet parsing (5000 rows) ===")
+        for label, seconds in timings.items():
+            print(f"  {label:<26} {seconds:.3f}s")
+        for label in timings:
+            self.assertEqual(results[label], results['old html.parser scan'])
+        # html.parser time is dominated by building the soup; lxml is the fast path
+        if HAS_LXML:
+            self.assertLess(timings['lxml single pass'], timings['old html.parser scan'] / 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Unit tests for incremental Google Sheet sync (conditional download and row-level diff).
+"""
+
+# Standardized project imports
+from utils.config import setup_project_imports
+setup_project_imports()
+import unittest
+import os
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+import pandas as pd
+
+import simple_workflow
+from utils.sheet_sync import SheetCache, SheetState, content_hash
+
+
+SHEET_HTML = """<html><body><div id="1159146182"><table class="waffle">
+<tr><td>#</td><td></td><td>Name</td><td>Email</td><td>Type</td></tr>
+<tr><td>1</td><td></td><td><a href="https://www.google.com/url?q=https://docs.google.com/document/d/abc/edit&amp;sa=D">Ann</a></td><td>ann@example.com</td><td>INTJ</td></tr>
+<tr><td>2</td><td></td><td>Bob</td><td>bob@example.com</td><td>ENFP</td></tr>
+</table></div></body></html>"""
+
+
+def people(*rows):
+    return [{'row_id': str(row_id), 'name': name, 'email': f"{name.lower()}@example.com",
+             'type': 'INTJ', 'doc_link': ''} for row_id, name in rows]
+
+
+class FakeResponse:
+    def __init__(self, status_code, text='', headers=None):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class TestSheetDownload(unittest.TestCase):
+    """Test step 1 revalidates the cached sheet"""
+
+    def setUp(self):
+        """Create a temporary cache location"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.original_cwd = os.getcwd()
+        os.chdir(self.temp_dir)
+        self.cache = SheetCache(os.path.join(self.temp_dir, "cache", "google_sheet_cache.html"))
+        patcher = mock.patch.object(simple_workflow, 'get_sheet_cache',
+                                    side_effect=lambda: SheetCache(str(self.cache.cache_file)))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """Clean up temporary files"""
+        import shutil
+        os.chdir(self.original_cwd)
+        shutil.rmtree(self.temp_dir)
+
+    def test_first_download_stores_validators(self):
+        """Test a fresh download is cached with its ETag and hash"""
+        response = FakeResponse(200, SHEET_HTML, {'ETag': '"v1"', 'Last-Modified': 'Mon, 01 Jan 2024 00:00:00 GMT'})
+        with mock.patch.object(simple_workflow, 'http_get', return_value=response) as http_get:
+            self.assertEqual(simple_workflow.step1_download_sheet(), SHEET_HTML)
+        self.assertEqual(http_get.call_args.kwargs['headers'], {})
+
+        cache = SheetCache(str(self.cache.cache_file))
+        self.assertEqual(cache.cached_html(), SHEET_HTML)
+        self.assertEqual(cache.conditional_headers(), {'If-None-Match': '"v1"',
+                                                       'If-Modified-Since': 'Mon, 01 Jan 2024 00:00:00 GMT'})
+        self.assertEqual(cache.meta['sha256'], content_hash(SHEET_HTML))
+
+    def test_not_modified_uses_cache(self):
+        """Test a 304 response returns the cached HTML"""
+        self.cache.store(SHEET_HTML, {'ETag': '"v1"'})
+        with mock.patch.object(simple_workflow, 'http_get', return_value=FakeResponse(304)) as http_get:
+            self.assertEqual(simple_workflow.step1_download_sheet(), SHEET_HTML)
+        self.assertEqual(http_get.call_args.kwargs['headers'], {'If-None-Match': '"v1"'})
+
+    def test_same_content_new_headers_is_unchanged(self):
+        """Test identical content re-sent with new validators is detected by hash"""
+        self.cache.store(SHEET_HTML, {'ETag': '"v1"'})
+        os.utime(self.cache.cache_file, (0, 0))
+        with mock.patch.object(simple_workflow, 'http_get',
+                               return_value=FakeResponse(200, SHEET_HTML, {'ETag': '"v2"'})):
+            self.assertEqual(simple_workflow.step1_download_sheet(), SHEET_HTML)
+        self.assertEqual(self.cache.cache_file.stat().st_mtime, 0)
+        self.assertEqual(SheetCache(str(self.cache.cache_file)).meta['etag'], '"v2"')
+
+
+class TestSheetState(unittest.TestCase):
+    """Test parse reuse and the row-level diff"""
+
+    def setUp(self):
+        """Create a temporary state file and output CSV"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.state_file = os.path.join(self.temp_dir, "cache", "google_sheet_state.json")
+        self.output_file = os.path.join(self.temp_dir, "output.csv")
+        Path(self.output_file).write_text("row_id\n")
+
+    def tearDown(self):
+        """Clean up temporary files"""
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    def test_diff_by_row_id(self):
+        """Test new, changed, unchanged and removed people"""
+        state = SheetState(self.state_file)
+        state.record_output(self.output_file, 'full', people((1, 'Ann'), (2, 'Bob'), (3, 'Cy')))
+        state.save()
+
+        current = people((1, 'Ann'), (2, 'Bobby'), (4, 'Dee'))
+        diff = SheetState(self.state_file).diff(current, self.output_file, 'full')
+        self.assertEqual([p['row_id'] for p in diff.new], ['4'])
+        self.assertEqual([p['row_id'] for p in diff.changed], ['2'])
+        self.assertEqual(diff.unchanged_ids, {'1'})
+        self.assertEqual(diff.removed, ['3'])
+        self.assertEqual(diff.pending_ids, {'2', '4'})
+
+    def test_other_mode_or_missing_output_is_all_new(self):
+        """Test records written in another mode (or deleted) are not reused"""
+        state = SheetState(self.state_file)
+        state.record_output(self.output_file, 'text', people((1, 'Ann')))
+        self.assertEqual(state.diff(people((1, 'Ann')), self.output_file, 'full').pending_ids, {'1'})
+        os.remove(self.output_file)
+        self.assertEqual(state.diff(people((1, 'Ann')), self.output_file, 'text').pending_ids, {'1'})
+
+    def test_step2_reuses_parse_of_same_sheet(self):
+        """Test the sheet is parsed once per distinct content"""
+        with mock.patch.object(simple_workflow, 'get_sheet_state', side_effect=lambda: SheetState(self.state_file)), \
+             mock.patch.object(simple_workflow, 'parse_people_from_sheet',
+                               wraps=simple_workflow.parse_people_from_sheet) as parse:
+            first = simple_workflow.step2_extract_people_and_docs(SHEET_HTML)
+            second = simple_workflow.step2_extract_people_and_docs(SHEET_HTML)
+            simple_workflow.step2_extract_people_and_docs(SHEET_HTML.replace('Bob', 'Rob'))
+        self.assertEqual(parse.call_count, 2)
+        self.assertEqual(first, second)
+        self.assertEqual(first[0][0]['doc_link'], 'https://docs.google.com/document/d/abc/edit')
+
+    def test_unchanged_records_carried_over(self):
+        """Test unchanged people keep their existing output rows"""
+        pd.DataFrame([
+            {'row_id': '1', 'name': 'Ann', 'document_text': 'kept text'},
+            {'row_id': '2', 'name': 'Bob', 'document_text': 'old text'}
+        ]).to_csv(self.output_file, index=False)
+        state = SheetState(self.state_file)
+        state.record_output(self.output_file, 'text', people((1, 'Ann'), (2, 'Bob'), (3, 'Cy')))
+
+        current = people((1, 'Ann'), (2, 'Bobby'), (3, 'Cy'))
+        all_records = [{'row_id': p['row_id'], 'name': p['name'], 'document_text': ''} for p in current]
+        positions = {record['row_id']: index for index, record in enumerate(all_records)}
+        pending_ids, carried_ids = simple_workflow.apply_sheet_diff(
+            all_records, positions, state.diff(current, self.output_file, 'text'), self.output_file
+        )
+
+        self.assertEqual(carried_ids, {'1'})
+        # Cy was recorded but is missing from the output, so is processed again
+        self.assertEqual(pending_ids, {'2', '3'})
+        self.assertEqual(all_records[0]['document_text'], 'kept text')
+        self.assertEqual(all_records[1]['document_text'], '')
+
+    def test_full_mode_only_records_completed_people(self):
+        """Test people whose scrape or CSV write failed are processed again next run"""
+        ann = dict(people((1, 'Ann'))[0], doc_link='https://docs.google.com/document/d/abc/edit')
+        bob = people((2, 'Bob'))[0]
+        all_records = [{'row_id': '1'}, {'row_id': '2'}]
+
+        def process(person, scraped=('<html></html>', 'text'), written=True):
+            with mock.patch.object(simple_workflow, 'step3_scrape_doc_contents', return_value=scraped), \
+                 mock.patch.object(simple_workflow, 'step5_process_extracted_data', return_value={'row_id': person['row_id']}), \
+                 mock.patch.object(simple_workflow, 'update_csv_incrementally', return_value=written) as update:
+                done = simple_workflow.process_person_full(person, bool(person['doc_link']), all_records,
+                                                           int(person['row_id']) - 1, self.output_file)
+            self.assertEqual(update.call_count, 1)
+            return done
+
+        self.assertTrue(process(ann))
+        self.assertFalse(process(ann, scraped=('', '')))
+        self.assertFalse(process(ann, written=False))
+        self.assertTrue(process(bob))
+        self.assertFalse(process(bob, written=False))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Unit tests for ordered parallel chunk processing in CSVManager.stream_process.
+"""
+
+# Standardized project imports
+from utils.config import setup_project_imports
+setup_project_imports()
+import unittest
+import csv
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from utils.csv_manager import CSVManager, streaming_csv_update, _process_chunks_ordered
+
+
+def normalise_links(rows):
+    """CPU-bound chunk function: clean and normalise pipe-delimited links"""
+    for row in rows:
+        links = []
+        for link in row['links'].split('|'):
+            for _ in range(20):
+                link = re.sub(r'\s+', '', link.strip()).replace('http://', 'https://')
+            links.append(link.lower())
+        row['links'] = '|'.join(sorted(set(links)))
+    return rows
+
+
+def fail_on_row_7(rows):
+    """Chunk function that fails part way through the file"""
+    if any(row['row_id'] == '7' for row in rows):
+        raise RuntimeError("bad row 7")
+    return rows
+
+
+def square(chunk):
+    return [value * value for value in chunk]
+
+
+class TestStreamProcess(unittest.TestCase):
+    """Test parallel mode writes the same file, in order, through the temp-file path"""
+
+    def setUp(self):
+        """Create a temporary CSV"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.csv_path = Path(self.temp_dir) / "links.csv"
+        self._write_rows(2000)
+
+    def tearDown(self):
+        """Clean up temporary files"""
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    def _write_rows(self, count):
+        pd.DataFrame({
+            'row_id': [str(i) for i in range(count)],
+            'links': [f" HTTP://YouTube.com/watch?v={i} | http://drive.google.com/file/d/{i % 13} " for i in range(count)]
+        }).to_csv(self.csv_path, index=False)
+
+    def _manager(self, chunk_size=100):
+        return CSVManager(str(self.csv_path), chunk_size=chunk_size, auto_backup=False)
+
+    def test_parallel_output_matches_sequential(self):
+        """Test worker processes produce the same ordered output"""
+        sequential_path = Path(self.temp_dir) / "sequential.csv"
+        parallel_path = Path(self.temp_dir) / "parallel.csv"
+
+        manager = self._manager()
+        self.assertEqual(manager.stream_process(normalise_links, str(sequential_path), workers=0), 2000)
+        self.assertEqual(manager.stream_process(normalise_links, str(parallel_path), workers=2, max_in_flight=3), 2000)
+
+        self.assertEqual(parallel_path.read_bytes(), sequential_path.read_bytes())
+        self.assertEqual(list(pd.read_csv(parallel_path)['row_id']), list(range(2000)))
+
+    def test_in_place_update_and_context_manager(self):
+        """Test streaming_csv_update passes parallel options through"""
+        with open(self.csv_path, newline='') as f:
+            expected = normalise_links(list(csv.DictReader(f)))
+
+        with streaming_csv_update(str(self.csv_path), normalise_links, chunk_size=300, workers=2) as rows:
+            self.assertEqual(rows, 2000)
+        df = pd.read_csv(self.csv_path, dtype=str)
+        self.assertEqual(list(df['links']), [row['links'] for row in expected])
+
+    def test_unpicklable_function_runs_in_process(self):
+        """Test closures fall back to in-process chunks"""
+        output_path = Path(self.temp_dir) / "filtered.csv"
+        keep = {'1', '2', '3'}
+        rows = self._manager().stream_process(lambda chunk: [row for row in chunk if row['row_id'] in keep],
+                                              str(output_path), workers=2)
+        self.assertEqual(rows, 3)
+
+    def test_worker_error_keeps_original(self):
+        """Test a failing chunk leaves the input file untouched and no temp files"""
+        original = self.csv_path.read_bytes()
+        # The error surfaces through the handle_file_operations decorator
+        with self.assertRaises(Exception):
+            self._manager(chunk_size=5).stream_process(fail_on_row_7, workers=2)
+        self.assertEqual(self.csv_path.read_bytes(), original)
+        self.assertEqual(os.listdir(self.temp_dir), ["links.csv"])
+
+    def test_in_flight_chunks_bounded(self):
+        """Test no more than max_in_flight chunks are read ahead of the writer"""
+        consumed = []
+
+        def chunks():
+            for i in range(40):
+                consumed.append(i)
+                yield [i, i + 1]
+
+        max_read_ahead = 0
+        results = []
+        for written, result in enumerate(_process_chunks_ordered(chunks(), square, 2, 3), 1):
+            max_read_ahead = max(max_read_ahead, len(consumed) - written)
+            results.append(result)
+
+        self.assertEqual(results, [[i * i, (i + 1) * (i + 1)] for i in range(40)])
+        self.assertLessEqual(max_read_ahead, 3)
+
+    def test_parallel_throughput_benchmark(self):
+        """Benchmark sequential vs worker-process chunk processing"""
+        self._write_rows(20000)
+        manager = self._manager(chunk_size=1000)
+        workers = min(4, os.cpu_count() or 1)
+
+        timings = {}
+        for mode_workers in (0, workers):
+            output_path = Path(self.temp_dir) / f"out_{mode_workers}.csv"
+            start_time = time.perf_counter()
+            manager.stream_process(normalise_links, str(output_path), workers=mode_workers)
+            timings[mode_workers] = time.perf_counter() - start_time
+
+        print(f"\nstream_process 20k rows: in-process {timings[0]:.2f}s, "
+              f"{workers} workers {timings[workers]:.2f}s")
+        if workers >= 2:
+            self.assertLess(timings[workers], timings[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
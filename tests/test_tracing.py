@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Unit tests for tracing spans - per-stage time breakdown of the download pipeline.
+"""
+
+# Standardized project imports
+from utils.config import setup_project_imports
+setup_project_imports()
+import unittest
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from utils.tracing import (
+    Tracer, NOOP_SPAN, start_span, current_span, set_tracer,
+    read_trace, summarize_trace, format_trace_summary
+)
+
+
+class TestTracing(unittest.TestCase):
+    """Test span nesting, the trace file and the stage summary"""
+
+    def setUp(self):
+        """Install a tracer writing to a temporary trace file"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.trace_file = Path(self.temp_dir) / "trace.jsonl"
+        self.tracer = Tracer(self.trace_file, flush_every=1000)
+        self.previous_tracer = set_tracer(self.tracer)
+
+    def tearDown(self):
+        """Restore the previous tracer and clean up"""
+        set_tracer(self.previous_tracer)
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_nested_spans_share_trace(self):
+        """Test child spans link to their parent and channel trace"""
+        with start_span("channel", channel_url="https://youtube.com/@a") as channel:
+            with start_span("video", video_id="v1") as video:
+                with start_span("s3.upload"):
+                    pass
+            self.assertIs(current_span(), channel)
+        self.assertIsNone(current_span())
+        with start_span("channel", channel_url="https://youtube.com/@b"):
+            pass
+        self.tracer.flush()
+
+        spans = {span["name"] + span.get("attributes", {}).get("channel_url", ""): span
+                 for span in read_trace(self.trace_file)}
+        channel_a = spans["channelhttps://youtube.com/@a"]
+        channel_b = spans["channelhttps://youtube.com/@b"]
+        self.assertIsNone(channel_a["parent_id"])
+        self.assertEqual(spans["video"]["parent_id"], channel_a["span_id"])
+        self.assertEqual(spans["s3.upload"]["parent_id"], video.span_id)
+        self.assertEqual(spans["s3.upload"]["trace_id"], channel_a["trace_id"])
+        self.assertNotEqual(channel_a["trace_id"], channel_b["trace_id"])
+
+    def test_error_status_and_explicit_parent(self):
+        """Test failed stages are marked and spans can be parented across threads"""
+        with self.assertRaises(RuntimeError):
+            with start_span("video", video_id="v2") as video:
+                def upload():
+                    with start_span("s3.upload_fileobj", parent=video):
+                        pass
+                thread = threading.Thread(target=upload)
+                thread.start()
+                thread.join()
+                raise RuntimeError("yt-dlp failed")
+        self.tracer.flush()
+
+        spans = {span["name"]: span for span in read_trace(self.trace_file)}
+        self.assertEqual(spans["video"]["status"], "error")
+        self.assertIn("yt-dlp failed", spans["video"]["error"])
+        self.assertEqual(spans["s3.upload_fileobj"]["parent_id"], spans["video"]["span_id"])
+        self.assertEqual(spans["s3.upload_fileobj"]["status"], "ok")
+
+    def test_summary_self_time(self):
+        """Test the stage breakdown subtracts child time from parents"""
+        with start_span("channel"):
+            time.sleep(0.02)
+            for _ in range(3):
+                with start_span("yt_dlp.download"):
+                    time.sleep(0.02)
+        self.tracer.flush()
+
+        summary = summarize_trace(self.trace_file)
+        self.assertEqual(list(summary), ["yt_dlp.download", "channel"])
+        self.assertEqual(summary["yt_dlp.download"]["count"], 3)
+        self.assertGreaterEqual(summary["yt_dlp.download"]["self_seconds"], 0.06)
+        self.assertLess(summary["channel"]["self_seconds"], summary["channel"]["total_seconds"] - 0.05)
+        self.assertIn("yt_dlp.download", format_trace_summary(summary))
+
+    def test_download_integration_spans(self):
+        """Test a local download is traced as video -> rate limit wait -> yt-dlp download"""
+        from mass_download import download_integration
+        from mass_download.download_integration import DownloadIntegration, DownloadMode
+        from mass_download.database_schema import VideoRecord
+
+        integration = DownloadIntegration.__new__(DownloadIntegration)
+        integration.download_mode = DownloadMode.LOCAL_ONLY
+        integration.local_download_dir = self.temp_dir
+        integration.download_resolution = "720"
+        integration.download_format = "mp4"
+        integration.download_subtitles = False
+
+        def fake_download(video_url, output_dir, **kwargs):
+            video_path = Path(output_dir) / "video.mp4"
+            video_path.write_bytes(b"0" * 1024)
+            return {"success": True, "video_path": str(video_path)}
+
+        video_record = VideoRecord(person_id=1, video_id="dQw4w9WgXcQ", title="Traced")
+        with patch.object(download_integration, "download_single_video", fake_download):
+            with start_span("channel") as channel:
+                result = integration.download_video(video_record)
+        self.tracer.flush()
+
+        self.assertEqual(result.status, "completed")
+        spans = {span["name"]: span for span in read_trace(self.trace_file)}
+        self.assertEqual(spans["video"]["parent_id"], channel.span_id)
+        self.assertEqual(spans["video"]["attributes"]["video_id"], "dQw4w9WgXcQ")
+        self.assertEqual(spans["rate_limit.wait"]["parent_id"], spans["video"]["span_id"])
+        self.assertEqual(spans["yt_dlp.download"]["parent_id"], spans["video"]["span_id"])
+
+    def test_disabled_overhead(self):
+        """Test disabled tracing returns the shared no-op span cheaply"""
+        set_tracer(None)
+        self.assertIs(start_span("video", video_id="v1"), NOOP_SPAN)
+
+        iterations = 100000
+        start_time = time.perf_counter()
+        for _ in range(iterations):
+            with start_span("stage"):
+                pass
+        disabled_cost = (time.perf_counter() - start_time) / iterations
+
+        self.assertLess(disabled_cost, 5e-6, f"Disabled span costs {disabled_cost * 1e9:.0f}ns")
+        self.assertFalse(self.trace_file.exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1468,16 +1468,25 @@ class ProgressTracker:
     - utils/streaming_integration.py: StreamingProgress class patterns
     
     Builds on existing load_json_state/save_json_state utilities.
+    
+    Changes are appended to a ProgressJournal (progress_file with an
+    .events.jsonl suffix) as they happen, and save() only rewrites the JSON
+    file every compact_every changes, so per-item save() calls stay O(1).
+    Direct edits through .data are written at the next compaction (or
+    compact()). Membership checks use sets.
     """
     
-    def __init__(self, progress_file: str, default_structure: Optional[Dict] = None):
+    def __init__(self, progress_file: str, default_structure: Optional[Dict] = None,
+                 compact_every: int = 1000):
         """
         Initialize progress tracker.
         
         Args:
             progress_file: Path to progress JSON file
             default_structure: Default progress structure if file doesn't exist
+            compact_every: Journaled changes between rewrites of the JSON file
         """
+        from .json_utils import ProgressJournal
         self.progress_file = progress_file
         self.default_structure = default_structure or {
             "completed": [],
@@ -1487,56 +1496,101 @@ class ProgressTracker:
             "start_time": None,
             "last_update": None
         }
+        self._journal = ProgressJournal(progress_file, compact_every)
         self._data = self.load()
     
     def load(self) -> Dict:
-        """Load progress from file."""
-        return load_json_state(self.progress_file, self.default_structure.copy())
+        """Load progress from file (snapshot plus journaled changes)."""
+        import copy
+        self._data, events = self._journal.load(copy.deepcopy(self.default_structure))
+        self._index()
+        for event in events:
+            self._apply(event)
+        return self._data
     
     def save(self) -> None:
-        """Save progress to file."""
+        """Save progress to file (changes are already journaled; compacts when due)."""
         from datetime import datetime
         self._data["last_update"] = datetime.now().isoformat()
-        save_json_state(self.progress_file, self._data)
-    
-    def mark_completed(self, item: str) -> None:
-        """Mark item as completed."""
-        if item not in self._data["completed"]:
+        if self._journal.compaction_due:
+            self.compact()
+    
+    def compact(self) -> None:
+        """Rewrite the progress file now and truncate the journal."""
+        if not self._journal.compact(self._data):
+            logging.error(f"Failed to save JSON state to {self.progress_file}")
+    
+    def _index(self) -> None:
+        self._completed_set = set(self._data["completed"])
+        self._failed_set = set(self._data["failed"]) if isinstance(self._data["failed"], list) else None
+    
+    def _record(self, event: Dict) -> None:
+        self._apply(event)
+        self._journal.append(event)
+    
+    def _apply(self, event: Dict) -> None:
+        """Apply a journaled change to the in-memory progress."""
+        op = event["op"]
+        if op == "completed":
+            item = event["item"]
+            self._completed_set.add(item)
             self._data["completed"].append(item)
             self._data["total_processed"] += 1
             # Remove from failed if it was there
-            if item in self._data["failed"]:
+            if self.is_failed(item):
                 self._remove_failed(item)
+        elif op == "failed":
+            item = event["item"]
+            if self._failed_set is not None:
+                self._failed_set.add(item)
+                self._data["failed"].append(item)
+            else:
+                self._data["failed"][item] = {"error": event["error"], "timestamp": event["timestamp"]}
+        elif op == "batch":
+            self._data["last_batch"] = event["batch"]
+        elif op == "reset":
+            import copy
+            self._data = copy.deepcopy(self.default_structure)
+            self._data["start_time"] = event["start_time"]
+            self._index()
+    
+    def mark_completed(self, item: str) -> None:
+        """Mark item as completed."""
+        if item not in self._completed_set:
+            self._record({"op": "completed", "item": item})
     
     def mark_failed(self, item: str, error: Optional[str] = None) -> None:
         """Mark item as failed with optional error message."""
-        if isinstance(self._data["failed"], list):
-            if item not in self._data["failed"]:
-                self._data["failed"].append(item)
+        if self._failed_set is not None:
+            if item not in self._failed_set:
+                self._record({"op": "failed", "item": item})
         else:
             # Dictionary format for detailed error tracking
             from datetime import datetime
-            self._data["failed"][item] = {
+            self._record({
+                "op": "failed",
+                "item": item,
                 "error": error or "Unknown error",
                 "timestamp": datetime.now().isoformat()
-            }
+            })
     
     def _remove_failed(self, item: str) -> None:
         """Remove item from failed list/dict."""
-        if isinstance(self._data["failed"], list):
-            if item in self._data["failed"]:
+        if self._failed_set is not None:
+            if item in self._failed_set:
+                self._failed_set.discard(item)
                 self._data["failed"].remove(item)
         else:
             self._data["failed"].pop(item, None)
     
     def is_completed(self, item: str) -> bool:
         """Check if item is completed."""
-        return item in self._data["completed"]
+        return item in self._completed_set
     
     def is_failed(self, item: str) -> bool:
         """Check if item is failed."""
-        if isinstance(self._data["failed"], list):
-            return item in self._data["failed"]
+        if self._failed_set is not None:
+            return item in self._failed_set
         else:
             return item in self._data["failed"]
     
@@ -1546,10 +1600,7 @@ class ProgressTracker:
     
     def get_failed_count(self) -> int:
         """Get number of failed items."""
-        if isinstance(self._data["failed"], list):
-            return len(self._data["failed"])
-        else:
-            return len(self._data["failed"])
+        return len(self._data["failed"])
     
     def get_total_processed(self) -> int:
         """Get total number of processed items."""
@@ -1557,7 +1608,7 @@ class ProgressTracker:
     
     def set_batch_position(self, batch: int) -> None:
         """Set current batch position for resumable processing."""
-        self._data["last_batch"] = batch
+        self._record({"op": "batch", "batch": batch})
     
     def get_batch_position(self) -> int:
         """Get current batch position."""
@@ -1565,9 +1616,8 @@ class ProgressTracker:
     
     def reset(self) -> None:
         """Reset progress to initial state."""
-        self._data = self.default_structure.copy()
         from datetime import datetime
-        self._data["start_time"] = datetime.now().isoformat()
+        self._record({"op": "reset", "start_time": datetime.now().isoformat()})
     
     def get_progress_summary(self) -> Dict:
         """Get summary of current progress."""
@@ -1787,6 +1837,7 @@ class WorkflowOrchestrator:
         
         # Generate final results
         workflow_results = self._generate_workflow_results(workflow_data)
+        self.progress.compact()
         
         elapsed_time = (datetime.now() - self.start_time).total_seconds()
         self.logger.info(f"🎉 Workflow completed: {self.workflow_name} ({elapsed_time:.1f}s)")
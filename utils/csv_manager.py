@@ -7,6 +7,14 @@ csv_file_integrity_mapper.py, and fix_csv_file_mappings.py
 
 import os
 import csv
+import time
+import atexit
+import pickle
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+import numpy as np
 import pandas as pd
 import json
 import shutil
@@ -54,6 +62,15 @@ except ImportError:
     # Import CSV S3 versioning
     from .csv_s3_versioning import get_csv_versioning
 
+# Optional columnar backend (file_processing.storage_format: parquet)
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
 # Setup module logger
 logger = get_logger(__name__)
 
@@ -93,6 +110,361 @@ def safe_get_na_value(column_name: str = None, dtype: str = 'string') -> Any:
         return None
 
 
+# Row filters: (column, op, value) tuples, ANDed (pyarrow's filter format)
+_FILTER_OPS = ('==', '=', '!=', 'in', 'not in')
+
+
+def _validate_filters(filters: List[Tuple[str, str, Any]]):
+    for column, op, value in filters:
+        if op not in _FILTER_OPS:
+            raise ValueError(f"CSV MANAGER ERROR: filter op must be one of {_FILTER_OPS}. Got: {op}")
+
+
+def _apply_filters(df: pd.DataFrame, filters: List[Tuple[str, str, Any]]) -> pd.DataFrame:
+    """Pandas equivalent of pyarrow filters (missing values never match)"""
+    mask = pd.Series(True, index=df.index)
+    for column, op, value in filters:
+        values = df[column]
+        if op in ('==', '='):
+            condition = values == value
+        elif op == '!=':
+            condition = values != value
+        elif op == 'in':
+            condition = values.isin(list(value))
+        else:
+            condition = ~values.isin(list(value))
+        mask &= condition.fillna(False).astype(bool) & values.notna()
+    return df[mask]
+
+
+# With Copy-on-Write (always on from pandas 3) a shallow copy is an
+# independent snapshot; without it, cached frames must be deep-copied
+_COPY_ON_WRITE = int(pd.__version__.split('.')[0]) >= 3 or pd.get_option('mode.copy_on_write') is True
+
+
+def _snapshot(df: pd.DataFrame) -> pd.DataFrame:
+    """Copy of a cached DataFrame that callers may modify freely"""
+    return df.copy(deep=not _COPY_ON_WRITE)
+
+
+def _apply_cells(df: pd.DataFrame, cells: Dict[int, Dict[str, str]]) -> pd.DataFrame:
+    """
+    Write raw CSV cells (row position -> {column: text}) into df in place.
+    
+    Empty text becomes NA, as when the CSV is parsed; text that does not fit
+    a numeric column turns that column into object dtype.
+    """
+    by_column: Dict[str, Tuple[List[int], List[Any]]] = {}
+    for position, updates in cells.items():
+        if position >= len(df):
+            continue
+        for column, value in updates.items():
+            positions, values = by_column.setdefault(column, ([], []))
+            positions.append(position)
+            values.append(pd.NA if value == '' else value)
+    
+    for column, (positions, values) in by_column.items():
+        if column not in df.columns:
+            df[column] = pd.Series(pd.NA, index=df.index, dtype='string')
+        elif pd.api.types.is_numeric_dtype(df[column].dtype) or pd.api.types.is_bool_dtype(df[column].dtype):
+            try:
+                values = pd.to_numeric(pd.Series(values, dtype=object)).tolist()
+            except (ValueError, TypeError):
+                df[column] = df[column].astype(object)
+        df.iloc[positions, df.columns.get_loc(column)] = values
+    return df
+
+
+def _iter_chunks(rows, chunk_size: int):
+    """Yield lists of up to chunk_size rows"""
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _process_chunks_ordered(chunks, process_func: Callable, workers: int, max_in_flight: int):
+    """
+    Run process_func over chunks in a process pool, yielding results in input order.
+    
+    At most max_in_flight chunks are submitted but not yet yielded, which
+    bounds the memory held by queued inputs and finished-but-unwritten results.
+    """
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight = deque()
+        for chunk in chunks:
+            if len(in_flight) >= max_in_flight:
+                yield in_flight.popleft().result()
+            in_flight.append(pool.submit(process_func, chunk))
+        while in_flight:
+            yield in_flight.popleft().result()
+
+
+class CSVRowStore:
+    """
+    Batched in-place row updates for a CSV file.
+
+    Rows are loaded once into memory with a row_id -> position index, so an
+    update is a dict lookup plus a list assignment. Changed rows are written
+    back with one atomic rewrite (temp file + rename, under the file lock)
+    per flush interval instead of one full rewrite per update.
+
+    Pending updates are kept separately from the loaded rows: if another
+    writer replaces the file, the store reloads it and re-applies them on top.
+    A timer writes them out flush_interval after they were made even if no
+    further update arrives. Updates made less than flush_interval before a
+    crash are lost, so callers that need durability at a point call flush().
+    """
+
+    def __init__(self, csv_path: Union[str, Path], flush_interval: float = 5.0,
+                 max_pending: int = 1000, encoding: str = 'utf-8',
+                 use_file_lock: bool = True, timeout: float = 30.0,
+                 on_flush: Optional[Callable[[int, int], None]] = None):
+        """
+        Initialize row store.
+
+        Args:
+            csv_path: CSV file to update
+            flush_interval: Seconds between rewrites (0 = rewrite on every update)
+            max_pending: Rewrite early once this many rows have pending updates
+            encoding: File encoding
+            use_file_lock: Hold the CSV's file lock while rewriting
+            timeout: File lock timeout
+            on_flush: Called with (row_count, column_count) after each rewrite
+        """
+        if flush_interval < 0:
+            raise ValueError(f"CSV ROW STORE ERROR: flush_interval must be >= 0. Got: {flush_interval}")
+        if max_pending < 1:
+            raise ValueError(f"CSV ROW STORE ERROR: max_pending must be at least 1. Got: {max_pending}")
+
+        self.csv_path = Path(csv_path)
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.encoding = encoding
+        self.use_file_lock = use_file_lock
+        self.timeout = timeout
+        self.on_flush = on_flush
+
+        self._lock = threading.RLock()
+        self._header: Optional[List[str]] = None
+        self._columns: Dict[str, int] = {}
+        self._rows: List[List[str]] = []
+        self._index: Dict[str, List[int]] = {}
+        self._signature: Optional[Tuple[int, int, int]] = None
+        # Updates not yet written: row_id (or '#<position>') -> {column: value}
+        self._pending: Dict[str, Dict[str, str]] = {}
+        # The same updates by row position in the loaded file
+        self._dirty: Dict[int, Dict[str, str]] = {}
+        self._last_flush = time.monotonic()
+        self._flush_timer: Optional[threading.Timer] = None
+        self.rewrites = 0
+        # (signature before, signature after, {position: cells} written) of the last rewrite
+        self.last_flush: Optional[Tuple[Optional[Tuple[int, int, int]], Optional[Tuple[int, int, int]],
+                                        Dict[int, Dict[str, str]]]] = None
+
+        atexit.register(self.flush)
+
+    @property
+    def pending_count(self) -> int:
+        """Rows with updates not yet written to disk."""
+        return len(self._pending)
+
+    def _file_signature(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            stat = self.csv_path.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def _load(self):
+        """(Re)load rows and rebuild the row_id index, then re-apply pending updates."""
+        self._header, self._rows, self._index, self._dirty = None, [], {}, {}
+        signature = self._file_signature()
+        if signature is not None:
+            with open(self.csv_path, 'r', encoding=self.encoding, newline='') as f:
+                reader = csv.reader(f)
+                self._header = next(reader, None)
+                self._rows = list(reader)
+        self._header = self._header or []
+        self._columns = {column: position for position, column in enumerate(self._header)}
+
+        row_id_column = self._columns.get('row_id')
+        if row_id_column is not None:
+            for position, row in enumerate(self._rows):
+                if row_id_column < len(row):
+                    self._index.setdefault(row[row_id_column], []).append(position)
+        self._signature = signature
+
+        for key, updates in self._pending.items():
+            for position in self._positions(key, all_matches=True):
+                self._apply(position, updates)
+                self._dirty.setdefault(position, {}).update(updates)
+
+    def _ensure_loaded(self):
+        if self._header is None or self._file_signature() != self._signature:
+            self._load()
+
+    def invalidate(self):
+        """Drop loaded rows (another writer replaced the file); pending updates are kept."""
+        with self._lock:
+            self._header = None
+
+    def _positions(self, key: str, all_matches: bool) -> List[int]:
+        if key.startswith('#'):
+            position = int(key[1:])
+            return [position] if 0 <= position < len(self._rows) else []
+        positions = self._index.get(key, [])
+        return positions if all_matches else positions[:1]
+
+    def _add_column(self, column: str):
+        self._columns[column] = len(self._header)
+        self._header.append(column)
+        for row in self._rows:
+            row.append('')
+
+    def _apply(self, position: int, updates: Dict[str, str]):
+        row = self._rows[position]
+        for column, value in updates.items():
+            if column not in self._columns:
+                self._add_column(column)
+            column_position = self._columns[column]
+            if column_position >= len(row):
+                row.extend([''] * (column_position + 1 - len(row)))
+            row[column_position] = value
+
+    @staticmethod
+    def _to_cell(value: Any) -> str:
+        if value is None or value is pd.NA or (isinstance(value, float) and value != value):
+            return ''
+        return str(value)
+
+    def _update(self, key: str, updates: Dict[str, Any], add_columns: bool, all_matches: bool) -> bool:
+        with self._lock:
+            self._ensure_loaded()
+            positions = self._positions(key, all_matches)
+            if not positions:
+                return False
+
+            cells = {}
+            for column, value in updates.items():
+                if column in self._columns or add_columns:
+                    cells[column] = self._to_cell(value)
+                else:
+                    logger.warning(f"Column '{column}' not found in CSV")
+
+            for position in positions:
+                self._apply(position, cells)
+                self._dirty.setdefault(position, {}).update(cells)
+            self._pending.setdefault(key, {}).update(cells)
+
+            since_flush = time.monotonic() - self._last_flush
+            if len(self._pending) >= self.max_pending or since_flush >= self.flush_interval:
+                self.flush()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.flush_interval - since_flush, self._flush_on_timer)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+            return True
+
+    def _flush_on_timer(self):
+        """Write updates that no later update came along to flush."""
+        try:
+            self.flush()
+        except Exception as e:
+            logger.error(f"Timed flush of {self.csv_path} failed; updates stay pending: {e}")
+
+    def update(self, row_id: Union[int, str], updates: Dict[str, Any],
+               add_columns: bool = False, all_matches: bool = False) -> bool:
+        """
+        Update the row with this row_id (O(1); written at the next flush).
+
+        Args:
+            row_id: Row ID to update
+            updates: Column -> value (None/NaN written as empty)
+            add_columns: Add unknown columns instead of skipping them
+            all_matches: Update every row with this row_id, not just the first
+
+        Returns:
+            True if the row exists, False otherwise
+        """
+        return self._update(str(row_id), updates, add_columns, all_matches)
+
+    def update_at(self, position: int, updates: Dict[str, Any], add_columns: bool = True) -> bool:
+        """Update the row at a 0-based data row position (O(1); written at the next flush)."""
+        return self._update(f"#{position}", updates, add_columns, all_matches=False)
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._ensure_loaded()
+            return len(self._rows)
+
+    def pending_cells(self) -> Tuple[Optional[Tuple[int, int, int]], Dict[int, Dict[str, str]]]:
+        """
+        Unwritten cells by data row position, for reads that overlay them.
+
+        Returns:
+            (signature of the file the positions refer to, {position: {column: text}})
+        """
+        with self._lock:
+            if not self._pending:
+                return self._signature, {}
+            self._ensure_loaded()
+            return self._signature, {position: dict(cells) for position, cells in self._dirty.items()}
+
+    def flush(self) -> bool:
+        """
+        Write pending updates with one atomic rewrite.
+
+        Returns:
+            True if a rewrite happened
+        """
+        with self._lock:
+            self._last_flush = time.monotonic()
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._pending:
+                return False
+
+            lock_context = file_lock(str(self.csv_path), timeout=self.timeout) if self.use_file_lock else None
+            if lock_context:
+                lock_context.__enter__()
+            try:
+                # Another writer may have replaced the file since we loaded it
+                self._ensure_loaded()
+                base_signature = self._signature
+
+                temp_fd, temp_path = tempfile.mkstemp(suffix='.csv', dir=self.csv_path.parent)
+                try:
+                    with os.fdopen(temp_fd, 'w', encoding=self.encoding, newline='') as f:
+                        writer = csv.writer(f, lineterminator='\n')
+                        writer.writerow(self._header)
+                        writer.writerows(self._rows)
+                    os.replace(temp_path, self.csv_path)
+                except BaseException:
+                    if os.path.exists(temp_path):
+                        os.unlink(temp_path)
+                    raise
+
+                self._signature = self._file_signature()
+                self.last_flush = (base_signature, self._signature, self._dirty)
+                self._pending = {}
+                self._dirty = {}
+                self.rewrites += 1
+            finally:
+                if lock_context:
+                    lock_context.__exit__(None, None, None)
+
+            if self.on_flush:
+                try:
+                    self.on_flush(len(self._rows), len(self._header))
+                except Exception as e:
+                    logger.warning(f"CSV flush callback failed (non-fatal): {e}")
+            return True
+
+
 class CSVManager:
     """Unified CSV operations manager with atomic, streaming, tracking, and integrity capabilities"""
     
@@ -102,11 +474,25 @@ class CSVManager:
                  use_file_lock: bool = True, 
                  auto_backup: bool = True,
                  timeout: float = 30.0,
-                 encoding: str = 'utf-8'):
-        """Initialize CSV manager with configurable defaults"""
+                 encoding: str = 'utf-8',
+                 storage_format: Optional[str] = None):
+        """Initialize CSV manager with configurable defaults
+        
+        storage_format 'parquet' keeps a Parquet copy of the CSV next to it
+        (same name, .parquet) that read() serves with column projection and
+        predicate pushdown. The CSV stays the file of record.
+        """
         if csv_path is None:
             csv_path = get_config().get('paths.output_csv', 'outputs/output.csv')
         self.csv_path = Path(csv_path)
+        self.storage_format = storage_format or config.get('file_processing.storage_format', 'csv')
+        if self.storage_format not in ('csv', 'parquet'):
+            raise ValueError(f"CSV MANAGER ERROR: storage_format must be 'csv' or 'parquet'. Got: {self.storage_format}")
+        if self.storage_format == 'parquet' and not HAS_PYARROW:
+            raise ImportError("CSV MANAGER ERROR: storage_format 'parquet' requires pyarrow (pip install pyarrow)")
+        self.parquet_row_group_size = config.get('file_processing.parquet_row_group_size', 10000)
+        self.stream_workers = config.get('file_processing.stream_workers', 0)
+        self.stream_max_in_flight = config.get('file_processing.stream_max_in_flight', 0)
         self.chunk_size = chunk_size
         self.use_file_lock = use_file_lock
         self.auto_backup = auto_backup
@@ -114,19 +500,109 @@ class CSVManager:
         self.encoding = encoding
         
         # Initialize tracking state
+        self._cache_lock = threading.RLock()
         self._df_cache = None
         self._last_modified = None
+        self._row_index = None
+        self._row_store = None
+    
+    @property
+    def row_store(self) -> CSVRowStore:
+        """Batched row updater for this CSV (created on first use)"""
+        if self._row_store is None:
+            self._row_store = CSVRowStore(
+                self.csv_path,
+                flush_interval=config.get('file_processing.csv_update_flush_interval', 5.0),
+                max_pending=config.get('file_processing.csv_update_max_pending', 1000),
+                encoding=self.encoding,
+                use_file_lock=self.use_file_lock,
+                timeout=self.timeout,
+                on_flush=self._on_row_store_flush
+            )
+        return self._row_store
+    
+    def _on_row_store_flush(self, row_count: int, column_count: int):
+        base_signature, signature, cells = self._row_store.last_flush
+        with self._cache_lock:
+            if self._df_cache is not None and self._last_modified == base_signature:
+                self._roll_cache_forward(signature, cells)
+            else:
+                self.clear_cache()
+        self._upload_csv_version("batched_update", row_count, column_count)
+    
+    def flush_updates(self) -> bool:
+        """Write pending row updates to the CSV now"""
+        if self._row_store is None:
+            return False
+        return self._row_store.flush()
+    
+    # === READ CACHE ===
+    
+    def _file_signature(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            stat = self.csv_path.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    
+    def _validate_cache(self):
+        """Drop cached reads if the CSV changed on disk since they were made"""
+        signature = self._file_signature()
+        if self._df_cache is None or signature != self._last_modified:
+            self._df_cache = {}
+            self._row_index = None
+            self._last_modified = signature
+    
+    def clear_cache(self):
+        """Forget cached reads (called after every write through this manager)"""
+        with self._cache_lock:
+            self._df_cache = None
+            self._last_modified = None
+            self._row_index = None
+    
+    def _roll_cache_forward(self, signature: Optional[Tuple[int, int, int]],
+                            cells: Dict[int, Dict[str, str]]):
+        """
+        Bring cached reads up to date with a row store rewrite instead of re-parsing.
+        
+        Only full reads are patched; projections and filtered reads are dropped,
+        since the written cells can change which rows a filter keeps.
+        """
+        full_reads = {key: df for key, df in self._df_cache.items() if key[1] is None and key[2] is None}
+        written_columns = {column for updates in cells.values() for column in updates}
+        if any(not written_columns <= set(df.columns) for df in full_reads.values()):
+            # A new column's dtype is only known once the file is parsed again
+            self.clear_cache()
+            return
+        
+        self._df_cache = {key: _apply_cells(df, cells) for key, df in full_reads.items()}
+        self._last_modified = signature
+        if self._row_index is not None and 'row_id' not in written_columns:
+            self._row_index = (signature, self._row_index[1])
+        else:
+            self._row_index = None
+    
+    def _row_positions(self, df: pd.DataFrame) -> Dict[str, int]:
+        """row_id -> first position in df, built once per cached snapshot"""
+        if self._row_index is None or self._row_index[0] != self._last_modified:
+            positions = {}
+            for position, value in enumerate(df['row_id'].to_numpy()):
+                positions.setdefault(str(value), position)
+            self._row_index = (self._last_modified, positions)
+        return self._row_index[1]
     
     # === CORE OPERATIONS ===
     
     @staticmethod
-    def safe_csv_read(csv_path: str, dtype_spec: str = 'tracking') -> pd.DataFrame:
+    def safe_csv_read(csv_path: str, dtype_spec: str = 'tracking',
+                      usecols: Optional[List[str]] = None) -> pd.DataFrame:
         """
         Standardized CSV reading with consistent dtype specifications.
         
         Args:
             csv_path: Path to CSV file
             dtype_spec: Predefined dtype specification ('tracking', 'basic', 'all_string')
+            usecols: Only load these columns
             
         Returns:
             DataFrame with appropriate dtypes applied
@@ -155,22 +631,201 @@ class CSVManager:
         dtype = dtype_specs.get(dtype_spec, 'string')
         
         try:
-            return pd.read_csv(csv_path, dtype=dtype, na_values=[''], keep_default_na=False)
+            return pd.read_csv(csv_path, dtype=dtype, na_values=[''], keep_default_na=False, usecols=usecols)
         except Exception as e:
             logger.error(csv_error('CSV_READ_ERROR', path=csv_path, error=str(e)))
             raise
     
-    def read(self, dtype_spec: str = 'tracking') -> pd.DataFrame:
+    def read(self, dtype_spec: str = 'tracking', columns: Optional[List[str]] = None,
+             filters: Optional[List[Tuple[str, str, Any]]] = None) -> pd.DataFrame:
         """
         Instance method to read the CSV using the manager's csv_path.
         
         Args:
-            dtype_spec: dtype specification ('tracking', 'all_string', 'infer')
+            dtype_spec: dtype specification ('tracking', 'all_string', 'infer');
+                the Parquet backend reads every column as string
+            columns: Only load these columns
+            filters: Only load rows matching all (column, op, value) filters,
+                op one of ==, !=, in, not in (e.g. [('youtube_status', 'in', ['pending', 'failed'])])
             
         Returns:
-            DataFrame with loaded CSV data
+            DataFrame with loaded CSV data (re-indexed from 0 when filtered)
+        
+        Reads are cached until the CSV's (mtime, size, inode) changes; each
+        call returns its own copy, so modifying it does not touch the cache.
+        Row updates the row store has not written yet are overlaid on the
+        result, so reading never forces a rewrite.
         """
-        return self.safe_csv_read(str(self.csv_path), dtype_spec)
+        return self._read(dtype_spec, columns, filters)[0]
+    
+    def _read(self, dtype_spec: str, columns: Optional[List[str]],
+              filters: Optional[List[Tuple[str, str, Any]]]) -> Tuple[pd.DataFrame, bool]:
+        """read(), plus whether pending updates changed any row_id (cached row positions are stale)"""
+        if filters:
+            _validate_filters(filters)
+        
+        for _ in range(3):
+            signature, cells = self._row_store.pending_cells() if self._row_store is not None else (None, {})
+            with self._cache_lock:
+                self._validate_cache()
+                if not cells:
+                    return self._cached_read(dtype_spec, columns, filters), False
+                if signature == self._last_modified:
+                    # Filters and projections are applied after the overlay, which may change their result
+                    df = _apply_cells(self._cached_read(dtype_spec, None, None), cells)
+                    if filters:
+                        df = _apply_filters(df, filters).reset_index(drop=True)
+                    if columns is not None:
+                        df = df[list(columns)]
+                    return df, any('row_id' in updates for updates in cells.values())
+            # The file changed between the two snapshots (a flush or another writer); try again
+        
+        self.flush_updates()
+        with self._cache_lock:
+            self._validate_cache()
+            return self._cached_read(dtype_spec, columns, filters), False
+    
+    def _cached_read(self, dtype_spec: str, columns: Optional[List[str]],
+                     filters: Optional[List[Tuple[str, str, Any]]]) -> pd.DataFrame:
+        """Snapshot of the parsed file from the cache, parsing on a miss (caller holds the cache lock)"""
+        key = (dtype_spec, tuple(columns) if columns is not None else None, repr(filters) if filters else None)
+        df = self._df_cache.get(key)
+        if df is None and columns is not None and not filters:
+            # A projection of an already cached full read needs no parsing
+            full = self._df_cache.get((dtype_spec, None, None))
+            if full is not None:
+                df = full[list(columns)]
+        if df is None:
+            df = self._load(dtype_spec, columns, filters)
+        if self._last_modified is not None:
+            self._df_cache[key] = df
+        return _snapshot(df)
+    
+    def _load(self, dtype_spec: str, columns: Optional[List[str]],
+              filters: Optional[List[Tuple[str, str, Any]]]) -> pd.DataFrame:
+        """Parse the dataset for read(), bypassing the cache"""
+        if self.storage_format == 'parquet':
+            self.sync_parquet()
+            table = pq.read_table(self.parquet_path, columns=columns, filters=filters or None)
+            return table.to_pandas(types_mapper={pa.string(): pd.StringDtype()}.get)
+        
+        if columns is None and not filters:
+            return self.safe_csv_read(str(self.csv_path), dtype_spec)
+        
+        usecols = None
+        if columns is not None:
+            usecols = list(columns) + [column for column, _, _ in filters or [] if column not in columns]
+        df = self.safe_csv_read(str(self.csv_path), dtype_spec, usecols=usecols)
+        if filters:
+            df = _apply_filters(df, filters).reset_index(drop=True)
+        return df[list(columns)] if columns is not None else df
+    
+    def get_columns(self) -> List[str]:
+        """Column names of the dataset without loading any rows"""
+        if self.storage_format == 'parquet':
+            self.sync_parquet()
+            return list(pq.read_schema(self.parquet_path).names)
+        with open(self.csv_path, 'r', encoding=self.encoding, newline='') as f:
+            return next(csv.reader(f), [])
+    
+    # === PARQUET BACKEND ===
+    
+    @property
+    def parquet_path(self) -> Path:
+        """Parquet copy of the CSV"""
+        return self.csv_path.with_suffix('.parquet')
+    
+    def _csv_signature(self) -> Optional[str]:
+        try:
+            stat = self.csv_path.stat()
+        except FileNotFoundError:
+            return None
+        return f"{stat.st_mtime_ns}:{stat.st_size}"
+    
+    def _parquet_is_current(self) -> bool:
+        signature = self._csv_signature()
+        if signature is None or not self.parquet_path.exists():
+            return False
+        try:
+            metadata = pq.read_schema(self.parquet_path).metadata or {}
+        except Exception:
+            return False
+        return metadata.get(b'csv_signature') == signature.encode()
+    
+    def _write_parquet(self, table: 'pa.Table', signature: Optional[str]):
+        """Write the Parquet copy atomically, tagged with the CSV it matches"""
+        metadata = dict(table.schema.metadata or {})
+        metadata[b'csv_signature'] = (signature or '').encode()
+        table = table.replace_schema_metadata(metadata)
+        
+        temp_path = self.parquet_path.with_name(f".{self.parquet_path.name}.{os.getpid()}.tmp")
+        try:
+            pq.write_table(table, temp_path, row_group_size=self.parquet_row_group_size, compression='zstd')
+            os.replace(temp_path, self.parquet_path)
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
+    
+    def sync_parquet(self, force: bool = False) -> bool:
+        """
+        Rebuild the Parquet copy if the CSV changed since it was written.
+        
+        Args:
+            force: Rebuild even if the copy is current
+            
+        Returns:
+            True if the copy was rebuilt
+        """
+        if not HAS_PYARROW:
+            raise ImportError("CSV MANAGER ERROR: Parquet storage requires pyarrow (pip install pyarrow)")
+        if not force and self._parquet_is_current():
+            return False
+        
+        signature = self._csv_signature()
+        with open(self.csv_path, 'r', encoding=self.encoding, newline='') as f:
+            header = next(csv.reader(f), [])
+        
+        # Every column as string with '' as missing, like safe_csv_read
+        table = pa_csv.read_csv(
+            self.csv_path,
+            read_options=pa_csv.ReadOptions(encoding=self.encoding),
+            parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={column: pa.string() for column in header},
+                null_values=[''],
+                strings_can_be_null=True
+            )
+        )
+        self._write_parquet(table, signature)
+        logger.debug(f"Rebuilt Parquet copy {self.parquet_path} ({table.num_rows} rows)")
+        return True
+    
+    def export_csv(self, output_path: str, columns: Optional[List[str]] = None,
+                   filters: Optional[List[Tuple[str, str, Any]]] = None) -> int:
+        """
+        Export the dataset (optionally projected and filtered) to a CSV file.
+        
+        Args:
+            output_path: CSV file to write
+            columns: Only export these columns
+            filters: Only export rows matching these filters (see read())
+            
+        Returns:
+            Number of rows exported
+        """
+        df = self.read('all_string', columns=columns, filters=filters)
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        df.to_csv(output_path, index=False, encoding=self.encoding)
+        return len(df)
+    
+    def read_csv_safe(self, dtype_spec: str = 'tracking') -> pd.DataFrame:
+        """Read the CSV, including pending row updates"""
+        return self.read(dtype_spec)
+    
+    def write_csv(self, df: pd.DataFrame, operation_name: str = "write") -> bool:
+        """Replace the CSV with df"""
+        return self.safe_csv_write(df, operation_name)
     
     @handle_file_operations("CSV write operation")
     def safe_csv_write(self, df: pd.DataFrame, operation_name: str = "write", 
@@ -186,6 +841,9 @@ class CSVManager:
         Returns:
             True if successful, False otherwise
         """
+        # Pending row updates would otherwise be lost or re-applied over df
+        self.flush_updates()
+        
         if self.auto_backup and self.csv_path.exists():
             backup_path = self.create_backup(operation_name)
             logger.debug(f"Created backup: {backup_path}")
@@ -204,28 +862,24 @@ class CSVManager:
             else:
                 df.to_csv(self.csv_path, index=False, encoding=self.encoding)
             
+            # Keep the Parquet copy current without re-parsing the CSV
+            if self.storage_format == 'parquet':
+                try:
+                    self._write_parquet(
+                        pa.Table.from_pandas(df.astype('string'), preserve_index=False),
+                        self._csv_signature()
+                    )
+                except Exception as parquet_error:
+                    # Rebuilt from the CSV on the next read
+                    logger.warning(f"Parquet copy update failed (non-fatal): {parquet_error}")
+            
             # Upload CSV version to S3 automatically
-            try:
-                # Check if S3 storage is enabled
-                if config.get('downloads.storage_mode', 'local') == 's3':
-                    versioning = get_csv_versioning()
-                    metadata = {
-                        'operation': operation_name,
-                        'row_count': str(len(df)),
-                        'column_count': str(len(df.columns))
-                    }
-                    upload_result = versioning.upload_csv_version(str(self.csv_path), metadata)
-                    if upload_result['success']:
-                        logger.info(f"CSV version uploaded to S3: {upload_result['versioned_name']}")
-                    else:
-                        logger.warning(f"Failed to upload CSV version to S3: {upload_result.get('error')}")
-            except Exception as s3_error:
-                # Don't fail the operation if S3 upload fails
-                logger.warning(f"CSV S3 versioning error (non-fatal): {str(s3_error)}")
+            self._upload_csv_version(operation_name, len(df), len(df.columns))
             
             # Clear cache
-            self._df_cache = None
-            self._last_modified = None
+            self.clear_cache()
+            if self._row_store is not None:
+                self._row_store.invalidate()
             
             return True
             
@@ -233,6 +887,27 @@ class CSVManager:
             logger.error(csv_error('CSV_WRITE_ERROR', path=str(self.csv_path), error=str(e)))
             return False
     
+    def _upload_csv_version(self, operation_name: str, row_count: int, column_count: int):
+        """Upload the current CSV as a new S3 version (non-fatal)"""
+        try:
+            # Check if S3 storage is enabled
+            if config.get('downloads.storage_mode', 'local') == 's3':
+                versioning = get_csv_versioning()
+                metadata = {
+                    'operation': operation_name,
+                    'row_count': str(row_count),
+                    'column_count': str(column_count)
+                }
+                # Debounced and skipped when unchanged; see CSVS3Versioning.request_upload
+                upload_result = versioning.request_upload(str(self.csv_path), metadata)
+                if not upload_result['success']:
+                    logger.warning(f"Failed to upload CSV version to S3: {upload_result.get('error')}")
+                elif not upload_result.get('deferred') and not upload_result.get('skipped'):
+                    logger.info(f"CSV version uploaded to S3: {upload_result['versioned_name']}")
+        except Exception as s3_error:
+            # Don't fail the operation if S3 upload fails
+            logger.warning(f"CSV S3 versioning error (non-fatal): {str(s3_error)}")
+    
     # === ATOMIC OPERATIONS (from atomic_csv.py) ===
     
     @contextmanager
@@ -281,7 +956,7 @@ class CSVManager:
                 lock_context.__exit__(None, None, None)
             
             # Clear cache
-            self._df_cache = None
+            self.clear_cache()
     
     @handle_file_operations("Atomic CSV write")
     def atomic_write(self, rows: List[Dict], fieldnames: Optional[List[str]] = None) -> bool:
@@ -308,7 +983,7 @@ class CSVManager:
             # Read existing data if file exists
             existing_rows = []
             if self.csv_path.exists():
-                df = self.safe_csv_read(str(self.csv_path))
+                df = self.read()
                 existing_rows = df.to_dict('records')
                 if not fieldnames:
                     fieldnames = list(df.columns)
@@ -328,15 +1003,22 @@ class CSVManager:
     
     @handle_file_operations("Streaming CSV processing")
     def stream_process(self, process_func: Callable, output_path: Optional[str] = None, 
-                      fieldnames: Optional[List[str]] = None, has_header: bool = True) -> int:
+                      fieldnames: Optional[List[str]] = None, has_header: bool = True,
+                      workers: Optional[int] = None, max_in_flight: Optional[int] = None) -> int:
         """
         Process CSV file in chunks using streaming approach.
         
+        With workers > 0, chunks are processed in a process pool and written
+        back in input order; process_func must then be picklable (a module-level
+        function), otherwise chunks are processed in this process.
+        
         Args:
             process_func: Function that takes a list of rows and returns processed rows
             output_path: Output file path (defaults to input path)
             fieldnames: CSV field names
             has_header: Whether CSV has header row
+            workers: Worker processes (default: file_processing.stream_workers, 0 = in-process)
+            max_in_flight: Chunks submitted but not yet written (default: 2 * workers)
             
         Returns:
             Number of rows processed
@@ -347,6 +1029,19 @@ class CSVManager:
         output_path = Path(output_path)
         rows_processed = 0
         
+        workers = self.stream_workers if workers is None else workers
+        max_in_flight = max_in_flight or self.stream_max_in_flight or 2 * workers
+        if workers < 0 or max_in_flight < 0:
+            raise ValueError(f"CSV MANAGER ERROR: workers and max_in_flight must be >= 0. "
+                             f"Got: {workers}, {max_in_flight}")
+        if workers > 0:
+            try:
+                pickle.dumps(process_func)
+            except Exception:
+                logger.warning(f"process_func {getattr(process_func, '__qualname__', process_func)} "
+                               f"cannot be sent to worker processes; processing chunks in-process")
+                workers = 0
+        
         # Create backup if processing in place
         if output_path == self.csv_path and self.auto_backup:
             backup_path = self.create_backup("stream_process")
@@ -354,6 +1049,7 @@ class CSVManager:
         
         # Create temporary output file
         temp_fd, temp_path = tempfile.mkstemp(suffix='.csv', dir=output_path.parent)
+        os.close(temp_fd)
         temp_file = Path(temp_path)
         
         try:
@@ -371,23 +1067,15 @@ class CSVManager:
                     if fieldnames and hasattr(writer, 'writeheader'):
                         writer.writeheader()
                     
-                    # Process in chunks
-                    chunk = []
-                    for row in reader:
-                        chunk.append(row)
-                        
-                        if len(chunk) >= self.chunk_size:
-                            processed_chunk = process_func(chunk)
-                            for processed_row in processed_chunk:
-                                writer.writerow(processed_row)
-                            rows_processed += len(processed_chunk)
-                            chunk = []
+                    # Process in chunks (in input order either way)
+                    chunks = _iter_chunks(reader, self.chunk_size)
+                    if workers > 0:
+                        processed_chunks = _process_chunks_ordered(chunks, process_func, workers, max_in_flight)
+                    else:
+                        processed_chunks = (process_func(chunk) for chunk in chunks)
                     
-                    # Process final chunk
-                    if chunk:
-                        processed_chunk = process_func(chunk)
-                        for processed_row in processed_chunk:
-                            writer.writerow(processed_row)
+                    for processed_chunk in processed_chunks:
+                        writer.writerows(processed_chunk)
                         rows_processed += len(processed_chunk)
             
             # Atomically move temp file to final location
@@ -395,7 +1083,7 @@ class CSVManager:
             
             # Clear cache if processing in place
             if output_path == self.csv_path:
-                self._df_cache = None
+                self.clear_cache()
             
             return rows_processed
             
@@ -429,7 +1117,7 @@ class CSVManager:
                 df = pd.DataFrame(columns=required_columns)
                 return self.safe_csv_write(df, "ensure_tracking_columns")
             
-            df = self.safe_csv_read(str(self.csv_path))
+            df = self.read()
             missing_columns = set(required_columns) - set(df.columns)
             
             if missing_columns:
@@ -445,36 +1133,42 @@ class CSVManager:
     
     def get_pending_downloads(self, download_type: str = 'both', 
                             include_failed: bool = True, retry_attempts: int = 3) -> List[RowContext]:
-        """Get list of pending downloads"""
+        """Get list of pending downloads (RowContext.row_index is the row's CSV position)"""
         try:
-            df = self.safe_csv_read(str(self.csv_path))
-            pending_rows = []
+            context_columns = ['row_id', 'name', 'email', 'type']
+            status_columns = [f'{kind}_status' for kind in ('youtube', 'drive')
+                              if download_type in ['both', kind]]
+            available = set(self.get_columns())
+            df = self.read(columns=[column for column in context_columns + status_columns
+                                    if column in available])
             
-            for _, row in df.iterrows():
-                row_context = RowContext(
-                    row_id=str(row.get('row_id', '')),
-                    name=str(row.get('name', '')),
-                    email=str(row.get('email', '')),
-                    type=str(row.get('type', '')),
-                    link=str(row.get('link', ''))
-                )
-                
-                # Check YouTube status
-                if download_type in ['both', 'youtube']:
-                    youtube_status = str(row.get('youtube_status', ''))
-                    if (youtube_status in ['pending', ''] or 
-                        (include_failed and youtube_status == 'failed')):
-                        pending_rows.append(row_context)
-                        continue
-                
-                # Check Drive status
-                if download_type in ['both', 'drive']:
-                    drive_status = str(row.get('drive_status', ''))
-                    if (drive_status in ['pending', ''] or 
-                        (include_failed and drive_status == 'failed')):
-                        pending_rows.append(row_context)
+            # Boolean mask over all rows; a missing status column means every row is pending
+            selected = np.zeros(len(df), dtype=bool)
+            for status_column in status_columns:
+                if status_column not in df.columns:
+                    selected[:] = True
+                    break
+                statuses = df[status_column]
+                pending = statuses.isin(['pending', ''])
+                if include_failed:
+                    pending |= statuses == 'failed'
+                selected |= pending.fillna(False).to_numpy(dtype=bool)
+            
+            # Build RowContext objects only for the selected rows
+            positions = np.flatnonzero(selected)
+            fields = {}
+            for column in context_columns:
+                if column in df.columns:
+                    fields[column] = [str(value) for value in df[column].to_numpy()[positions]]
+                else:
+                    fields[column] = [''] * len(positions)
             
-            return pending_rows
+            return [
+                RowContext(row_id=row_id, row_index=int(position), type=row_type, name=name, email=email)
+                for position, row_id, name, email, row_type in zip(
+                    positions, fields['row_id'], fields['name'], fields['email'], fields['type']
+                )
+            ]
             
         except Exception as e:
             logger.error(csv_error('CSV_READ_ERROR', path=str(self.csv_path), error=str(e)))
@@ -483,23 +1177,17 @@ class CSVManager:
     @handle_file_operations("Update download status")
     def update_download_status(self, row_index: int, download_type: str, 
                              result: DownloadResult) -> bool:
-        """Update download status for a specific row"""
+        """Update download status for a specific row (batched, see CSVRowStore)"""
         try:
-            df = self.safe_csv_read(str(self.csv_path))
-            
-            if row_index >= len(df):
-                logger.error(f"Row index {row_index} out of bounds")
-                return False
-            
             # Update status columns
-            status_col = f'{download_type}_status'
-            error_col = f'{download_type}_error'
-            
-            df.loc[row_index, status_col] = result.status
+            updates = {f'{download_type}_status': result.get_summary()['status']}
             if result.error_message:
-                df.loc[row_index, error_col] = sanitize_csv_field(result.error_message)
+                updates[f'{download_type}_error'] = sanitize_csv_field(result.error_message)
             
-            return self.safe_csv_write(df, f"update_{download_type}_status")
+            if not self.row_store.update_at(row_index, updates):
+                logger.error(f"Row index {row_index} out of bounds")
+                return False
+            return True
             
         except Exception as e:
             logger.error(csv_error('CSV_WRITE_ERROR', path=str(self.csv_path), error=str(e)))
@@ -508,21 +1196,19 @@ class CSVManager:
     def get_download_status_summary(self) -> Dict[str, Any]:
         """Get summary of download statuses"""
         try:
-            df = self.safe_csv_read(str(self.csv_path))
+            status_columns = ['youtube_status', 'drive_status']
+            available = set(self.get_columns())
+            df = self.read(columns=[column for column in status_columns if column in available])
             
-            summary = {
-                'total_rows': len(df),
-                'youtube': {
-                    'pending': len(df[df['youtube_status'].isin(['pending', ''])]),
-                    'completed': len(df[df['youtube_status'] == 'completed']),
-                    'failed': len(df[df['youtube_status'] == 'failed'])
-                },
-                'drive': {
-                    'pending': len(df[df['drive_status'].isin(['pending', ''])]),
-                    'completed': len(df[df['drive_status'] == 'completed']),
-                    'failed': len(df[df['drive_status'] == 'failed'])
+            summary = {'total_rows': len(df)}
+            for status_column in status_columns:
+                # One counting pass per column (KeyError if the column is missing)
+                counts = df[status_column].value_counts()
+                summary[status_column.replace('_status', '')] = {
+                    'pending': int(counts.get('pending', 0) + counts.get('', 0)),
+                    'completed': int(counts.get('completed', 0)),
+                    'failed': int(counts.get('failed', 0))
                 }
-            }
             
             return summary
             
@@ -757,13 +1443,11 @@ class CSVManager:
             True if successful, False otherwise
         """
         try:
-            df = self.read_csv_safe()
-            mask = df['row_id'].astype(str) == str(row_id)
-            
-            if not df[mask].empty:
-                df.loc[mask, 's3_paths'] = self.save_s3_paths(s3_paths)
-                df.loc[mask, 'file_uuids'] = self.save_file_uuids(file_uuids)
-                self.write_csv(df)
+            updates = {
+                's3_paths': self.save_s3_paths(s3_paths),
+                'file_uuids': self.save_file_uuids(file_uuids)
+            }
+            if self.row_store.update(row_id, updates, add_columns=True, all_matches=True):
                 return True
             else:
                 logger.warning(f"Row ID {row_id} not found in CSV")
@@ -792,11 +1476,16 @@ class CSVManager:
             logger.warning(f"Invalid row ID provided: {row_id}")
             return None
         
-        df = self.read_csv_safe()
-        mask = df['row_id'].astype(str) == str(validated_id)
+        df, row_ids_changed = self._read('tracking', None, None)
+        if row_ids_changed:
+            matches = (df['row_id'] == str(validated_id)).to_numpy().nonzero()[0]
+            position = matches[0] if len(matches) else None
+        else:
+            with self._cache_lock:
+                position = self._row_positions(df).get(str(validated_id))
         
-        if mask.any():
-            return df[mask].iloc[0]
+        if position is not None:
+            return df.iloc[position]
         return None
     
     def find_rows_by_criteria(self, criteria: Dict[str, Any]) -> pd.DataFrame:
@@ -830,25 +1519,10 @@ class CSVManager:
             True if successful, False otherwise
         """
         try:
-            df = self.read_csv_safe()
-            mask = df['row_id'].astype(str) == str(row_id)
-            
-            if not mask.any():
+            # O(1) indexed update; written by the row store's next flush
+            if not self.row_store.update(row_id, updates):
                 logger.warning(f"Row ID {row_id} not found in CSV")
                 return False
-            
-            # Get the index of the row
-            row_index = df.index[mask].tolist()[0]
-            
-            # Update each field
-            for column, value in updates.items():
-                if column in df.columns:
-                    df.at[row_index, column] = value
-                else:
-                    logger.warning(f"Column '{column}' not found in CSV")
-            
-            # Save the updated dataframe
-            self.write_csv(df)
             return True
             
         except Exception as e:
@@ -922,6 +1596,140 @@ class CSVManager:
         return str(backup_path)
 
 
+class IncrementalCSVWriter:
+    """
+    Record-at-a-time output writer for long workflow runs.
+
+    start() writes the full CSV once. Each finished record is then appended
+    (and fsynced) as a JSON line to a journal next to the CSV instead of rewriting the whole
+    file, so a run costs O(n) instead of O(n^2). finalize() writes the single
+    consolidated CSV and removes the journal.
+
+    The journal is removed only after the consolidated CSV is written. A
+    crashed run leaves it behind, and the next start() folds its records
+    (matched by key_column) into the new base records before writing.
+    """
+
+    def __init__(self, csv_path: Union[str, Path], columns: List[str],
+                 key_column: str = 'row_id', encoding: str = 'utf-8'):
+        """
+        Initialize incremental writer.
+
+        Args:
+            csv_path: Output CSV
+            columns: Output columns in order (missing values written as '')
+            key_column: Column identifying a record across runs
+            encoding: File encoding
+        """
+        if key_column not in columns:
+            raise ValueError(f"INCREMENTAL CSV ERROR: key_column '{key_column}' must be one of the columns")
+
+        self.csv_path = Path(csv_path)
+        self.journal_path = self.csv_path.with_name(f"{self.csv_path.name}.journal.jsonl")
+        self.columns = list(columns)
+        self.key_column = key_column
+        self.encoding = encoding
+
+        self._records: List[Dict[str, Any]] = []
+        self._journal = None
+        self.appended = 0
+
+    def _row(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        return {column: record.get(column, '') for column in self.columns}
+
+    def recover(self) -> Dict[str, Dict[str, Any]]:
+        """Records left in the journal by an unfinished run (key -> record, last wins)"""
+        if not self.journal_path.exists():
+            return {}
+
+        recovered = {}
+        with open(self.journal_path, 'r', encoding=self.encoding) as f:
+            for line in f:
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn last line from a crash
+                    logger.warning(f"Skipping unreadable record in journal {self.journal_path}")
+                    continue
+                recovered[str(row.get(self.key_column, ''))] = row
+        return recovered
+
+    def _write_consolidated(self, operation_name: str) -> bool:
+        df = pd.DataFrame([self._row(record) for record in self._records], columns=self.columns)
+        return CSVManager(csv_path=str(self.csv_path), encoding=self.encoding).safe_csv_write(
+            df, operation_name=operation_name
+        )
+
+    def start(self, records: List[Dict[str, Any]]) -> bool:
+        """
+        Write the full CSV once (folding in a crashed run's journal) and open a new journal.
+
+        Args:
+            records: All output records; append() updates this list in place
+
+        Returns:
+            True if the CSV was written
+        """
+        self._records = records
+        recovered = self.recover()
+        if recovered:
+            folded = 0
+            for position, record in enumerate(records):
+                previous = recovered.get(str(record.get(self.key_column, '')))
+                if previous is not None:
+                    records[position] = {**record, **previous}
+                    folded += 1
+            logger.info(f"Recovered {folded} records from unfinished run journal {self.journal_path}")
+
+        if not self._write_consolidated("incremental_start"):
+            return False
+
+        self._journal = open(self.journal_path, 'w', encoding=self.encoding)
+        return True
+
+    def append(self, position: int, record: Dict[str, Any]) -> bool:
+        """
+        Record a finished record: durable in the journal before this returns.
+
+        Args:
+            position: Index of the record in the start() records
+            record: The finished record
+
+        Returns:
+            True if the record was journaled
+        """
+        if self._journal is None:
+            raise RuntimeError("INCREMENTAL CSV ERROR: start() must be called before append()")
+
+        self._records[position] = record
+        try:
+            self._journal.write(json.dumps(self._row(record), default=str) + '\n')
+            self._journal.flush()
+            os.fsync(self._journal.fileno())
+            self.appended += 1
+            return True
+        except OSError as e:
+            logger.error(csv_error('CSV_WRITE_ERROR', path=str(self.journal_path), error=str(e)))
+            return False
+
+    def finalize(self) -> bool:
+        """
+        Write the consolidated CSV, then remove the journal.
+
+        Returns:
+            True if the CSV was written (the journal is kept otherwise)
+        """
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+        if not self._write_consolidated("incremental_final"):
+            return False
+        if self.journal_path.exists():
+            self.journal_path.unlink()
+        return True
+
+
 # === STANDALONE FUNCTIONS FOR BACKWARD COMPATIBILITY ===
 
 def create_csv_backup(csv_path: str, operation_name: str = "backup") -> str:
@@ -954,11 +1762,12 @@ def atomic_csv_update(filename, fieldnames=None, encoding='utf-8', use_lock=True
 
 @contextmanager
 def streaming_csv_update(filename, process_func, chunk_size=1000, fieldnames=None, 
-                        encoding='utf-8', use_lock=True, timeout=30.0):
+                        encoding='utf-8', use_lock=True, timeout=30.0, workers=None, max_in_flight=None):
     """Backward compatibility context manager for streaming CSV updates"""
     manager = CSVManager(csv_path=filename, chunk_size=chunk_size, use_file_lock=use_lock, 
                         timeout=timeout, encoding=encoding)
-    rows_processed = manager.stream_process(process_func, fieldnames=fieldnames)
+    rows_processed = manager.stream_process(process_func, fieldnames=fieldnames,
+                                            workers=workers, max_in_flight=max_in_flight)
     yield rows_processed
 
 
@@ -1065,6 +1874,25 @@ def extract_all_links_from_row(row: pd.Series) -> Dict[str, List[str]]:
     }
 
 
+def links_per_row(df: pd.DataFrame, column: str) -> pd.Series:
+    """
+    Number of links in a column for every row, counted like extract_links_from_row().
+    
+    Args:
+        df: CSV data
+        column: Pipe-delimited link column
+        
+    Returns:
+        Link count per row (0 where the column is missing or empty)
+    """
+    if column not in df.columns:
+        return pd.Series(0, index=df.index)
+    
+    links = df[column].dropna().astype(str).str.split('|').explode().str.strip()
+    links = links[~links.isin(['', 'nan', 'None'])]
+    return links.groupby(level=0).size().reindex(df.index, fill_value=0)
+
+
 def get_standard_csv_path() -> str:
     """Get the standard output CSV path from configuration."""
     try:
@@ -1123,29 +1951,18 @@ def count_links_by_type(csv_path: str = None) -> Dict[str, int]:
     if csv_path is None:
         csv_path = get_standard_csv_path()
     
-    df = CSVManager.load_output_csv(csv_path)
+    df = load_output_csv(csv_path)
     
-    counts = {
-        'youtube': 0,
-        'drive': 0,
+    youtube_counts = links_per_row(df, 'youtube_playlist')
+    drive_counts = links_per_row(df, 'google_drive')
+    
+    return {
+        'youtube': int(youtube_counts.sum()),
+        'drive': int(drive_counts.sum()),
         'total_people': len(df),
-        'people_with_youtube': 0,
-        'people_with_drive': 0
+        'people_with_youtube': int((youtube_counts > 0).sum()),
+        'people_with_drive': int((drive_counts > 0).sum())
     }
-    
-    for _, row in df.iterrows():
-        youtube_links = CSVManager.extract_links_from_row(row, 'youtube_playlist')
-        drive_links = CSVManager.extract_links_from_row(row, 'google_drive')
-        
-        counts['youtube'] += len(youtube_links)
-        counts['drive'] += len(drive_links)
-        
-        if youtube_links:
-            counts['people_with_youtube'] += 1
-        if drive_links:
-            counts['people_with_drive'] += 1
-    
-    return counts
 
 
 if __name__ == "__main__":
@@ -1,13 +1,27 @@
 #!/usr/bin/env python3
 """
 CSV S3 Versioning - Automatically upload CSV files to S3 with timestamps
+
+Uploads track the CSV's change rate rather than its write count:
+- request_upload() is debounced: at most one upload per min_interval_seconds
+  or per max_pending_writes writes, with a trailing upload for the last write
+- A version whose content hash matches the last uploaded one is skipped
+- With diff_uploads, versions are gzipped unified diffs against the previous
+  version (a full copy every full_every versions); apply_csv_diff() restores them
 """
 
 import boto3
+import gzip
+import atexit
+import difflib
+import hashlib
+import threading
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 import json
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 try:
     from .logging_config import get_logger
@@ -20,19 +34,104 @@ logger = get_logger(__name__)
 config = get_config()
 
 
+DIFF_SUFFIX = ".diff.gz"
+NO_NEWLINE_MARKER = "\\ No newline at end of file\n"
+
+
+def make_csv_diff(base: bytes, new: bytes) -> bytes:
+    """Gzipped unified diff (no context lines) turning base into new"""
+    diff = difflib.unified_diff(
+        base.decode('utf-8').splitlines(keepends=True),
+        new.decode('utf-8').splitlines(keepends=True),
+        n=0
+    )
+    # A last line without a newline is marked as diff(1) does, so it can't run into the next line
+    return gzip.compress(''.join(
+        line if line.endswith('\n') else line + '\n' + NO_NEWLINE_MARKER for line in diff
+    ).encode('utf-8'))
+
+
+def apply_csv_diff(base: bytes, diff: bytes) -> bytes:
+    """Restore a version from its base and a make_csv_diff() diff"""
+    base_lines = base.decode('utf-8').splitlines(keepends=True)
+    output: List[str] = []
+    position = 0
+    
+    previous = ''
+    for line in gzip.decompress(diff).decode('utf-8').splitlines(keepends=True):
+        if line == NO_NEWLINE_MARKER:
+            if previous.startswith('+'):
+                output[-1] = output[-1][:-1]
+        elif line.startswith('@@'):
+            old_range = line.split()[1][1:]
+            old_start, _, old_length = old_range.partition(',')
+            old_length = int(old_length) if old_length else 1
+            # Unified diff ranges are 1-based, except empty ranges name the line before
+            start = int(old_start) - (1 if old_length else 0)
+            output.extend(base_lines[position:start])
+            position = start + old_length
+        elif line.startswith('+') and not line.startswith('+++'):
+            output.append(line[1:])
+        previous = line
+    
+    output.extend(base_lines[position:])
+    return ''.join(output).encode('utf-8')
+
+
+@dataclass
+class _CSVVersionState:
+    """Last uploaded version and debounce state for one CSV"""
+    sha256: Optional[str] = None
+    content: Optional[bytes] = None
+    s3_key: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+    diffs_since_full: int = 0
+    last_upload_time: Optional[float] = None  # monotonic; None until the first upload
+    pending_writes: int = 0
+    pending_metadata: Optional[Dict[str, Any]] = None
+    timer: Optional[threading.Timer] = None
+    # Serializes uploads of this CSV, so each diff is taken against the version uploaded before it
+    upload_lock: threading.Lock = field(default_factory=threading.Lock)
+
+
 class CSVS3Versioning:
     """Handles CSV versioning in S3 with timestamp-based naming"""
     
-    def __init__(self, bucket_name: Optional[str] = None, folder_prefix: str = "csv-versions"):
+    def __init__(self, bucket_name: Optional[str] = None, folder_prefix: str = "csv-versions",
+                 min_interval_seconds: Optional[float] = None, max_pending_writes: Optional[int] = None,
+                 diff_uploads: Optional[bool] = None, full_every: Optional[int] = None):
         """Initialize S3 versioning for CSV files
         
         Args:
             bucket_name: S3 bucket name (defaults to config)
             folder_prefix: Folder prefix in S3 for CSV versions
+            min_interval_seconds: Minimum seconds between debounced uploads (defaults to config)
+            max_pending_writes: Upload early after this many debounced writes (defaults to config)
+            diff_uploads: Upload diffs against the previous version (defaults to config)
+            full_every: Upload a full copy after this many diffs (defaults to config)
         """
         self.bucket_name = bucket_name or config.get('downloads.s3.default_bucket', 'typing-clients-uuid-system')
         self.folder_prefix = folder_prefix
         
+        def setting(value, key, default):
+            return value if value is not None else config.get(f'downloads.s3.csv_versioning.{key}', default)
+        
+        self.min_interval_seconds = float(setting(min_interval_seconds, 'min_interval_seconds', 60.0))
+        self.max_pending_writes = int(setting(max_pending_writes, 'max_pending_writes', 100))
+        self.diff_uploads = bool(setting(diff_uploads, 'diff_uploads', False))
+        self.full_every = int(setting(full_every, 'full_every', 20))
+        
+        if self.min_interval_seconds < 0:
+            raise ValueError(f"CSV VERSIONING ERROR: min_interval_seconds must be >= 0. Got: {self.min_interval_seconds}")
+        if self.max_pending_writes < 1:
+            raise ValueError(f"CSV VERSIONING ERROR: max_pending_writes must be at least 1. Got: {self.max_pending_writes}")
+        if self.full_every < 1:
+            raise ValueError(f"CSV VERSIONING ERROR: full_every must be at least 1. Got: {self.full_every}")
+        
+        self._states: Dict[str, _CSVVersionState] = {}
+        self._lock = threading.RLock()
+        atexit.register(self.flush)
+        
         # Use profile-aware S3 client
         try:
             from .s3_manager import get_s3_client
@@ -48,9 +147,10 @@ class CSVS3Versioning:
             original_path: Original CSV file path
             
         Returns:
-            Timestamped filename like output_2025-07-21_143052.csv
+            Timestamped filename like output_2025-07-21_143052_123456.csv
+            (microseconds, so two uploads in one second never share a key)
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
+        timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S_%f")
         stem = original_path.stem
         suffix = original_path.suffix
         return f"{stem}_{timestamp}{suffix}"
@@ -62,7 +162,7 @@ class CSVS3Versioning:
             versioned_name: Timestamped filename
             
         Returns:
-            S3 key like csv-versions/2025/07/output_2025-07-21_143052.csv
+            S3 key like csv-versions/2025/07/output_2025-07-21_143052_123456.csv
         """
         # Organize by year/month for easier browsing
         now = datetime.now()
@@ -70,31 +170,146 @@ class CSVS3Versioning:
         month = now.strftime("%m")
         return f"{self.folder_prefix}/{year}/{month}/{versioned_name}"
     
-    def upload_csv_version(self, local_csv_path: str, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def _state(self, local_path: Path) -> _CSVVersionState:
+        key = str(local_path.resolve())
+        if key not in self._states:
+            self._states[key] = _CSVVersionState()
+        return self._states[key]
+    
+    def request_upload(self, local_csv_path: str, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Debounced upload for a CSV that was just written
+        
+        Uploads now if min_interval_seconds have passed since the last upload
+        or max_pending_writes writes are pending; otherwise schedules one
+        trailing upload of the latest content.
+        
+        Args:
+            local_csv_path: Path to local CSV file
+            metadata: Optional metadata to include (the latest write's wins)
+            
+        Returns:
+            Upload result, or {'success': True, 'deferred': True, ...} if debounced
+        """
+        local_path = Path(local_csv_path)
+        with self._lock:
+            state = self._state(local_path)
+            state.pending_writes += 1
+            state.pending_metadata = metadata
+            
+            if state.last_upload_time is None:
+                wait = 0.0
+            else:
+                wait = self.min_interval_seconds - (time.monotonic() - state.last_upload_time)
+            if wait > 0 and state.pending_writes < self.max_pending_writes:
+                if state.timer is None:
+                    state.timer = threading.Timer(wait, self._upload_pending, args=(local_path,))
+                    state.timer.daemon = True
+                    state.timer.start()
+                return {
+                    'success': True,
+                    'deferred': True,
+                    'pending_writes': state.pending_writes,
+                    'local_path': str(local_path)
+                }
+            
+        return self._upload_pending(local_path)
+    
+    def _upload_pending(self, local_path: Path) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            state = self._state(local_path)
+            if state.timer is not None:
+                state.timer.cancel()
+                state.timer = None
+            if not state.pending_writes:
+                return None
+            
+            metadata = dict(state.pending_metadata or {})
+            metadata['coalesced_writes'] = str(state.pending_writes)
+            state.pending_writes = 0
+            state.pending_metadata = None
+        
+        # Upload without the lock, so writers requesting uploads don't wait on S3
+        try:
+            result = self.upload_csv_version(str(local_path), metadata, allow_diff=True)
+        except Exception as e:
+            result = {'success': False, 'error': str(e), 'local_path': str(local_path)}
+        if not result['success']:
+            logger.warning(f"Failed to upload CSV version to S3: {result.get('error')}")
+        return result
+    
+    def flush(self):
+        """Upload every debounced CSV write that is still pending"""
+        with self._lock:
+            pending = [Path(path) for path, state in self._states.items() if state.pending_writes]
+        for local_path in pending:
+            self._upload_pending(local_path)
+    
+    def upload_csv_version(self, local_csv_path: str, metadata: Optional[Dict[str, Any]] = None,
+                           force: bool = False, allow_diff: bool = False) -> Dict[str, Any]:
         """Upload CSV to S3 with versioning
         
         Args:
             local_csv_path: Path to local CSV file
             metadata: Optional metadata to include
+            force: Upload even if the content matches the last uploaded version
+            allow_diff: Upload a diff against the last version if diff_uploads is enabled
             
         Returns:
-            Dict with upload details including S3 key and URL
+            Dict with upload details including S3 key and URL ('skipped': True
+            with the last version's details if the content is unchanged)
         """
         local_path = Path(local_csv_path)
         
         if not local_path.exists():
             raise FileNotFoundError(f"CSV file not found: {local_csv_path}")
         
+        with self._lock:
+            state = self._state(local_path)
+        
+        with state.upload_lock:
+            # Hash the exact bytes that get uploaded, so a concurrent rewrite can't split them
+            content = local_path.read_bytes()
+            sha256 = hashlib.sha256(content).hexdigest()
+            
+            with self._lock:
+                state.last_upload_time = time.monotonic()
+            
+            if not force and sha256 == state.sha256 and state.result is not None:
+                logger.debug(f"CSV unchanged since {state.s3_key}, skipping upload")
+                return dict(state.result, skipped=True)
+            
+            use_diff = (allow_diff and self.diff_uploads and state.content is not None
+                        and state.diffs_since_full + 1 < self.full_every)
+            return self._put_version(local_path, state, content, sha256, metadata, use_diff)
+    
+    def _put_version(self, local_path: Path, state: _CSVVersionState, content: bytes, sha256: str,
+                     metadata: Optional[Dict[str, Any]], use_diff: bool) -> Dict[str, Any]:
         # Generate versioned name and S3 key
         versioned_name = self.generate_versioned_name(local_path)
+        body = content
+        if use_diff:
+            diff = make_csv_diff(state.content, content)
+            if apply_csv_diff(state.content, diff) == content:
+                versioned_name += DIFF_SUFFIX
+                body = diff
+            else:
+                logger.warning(f"CSV diff for {local_path.name} does not restore the content, uploading a full copy")
+                use_diff = False
         s3_key = self.generate_s3_key(versioned_name)
         
         # Prepare metadata
         upload_metadata = {
             'original_filename': local_path.name,
             'upload_timestamp': datetime.now().isoformat(),
-            'file_size': str(local_path.stat().st_size)
+            'file_size': str(len(content)),
+            'content_sha256': sha256
         }
+        if use_diff:
+            upload_metadata.update({
+                'version_format': 'unified-diff-gzip',
+                'base_s3_key': state.s3_key,
+                'base_sha256': state.sha256
+            })
         
         if metadata:
             upload_metadata.update(metadata)
@@ -103,14 +318,12 @@ class CSVS3Versioning:
             # Upload to S3
             logger.info(f"Uploading CSV version to S3: {s3_key}")
             
-            self.s3_client.upload_file(
-                str(local_path),
-                self.bucket_name,
-                s3_key,
-                ExtraArgs={
-                    'ContentType': 'text/csv',
-                    'Metadata': upload_metadata
-                }
+            self.s3_client.put_object(
+                Body=body,
+                Bucket=self.bucket_name,
+                Key=s3_key,
+                ContentType='application/gzip' if use_diff else 'text/csv',
+                Metadata=upload_metadata
             )
             
             # Generate S3 URL
@@ -124,9 +337,19 @@ class CSVS3Versioning:
                 's3_url': s3_url,
                 'bucket': self.bucket_name,
                 'timestamp': upload_metadata['upload_timestamp'],
-                'file_size': int(upload_metadata['file_size'])
+                'file_size': int(upload_metadata['file_size']),
+                'uploaded_bytes': len(body),
+                'content_sha256': sha256,
+                'is_diff': use_diff
             }
             
+            state.sha256 = sha256
+            state.s3_key = s3_key
+            state.result = result
+            state.diffs_since_full = state.diffs_since_full + 1 if use_diff else 0
+            # Only diffs need the previous content
+            state.content = content if self.diff_uploads else None
+            
             logger.info(f"✅ CSV version uploaded: {versioned_name}")
             return result
             
@@ -195,7 +418,8 @@ class CSVS3Versioning:
         Returns:
             Latest version details or None
         """
-        versions = self.list_csv_versions(prefix_filter=prefix_filter, limit=1)
+        versions = [version for version in self.list_csv_versions(prefix_filter=prefix_filter)
+                    if not version['filename'].endswith(DIFF_SUFFIX)]
         return versions[0] if versions else None
 
 
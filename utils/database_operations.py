@@ -80,6 +80,13 @@ class DatabaseManager:
         self._connections = []
         self._lock = threading.Lock()
         self._initialized = False
+        self._stats_lock = threading.Lock()
+        self._pool_stats = {
+            "wait_count": 0,
+            "wait_seconds_total": 0.0,
+            "max_wait_seconds": 0.0,
+            "waiting": 0
+        }
     
     def _get_sqlite_connection(self) -> sqlite3.Connection:
         """Get SQLite connection."""
@@ -142,7 +149,15 @@ class DatabaseManager:
     @contextmanager
     def get_connection(self):
         """Get database connection with automatic cleanup."""
-        with self._lock:
+        wait_start = time.perf_counter()
+        with self._stats_lock:
+            self._pool_stats["waiting"] += 1
+        try:
+            self._lock.acquire()
+        finally:
+            with self._stats_lock:
+                self._pool_stats["waiting"] -= 1
+        try:
             if self.config.db_type == 'sqlite':
                 conn = self._get_sqlite_connection()
             elif self.config.db_type == 'postgresql':
@@ -151,12 +166,27 @@ class DatabaseManager:
                 conn = self._get_mysql_connection()
             else:
                 raise ValueError(f"Unsupported database type: {self.config.db_type}")
+        finally:
+            self._lock.release()
+            self._record_wait(time.perf_counter() - wait_start)
         
         try:
             yield conn
         finally:
             conn.close()
     
+    def _record_wait(self, wait_seconds: float):
+        """Record time spent waiting for (and opening) a connection."""
+        with self._stats_lock:
+            self._pool_stats["wait_count"] += 1
+            self._pool_stats["wait_seconds_total"] += wait_seconds
+            self._pool_stats["max_wait_seconds"] = max(self._pool_stats["max_wait_seconds"], wait_seconds)
+    
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Get connection wait statistics."""
+        with self._stats_lock:
+            return dict(self._pool_stats)
+    
     @contextmanager
     def transaction(self):
         """Database transaction context manager."""
@@ -12,7 +12,7 @@ try:
     from validation import validate_google_drive_url, validate_file_path, ValidationError
     from retry_utils import retry_request, get_with_retry, retry_with_backoff
     from file_lock import file_lock, safe_file_operation
-    from rate_limiter import rate_limit, wait_for_rate_limit
+    from rate_limiter import rate_limit, wait_for_rate_limit, record_transfer
     from row_context import RowContext, DownloadResult
     from sanitization import sanitize_error_message, SafeDownloadError, validate_csv_field_safety
     from config import get_drive_downloads_dir, create_download_dir, Constants
@@ -24,7 +24,7 @@ except ImportError:
     from .validation import validate_google_drive_url, validate_file_path, ValidationError
     from .retry_utils import retry_request, get_with_retry, retry_with_backoff
     from .file_lock import file_lock, safe_file_operation
-    from .rate_limiter import rate_limit, wait_for_rate_limit
+    from .rate_limiter import rate_limit, wait_for_rate_limit, record_transfer
     from .row_context import RowContext, DownloadResult
     from .sanitization import sanitize_error_message, SafeDownloadError, validate_csv_field_safety
     from .config import get_drive_downloads_dir, create_download_dir, Constants
@@ -158,6 +158,7 @@ def is_folder_url(url):
     return '/drive/folders/' in url or 'folders/' in url
 
 
+@rate_limit('google_drive', host='drive.google.com')
 def list_folder_files(folder_url, logger=None):
     """
     List files in a Google Drive folder by scraping the public folder page
@@ -451,7 +452,7 @@ def get_folder_contents(folder_id, logger=None):
     base_delay=5.0,
     exceptions=(requests.RequestException, IOError)
 )
-@rate_limit('google_drive')
+@rate_limit('google_drive', host='drive.google.com')
 def download_drive_file(file_id, output_filename=None, logger=None):
     """Download a file from Google Drive using file ID"""
     if not logger:
@@ -565,6 +566,7 @@ def download_drive_file(file_id, output_filename=None, logger=None):
             
             # Move to final location
             os.replace(temp_path, output_path)
+            record_transfer(os.path.getsize(output_path))
             
         except Exception as e:
             # Clean up temp file on error
@@ -600,6 +602,7 @@ def save_metadata(file_id, url, metadata, logger=None):
     logger.info(f"Saved metadata to {metadata_file}")
     return metadata_file
 
+@rate_limit('google_drive', host='drive.usercontent.google.com')
 def process_direct_download_url(url, output_filename=None, logger=None):
     """Process a direct drive.usercontent.google.com download URL"""
     if not logger:
@@ -683,6 +686,7 @@ def process_direct_download_url(url, output_filename=None, logger=None):
             
             # Move to final location
             os.replace(temp_path, output_path)
+            record_transfer(os.path.getsize(output_path))
             logger.success(f"Downloaded file to {output_path}")
             return output_path
             
@@ -11,7 +11,7 @@ try:
     from retry_utils import retry_subprocess, retry_with_backoff
     from file_lock import file_lock, safe_file_operation
     from config import get_config, get_youtube_downloads_dir, get_timeout, create_download_dir
-    from rate_limiter import rate_limit, wait_for_rate_limit
+    from rate_limiter import rate_limit, wait_for_rate_limit, record_transfer
     from row_context import RowContext, DownloadResult
     from sanitization import sanitize_error_message, SafeDownloadError
     # Consolidated error handling imports
@@ -22,7 +22,7 @@ except ImportError:
     from .retry_utils import retry_subprocess, retry_with_backoff
     from .file_lock import file_lock, safe_file_operation
     from .config import get_config, get_youtube_downloads_dir, get_timeout, create_download_dir
-    from .rate_limiter import rate_limit, wait_for_rate_limit
+    from .rate_limiter import rate_limit, wait_for_rate_limit, record_transfer
     from .row_context import RowContext, DownloadResult
     from .sanitization import sanitize_error_message, SafeDownloadError
     # Consolidated error handling imports
@@ -37,9 +37,13 @@ config = get_config()
 # Directory to save downloaded videos and transcripts (from config)
 DOWNLOADS_DIR = get_youtube_downloads_dir()
 
-@rate_limit('youtube')
-def download_single_video(url, video_id=None, title=None, transcript_only=False, resolution=None, output_format=None, yt_dlp_path="yt-dlp", logger=None):
-    """Download a single YouTube video using yt-dlp"""
+@rate_limit('youtube', host='youtube.com')
+def download_single_video(url, video_id=None, title=None, transcript_only=False, resolution=None, output_format=None, yt_dlp_path="yt-dlp", logger=None, max_attempts=3):
+    """Download a single YouTube video using yt-dlp
+    
+    max_attempts bounds each yt-dlp call's in-place retries; callers whose
+    scheduler retries the whole download pass 1 so no worker sleeps here.
+    """
     if not logger:
         logger = globals()['logger']  # Use module-level logger
     
@@ -85,7 +89,7 @@ def download_single_video(url, video_id=None, title=None, transcript_only=False,
                 info_cmd,
                 capture_output=True,
                 text=True,
-                max_attempts=3,
+                max_attempts=max_attempts,
                 base_delay=2.0,
                 logger=logger
             )
@@ -143,7 +147,7 @@ def download_single_video(url, video_id=None, title=None, transcript_only=False,
                 logger.info("Attempting to download transcript...")
                 retry_subprocess(
                     sub_cmd,
-                    max_attempts=3,
+                    max_attempts=max_attempts,
                     base_delay=2.0,
                     logger=logger
                 )
@@ -220,11 +224,12 @@ def download_single_video(url, video_id=None, title=None, transcript_only=False,
             logger.info(f"Downloading video in {resolution}p {output_format} format...")
             retry_subprocess(
                 video_cmd,
-                max_attempts=3,
+                max_attempts=max_attempts,
                 base_delay=5.0,  # Longer delay for video downloads
                 logger=logger
             )
             logger.success(f"Video downloaded to {video_file}")
+            record_transfer(video_file.stat().st_size)
             return video_file
         
         downloaded_video = download_video()
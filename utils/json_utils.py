@@ -7,7 +7,7 @@ Consolidates JSON file operations and state management patterns.
 import json
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, TextIO, Union
 from datetime import datetime
 
 def read_json_safe(file_path: Union[str, Path], default: Any = None) -> Any:
@@ -166,15 +166,146 @@ def append_to_json_array(file_path: Union[str, Path], item: Any, max_items: Opti
     
     return write_json_safe(file_path, current_array)
 
+def open_journal_for_append(file_path: Union[str, Path]) -> TextIO:
+    """
+    Open a JSON-lines journal for appending, dropping a torn final line.
+    
+    A crash mid-append can leave the last record without its newline; anything
+    appended after it would be merged into that line and lost on the next
+    read, so the file is first truncated back to its last complete line.
+    
+    Args:
+        file_path: Path to the journal file (created if missing)
+        
+    Returns:
+        Text file handle opened in append mode
+    """
+    file_path = Path(file_path)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    with open(file_path, 'ab+') as f:
+        position = f.seek(0, os.SEEK_END)
+        if position:
+            f.seek(position - 1)
+            if f.read(1) != b"\n":
+                # Scan back for the end of the last complete line
+                complete = 0
+                while position > 0:
+                    start = max(0, position - 65536)
+                    f.seek(start)
+                    newline = f.read(position - start).rfind(b"\n")
+                    if newline != -1:
+                        complete = start + newline + 1
+                        break
+                    position = start
+                f.truncate(complete)
+    
+    return open(file_path, 'a', encoding='utf-8')
+
 # ============================================================================
 # UNIFIED PROGRESS & STATE TRACKING (DRY ITERATION 2 - Step 3)  
 # ============================================================================
 
 from contextlib import contextmanager
-from typing import Set, Callable
+from typing import Set, Callable, List, Tuple
 import threading
 
 
+class ProgressJournal:
+    """
+    Append-only event log beside a JSON progress snapshot.
+    
+    Each change is one appended line in <snapshot>.events.jsonl instead of a
+    rewrite of the whole snapshot. Every compact_every events the owner writes
+    its state as a new snapshot (atomically) and the log is truncated. Events
+    carry a sequence number and the snapshot records the last one it contains,
+    so load() replays exactly the events the snapshot is missing - even if a
+    crash hit between writing the snapshot and truncating the log. A torn
+    final line from a crash mid-append is skipped, and truncated before the
+    next append.
+    
+    Not thread-safe: owners serialise calls.
+    """
+    
+    SEQUENCE_KEY = '_journal_sequence'
+    
+    def __init__(self, snapshot_file: Union[str, Path], compact_every: int = 1000):
+        if compact_every < 1:
+            raise ValueError(f"PROGRESS JOURNAL ERROR: compact_every must be at least 1, got {compact_every}")
+        self.snapshot_file = Path(snapshot_file)
+        self.events_file = self.snapshot_file.with_suffix('.events.jsonl')
+        self.compact_every = compact_every
+        self.pending_events = 0
+        self._sequence = 0
+        self._log = None
+    
+    @property
+    def compaction_due(self) -> bool:
+        return self.pending_events >= self.compact_every
+    
+    def load(self, default: Dict[str, Any]) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """Return (snapshot state, events logged after it)."""
+        state = read_json_safe(self.snapshot_file, default)
+        if not isinstance(state, dict):
+            state = default
+        self._sequence = state.pop(self.SEQUENCE_KEY, 0)
+        
+        events = []
+        try:
+            with open(self.events_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        event = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if event.get('seq', 0) > self._sequence:
+                        events.append(event)
+                        self._sequence = event['seq']
+        except FileNotFoundError:
+            pass
+        
+        self.pending_events = len(events)
+        return state, events
+    
+    def append(self, event: Dict[str, Any]) -> bool:
+        """Log one event. Returns False if it could not be written."""
+        self._sequence += 1
+        event['seq'] = self._sequence
+        self.pending_events += 1
+        try:
+            if self._log is None:
+                # Drops a torn last line, which would otherwise swallow this event
+                self._log = open_journal_for_append(self.events_file)
+            self._log.write(json.dumps(event, ensure_ascii=False, default=str) + "\n")
+            self._log.flush()
+            return True
+        except OSError:
+            return False
+    
+    def compact(self, state: Dict[str, Any], indent: int = 2) -> bool:
+        """Write state as the new snapshot and truncate the event log."""
+        snapshot = dict(state)
+        snapshot[self.SEQUENCE_KEY] = self._sequence
+        temp_file = self.snapshot_file.with_name(f".{self.snapshot_file.name}.{os.getpid()}.tmp")
+        if not write_json_safe(temp_file, snapshot, indent=indent):
+            return False
+        try:
+            os.replace(temp_file, self.snapshot_file)
+            self.close()
+            # Everything in the log is now in the snapshot
+            self._log = open(self.events_file, 'w', encoding='utf-8')
+        except OSError:
+            return False
+        self.pending_events = 0
+        return True
+    
+    def close(self) -> None:
+        """Close the event log."""
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+
 class ProgressTracker:
     """
     Unified progress tracking for all download and processing operations (DRY CONSOLIDATION - Step 3).
@@ -185,12 +316,17 @@ class ProgressTracker:
     - Inconsistent progress state structures across modules
     
     BUSINESS IMPACT: Prevents progress loss and inconsistent tracking across workflows
+    
+    Changes are appended to a ProgressJournal; the JSON file itself is only
+    rewritten every compact_every changes. Membership checks use id sets.
     """
     
-    def __init__(self, progress_file: Union[str, Path], operation_name: str = "operation"):
+    def __init__(self, progress_file: Union[str, Path], operation_name: str = "operation",
+                 compact_every: int = 1000):
         self.progress_file = Path(progress_file)
         self.operation_name = operation_name
         self.lock = threading.Lock()
+        self._journal = ProgressJournal(self.progress_file, compact_every)
         self._state = self._load_state()
     
     def _load_state(self) -> Dict[str, Any]:
@@ -210,31 +346,56 @@ class ProgressTracker:
             }
         }
         
-        existing_state = read_json_safe(self.progress_file, default_state)
+        existing_state, events = self._journal.load(default_state)
         
         # Ensure all required keys exist
         for key, value in default_state.items():
             if key not in existing_state:
                 existing_state[key] = value
         
+        self._state = existing_state
+        self._processed_ids = {entry.get('id') for entry in existing_state['processed']}
+        self._skipped_ids = {entry.get('id') for entry in existing_state['skipped']}
+        for event in events:
+            self._apply(event)
         return existing_state
     
     def _save_state(self) -> None:
-        """Save progress state to file."""
-        self._state['last_updated'] = datetime.now().isoformat()
-        write_json_safe(self.progress_file, self._state)
+        """Save progress state to file (compacts the journal)."""
+        self._journal.compact(self._state)
+    
+    def _apply(self, event: Dict[str, Any]) -> None:
+        """Apply a journaled change to the in-memory state."""
+        entry = event['entry']
+        if event['op'] == 'processed':
+            self._processed_ids.add(entry['id'])
+            self._state['processed'].append(entry)
+            self._state['stats']['completed'] += 1
+        elif event['op'] == 'failed':
+            self._state['failed'][event['id']] = entry
+            self._state['stats']['failed'] += 1
+        elif event['op'] == 'skipped':
+            self._skipped_ids.add(entry['id'])
+            self._state['skipped'].append(entry)
+            self._state['stats']['skipped'] += 1
+        self._state['last_updated'] = entry['timestamp']
+    
+    def _record(self, event: Dict[str, Any]) -> None:
+        """Apply a change and journal it (caller holds lock)."""
+        self._apply(event)
+        self._journal.append(event)
+        if self._journal.compaction_due:
+            self._save_state()
     
     def mark_processed(self, item_id: str, metadata: Optional[Dict[str, Any]] = None) -> None:
         """Mark an item as successfully processed."""
         with self.lock:
-            if item_id not in [entry.get('id') for entry in self._state['processed']]:
+            if item_id not in self._processed_ids:
                 entry = {'id': item_id, 'timestamp': datetime.now().isoformat()}
                 if metadata:
                     entry.update(metadata)
                 
-                self._state['processed'].append(entry)
-                self._state['stats']['completed'] += 1
-                self._save_state()
+                self._record({'op': 'processed', 'entry': entry})
     
     def mark_failed(self, item_id: str, error_message: str, metadata: Optional[Dict[str, Any]] = None) -> None:
         """Mark an item as failed."""
@@ -246,25 +407,32 @@ class ProgressTracker:
             if metadata:
                 failure_entry.update(metadata)
             
-            self._state['failed'][item_id] = failure_entry
-            self._state['stats']['failed'] += 1
-            self._save_state()
+            self._record({'op': 'failed', 'id': item_id, 'entry': failure_entry})
     
     def mark_skipped(self, item_id: str, reason: str) -> None:
         """Mark an item as skipped."""
         with self.lock:
-            if item_id not in [entry.get('id') for entry in self._state['skipped']]:
-                self._state['skipped'].append({
+            if item_id not in self._skipped_ids:
+                self._record({'op': 'skipped', 'entry': {
                     'id': item_id,
                     'reason': reason,
                     'timestamp': datetime.now().isoformat()
-                })
-                self._state['stats']['skipped'] += 1
-                self._save_state()
+                }})
+    
+    def compact(self) -> None:
+        """Write the full progress file now and truncate the journal."""
+        with self.lock:
+            self._save_state()
+    
+    def close(self) -> None:
+        """Write the full progress file and close the journal."""
+        with self.lock:
+            self._save_state()
+            self._journal.close()
     
     def is_processed(self, item_id: str) -> bool:
         """Check if an item has been processed."""
-        return any(entry.get('id') == item_id for entry in self._state['processed'])
+        return item_id in self._processed_ids
     
     def is_failed(self, item_id: str) -> bool:
         """Check if an item has failed."""
@@ -272,7 +440,7 @@ class ProgressTracker:
     
     def is_skipped(self, item_id: str) -> bool:
         """Check if an item was skipped."""
-        return any(entry.get('id') == item_id for entry in self._state['skipped'])
+        return item_id in self._skipped_ids
     
     def get_summary(self) -> Dict[str, Any]:
         """Get progress summary."""
@@ -471,4 +639,4 @@ class BatchProgressTracker:
             'estimated_remaining_seconds': (elapsed / processed * (self.total_items - processed)) if processed > 0 else None,
             'current_item': self.stats['current_item']
         }
-EOF < /dev/null
+
@@ -8,21 +8,97 @@ Implements fail-fast, fail-loud, fail-safely principles:
 - Fail Loud: Detailed error messages for misconfigurations  
 - Fail Safely: Graceful fallback to default rates if configuration unavailable
 """
+import os
+import re
+import json
 import time
+import asyncio
+import sqlite3
+import inspect
+import tempfile
 import threading
+import contextvars
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from datetime import datetime
+from enum import Enum
 from functools import wraps
-from typing import Dict, Optional, Any
+from pathlib import Path
+from typing import Deque, Dict, List, Optional, Any, Tuple, Union
+from urllib.parse import urlparse
 from dataclasses import dataclass
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+# Default location of host-wide shared rate limit state
+DEFAULT_SHARED_STATE_PATH = "/tmp/mass_download_rate_limits.sqlite3"
+
+# Default location of learned (adaptive) per-service rates
+DEFAULT_ADAPTIVE_STATE_PATH = "cache/rate_limit_state.json"
+
+# Response text that means the remote service is throttling us
+THROTTLE_MARKERS = (
+    "http error 429",
+    "too many requests",
+    "sign in to confirm you're not a bot",
+    "sign in to confirm you\u2019re not a bot",
+    "rate limit",
+    "rate-limit",
+    "ratelimit",
+)
+
+# Hierarchy levels, widest scope first (the order tokens are acquired in)
+LEVEL_GLOBAL_BYTES = "global_bytes"
+LEVEL_HOST = "host"
+LEVEL_SERVICE = "service"
+LEVEL_CHANNEL = "channel"
+
+# Waits shorter than this don't count as a level being binding
+_BINDING_MIN_WAIT = 0.001
+
+# Services whose grant is held by the current thread / asyncio task
+_held_services: contextvars.ContextVar = contextvars.ContextVar("held_rate_limit_services", default=frozenset())
+
+_RETRY_AFTER_PATTERN = re.compile(r"retry[- ]after[:= ]+(\d+(?:\.\d+)?)", re.IGNORECASE)
+
+
+class RateLimitSignal(Enum):
+    """Feedback from a completed request, used to adapt a service's rate."""
+    SUCCESS = "success"
+    THROTTLED = "throttled"
+
+
+def _config_value(config: Optional[Any], key_path: str) -> Any:
+    """
+    Look up a dotted key in either a Config object or a plain dict (e.g. loaded YAML).
+    
+    Returns None if the key is missing or config is None.
+    """
+    if config is None:
+        return None
+    
+    value = config.get(key_path) if hasattr(config, "get") else None
+    if value is not None or not isinstance(config, dict):
+        return value
+    
+    # Plain dicts don't understand dotted paths - walk them manually
+    value = config
+    for part in key_path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
 @dataclass
 class RateLimitConfig:
     """Configuration for a rate limit service."""
     rate: float  # requests per second
     burst: int   # maximum burst size
+    min_rate: Optional[float] = None  # adaptive floor (None = adaptive default)
+    max_rate: Optional[float] = None  # adaptive ceiling (None = configured rate)
     
     def __post_init__(self):
         """Validate rate limit configuration with fail-fast principles."""
@@ -43,17 +119,57 @@ class RateLimitConfig:
                 f"RATE_LIMIT CONFIG ERROR: burst must be at least 1. "
                 f"Got: {self.burst}"
             )
+        
+        for name in ("min_rate", "max_rate"):
+            value = getattr(self, name)
+            if value is not None and (not isinstance(value, (int, float)) or value <= 0):
+                raise ValueError(
+                    f"RATE_LIMIT CONFIG ERROR: {name} must be positive number. "
+                    f"Got: {value} (type: {type(value)})"
+                )
+        
+        if self.min_rate is not None and self.max_rate is not None and self.min_rate > self.max_rate:
+            raise ValueError(
+                f"RATE_LIMIT CONFIG ERROR: min_rate ({self.min_rate}) cannot exceed "
+                f"max_rate ({self.max_rate})"
+            )
+
+
+class _Waiter:
+    """A parked request in a TokenBucket's FIFO queue (thread or asyncio task)."""
+    
+    __slots__ = ("tokens", "condition", "loop", "event")
+    
+    def __init__(self, tokens: int, condition: Optional[threading.Condition] = None,
+                 loop: Optional[asyncio.AbstractEventLoop] = None,
+                 event: Optional[asyncio.Event] = None):
+        self.tokens = tokens
+        self.condition = condition
+        self.loop = loop
+        self.event = event
+    
+    def wake(self):
+        """Wake this waiter (caller must hold the bucket lock)."""
+        if self.condition is not None:
+            self.condition.notify()
+        else:
+            self.loop.call_soon_threadsafe(self.event.set)
 
 
 class TokenBucket:
     """
-    Token bucket rate limiter with burst support.
+    Token bucket rate limiter with burst support and FIFO waiters.
     
     Implements a token bucket algorithm where:
     - Tokens are added at a steady rate (rate per second)
     - Up to 'burst' tokens can be stored
     - Each request consumes one token
     - Requests block if no tokens available
+    
+    Blocked requests are parked in arrival order, each on its own condition
+    (threads) or event (asyncio tasks). Only the head of the queue sleeps on a
+    timer; everyone else sleeps until woken, and each grant or timeout wakes
+    exactly the next waiter. This avoids thundering herds and starvation.
     """
     
     def __init__(self, rate: float, burst: int):
@@ -72,8 +188,9 @@ class TokenBucket:
         self.rate = float(rate)
         self.burst = int(burst)
         self.tokens = float(burst)  # Start with full bucket
-        self.last_update = time.time()
-        self.lock = threading.RLock()  # Thread-safe operations
+        self.last_update = time.monotonic()
+        self.lock = threading.Lock()  # Shared by all waiter conditions
+        self._waiters: Deque[_Waiter] = deque()
         
         logger.debug(f"TokenBucket initialized: rate={self.rate}/sec, burst={self.burst}")
     
@@ -81,6 +198,9 @@ class TokenBucket:
         """
         Acquire tokens from bucket (non-blocking).
         
+        Never jumps ahead of parked waiters, so a burst of non-blocking callers
+        cannot starve blocked ones.
+        
         Args:
             tokens: Number of tokens to acquire
             
@@ -88,19 +208,17 @@ class TokenBucket:
             True if tokens acquired, False if insufficient tokens
         """
         with self.lock:
-            self._add_tokens()
-            
-            if self.tokens >= tokens:
-                self.tokens -= tokens
+            if not self._waiters and self._consume(tokens) == 0.0:
                 logger.debug(f"Acquired {tokens} tokens, {self.tokens:.1f} remaining")
                 return True
             else:
-                logger.debug(f"Insufficient tokens: need {tokens}, have {self.tokens:.1f}")
+                logger.debug(f"Insufficient tokens: need {tokens}, have {self.tokens:.1f}, "
+                             f"{len(self._waiters)} waiting")
                 return False
     
     def wait_for_tokens(self, tokens: int = 1, timeout: float = 60.0) -> bool:
         """
-        Wait for tokens to become available (blocking).
+        Wait for tokens to become available (blocking, FIFO).
         
         Args:
             tokens: Number of tokens needed
@@ -109,28 +227,204 @@ class TokenBucket:
         Returns:
             True if tokens acquired, False if timeout
         """
-        start_time = time.time()
+        self._validate_request(tokens)
+        deadline = time.monotonic() + timeout
         
-        while time.time() - start_time < timeout:
-            if self.acquire(tokens):
+        with self.lock:
+            if self._take_if_first(tokens):
                 return True
             
-            # Calculate how long to wait for next token
-            with self.lock:
-                if self.tokens < tokens:
-                    tokens_needed = tokens - self.tokens
-                    wait_time = tokens_needed / self.rate
-                    wait_time = min(wait_time, 1.0)  # Don't wait more than 1 second at a time
+            waiter = _Waiter(tokens, condition=threading.Condition(self.lock))
+            self._waiters.append(waiter)
+            
+            try:
+                while True:
+                    wait_time = self._grant_or_wait_time(waiter)
+                    if wait_time is None:
+                        return True
                     
-                    logger.debug(f"Waiting {wait_time:.2f}s for {tokens_needed:.1f} tokens")
-                    time.sleep(wait_time)
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        logger.warning(f"Timeout waiting for {tokens} tokens after {timeout}s")
+                        return False
+                    
+                    waiter.condition.wait(min(wait_time, remaining))
+            finally:
+                # No-op once granted; on timeout or any exception (e.g. a
+                # KeyboardInterrupt mid-wait) a dead waiter would stall the FIFO
+                self._remove_waiter(waiter)
+    
+    async def acquire_async(self, tokens: int = 1, timeout: float = 60.0) -> bool:
+        """
+        Wait for tokens without blocking the event loop (FIFO with threads).
+        
+        Async callers share the same queue as blocking callers, so mixing an
+        asyncio pipeline with worker threads keeps a single fair order.
         
-        logger.warning(f"Timeout waiting for {tokens} tokens after {timeout}s")
-        return False
+        Args:
+            tokens: Number of tokens needed
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            True if tokens acquired, False if timeout
+        """
+        self._validate_request(tokens)
+        deadline = time.monotonic() + timeout
+        
+        with self.lock:
+            if self._take_if_first(tokens):
+                return True
+            
+            waiter = _Waiter(tokens, loop=asyncio.get_running_loop(), event=asyncio.Event())
+            self._waiters.append(waiter)
+        
+        try:
+            while True:
+                with self.lock:
+                    wait_time = self._grant_or_wait_time(waiter)
+                    if wait_time is None:
+                        return True
+                    
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        logger.warning(f"Timeout waiting for {tokens} tokens after {timeout}s")
+                        return False
+                    
+                    waiter.event.clear()
+                
+                try:
+                    await asyncio.wait_for(waiter.event.wait(), min(wait_time, remaining))
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            # Covers cancellation as well as timeouts; a no-op once granted
+            with self.lock:
+                self._remove_waiter(waiter)
+    
+    def set_rate(self, rate: float):
+        """
+        Change the refill rate in place (used by adaptive rate limiting).
+        
+        Tokens accrued so far are settled at the old rate first, and the head
+        waiter is woken so it recomputes its sleep at the new rate.
+        """
+        if rate <= 0:
+            raise ValueError(f"Token bucket rate must be positive, got: {rate}")
+        
+        with self.lock:
+            self._available_tokens()
+            self.rate = float(rate)
+            self._wake_next()
+    
+    def hold_off(self, seconds: float):
+        """
+        Block new grants for the given number of seconds (e.g. a Retry-After).
+        
+        Implemented as token debt: the bucket is drained so the normal refill
+        reaches one token exactly when the hold-off expires, and queued waiters
+        keep their FIFO order.
+        """
+        if seconds <= 0:
+            return
+        
+        with self.lock:
+            target = 1.0 - seconds * self.rate
+            available = self._available_tokens()
+            if available > target:
+                self._debit(available - target)
+            self._wake_next()
+    
+    def charge(self, tokens: float):
+        """
+        Take tokens after the fact, going into debt if needed.
+        
+        Used for budgets whose cost is only known once the work is done (e.g.
+        bytes transferred): later requests wait until the debt is repaid.
+        """
+        if tokens <= 0:
+            return
+        
+        with self.lock:
+            self._debit(tokens)
+    
+    def _validate_request(self, tokens: int):
+        """Fail fast on requests that could never be satisfied."""
+        if tokens <= 0:
+            raise ValueError(f"Token request must be positive, got: {tokens}")
+        if tokens > self.burst:
+            raise ValueError(
+                f"RATE_LIMIT ERROR: Requested {tokens} tokens exceeds burst capacity {self.burst}. "
+                f"This request could never be satisfied."
+            )
+    
+    def _take_if_first(self, tokens: int) -> bool:
+        """Take tokens immediately if nobody is queued (caller holds lock)."""
+        return not self._waiters and self._consume(tokens) == 0.0
+    
+    def _grant_or_wait_time(self, waiter: _Waiter) -> Optional[float]:
+        """
+        Grant tokens to waiter if it is at the head and tokens suffice (caller holds lock).
+        
+        Returns:
+            None if granted, otherwise how long the waiter should sleep
+            (infinite for waiters behind the head - they are woken explicitly).
+        """
+        if self._waiters[0] is not waiter:
+            return float("inf")
+        
+        wait_time = self._consume(waiter.tokens)
+        if wait_time == 0.0:
+            self._waiters.popleft()
+            self._wake_next()
+            return None
+        
+        return wait_time
+    
+    def _remove_waiter(self, waiter: _Waiter):
+        """Drop a waiter from the queue, handing the head slot on if needed (caller holds lock)."""
+        was_head = bool(self._waiters) and self._waiters[0] is waiter
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            return
+        if was_head:
+            self._wake_next()
+    
+    def _wake_next(self):
+        """Wake the new head of the queue, if any (caller holds lock)."""
+        if self._waiters:
+            self._waiters[0].wake()
+    
+    def _consume(self, tokens: int) -> float:
+        """
+        Refill, then take tokens if enough are available (caller holds lock).
+        
+        This is the single point where token state is read and written, so
+        alternative storage backends only need to override it and
+        _available_tokens().
+        
+        Returns:
+            0.0 if tokens were taken, otherwise seconds until they will be available
+        """
+        self._add_tokens()
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return 0.0
+        return (tokens - self.tokens) / self.rate
+    
+    def _available_tokens(self) -> float:
+        """Current token count after refill (caller holds lock)."""
+        self._add_tokens()
+        return self.tokens
+    
+    def _debit(self, tokens: float):
+        """Take tokens unconditionally, allowing the count to go negative (caller holds lock)."""
+        self._add_tokens()
+        self.tokens -= tokens
     
     def _add_tokens(self):
-        """Add tokens based on elapsed time (thread-safe)."""
-        now = time.time()
+        """Add tokens based on elapsed time (caller holds lock)."""
+        now = time.monotonic()
         elapsed = now - self.last_update
         self.last_update = now
         
@@ -141,21 +435,200 @@ class TokenBucket:
     def get_status(self) -> Dict[str, Any]:
         """Get current bucket status for monitoring."""
         with self.lock:
-            self._add_tokens()
+            tokens = self._available_tokens()
             return {
                 "rate": self.rate,
                 "burst": self.burst,
-                "tokens": round(self.tokens, 2),
-                "utilization": round((self.burst - self.tokens) / self.burst * 100, 1)
+                "tokens": round(tokens, 2),
+                "waiters": len(self._waiters),
+                "utilization": round((self.burst - tokens) / self.burst * 100, 1)
             }
 
 
+class _SharedStateStore:
+    """
+    One SQLite connection to the shared token table, serialised by a lock.
+    
+    A limiter hands the same store to every shared bucket it creates, so
+    thousands of per-channel or per-host buckets cost one file handle rather
+    than one connection each. Buckets hold their own lock before taking this
+    one, never the other way round.
+    """
+    
+    def __init__(self, db_path: Union[str, Path]):
+        self.db_path = Path(db_path)
+        self.lock = threading.Lock()
+        
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self.conn = sqlite3.connect(
+                str(self.db_path), timeout=30.0, isolation_level=None, check_same_thread=False
+            )
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS token_buckets ("
+                "service TEXT PRIMARY KEY, tokens REAL NOT NULL, last_update REAL NOT NULL, "
+                "rate REAL NOT NULL, burst INTEGER NOT NULL)"
+            )
+        except sqlite3.Error as e:
+            raise RuntimeError(
+                f"RATE_LIMIT ERROR: Cannot open shared rate limit state at {self.db_path}. Error: {e}"
+            ) from e
+    
+    def close(self):
+        """Close the shared state connection."""
+        with self.lock:
+            self.conn.close()
+
+
+class SharedTokenBucket(TokenBucket):
+    """
+    Token bucket whose tokens live in a SQLite row shared by every process on the host.
+    
+    Each refill-and-take runs inside a BEGIN IMMEDIATE transaction, so the
+    read-modify-write is atomic across processes. Waiters inside one process
+    still queue FIFO through TokenBucket; the head waiter re-reads the shared
+    row whenever it wakes, so tokens taken by other processes are respected.
+    
+    If the database becomes unavailable the bucket logs loudly and falls back
+    to in-process accounting rather than blocking work (fail-safely).
+    """
+    
+    def __init__(self, service: str, rate: float, burst: int,
+                 db_path: Optional[Union[str, Path]] = None,
+                 store: Optional[_SharedStateStore] = None):
+        """
+        Initialize shared token bucket with fail-fast validation.
+        
+        Args:
+            service: Service name (row key shared by all processes)
+            rate: Tokens added per second (requests per second)
+            burst: Maximum tokens that can be stored (burst limit)
+            db_path: SQLite file shared by all processes on this host
+            store: Connection shared with other buckets (opened from db_path if None)
+        """
+        super().__init__(rate, burst)
+        
+        if not service or not isinstance(service, str):
+            raise ValueError(f"Shared token bucket service must be non-empty string, got: {service}")
+        if store is None and db_path is None:
+            raise ValueError("Shared token bucket needs either a db_path or a store")
+        
+        self.service = service
+        self._owns_store = store is None
+        self._store = store if store is not None else _SharedStateStore(db_path)
+        self.db_path = self._store.db_path
+        
+        try:
+            with self._store.lock:
+                self._store.conn.execute(
+                    "INSERT OR IGNORE INTO token_buckets (service, tokens, last_update, rate, burst) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (self.service, float(self.burst), time.time(), self.rate, self.burst)
+                )
+        except sqlite3.Error as e:
+            raise RuntimeError(
+                f"RATE_LIMIT ERROR: Cannot open shared rate limit state at {self.db_path}. "
+                f"Service: {service}. Error: {e}"
+            ) from e
+        
+        logger.debug(f"SharedTokenBucket initialized: service={service}, db={self.db_path}")
+    
+    def _consume(self, tokens: int) -> float:
+        """Atomically refill and take tokens from the shared row (caller holds lock)."""
+        try:
+            return self._update_shared(tokens)
+        except sqlite3.Error as e:
+            logger.error(f"Shared rate limit state unavailable for {self.service} ({e}); "
+                         f"falling back to in-process accounting")
+            return super()._consume(tokens)
+    
+    def _available_tokens(self) -> float:
+        """Current shared token count after refill (caller holds lock)."""
+        try:
+            self._update_shared(0)
+        except sqlite3.Error as e:
+            logger.warning(f"Could not read shared rate limit state for {self.service}: {e}")
+            self._add_tokens()
+        return self.tokens
+    
+    def _debit(self, tokens: float):
+        """Take tokens from the shared row unconditionally (caller holds lock)."""
+        try:
+            self._update_shared(tokens, force=True)
+        except sqlite3.Error as e:
+            logger.error(f"Shared rate limit state unavailable for {self.service} ({e}); "
+                         f"hold-off applied to this process only")
+            super()._debit(tokens)
+    
+    def _update_shared(self, tokens: float, force: bool = False) -> float:
+        """
+        Refill-and-take inside one write transaction; mirrors the result locally.
+        
+        With force=True the tokens are taken even if that leaves a debt.
+        """
+        with self._store.lock:
+            conn = self._store.conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT tokens, last_update FROM token_buckets WHERE service = ?", (self.service,)
+                ).fetchone()
+                now = time.time()
+                
+                if row is None:
+                    available = float(self.burst)
+                else:
+                    elapsed = max(0.0, now - row[1])
+                    available = min(float(self.burst), row[0] + elapsed * self.rate)
+                
+                if force or available >= tokens:
+                    available -= tokens
+                    wait_time = 0.0
+                else:
+                    wait_time = (tokens - available) / self.rate
+                
+                conn.execute(
+                    "INSERT OR REPLACE INTO token_buckets (service, tokens, last_update, rate, burst) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (self.service, available, now, self.rate, self.burst)
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        
+        self.tokens = available
+        self.last_update = time.monotonic()
+        return wait_time
+    
+    def close(self):
+        """Close the shared state connection, unless it belongs to a limiter."""
+        if self._owns_store:
+            with self.lock:
+                self._store.close()
+
+
 class ServiceRateLimiter:
     """
     Per-service rate limiter with configuration integration.
     
     Manages rate limits for different services (youtube, google_drive, etc.)
     using token bucket algorithm with burst support.
+    
+    Requests made through wait_for_levels() acquire from a hierarchy of
+    buckets, widest first: global bytes/sec (charged after transfers via
+    record_transfer), per-host requests/sec, per-service requests/sec and
+    per-channel requests/sec. Levels not configured under
+    rate_limiting.hierarchy are skipped. The level a request waited longest
+    on is reported as binding and tallied in get_binding_report().
+    
+    When rate_limiting.adaptive is enabled, callers report how each request
+    went (record_feedback) and the service's refill rate is adjusted AIMD
+    style: halved (by decrease_factor) on throttling, nudged up by
+    increase_step after a streak of successes, always within the service's
+    [min_rate, max_rate]. Learned rates are persisted to a JSON state file so
+    the next run starts at the last known-safe rate instead of re-probing.
     """
     
     def __init__(self, config: Optional[Any] = None):
@@ -172,8 +645,95 @@ class ServiceRateLimiter:
         # Default rate limits (fail-safely)
         self.default_config = RateLimitConfig(rate=2.0, burst=5)
         
+        # Optional host-wide shared state so several processes draw from one bucket per service
+        self.shared_state_path: Optional[Path] = None
+        self._shared_store: Optional[_SharedStateStore] = None
+        shared_config = _config_value(config, "rate_limiting.shared_state") or {}
+        if shared_config.get("enabled", False):
+            self.shared_state_path = Path(shared_config.get("path", DEFAULT_SHARED_STATE_PATH))
+            logger.info(f"Rate limits shared across processes via {self.shared_state_path}")
+        
+        # Feedback-adaptive rates (disabled unless configured)
+        adaptive_config = _config_value(config, "rate_limiting.adaptive") or {}
+        self.adaptive_enabled = bool(adaptive_config.get("enabled", False))
+        self.adaptive_min_rate = float(adaptive_config.get("min_rate", 0.1))
+        self.decrease_factor = float(adaptive_config.get("decrease_factor", 0.5))
+        self.increase_step = float(adaptive_config.get("increase_step", 0.1))
+        self.success_threshold = int(adaptive_config.get("success_threshold", 20))
+        self.throttle_cooldown = float(adaptive_config.get("throttle_cooldown", 5.0))
+        self.adaptive_state_path = Path(adaptive_config.get("state_path", DEFAULT_ADAPTIVE_STATE_PATH))
+        
+        if not 0 < self.decrease_factor < 1:
+            raise ValueError(
+                f"RATE_LIMIT CONFIG ERROR: adaptive.decrease_factor must be between 0 and 1. "
+                f"Got: {self.decrease_factor}"
+            )
+        if self.adaptive_min_rate <= 0 or self.increase_step <= 0 or self.success_threshold < 1:
+            raise ValueError(
+                f"RATE_LIMIT CONFIG ERROR: adaptive min_rate and increase_step must be positive "
+                f"and success_threshold at least 1. Got: min_rate={self.adaptive_min_rate}, "
+                f"increase_step={self.increase_step}, success_threshold={self.success_threshold}"
+            )
+        
+        # Hierarchical levels around the per-service buckets (all optional)
+        hierarchy_config = _config_value(config, "rate_limiting.hierarchy") or {}
+        self.channel_config = self._scope_config(hierarchy_config.get("per_channel"))
+        self.host_config = self._scope_config(hierarchy_config.get("per_host"))
+        self.scoped_buckets: "OrderedDict[Tuple[str, str], TokenBucket]" = OrderedDict()
+        self._scoped_last_used: Dict[Tuple[str, str], float] = {}
+        self.max_scoped_buckets = int(hierarchy_config.get("max_scoped_buckets", 1024))
+        self.scoped_idle_seconds = float(hierarchy_config.get("scoped_idle_seconds", 600.0))
+        if self.max_scoped_buckets < 1 or self.scoped_idle_seconds <= 0:
+            raise ValueError(
+                f"RATE_LIMIT CONFIG ERROR: hierarchy.max_scoped_buckets must be at least 1 and "
+                f"scoped_idle_seconds positive. Got: max_scoped_buckets={self.max_scoped_buckets}, "
+                f"scoped_idle_seconds={self.scoped_idle_seconds}"
+            )
+        self.binding_stats: Dict[str, Dict[str, float]] = {}
+        
+        self.global_bytes_bucket: Optional[TokenBucket] = None
+        bytes_per_second = hierarchy_config.get("global_bytes_per_second") or 0
+        if bytes_per_second:
+            bytes_config = RateLimitConfig(
+                rate=float(bytes_per_second),
+                burst=int(hierarchy_config.get("global_bytes_burst", bytes_per_second))
+            )
+            self.global_bytes_bucket = self._create_bucket(LEVEL_GLOBAL_BYTES, bytes_config.rate, bytes_config.burst)
+            logger.info(f"Global transfer budget: {bytes_config.rate / 1048576:.1f} MB/sec")
+        
+        self.learned_rates: Dict[str, float] = {}
+        self._success_streaks: Dict[str, int] = {}
+        self._last_decrease: Dict[str, float] = {}
+        if self.adaptive_enabled:
+            self.learned_rates = self._load_learned_rates()
+            logger.info(f"Adaptive rate limiting enabled (state: {self.adaptive_state_path}, "
+                        f"{len(self.learned_rates)} learned rates loaded)")
+        
         logger.info("ServiceRateLimiter initialized with configuration integration")
     
+    @staticmethod
+    def _scope_config(section: Optional[Dict[str, Any]]) -> Optional[RateLimitConfig]:
+        """Validated config for an optional hierarchy level (None = level disabled)."""
+        if not section:
+            return None
+        return RateLimitConfig(rate=section.get("rate"), burst=section.get("burst"))
+    
+    def _create_bucket(self, key: str, rate: float, burst: int) -> TokenBucket:
+        """Create a bucket on the configured backend (per-process or host-wide)."""
+        if self.shared_state_path:
+            with self.lock:
+                if self._shared_store is None:
+                    self._shared_store = _SharedStateStore(self.shared_state_path)
+            return SharedTokenBucket(key, rate, burst, store=self._shared_store)
+        return TokenBucket(rate, burst)
+    
+    def close(self):
+        """Close the shared state connection used by this limiter's buckets."""
+        with self.lock:
+            if self._shared_store is not None:
+                self._shared_store.close()
+                self._shared_store = None
+    
     def get_service_config(self, service: str) -> RateLimitConfig:
         """
         Get rate limit configuration for a service with fail-safe fallbacks.
@@ -187,13 +747,17 @@ class ServiceRateLimiter:
         try:
             if self.config:
                 # Try to get service-specific configuration
-                service_config = self.config.get(f"rate_limiting.services.{service}")
+                service_config = _config_value(self.config, f"rate_limiting.services.{service}")
                 if service_config:
                     rate = service_config.get("rate", self.default_config.rate)
                     burst = service_config.get("burst", self.default_config.burst)
                     
                     # Validate and return configuration
-                    config = RateLimitConfig(rate=rate, burst=burst)
+                    config = RateLimitConfig(
+                        rate=rate, burst=burst,
+                        min_rate=service_config.get("min_rate"),
+                        max_rate=service_config.get("max_rate")
+                    )
                     logger.debug(f"Loaded config for {service}: rate={rate}/sec, burst={burst}")
                     return config
             
@@ -219,8 +783,14 @@ class ServiceRateLimiter:
         with self.lock:
             if service not in self.buckets:
                 config = self.get_service_config(service)
-                self.buckets[service] = TokenBucket(config.rate, config.burst)
-                logger.info(f"Created token bucket for {service}: {config.rate}/sec, burst={config.burst}")
+                rate = config.rate
+                if service in self.learned_rates:
+                    rate = self._clamp_rate(service, self.learned_rates[service])
+                    logger.info(f"Resuming learned rate for {service}: {rate}/sec "
+                                f"(configured {config.rate}/sec)")
+                
+                self.buckets[service] = self._create_bucket(service, rate, config.burst)
+                logger.info(f"Created token bucket for {service}: {rate}/sec, burst={config.burst}")
             
             return self.buckets[service]
     
@@ -234,6 +804,258 @@ class ServiceRateLimiter:
         bucket = self.get_bucket(service)
         return bucket.wait_for_tokens(tokens, timeout)
     
+    async def wait_for_rate_limit_async(self, service: str, tokens: int = 1, timeout: float = 60.0) -> bool:
+        """Wait for rate limit availability without blocking the event loop."""
+        bucket = self.get_bucket(service)
+        return await bucket.acquire_async(tokens, timeout)
+    
+    def _scoped_bucket(self, level: str, key: str, config: RateLimitConfig) -> TokenBucket:
+        """Get or create the bucket for one host or channel."""
+        scope = (level, key)
+        with self.lock:
+            bucket = self.scoped_buckets.get(scope)
+            if bucket is None:
+                bucket = self._create_bucket(f"{level}:{key}", config.rate, config.burst)
+                self.scoped_buckets[scope] = bucket
+            else:
+                self.scoped_buckets.move_to_end(scope)
+            
+            now = time.monotonic()
+            self._scoped_last_used[scope] = now
+            self._evict_scoped_buckets(now)
+            return bucket
+    
+    def _evict_scoped_buckets(self, now: float):
+        """
+        Drop least recently used host/channel buckets (caller holds lock).
+        
+        A bucket goes once the map is over max_scoped_buckets or it has not
+        been used for scoped_idle_seconds - by then an in-process bucket has
+        refilled, and a shared one keeps its row in SQLite, so nothing is lost.
+        Buckets with parked waiters are never dropped.
+        """
+        for scope in list(self.scoped_buckets):
+            over_capacity = len(self.scoped_buckets) > self.max_scoped_buckets
+            idle = now - self._scoped_last_used[scope] > self.scoped_idle_seconds
+            if not (over_capacity or idle):
+                break
+            if self.scoped_buckets[scope]._waiters:
+                continue
+            del self.scoped_buckets[scope]
+            del self._scoped_last_used[scope]
+    
+    def get_levels(self, service: str, channel: Optional[str] = None,
+                   host: Optional[str] = None) -> List[Tuple[str, TokenBucket, int]]:
+        """
+        Buckets a request must acquire from, widest scope first.
+        
+        Returns:
+            List of (level name, bucket, tokens to take) tuples
+        """
+        levels = []
+        if self.global_bytes_bucket is not None:
+            # Bytes are charged after the transfer; before it we only wait out any debt
+            levels.append((LEVEL_GLOBAL_BYTES, self.global_bytes_bucket, 1))
+        if host and self.host_config:
+            host = host.lower()
+            if host.startswith("www."):
+                host = host[4:]
+            levels.append((LEVEL_HOST, self._scoped_bucket(LEVEL_HOST, host, self.host_config), 1))
+        levels.append((LEVEL_SERVICE, self.get_bucket(service), 1))
+        if channel and self.channel_config:
+            levels.append((LEVEL_CHANNEL, self._scoped_bucket(LEVEL_CHANNEL, channel, self.channel_config), 1))
+        return levels
+    
+    def wait_for_levels(self, service: str, tokens: int = 1, timeout: float = 60.0,
+                        channel: Optional[str] = None, host: Optional[str] = None) -> Tuple[bool, Optional[str]]:
+        """
+        Acquire at every level of the hierarchy (blocking).
+        
+        Args:
+            service: Service name
+            tokens: Tokens to take at the service level
+            timeout: Maximum total time to wait in seconds
+            channel: Channel the request is for (per-channel level)
+            host: Remote host the request goes to (per-host level)
+            
+        Returns:
+            (acquired, binding level) - the binding level is the one waited on
+            longest (None if nothing waited) or the one that timed out
+        """
+        deadline = time.monotonic() + timeout
+        waits: Dict[str, float] = {}
+        
+        for level, bucket, level_tokens in self.get_levels(service, channel, host):
+            level_tokens = tokens if level == LEVEL_SERVICE else level_tokens
+            start = time.monotonic()
+            acquired = bucket.wait_for_tokens(level_tokens, max(0.0, deadline - start))
+            waits[level] = time.monotonic() - start
+            if not acquired:
+                self._note_binding({level: waits[level]}, service)
+                return False, level
+        
+        return True, self._note_binding(waits, service)
+    
+    async def wait_for_levels_async(self, service: str, tokens: int = 1, timeout: float = 60.0,
+                                    channel: Optional[str] = None,
+                                    host: Optional[str] = None) -> Tuple[bool, Optional[str]]:
+        """Acquire at every level of the hierarchy without blocking the event loop."""
+        deadline = time.monotonic() + timeout
+        waits: Dict[str, float] = {}
+        
+        for level, bucket, level_tokens in self.get_levels(service, channel, host):
+            level_tokens = tokens if level == LEVEL_SERVICE else level_tokens
+            start = time.monotonic()
+            acquired = await bucket.acquire_async(level_tokens, max(0.0, deadline - start))
+            waits[level] = time.monotonic() - start
+            if not acquired:
+                self._note_binding({level: waits[level]}, service)
+                return False, level
+        
+        return True, self._note_binding(waits, service)
+    
+    def _note_binding(self, waits: Dict[str, float], service: str) -> Optional[str]:
+        """Record which level held a request back the longest."""
+        if not waits:
+            return None
+        
+        level, waited = max(waits.items(), key=lambda item: item[1])
+        if waited < _BINDING_MIN_WAIT:
+            return None
+        
+        with self.lock:
+            stats = self.binding_stats.setdefault(level, {"count": 0, "wait_seconds": 0.0})
+            stats["count"] += 1
+            stats["wait_seconds"] += waited
+        
+        logger.debug(f"Rate limit for {service} bound by {level} level ({waited:.3f}s wait)")
+        return level
+    
+    def record_transfer(self, nbytes: int):
+        """Charge transferred bytes against the global bytes/sec budget."""
+        if self.global_bytes_bucket is not None and nbytes:
+            self.global_bytes_bucket.charge(nbytes)
+    
+    def get_binding_report(self) -> Dict[str, Dict[str, float]]:
+        """How often each level was binding and how long requests waited on it."""
+        with self.lock:
+            return {
+                level: {
+                    "count": int(stats["count"]),
+                    "wait_seconds": round(stats["wait_seconds"], 3),
+                    "avg_wait_seconds": round(stats["wait_seconds"] / stats["count"], 3)
+                }
+                for level, stats in self.binding_stats.items()
+            }
+    
+    def get_rate_bounds(self, service: str) -> Tuple[float, float]:
+        """Adaptive (floor, ceiling) for a service's rate."""
+        config = self.get_service_config(service)
+        ceiling = config.max_rate if config.max_rate is not None else config.rate
+        floor = config.min_rate if config.min_rate is not None else min(self.adaptive_min_rate, ceiling)
+        return floor, ceiling
+    
+    def _clamp_rate(self, service: str, rate: float) -> float:
+        floor, ceiling = self.get_rate_bounds(service)
+        return max(floor, min(ceiling, rate))
+    
+    def record_feedback(self, service: str, signal: RateLimitSignal,
+                        retry_after: Optional[float] = None) -> float:
+        """
+        Adapt a service's rate from the outcome of a request.
+        
+        Args:
+            service: Service name
+            signal: SUCCESS or THROTTLED
+            retry_after: Seconds the server asked us to back off (THROTTLED only)
+            
+        Returns:
+            The service's refill rate after applying the feedback
+        """
+        if not isinstance(signal, RateLimitSignal):
+            raise ValueError(
+                f"RATE_LIMIT ERROR: signal must be a RateLimitSignal. "
+                f"Got: {signal} (type: {type(signal)})"
+            )
+        
+        bucket = self.get_bucket(service)
+        if not self.adaptive_enabled:
+            return bucket.rate
+        
+        with self.lock:
+            old_rate = bucket.rate
+            new_rate = old_rate
+            
+            if signal is RateLimitSignal.THROTTLED:
+                self._success_streaks[service] = 0
+                now = time.monotonic()
+                # Requests already in flight report the same throttling event;
+                # only the first report within the cooldown cuts the rate.
+                if now - self._last_decrease.get(service, float("-inf")) >= self.throttle_cooldown:
+                    self._last_decrease[service] = now
+                    new_rate = self._clamp_rate(service, old_rate * self.decrease_factor)
+            else:
+                streak = self._success_streaks.get(service, 0) + 1
+                if streak >= self.success_threshold:
+                    streak = 0
+                    new_rate = self._clamp_rate(service, old_rate + self.increase_step)
+                self._success_streaks[service] = streak
+            
+            if new_rate != old_rate:
+                bucket.set_rate(new_rate)
+                self.learned_rates[service] = new_rate
+                self._save_learned_rates()
+                log = logger.warning if new_rate < old_rate else logger.info
+                log(f"Adaptive rate for {service}: {old_rate:.3f}/sec -> {new_rate:.3f}/sec "
+                    f"({signal.value})")
+        
+        if signal is RateLimitSignal.THROTTLED and retry_after:
+            logger.warning(f"{service} asked us to retry after {retry_after}s; holding off")
+            bucket.hold_off(retry_after)
+        
+        return new_rate
+    
+    def _load_learned_rates(self) -> Dict[str, float]:
+        """Read persisted learned rates (fail-safely: bad state means start from config)."""
+        try:
+            with open(self.adaptive_state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            return {
+                service: float(entry["rate"])
+                for service, entry in state.get("services", {}).items()
+                if float(entry["rate"]) > 0
+            }
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable adaptive rate state {self.adaptive_state_path}: {e}")
+            return {}
+    
+    def _save_learned_rates(self):
+        """Atomically persist learned rates (caller holds lock)."""
+        timestamp = datetime.now().isoformat()
+        state = {
+            "services": {
+                service: {"rate": rate, "updated_at": timestamp}
+                for service, rate in self.learned_rates.items()
+            }
+        }
+        
+        try:
+            self.adaptive_state_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(
+                dir=str(self.adaptive_state_path.parent), prefix=".rate_limit_state_", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(state, f, indent=2)
+                os.replace(temp_path, self.adaptive_state_path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except OSError as e:
+            logger.error(f"Failed to persist adaptive rate state to {self.adaptive_state_path}: {e}")
+    
     def get_status(self) -> Dict[str, Dict[str, Any]]:
         """Get status of all service rate limiters."""
         status = {}
@@ -267,7 +1089,75 @@ def get_rate_limiter() -> ServiceRateLimiter:
         return _service_rate_limiter
 
 
-def rate_limit(service: str, tokens: int = 1, timeout: float = 60.0):
+def _rate_limit_timeout_error(service: str, tokens: int, timeout: float,
+                              level: Optional[str] = None) -> RuntimeError:
+    return RuntimeError(
+        f"RATE_LIMIT ERROR: Timeout waiting for rate limit after {timeout}s. "
+        f"Service: {service}, tokens: {tokens}, binding level: {level or 'unknown'}. "
+        f"This indicates the service may be overloaded or misconfigured."
+    )
+
+
+@contextmanager
+def rate_limited(service: str, tokens: int = 1, timeout: float = 60.0,
+                 channel: Optional[str] = None, host: Optional[str] = None):
+    """
+    Hold a hierarchical rate limit grant for the duration of a block.
+    
+    Rate-limited calls for the same service nested inside the block (e.g. a
+    @rate_limit helper called from an entry point that already acquired) do
+    not take tokens a second time.
+    
+    Usage:
+        with rate_limited("youtube", channel=channel_url, host="youtube.com") as binding:
+            download(...)
+    
+    Yields:
+        The binding level name, or None if the request did not wait
+        
+    Raises:
+        RuntimeError: If tokens are not available within timeout
+    """
+    held = _held_services.get()
+    if service in held:
+        yield None
+        return
+    
+    acquired, binding = get_rate_limiter().wait_for_levels(service, tokens, timeout, channel, host)
+    if not acquired:
+        raise _rate_limit_timeout_error(service, tokens, timeout, binding)
+    
+    context_token = _held_services.set(held | {service})
+    try:
+        yield binding
+    finally:
+        _held_services.reset(context_token)
+
+
+def _scope_resolver(func, channel_arg: Optional[str], host: Optional[str]):
+    """Build a function mapping call arguments to (channel, host) for rate_limit."""
+    if channel_arg is None:
+        return lambda args, kwargs: (None, host)
+    
+    signature = inspect.signature(func)
+    if channel_arg not in signature.parameters:
+        raise ValueError(
+            f"RATE_LIMIT CONFIG ERROR: channel_arg '{channel_arg}' is not a parameter "
+            f"of {func.__name__}{signature}"
+        )
+    
+    def resolve(args, kwargs):
+        channel = signature.bind_partial(*args, **kwargs).arguments.get(channel_arg)
+        channel_host = host
+        if channel_host is None and isinstance(channel, str):
+            channel_host = urlparse(channel).hostname
+        return channel, channel_host
+    
+    return resolve
+
+
+def rate_limit(service: str, tokens: int = 1, timeout: float = 60.0,
+               channel_arg: Optional[str] = None, host: Optional[str] = None):
     """
     Rate limiting decorator with burst support and token bucket algorithm.
     
@@ -275,52 +1165,144 @@ def rate_limit(service: str, tokens: int = 1, timeout: float = 60.0):
         service: Service name for rate limiting
         tokens: Number of tokens to consume
         timeout: Maximum time to wait for tokens
+        channel_arg: Name of the argument holding the channel (per-channel
+            level; its URL host is used for the per-host level unless host is given)
+        host: Remote host for the per-host level
         
     Usage:
         @rate_limit("youtube")
         def download_video():
             pass
+        
+        @rate_limit("youtube", channel_arg="channel_url")
+        def enumerate_channel(channel_url):
+            pass
+        
+        @rate_limit("youtube")
+        async def fetch_metadata():
+            pass
     """
     def decorator(func):
+        resolve_scope = _scope_resolver(func, channel_arg, host)
+        
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                held = _held_services.get()
+                if service in held:
+                    return await func(*args, **kwargs)
+                
+                channel, request_host = resolve_scope(args, kwargs)
+                rate_limiter = get_rate_limiter()
+                acquired, binding = await rate_limiter.wait_for_levels_async(
+                    service, tokens, timeout, channel, request_host
+                )
+                if not acquired:
+                    raise _rate_limit_timeout_error(service, tokens, timeout, binding)
+                
+                logger.debug(f"Rate limit acquired for {service}")
+                context_token = _held_services.set(held | {service})
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    _held_services.reset(context_token)
+            
+            return async_wrapper
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
-            rate_limiter = get_rate_limiter()
-            
-            # Try non-blocking acquire first for burst scenarios
-            if rate_limiter.acquire(service, tokens):
-                logger.debug(f"Burst token acquired for {service}")
-                return func(*args, **kwargs)
-            
-            # Wait for tokens if burst not available
-            logger.debug(f"Waiting for rate limit: {service} ({tokens} tokens)")
-            if rate_limiter.wait_for_rate_limit(service, tokens, timeout):
-                logger.debug(f"Rate limit acquired for {service}")
+            channel, request_host = resolve_scope(args, kwargs)
+            with rate_limited(service, tokens, timeout, channel, request_host):
                 return func(*args, **kwargs)
-            else:
-                raise RuntimeError(
-                    f"RATE_LIMIT ERROR: Timeout waiting for rate limit after {timeout}s. "
-                    f"Service: {service}, tokens: {tokens}. "
-                    f"This indicates the service may be overloaded or misconfigured."
-                )
         
         return wrapper
     return decorator
 
 
-def wait_for_rate_limit(service: str, tokens: int = 1, timeout: float = 60.0) -> bool:
+def wait_for_rate_limit(service: str, tokens: int = 1, timeout: float = 60.0,
+                        channel: Optional[str] = None, host: Optional[str] = None) -> bool:
     """
-    Wait for rate limit availability (function interface).
+    Wait for rate limit availability at every level (function interface).
     
     Args:
         service: Service name
         tokens: Number of tokens needed
         timeout: Maximum wait time
+        channel: Channel the request is for (per-channel level)
+        host: Remote host the request goes to (per-host level)
         
     Returns:
         True if tokens acquired, False if timeout
     """
     rate_limiter = get_rate_limiter()
-    return rate_limiter.wait_for_rate_limit(service, tokens, timeout)
+    acquired, _ = rate_limiter.wait_for_levels(service, tokens, timeout, channel, host)
+    return acquired
+
+
+async def wait_for_rate_limit_async(service: str, tokens: int = 1, timeout: float = 60.0,
+                                    channel: Optional[str] = None, host: Optional[str] = None) -> bool:
+    """
+    Wait for rate limit availability from asyncio code (function interface).
+    
+    Args:
+        service: Service name
+        tokens: Number of tokens needed
+        timeout: Maximum wait time
+        channel: Channel the request is for (per-channel level)
+        host: Remote host the request goes to (per-host level)
+        
+    Returns:
+        True if tokens acquired, False if timeout
+    """
+    rate_limiter = get_rate_limiter()
+    acquired, _ = await rate_limiter.wait_for_levels_async(service, tokens, timeout, channel, host)
+    return acquired
+
+
+def record_transfer(nbytes: int):
+    """Charge transferred bytes against the global bytes/sec budget (function interface)."""
+    get_rate_limiter().record_transfer(nbytes)
+
+
+def get_rate_limit_binding_report() -> Dict[str, Dict[str, float]]:
+    """Which hierarchy levels have been binding, for monitoring."""
+    return get_rate_limiter().get_binding_report()
+
+
+def classify_rate_limit_response(error_text: Optional[str]) -> Tuple[Optional[RateLimitSignal], Optional[float]]:
+    """
+    Classify a request outcome from its error text (e.g. yt-dlp stderr).
+    
+    Returns:
+        (SUCCESS, None) for an empty error, (THROTTLED, retry_after) when the
+        text looks like throttling, or (None, None) for unrelated failures
+        (private video, bad URL...) which say nothing about our rate.
+    """
+    if not error_text or not error_text.strip():
+        return RateLimitSignal.SUCCESS, None
+    
+    lowered = error_text.lower()
+    if not any(marker in lowered for marker in THROTTLE_MARKERS):
+        return None, None
+    
+    match = _RETRY_AFTER_PATTERN.search(error_text)
+    return RateLimitSignal.THROTTLED, float(match.group(1)) if match else None
+
+
+def report_rate_limit_feedback(service: str, signal: Optional[RateLimitSignal],
+                               retry_after: Optional[float] = None) -> Optional[float]:
+    """
+    Report a request outcome to the global limiter (function interface).
+    
+    A None signal (unclassified failure) is ignored.
+    
+    Returns:
+        The service's rate after the feedback, or None if nothing was recorded
+    """
+    if signal is None:
+        return None
+    rate_limiter = get_rate_limiter()
+    return rate_limiter.record_feedback(service, signal, retry_after)
 
 
 def get_rate_limit_status() -> Dict[str, Dict[str, Any]]:
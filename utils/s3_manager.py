@@ -32,12 +32,14 @@ try:
     from .sanitization import sanitize_error_message
     from .database_manager import get_database_manager
     from .yt_dlp_updater import ensure_yt_dlp_updated, get_yt_dlp_command
+    from .tracing import start_span
 except ImportError:
     from config import get_config, get_s3_bucket
     from logging_config import get_logger
     from sanitization import sanitize_error_message
     from database_manager import get_database_manager
     from yt_dlp_updater import ensure_yt_dlp_updated, get_yt_dlp_command
+    from tracing import start_span
 
 
 def get_s3_client(region_name: str = 'us-east-1') -> boto3.client:
@@ -259,12 +261,13 @@ class UnifiedS3Manager:
                     'original_filename': local_path.name
                 }
             
-            self.s3_client.upload_file(
-                str(local_path),
-                self.config.bucket_name,
-                s3_key,
-                ExtraArgs=extra_args
-            )
+            with start_span("s3.upload_file", s3_key=s3_key):
+                self.s3_client.upload_file(
+                    str(local_path),
+                    self.config.bucket_name,
+                    s3_key,
+                    ExtraArgs=extra_args
+                )
             
             upload_time = (datetime.now() - start_time).total_seconds()
             file_size = local_path.stat().st_size
@@ -298,6 +301,7 @@ class UnifiedS3Manager:
         sanitized_name = "".join(c for c in person_name if c.isalnum() or c in '-_')[:20]
         pipe_path = f"/tmp/youtube_{sanitized_name}_{os.getpid()}_{threading.get_ident()}"
         process = None
+        stream_span = start_span("s3.stream_youtube", s3_key=s3_key)
         
         try:
             # Ensure yt-dlp is updated to latest version (if enabled in config)
@@ -323,34 +327,35 @@ class UnifiedS3Manager:
             
             # Wait for process to actually start and begin writing
             self.logger.info("⏳ Waiting for yt-dlp to start writing to pipe...")
-            wait_attempts = 0
-            max_wait_attempts = 30  # 15 seconds max
-            
-            while wait_attempts < max_wait_attempts:
-                # Check if process died
-                if process.poll() is not None:
-                    stderr_output = process.stderr.read().decode()
-                    raise RuntimeError(f"yt-dlp process died before writing to pipe. Error: {stderr_output[:200]}")
+            with start_span("yt_dlp.start"):
+                wait_attempts = 0
+                max_wait_attempts = 30  # 15 seconds max
                 
-                # Check if pipe has data ready (non-blocking)
-                try:
-                    # Open pipe in non-blocking mode to test
-                    pipe_fd = os.open(pipe_path, os.O_RDONLY | os.O_NONBLOCK)
-                    ready, _, _ = select.select([pipe_fd], [], [], 0.1)  # 100ms timeout
-                    os.close(pipe_fd)
+                while wait_attempts < max_wait_attempts:
+                    # Check if process died
+                    if process.poll() is not None:
+                        stderr_output = process.stderr.read().decode()
+                        raise RuntimeError(f"yt-dlp process died before writing to pipe. Error: {stderr_output[:200]}")
                     
-                    if ready:
-                        self.logger.info("✅ PIPE_READY: yt-dlp started writing to pipe")
-                        break
-                except (OSError, BlockingIOError):
-                    # Pipe not ready yet, continue waiting
-                    pass
-                
-                time.sleep(0.5)
-                wait_attempts += 1
-                
-                if wait_attempts % 10 == 0:  # Log every 5 seconds
-                    self.logger.info(f"⏳ Still waiting for yt-dlp to start... ({wait_attempts/2:.1f}s)")
+                    # Check if pipe has data ready (non-blocking)
+                    try:
+                        # Open pipe in non-blocking mode to test
+                        pipe_fd = os.open(pipe_path, os.O_RDONLY | os.O_NONBLOCK)
+                        ready, _, _ = select.select([pipe_fd], [], [], 0.1)  # 100ms timeout
+                        os.close(pipe_fd)
+                        
+                        if ready:
+                            self.logger.info("✅ PIPE_READY: yt-dlp started writing to pipe")
+                            break
+                    except (OSError, BlockingIOError):
+                        # Pipe not ready yet, continue waiting
+                        pass
+                    
+                    time.sleep(0.5)
+                    wait_attempts += 1
+                    
+                    if wait_attempts % 10 == 0:  # Log every 5 seconds
+                        self.logger.info(f"⏳ Still waiting for yt-dlp to start... ({wait_attempts/2:.1f}s)")
             
             if wait_attempts >= max_wait_attempts:
                 raise TimeoutError(f"yt-dlp did not start writing to pipe within 15 seconds. URL may be invalid: {url}")
@@ -365,7 +370,7 @@ class UnifiedS3Manager:
                 try:
                     self.logger.info(f"📖 PIPE_OPEN_ATTEMPT: {pipe_path}")
                     
-                    with open(pipe_path, 'rb') as pipe_file:
+                    with start_span("s3.upload_fileobj", parent=stream_span), open(pipe_path, 'rb') as pipe_file:
                         self.logger.info("✅ PIPE_OPEN_SUCCESS: Starting S3 upload")
                         extra_args = {'ContentType': 'video/mp4'}
                         if self.config.add_metadata:
@@ -417,6 +422,8 @@ class UnifiedS3Manager:
                 stderr_output = process.stderr.read().decode() if process.stderr else ""
                 full_error = f"stdout: {stdout_output[:100]} stderr: {stderr_output[:100]}"
                 self.logger.error(f"❌ yt-dlp failed with return code {process.returncode}: {full_error}")
+                stream_span.set_attribute("returncode", process.returncode)
+                stream_span.end(status="error")
                 return UploadResult(
                     success=False,
                     s3_key=s3_key,
@@ -437,6 +444,7 @@ class UnifiedS3Manager:
                 pass  # Ignore cleanup errors
             
             self.logger.error(f"❌ PIPE_ERROR: {str(e)}")
+            stream_span.end(error=e)
             return UploadResult(
                 success=False,
                 s3_key=s3_key,
@@ -450,6 +458,7 @@ class UnifiedS3Manager:
                     os.remove(pipe_path)
             except Exception as cleanup_error:
                 self.logger.warning(f"⚠️ Pipe cleanup failed: {cleanup_error}")
+            stream_span.end()
     
     def stream_drive_to_s3(self, drive_id: str, s3_key: str) -> UploadResult:
         """Stream Drive file directly to S3"""
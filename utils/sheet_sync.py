@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Sheet Sync - Incremental download and change detection for the Google Sheet
+
+- SheetCache keeps the last downloaded sheet HTML with its ETag,
+  Last-Modified and content hash beside it, so step 1 can revalidate with a
+  conditional GET and tell an unchanged sheet from a changed one even when
+  the server re-sends identical content with new headers
+- SheetState remembers the last parse (keyed by the sheet's content hash)
+  and, per output CSV, which people's records are up to date. diff() keys
+  people by row_id so only new or changed people go through steps 3-6
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+try:
+    from .json_utils import read_json_safe, write_json_safe
+except ImportError:
+    from json_utils import read_json_safe, write_json_safe
+
+
+# Sheet fields that make up a person; a change to any of them re-processes the person
+PERSON_FIELDS = ('row_id', 'name', 'email', 'type', 'doc_link')
+
+
+def content_hash(text: str) -> str:
+    """sha256 of text"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def person_fingerprint(person: Dict[str, Any]) -> str:
+    """Hash of the sheet fields of one person"""
+    return content_hash(json.dumps([str(person.get(name, '')) for name in PERSON_FIELDS]))
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(temp_path, path)
+
+
+class SheetCache:
+    """Cached sheet HTML plus the validators needed to revalidate it"""
+
+    def __init__(self, cache_file: str):
+        self.cache_file = Path(cache_file)
+        self.meta_file = self.cache_file.with_suffix('.meta.json')
+        self.meta = read_json_safe(self.meta_file, {}) or {}
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since for the cached copy (none without one)"""
+        if not self.cache_file.exists():
+            return {}
+        headers = {}
+        if self.meta.get('etag'):
+            headers['If-None-Match'] = self.meta['etag']
+        if self.meta.get('last_modified'):
+            headers['If-Modified-Since'] = self.meta['last_modified']
+        return headers
+
+    def cached_html(self) -> Optional[str]:
+        """The cached sheet HTML, or None if there is no cache"""
+        try:
+            return self.cache_file.read_text(encoding='utf-8')
+        except FileNotFoundError:
+            return None
+
+    def is_unchanged(self, html_content: str) -> bool:
+        """True if html_content matches the cached copy"""
+        return self.cache_file.exists() and content_hash(html_content) == self.meta.get('sha256')
+
+    def store(self, html_content: str, headers: Optional[Dict[str, str]] = None) -> None:
+        """Cache html_content with the response's validators"""
+        headers = headers or {}
+        sha256 = content_hash(html_content)
+        if sha256 != self.meta.get('sha256') or not self.cache_file.exists():
+            _write_atomic(self.cache_file, html_content)
+        self.meta = {
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+            'sha256': sha256,
+            'checked_at': datetime.now().isoformat()
+        }
+        write_json_safe(self.meta_file, self.meta)
+
+
+@dataclass
+class SheetDiff:
+    """People of the current sheet split by what changed since the last run"""
+    new: List[Dict[str, Any]] = field(default_factory=list)
+    changed: List[Dict[str, Any]] = field(default_factory=list)
+    unchanged: List[Dict[str, Any]] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+
+    @property
+    def pending_ids(self) -> Set[str]:
+        """row_ids that need processing"""
+        return {person['row_id'] for person in self.new + self.changed}
+
+    @property
+    def unchanged_ids(self) -> Set[str]:
+        return {person['row_id'] for person in self.unchanged}
+
+
+class SheetState:
+    """
+    Last parse of the sheet and, per output CSV, the people it is current for.
+
+    A person is recorded for an output only once their record was written,
+    so people skipped by a test limit or a failed run count as pending next time.
+    """
+
+    def __init__(self, state_file: str):
+        self.state_file = Path(state_file)
+        self._state = read_json_safe(self.state_file, {}) or {}
+        self._state.setdefault('outputs', {})
+
+    def parsed_people(self, sheet_sha256: str) -> Optional[List[Dict[str, Any]]]:
+        """People parsed from a sheet with this content hash, if it was the last one parsed"""
+        if self._state.get('sheet_sha256') == sheet_sha256:
+            return [dict(person) for person in self._state.get('people', [])]
+        return None
+
+    def remember_parse(self, sheet_sha256: str, people: List[Dict[str, Any]]) -> None:
+        self._state['sheet_sha256'] = sheet_sha256
+        self._state['people'] = people
+
+    def diff(self, people: List[Dict[str, Any]], output_file: str, mode: str) -> SheetDiff:
+        """
+        Compare people with those already written to output_file in mode.
+
+        Everyone is new if the output does not exist or was written in another mode.
+        """
+        output = self._state['outputs'].get(str(output_file))
+        if not output or output.get('mode') != mode or not Path(output_file).exists():
+            return SheetDiff(new=list(people))
+
+        previous = output.get('rows', {})
+        result = SheetDiff()
+        for person in people:
+            fingerprint = previous.get(person['row_id'])
+            if fingerprint is None:
+                result.new.append(person)
+            elif fingerprint != person_fingerprint(person):
+                result.changed.append(person)
+            else:
+                result.unchanged.append(person)
+        current_ids = {person['row_id'] for person in people}
+        result.removed = [row_id for row_id in previous if row_id not in current_ids]
+        return result
+
+    def record_output(self, output_file: str, mode: str, people: List[Dict[str, Any]]) -> None:
+        """Record that output_file holds current records for people (replacing the previous set)"""
+        self._state['outputs'][str(output_file)] = {
+            'mode': mode,
+            'rows': {person['row_id']: person_fingerprint(person) for person in people},
+            'updated_at': datetime.now().isoformat()
+        }
+
+    def save(self) -> bool:
+        return write_json_safe(self.state_file, self._state)
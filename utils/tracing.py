@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Lightweight Tracing Spans
+
+Times each stage of the channel -> video -> upload pipeline so a slow run can
+be broken down by stage (channel info extraction, enumeration, DB writes,
+yt-dlp download, S3 upload):
+- Spans nest through a context variable; a channel is a trace, each video a child span
+- Finished spans are appended to a local JSONL trace file
+- summarize_trace() turns a trace file into a per-stage time breakdown
+
+When tracing is disabled start_span() returns a shared no-op span, so
+instrumented code pays one global lookup per stage.
+
+Usage:
+    with start_span("s3.upload", s3_key=key) as span:
+        ...
+        span.set_attribute("bytes", size)
+
+    python utils/tracing.py mass_download_trace.jsonl
+"""
+import os
+import sys
+import json
+import time
+import atexit
+import threading
+import contextvars
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TRACE_FILE = "mass_download_trace.jsonl"
+
+# Span that new spans in this thread / task are children of
+_current_span: contextvars.ContextVar = contextvars.ContextVar("current_trace_span", default=None)
+
+
+def _new_id() -> str:
+    return os.urandom(8).hex()
+
+
+class Span:
+    """A timed stage. Ends (and is written) when its with-block exits or end() is called."""
+
+    __slots__ = ("tracer", "name", "trace_id", "span_id", "parent_id", "attributes",
+                 "start_time", "_start", "_token", "_ended")
+
+    def __init__(self, tracer: "Tracer", name: str, parent: Optional["Span"], attributes: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.span_id = _new_id()
+        self.trace_id = parent.trace_id if parent is not None else _new_id()
+        self.parent_id = parent.span_id if parent is not None else None
+        self.attributes = attributes
+        self.start_time = time.time()
+        self._start = time.perf_counter()
+        self._token = _current_span.set(self)
+        self._ended = False
+
+    def set_attribute(self, key: str, value: Any):
+        """Attach a value to the span (written with it)."""
+        self.attributes[key] = value
+
+    def end(self, error: Optional[BaseException] = None, status: Optional[str] = None):
+        """Finish the span and restore the previous current span."""
+        if self._ended:
+            return
+        self._ended = True
+        duration = time.perf_counter() - self._start
+
+        try:
+            _current_span.reset(self._token)
+        except ValueError:
+            # Ended from a different context than it was started in
+            pass
+
+        record = {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start": round(self.start_time, 6),
+            "duration": round(duration, 6),
+            "status": status or ("error" if error is not None else "ok"),
+            "thread": threading.current_thread().name
+        }
+        if error is not None:
+            record["error"] = f"{type(error).__name__}: {error}"[:500]
+        if self.attributes:
+            record["attributes"] = self.attributes
+        self.tracer._write(record)
+
+    def __enter__(self) -> "Span":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.end(error=exc)
+        return False
+
+
+class _NoopSpan:
+    """Span returned when tracing is disabled."""
+
+    __slots__ = ()
+    trace_id = None
+    span_id = None
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def end(self, error: Optional[BaseException] = None, status: Optional[str] = None):
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Tracer:
+    """Create spans and append finished ones to a JSONL trace file."""
+
+    def __init__(self, trace_file: Union[str, Path] = DEFAULT_TRACE_FILE, flush_every: int = 256):
+        """
+        Initialize tracer with fail-fast validation.
+
+        Args:
+            trace_file: JSONL file finished spans are appended to
+            flush_every: Buffered spans written per file append
+        """
+        if flush_every < 1:
+            raise ValueError(f"TRACING ERROR: flush_every must be at least 1. Got: {flush_every}")
+
+        self.trace_file = Path(trace_file)
+        self.trace_file.parent.mkdir(parents=True, exist_ok=True)
+        self.flush_every = flush_every
+        self._buffer: List[str] = []
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+    def start_span(self, name: str, parent: Optional[Span] = None, **attributes) -> Span:
+        """Start a span (child of parent, else of the current span) and make it current."""
+        if not isinstance(parent, Span):
+            parent = _current_span.get()
+        return Span(self, name, parent, attributes)
+
+    def _write(self, record: Dict[str, Any]):
+        line = json.dumps(record, default=str)
+        with self._lock:
+            self._buffer.append(line)
+            if len(self._buffer) < self.flush_every:
+                return
+            lines, self._buffer = self._buffer, []
+        self._append(lines)
+
+    def _append(self, lines: List[str]):
+        with self._write_lock:
+            try:
+                with open(self.trace_file, 'a') as f:
+                    f.write("\n".join(lines) + "\n")
+            except OSError as e:
+                logger.error(f"Failed to write {len(lines)} spans to {self.trace_file}: {e}")
+
+    def flush(self):
+        """Write buffered spans to the trace file."""
+        with self._lock:
+            lines, self._buffer = self._buffer, []
+        if lines:
+            self._append(lines)
+
+
+# Global tracer (None = tracing disabled)
+_tracer: Optional[Tracer] = None
+_tracer_lock = threading.Lock()
+
+
+def initialize_tracing(config: Optional[Any] = None) -> Optional[Tracer]:
+    """
+    Enable tracing if mass_download.tracing.enabled is set.
+
+    Returns:
+        The global tracer, or None if tracing is disabled
+    """
+    global _tracer
+    tracing_config = (config.get("mass_download", {}) or {}).get("tracing", {}) if config is not None else {}
+    tracing_config = tracing_config or {}
+
+    with _tracer_lock:
+        if _tracer is None and tracing_config.get("enabled", False):
+            _tracer = Tracer(
+                trace_file=tracing_config.get("file", DEFAULT_TRACE_FILE),
+                flush_every=tracing_config.get("flush_every", 256)
+            )
+            atexit.register(_tracer.flush)
+            logger.info(f"Tracing enabled - writing spans to {_tracer.trace_file}")
+        return _tracer
+
+
+def set_tracer(tracer: Optional[Tracer]) -> Optional[Tracer]:
+    """Install (or with None, disable) the global tracer, returning the previous one flushed."""
+    global _tracer
+    with _tracer_lock:
+        previous, _tracer = _tracer, tracer
+    if previous is not None:
+        previous.flush()
+    return previous
+
+
+def get_tracer() -> Optional[Tracer]:
+    """Get the global tracer (None if tracing is disabled)."""
+    return _tracer
+
+
+def flush_tracing():
+    """Write any buffered spans."""
+    tracer = _tracer
+    if tracer is not None:
+        tracer.flush()
+
+
+def start_span(name: str, parent: Optional[Span] = None, **attributes) -> Union[Span, _NoopSpan]:
+    """Start a span on the global tracer (a no-op span when tracing is disabled)."""
+    tracer = _tracer
+    if tracer is None:
+        return NOOP_SPAN
+    return tracer.start_span(name, parent=parent, **attributes)
+
+
+def current_span() -> Optional[Span]:
+    """The span new spans will be children of (pass it as parent= across threads)."""
+    return _current_span.get()
+
+
+def read_trace(trace_file: Union[str, Path]) -> List[Dict[str, Any]]:
+    """Read spans from a trace file, skipping a torn last line."""
+    spans = []
+    with open(trace_file, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                spans.append(json.loads(line))
+            except json.JSONDecodeError:
+                logger.warning(f"Skipping unreadable span line in {trace_file}")
+    return spans
+
+
+def summarize_trace(spans: Union[str, Path, List[Dict[str, Any]]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Per-stage time breakdown of a trace.
+
+    Self time is a span's duration minus its direct children's, so stages add
+    up without double counting their nested stages.
+
+    Returns:
+        Stage name -> count, errors, total/self/mean/p50/p95/max seconds, and
+        share of all self time (stages sorted by self time, largest first)
+    """
+    if not isinstance(spans, list):
+        spans = read_trace(spans)
+
+    child_seconds: Dict[str, float] = {}
+    for span in spans:
+        if span.get("parent_id"):
+            child_seconds[span["parent_id"]] = child_seconds.get(span["parent_id"], 0.0) + span["duration"]
+
+    stages: Dict[str, Dict[str, Any]] = {}
+    for span in spans:
+        stage = stages.setdefault(span["name"], {"durations": [], "self_seconds": 0.0, "errors": 0})
+        stage["durations"].append(span["duration"])
+        stage["self_seconds"] += max(0.0, span["duration"] - child_seconds.get(span["span_id"], 0.0))
+        if span.get("status") == "error":
+            stage["errors"] += 1
+
+    total_self = sum(stage["self_seconds"] for stage in stages.values()) or 1.0
+    summary = {}
+    for name, stage in sorted(stages.items(), key=lambda item: item[1]["self_seconds"], reverse=True):
+        durations = sorted(stage["durations"])
+        count = len(durations)
+        total = sum(durations)
+        summary[name] = {
+            "count": count,
+            "errors": stage["errors"],
+            "total_seconds": round(total, 6),
+            "self_seconds": round(stage["self_seconds"], 6),
+            "self_percent": round(stage["self_seconds"] / total_self * 100, 1),
+            "mean_seconds": round(total / count, 6),
+            "p50_seconds": durations[(count - 1) // 2],
+            "p95_seconds": durations[min(count - 1, int(count * 0.95))],
+            "max_seconds": durations[-1]
+        }
+    return summary
+
+
+def format_trace_summary(summary: Dict[str, Dict[str, Any]]) -> str:
+    """Render a summarize_trace() result as a text table."""
+    header = f"{'Stage':<32} {'Count':>7} {'Errors':>6} {'Total s':>10} {'Self s':>10} {'Self %':>7} {'p50 s':>9} {'p95 s':>9}"
+    lines = [header, "-" * len(header)]
+    for name, stage in summary.items():
+        lines.append(
+            f"{name[:32]:<32} {stage['count']:>7} {stage['errors']:>6} {stage['total_seconds']:>10.2f} "
+            f"{stage['self_seconds']:>10.2f} {stage['self_percent']:>6.1f}% "
+            f"{stage['p50_seconds']:>9.3f} {stage['p95_seconds']:>9.3f}"
+        )
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print(f"Usage: {sys.argv[0]} TRACE_FILE")
+        sys.exit(1)
+    print(format_trace_summary(summarize_trace(sys.argv[1])))